@@ -1,17 +1,23 @@
 # ===== adzuna_fetch.py =====
+import hashlib
+import json
 import os
 import re
 import subprocess
+import sys
+import threading
 import time
 import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from html import unescape
-from typing import Any
+from typing import Any, NamedTuple
 from urllib.parse import urlparse
 
 import pandas as pd
 import requests
-from langdetect import LangDetectException, detect
 
 try:
     import ftfy
@@ -26,6 +32,7 @@ except Exception:
 from config import (
     ADZUNA_APP_ID,
     ADZUNA_APP_KEY,
+    ADZUNA_INCREMENTAL_STOP_SEEN_RATIO,
     DEFAULT_FILTER_MODE,
     DEFAULT_PAGES,
     EXPERIENCE_HARD_BLOCK_PHRASES,
@@ -55,6 +62,14 @@ from config import (
     resolve_market,
     require_adzuna_credentials,
 )
+import language_id
+from http_transport import RetryPolicy, get_transport, print_transport_stats
+from fetch_journal import FetchJournal, journal_path, prune_journals
+from language_id import detect_language
+from rule_profiler import RuleProfiler, profiling_requested
+from seen_ids import SeenIdIndex, job_id_key
+from table_storage import RowSpool, iter_table_chunks, read_table, save_table, table_source
+from verdict_cache import VerdictCache
 
 # Title patterns to drop immediately
 DEFAULT_BAD_TITLE_KEYWORDS = [
@@ -150,6 +165,10 @@ ACTIVE_MARKET_PROFILE = {}
 ACTIVE_OUTPUT_PATHS = {}
 ACTIVE_PRIORITY_TERMS = {}
 BASE_URL = ""
+KEYWORD_MATCHER = None
+VERDICT_CACHE = None
+RULE_PROFILER = None
+_RULES_FINGERPRINT = ""
 
 AUTO_CLOSE_EXCEL_ON_LOCK = os.getenv("JOB_AUTO_CLOSE_EXCEL_ON_LOCK", "1").strip().lower() not in {
     "0",
@@ -169,6 +188,7 @@ def configure_market(market: str = "", ch_focus: str = "") -> str:
     """Configure market-specific country/location/language/output settings."""
     global ACTIVE_MARKET, ACTIVE_CH_FOCUS, ACTIVE_MARKET_PROFILE, ACTIVE_OUTPUT_PATHS, ACTIVE_PRIORITY_TERMS, BASE_URL
     global SEARCH_TERMS, EXCLUDE_KEYWORDS, ROLE_FORBIDDEN_KEYWORDS, ROLE_REQUIRED_KEYWORDS, BAD_TITLE_KEYWORDS
+    global KEYWORD_MATCHER, _RULES_FINGERPRINT
 
     ACTIVE_MARKET = resolve_market(market)
     ACTIVE_CH_FOCUS = resolve_ch_focus(ch_focus) if ACTIVE_MARKET == "ch" else "all"
@@ -203,12 +223,12 @@ def configure_market(market: str = "", ch_focus: str = "") -> str:
                 "graduate": 3,
             }
         )
+    KEYWORD_MATCHER = build_keyword_matcher()
+    clear_language_analysis_cache()
+    _RULES_FINGERPRINT = ""
     return ACTIVE_MARKET
 
 
-configure_market()
-
-
 def clean_text(text: str) -> str:
     """Best-effort fix for common mojibake sequences from source feeds."""
     if text is None:
@@ -353,21 +373,199 @@ def job_text_for_rules(job: dict | None = None, **overrides) -> tuple[str, str]:
     return normalize_text(combined), combined
 
 
+class JobTextView:
+    """
+    Immutable per-job texts shared by the rule functions.
+    Derived (plain/normalized) texts are computed lazily, once per view.
+    Rule functions accept a view in place of their `title` argument; plain strings still work.
+    """
+
+    __slots__ = ("title", "desc", "loc", "company", "_texts")
+
+    def __init__(self, title: str = "", desc: str = "", loc: str = "", company: str = ""):
+        object.__setattr__(self, "title", title)
+        object.__setattr__(self, "desc", desc)
+        object.__setattr__(self, "loc", loc)
+        object.__setattr__(self, "company", company)
+        object.__setattr__(self, "_texts", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("JobTextView is immutable")
+
+    @classmethod
+    def from_job(cls, job: dict) -> "JobTextView":
+        """Plain-text view of a raw job row (same field fallbacks as passes_filters)."""
+        loc = job.get("location", "")
+        if isinstance(loc, dict):
+            loc = loc.get("display_name", "")
+        if not loc:
+            loc = job.get("location.display_name", "")
+        company_val = job.get("company", "")
+        if isinstance(company_val, dict):
+            company = company_val.get("display_name", "") or company_val.get("name", "")
+        else:
+            company = company_val or job.get("company.display_name", "")
+        return cls(
+            title=rule_plain_text(job.get("title", "") or ""),
+            desc=rule_plain_text(job.get("description", "") or ""),
+            loc=rule_plain_text(loc),
+            company=rule_plain_text(company),
+        )
+
+    def _cached(self, key: str, build) -> Any:
+        texts = self._texts
+        if key not in texts:
+            texts[key] = build()
+        return texts[key]
+
+    @property
+    def text(self) -> str:
+        """Title + description, as rule functions historically concatenated them."""
+        return self._cached("text", lambda: f"{self.title or ''} {self.desc or ''}")
+
+    @property
+    def title_norm(self) -> str:
+        return self._cached("title_norm", lambda: normalize_text(self.title or ""))
+
+    @property
+    def desc_norm(self) -> str:
+        return self._cached("desc_norm", lambda: normalize_text(self.desc or ""))
+
+    @property
+    def loc_norm(self) -> str:
+        return self._cached("loc_norm", lambda: normalize_text(self.loc or ""))
+
+    @property
+    def company_norm(self) -> str:
+        return self._cached("company_norm", lambda: normalize_text(self.company or "").strip())
+
+    @property
+    def text_norm(self) -> str:
+        return self._cached("text_norm", lambda: normalize_text(self.text))
+
+    @property
+    def text_loc_norm(self) -> str:
+        """Title + description + location (work-mode hints)."""
+        return self._cached(
+            "text_loc_norm", lambda: normalize_text(f"{self.title or ''} {self.desc or ''} {self.loc or ''}")
+        )
+
+    @property
+    def loc_title_norm(self) -> str:
+        return self._cached("loc_title_norm", lambda: normalize_text(f"{self.loc or ''} {self.title or ''}"))
+
+    @property
+    def loc_text_norm(self) -> str:
+        return self._cached(
+            "loc_text_norm", lambda: normalize_text(f"{self.loc or ''} {self.title or ''} {self.desc or ''}")
+        )
+
+    @property
+    def full_text(self) -> str:
+        """Cleaned title + description used by exclude/language rules (job_text_for_rules)."""
+        return self._cached(
+            "full_text", lambda: job_text_for_rules({"title": self.title, "description": self.desc})[1]
+        )
+
+    @property
+    def internship_text(self) -> str:
+        return self._cached("internship_text", lambda: _internship_matching_text(self))
+
+
+def job_text_view(title: "str | JobTextView", desc: str = "", loc: str = "", company: str = "") -> JobTextView:
+    """Return `title` if it already is a JobTextView, else wrap the legacy string arguments."""
+    if isinstance(title, JobTextView):
+        return title
+    return JobTextView(title, desc, loc, company)
+
+
+_KEYWORD_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_KEYWORD_WORD_RE = re.compile(r"\w+")
+_BOUNDARY_KEYWORD_RE = re.compile(r"[a-z0-9 ]+")
+_NON_WORD_RE = re.compile(r"\W")
+
+
+@lru_cache(maxsize=1024)
+def _match_text(text: Any) -> str:
+    """normalize() for keyword checks; the same text is usually checked against many keywords."""
+    return normalize(text or "")
+
+
+@lru_cache(maxsize=8192)
+def _compiled_keyword(keyword: str) -> tuple[str, tuple[str, ...] | None, bool]:
+    """
+    Normalize a keyword once.
+    Returns: (keyword_norm, boundary_words, whole_word)
+    - boundary_words: words for keyword_hit() boundary matching, None => substring match.
+    - whole_word: keyword_match() uses whole-word matching instead of substring.
+    """
+    kw = normalize(keyword or "").strip()
+    boundary_words = tuple(kw.split(" ")) if kw and _BOUNDARY_KEYWORD_RE.fullmatch(kw) else None
+    whole_word = bool(kw) and " " not in kw and not _NON_WORD_RE.search(kw)
+    return kw, boundary_words, whole_word
+
+
+class _TextTokens:
+    """Token view of one normalized text, shared by every keyword checked against it."""
+
+    __slots__ = ("tokens", "spaced", "positions", "words")
+
+    def __init__(self, text: str):
+        spans = [(m.group(), m.start(), m.end()) for m in _KEYWORD_TOKEN_RE.finditer(text)]
+        self.tokens = [token for token, _, _ in spans]
+        # spaced[i]: tokens i and i+1 are separated by whitespace only (the `\s+` of a multi-word keyword).
+        self.spaced = [text[spans[i][2] : spans[i + 1][1]].isspace() for i in range(len(spans) - 1)]
+        self.positions: dict[str, list[int]] = {}
+        for idx, token in enumerate(self.tokens):
+            self.positions.setdefault(token, []).append(idx)
+        self.words = frozenset(_KEYWORD_WORD_RE.findall(text))
+
+    def phrase_at(self, start: int, words: tuple[str, ...]) -> bool:
+        if start + len(words) > len(self.tokens):
+            return False
+        for offset in range(1, len(words)):
+            idx = start + offset
+            if self.tokens[idx] != words[offset] or not self.spaced[idx - 1]:
+                return False
+        return True
+
+    def has_phrase(self, words: tuple[str, ...]) -> bool:
+        return any(self.phrase_at(start, words) for start in self.positions.get(words[0], ()))
+
+
+@lru_cache(maxsize=1024)
+def _text_tokens(text_norm: str) -> _TextTokens:
+    return _TextTokens(text_norm)
+
+
+def _keyword_hit_norm(text_norm: str, compiled: tuple[str, tuple[str, ...] | None, bool]) -> bool:
+    kw, boundary_words, _ = compiled
+    if boundary_words:
+        return _text_tokens(text_norm).has_phrase(boundary_words)
+    return kw in text_norm
+
+
+def _keyword_match_norm(text_norm: str, compiled: tuple[str, tuple[str, ...] | None, bool]) -> bool:
+    kw, _, whole_word = compiled
+    if whole_word:
+        return kw in _text_tokens(text_norm).words
+    return kw in text_norm
+
+
 def keyword_hit(text: str, keyword: str, boundary_only: bool = True) -> bool:
     """
     Keyword match with safer boundaries to reduce substring false positives.
     Example fixed: expert vs expertise, host vs hosting, coo vs coordinate.
     """
-    txt = normalize(text or "")
-    kw = normalize(keyword or "").strip()
-    if not txt or not kw:
+    txt = _match_text(text)
+    compiled = _compiled_keyword(keyword or "")
+    if not txt or not compiled[0]:
         return False
 
-    if boundary_only and re.fullmatch(r"[a-z0-9 ]+", kw):
-        pattern = r"(?<![a-z0-9])" + re.escape(kw).replace(r"\ ", r"\s+") + r"(?![a-z0-9])"
-        return re.search(pattern, txt) is not None
+    if boundary_only:
+        return _keyword_hit_norm(txt, compiled)
 
-    return kw in txt
+    return compiled[0] in txt
 
 
 def keyword_match(text: str, kw: str) -> bool:
@@ -376,15 +574,104 @@ def keyword_match(text: str, kw: str) -> bool:
     - Multi-word / non-word keywords => case-insensitive substring.
     - Single token keywords => whole-word regex match.
     """
-    txt_norm = normalize_text(text or "")
-    kw_norm = normalize_text(kw or "").strip()
-    if not txt_norm or not kw_norm:
+    txt_norm = _match_text(text)
+    compiled = _compiled_keyword(kw or "")
+    if not txt_norm or not compiled[0]:
         return False
+    return _keyword_match_norm(txt_norm, compiled)
+
+
+class KeywordMatcher:
+    """
+    Keyword table compiled once per market profile (see configure_market).
+    hits() returns every keyword found in a normalized text with keyword_hit() semantics,
+    matches() does the same with keyword_match() semantics. Both scan the text once.
+    """
+
+    def __init__(self, keywords):
+        compiled = {}
+        for keyword in keywords:
+            entry = _compiled_keyword(keyword or "")
+            if entry[0]:
+                compiled[entry[0]] = entry
+        self.keywords = frozenset(compiled)
+        self._phrases_by_first: dict[str, list[tuple[str, tuple[str, ...]]]] = {}
+        self._hit_substrings = []
+        self._match_words = set()
+        self._match_substrings = []
+        for kw, boundary_words, whole_word in compiled.values():
+            if boundary_words:
+                self._phrases_by_first.setdefault(boundary_words[0], []).append((kw, boundary_words))
+            else:
+                self._hit_substrings.append(kw)
+            if whole_word:
+                self._match_words.add(kw)
+            else:
+                self._match_substrings.append(kw)
+        self._match_words = frozenset(self._match_words)
+        self.hits = lru_cache(maxsize=1024)(self._scan_hits)
+        self.matches = lru_cache(maxsize=1024)(self._scan_matches)
+
+    def __contains__(self, keyword_norm: str) -> bool:
+        return keyword_norm in self.keywords
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _scan_hits(self, text_norm: str) -> frozenset[str]:
+        if not text_norm:
+            return frozenset()
+        tokens = _text_tokens(text_norm)
+        found = set()
+        for start, token in enumerate(tokens.tokens):
+            for kw, words in self._phrases_by_first.get(token, ()):
+                if kw not in found and tokens.phrase_at(start, words):
+                    found.add(kw)
+        found.update(kw for kw in self._hit_substrings if kw in text_norm)
+        return frozenset(found)
+
+    def _scan_matches(self, text_norm: str) -> frozenset[str]:
+        if not text_norm:
+            return frozenset()
+        found = set(self._match_words & _text_tokens(text_norm).words)
+        found.update(kw for kw in self._match_substrings if kw in text_norm)
+        return frozenset(found)
+
+
+def _iter_keyword_hits(text: str, keywords, whole_word_match: bool = False):
+    """
+    Yield keywords hit in text, in list order.
+    Keywords known to KEYWORD_MATCHER are answered from its single scan; others are checked directly.
+    whole_word_match=True uses keyword_match() semantics instead of keyword_hit().
+    """
+    txt = _match_text(text)
+    if not txt:
+        return
+    matcher = KEYWORD_MATCHER
+    found = frozenset()
+    if matcher is not None:
+        found = matcher.matches(txt) if whole_word_match else matcher.hits(txt)
+    check = _keyword_match_norm if whole_word_match else _keyword_hit_norm
+    for keyword in keywords:
+        compiled = _compiled_keyword(keyword or "")
+        kw = compiled[0]
+        if not kw:
+            continue
+        if matcher is not None and kw in matcher:
+            if kw in found:
+                yield keyword
+        elif check(txt, compiled):
+            yield keyword
+
+
+def matched_keywords(text: str, keywords) -> list[str]:
+    """Return keywords (order preserved) that keyword_hit(text, kw) accepts."""
+    return list(_iter_keyword_hits(text, keywords))
 
-    if " " in kw_norm or re.search(r"\W", kw_norm):
-        return kw_norm in txt_norm
 
-    return re.search(rf"\b{re.escape(kw_norm)}\b", txt_norm, flags=re.IGNORECASE) is not None
+def any_keyword_hit(text: str, keywords) -> bool:
+    """Same as any(keyword_hit(text, kw) for kw in keywords)."""
+    return next(_iter_keyword_hits(text, keywords), None) is not None
 
 
 def extract_adzuna_job_id(url: str) -> str:
@@ -413,8 +700,81 @@ def canonicalize_url(url: str) -> str:
     return base
 
 
-def fetch_adzuna_page(page: int, term: str, results_per_page: int = RESULTS_PER_PAGE):
-    """Call Adzuna API for a given term and page."""
+class TokenBucket:
+    """
+    Thread-safe token bucket: at most `rate` acquisitions per second on average,
+    with bursts of up to `burst` back-to-back acquisitions.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available, then take it. rate <= 0 disables limiting."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    @contextmanager
+    def slot(self):
+        """acquire() as a context manager, the pacing hook of http_transport."""
+        self.acquire()
+        yield
+
+
+def adzuna_rate_limiter() -> TokenBucket:
+    """Token bucket configured from the active market profile."""
+    return TokenBucket(
+        ACTIVE_MARKET_PROFILE.get("adzuna_rate_limit_per_sec", 1.0),
+        ACTIVE_MARKET_PROFILE.get("adzuna_rate_limit_burst", 1),
+    )
+
+
+# Transient failures wait 2s then 4s before the next attempt, Retry-After permitting.
+ADZUNA_HTTP = get_transport("adzuna", retry=RetryPolicy(attempts=3, backoff=2.0), timeout=15)
+
+# Raw columns kept in the fetch journal: what the filters, merge_jobs and optimize_terms read.
+ADZUNA_JOURNAL_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "created",
+    "redirect_url",
+    "company.display_name",
+    "location.display_name",
+    "salary_min",
+    "salary_max",
+    "search_term",
+)
+
+
+def fetch_adzuna_page(
+    page: int,
+    term: str,
+    results_per_page: int = RESULTS_PER_PAGE,
+    session: requests.Session | None = None,
+    rate_limiter: TokenBucket | None = None,
+    extra_params: dict | None = None,
+):
+    """
+    Call Adzuna API for a given term and page; None once ADZUNA_HTTP gave up. session overrides the pool.
+    extra_params are added to the query (e.g. incremental_search_params()).
+    """
     url = f"{BASE_URL}/{page}"
     params = {
         "app_id": ADZUNA_APP_ID,
@@ -422,22 +782,199 @@ def fetch_adzuna_page(page: int, term: str, results_per_page: int = RESULTS_PER_
         "what": term,
         "results_per_page": results_per_page,
         "content-type": "application/json",
+        **(extra_params or {}),
     }
     print(f"[ADZUNA] Fetch page {page} for '{term}'...")
-    for attempt in range(3):
+    try:
+        resp = ADZUNA_HTTP.get(
+            url,
+            params=params,
+            timeout=15,
+            session=session,
+            pace=rate_limiter.slot if rate_limiter is not None else None,
+        )
+        return resp.json()
+    except Exception as e:
+        print(f"[WARN] Error on term='{term}' page={page}: {e}")
+        return None
+
+
+def fetch_adzuna_term(
+    term: str,
+    page_count: int,
+    results_per_page: int = RESULTS_PER_PAGE,
+    session: requests.Session | None = None,
+    rate_limiter: TokenBucket | None = None,
+    extra_params: dict | None = None,
+    seen_ids: SeenIdIndex | None = None,
+    stop_seen_ratio: float = ADZUNA_INCREMENTAL_STOP_SEEN_RATIO,
+    journal: FetchJournal | None = None,
+) -> list[dict]:
+    """
+    Fetch pages 1..page_count for one term, stopping at the first page without results.
+    With seen_ids (results sorted by date), also stop after the first page on which at least
+    stop_seen_ratio of the job ids are already known: later pages only hold older postings.
+    With journal, each page is appended to it instead of the returned list, and pages it already
+    holds (resumed run) are skipped, up to the page that ended the term.
+    """
+    print(f"[INFO] Searching for: {term}")
+    jobs = []
+    for page in range(1, page_count + 1):
+        journaled = journal.done(term, page) if journal is not None else None
+        if journaled is not None:
+            if journaled:
+                break
+            continue
+
+        data = fetch_adzuna_page(
+            page, term, results_per_page, session=session, rate_limiter=rate_limiter, extra_params=extra_params
+        )
+        if not data:
+            continue
+
+        results = data.get("results", [])
+        stop = not results
+        for job in results:
+            job["search_term"] = term
+        if results and seen_ids is not None and page < page_count:
+            share = seen_ids.seen_share(job.get("id") for job in results)
+            if share >= stop_seen_ratio:
+                print(f"[INFO] '{term}' page {page}: {share:.0%} already seen, stop paging")
+                stop = True
+        if journal is not None:
+            journal.record(term, page, results, stop=stop)
+        else:
+            jobs.extend(results)
+        if stop:
+            break
+    return jobs
+
+
+def fetch_adzuna_jobs(
+    search_terms: list[str],
+    results_per_page: int = RESULTS_PER_PAGE,
+    concurrency: int = 0,
+    pages_per_term: dict | None = None,
+    rate_limiter: TokenBucket | None = None,
+    seen_ids: SeenIdIndex | None = None,
+    journal: FetchJournal | None = None,
+) -> list[dict]:
+    """
+    Fetch every search term concurrently over the pooled keep-alive connections of ADZUNA_HTTP.
+    Pages of a term stay sequential so an empty page still stops that term early;
+    the shared rate_limiter (default: from the market profile) paces requests across all terms.
+    Results keep search_terms order, then page order, like a serial run.
+    With seen_ids the fetch is incremental: incremental_search_params() narrows the query and a
+    term stops paging once a page is mostly ids from earlier runs (the index is not updated here).
+    With journal, pages go to the journal as they arrive and the returned list stays empty.
+    """
+    concurrency = max(1, int(concurrency or ACTIVE_MARKET_PROFILE.get("adzuna_fetch_concurrency", 1)))
+    pages_per_term = PAGES_PER_TERM if pages_per_term is None else pages_per_term
+    rate_limiter = rate_limiter or adzuna_rate_limiter()
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(
+                fetch_adzuna_term,
+                term,
+                pages_per_term.get(term, DEFAULT_PAGES),
+                results_per_page,
+                None,
+                rate_limiter,
+                incremental_search_params() if seen_ids is not None else None,
+                seen_ids,
+                ADZUNA_INCREMENTAL_STOP_SEEN_RATIO,
+                journal,
+            )
+            for term in search_terms
+        ]
+        all_jobs = []
         try:
-            resp = requests.get(url, params=params, timeout=15)
-            # Retry on transient 5xx (e.g., 502)
-            if resp.status_code >= 500:
-                raise requests.HTTPError(f"{resp.status_code} {resp.reason}")
-            resp.raise_for_status()
-            return resp.json()
-        except Exception as e:
-            print(f"[WARN] Error on term='{term}' page={page} attempt {attempt + 1}/3: {e}")
-            if attempt < 2:
-                time.sleep(2 * (attempt + 1))
-            else:
-                return None
+            for future in futures:
+                all_jobs.extend(future.result())
+        except BaseException:
+            # Ctrl-C or a failed term: drop the terms not started yet rather than fetching them all.
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    return all_jobs
+
+
+def incremental_search_params() -> dict:
+    """
+    Query params of incremental fetches: newest postings first, none older than MAX_DAYS_OLD,
+    and the market profile's adzuna_where when it sets one.
+    """
+    params = {"sort_by": "date", "max_days_old": MAX_DAYS_OLD}
+    where = ACTIVE_MARKET_PROFILE.get("adzuna_where", "")
+    if where:
+        params["where"] = where
+    return params
+
+
+def merge_raw_store(previous: pd.DataFrame, fresh_jobs: list[dict], max_days: int = MAX_DAYS_OLD) -> pd.DataFrame:
+    """
+    Rolling raw store of incremental runs: the fresh jobs, then the previous rows whose
+    (search_term, Adzuna id) was not fetched again, without rows created more than max_days ago.
+    One row per (search_term, id), like the table FetchJournal.compact builds.
+    """
+    fresh = pd.json_normalize(fresh_jobs)
+    frames = [frame for frame in (fresh, previous) if not frame.empty]
+    if not frames:
+        return fresh
+    merged = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].reset_index(drop=True)
+    if "id" in merged.columns:
+        ids = merged["id"].map(job_id_key)
+        terms = merged["search_term"].fillna("").astype(str) if "search_term" in merged.columns else ""
+        keys = pd.DataFrame({"search_term": terms, "id": ids})
+        merged = merged[(ids == "") | ~keys.duplicated()]
+    if "created" in merged.columns:
+        merged = merged[[is_recent(created, max_days) for created in merged["created"]]]
+    return merged.reset_index(drop=True)
+
+
+def fetch_raw_table(
+    search_terms: list[str],
+    raw_path: str,
+    concurrency: int = 0,
+    incremental: bool = False,
+    resume: bool = False,
+) -> int:
+    """
+    Fetch search_terms into today's fetch journal (market adzuna_journal_jsonl), then build the raw
+    table at raw_path from it. resume keeps the pages journaled by an interrupted run of the day.
+    incremental merges the fresh jobs into the existing raw table (merge_raw_store) and updates the
+    seen-id index. Returns the number of raw rows saved.
+    """
+    journal_base = ACTIVE_OUTPUT_PATHS["adzuna_journal_jsonl"]
+    prune_journals(journal_base)
+    journal = FetchJournal(journal_path(journal_base), fields=ADZUNA_JOURNAL_FIELDS, resume=resume)
+    print(f"[INFO] Fetch journal: {journal.path} ({len(journal.pages)} pages already fetched)")
+    seen_ids = SeenIdIndex(ACTIVE_OUTPUT_PATHS["adzuna_seen_ids_json"]) if incremental else None
+    previous_raw = pd.DataFrame([])
+    if seen_ids is not None and table_source(raw_path) is not None:
+        previous_raw = read_table(raw_path)
+        if not len(seen_ids) and "id" in previous_raw.columns:
+            seeded = seen_ids.add(previous_raw["id"])
+            print(f"[INFO] Seen-id index seeded from the raw file: {seeded} ids")
+    try:
+        fetch_adzuna_jobs(search_terms, RESULTS_PER_PAGE, concurrency=concurrency, seen_ids=seen_ids, journal=journal)
+        print_transport_stats()
+        if seen_ids is None:
+            return journal.compact(raw_path, search_terms)
+
+        fresh_jobs = list(journal.iter_jobs(search_terms))
+        new_ids = seen_ids.add(job.get("id") for job in fresh_jobs)
+        seen_ids.save()
+        df_raw = merge_raw_store(previous_raw, fresh_jobs)
+        print(
+            f"[INFO] Incremental fetch: {len(fresh_jobs)} fetched, {new_ids} new ids, "
+            f"raw store {len(previous_raw)} -> {len(df_raw)} rows"
+        )
+        safe_save_table(df_raw, raw_path)
+        return len(df_raw)
+    finally:
+        journal.close()
 
 
 def is_recent(date_str, max_days: int) -> bool:
@@ -480,12 +1017,12 @@ ONSITE_TERMS = [
 ]
 
 
-def detect_work_mode(title: str, desc: str, loc: str) -> str:
+def detect_work_mode(title: "str | JobTextView", desc: str = "", loc: str = "") -> str:
     """Return remote/hybrid/onsite/unknown from job text hints."""
-    text = normalize_text(f"{title or ''} {desc or ''} {loc or ''}")
-    has_hybrid = any(keyword_hit(text, term, boundary_only=True) for term in HYBRID_TERMS)
-    has_remote = any(keyword_hit(text, term, boundary_only=True) for term in REMOTE_TERMS)
-    has_onsite = any(keyword_hit(text, term, boundary_only=True) for term in ONSITE_TERMS)
+    text = job_text_view(title, desc, loc).text_loc_norm
+    has_hybrid = any_keyword_hit(text, HYBRID_TERMS)
+    has_remote = any_keyword_hit(text, REMOTE_TERMS)
+    has_onsite = any_keyword_hit(text, ONSITE_TERMS)
 
     if has_hybrid:
         return "hybrid"
@@ -498,12 +1035,14 @@ def detect_work_mode(title: str, desc: str, loc: str) -> str:
     return "unknown"
 
 
-def is_remote_job(title: str, desc: str, loc: str) -> bool:
-    return detect_work_mode(title, desc, loc) in {"remote", "hybrid"}
+def is_remote_job(title: "str | JobTextView", desc: str = "", loc: str = "") -> bool:
+    return detect_work_mode(job_text_view(title, desc, loc)) in {"remote", "hybrid"}
 
 
-def location_ok(loc: str, title: str = "", desc: str = "") -> bool:
+def location_ok(loc: "str | JobTextView", title: str = "", desc: str = "") -> bool:
     """Return True if location is acceptable for the active market."""
+    view = loc if isinstance(loc, JobTextView) else JobTextView(title, desc, loc)
+    loc = view.loc
     # Always check blocked location keywords first, regardless of enforce_location_filter.
     # This prevents jobs in clearly foreign cities (e.g. Cluj for DE market) from slipping
     # through when enforce_location_filter is False.
@@ -511,16 +1050,16 @@ def location_ok(loc: str, title: str = "", desc: str = "") -> bool:
     # (e.g. "DevOps Engineer — Cluj") while listing a German HQ address in the location field.
     blocked_keywords = ACTIVE_MARKET_PROFILE.get("blocked_location_keywords", [])
     if blocked_keywords:
-        check_text = normalize(f"{loc or ''} {title or ''}")
-        if any(normalize(kw) in check_text for kw in blocked_keywords):
+        check_text = view.loc_title_norm
+        if any(_match_text(kw) in check_text for kw in blocked_keywords):
             return False
 
-    if ACTIVE_MARKET == "ch" and is_remote_job(title, desc, loc):
-        combined = normalize(f"{loc or ''} {title or ''} {desc or ''}")
+    if ACTIVE_MARKET == "ch" and is_remote_job(view):
+        combined = view.loc_text_norm
         foreign_keywords = ACTIVE_MARKET_PROFILE.get("foreign_location_keywords", [])
-        has_foreign = any(normalize(kw) in combined for kw in foreign_keywords)
+        has_foreign = any(_match_text(kw) in combined for kw in foreign_keywords)
         swiss_markers = ACTIVE_MARKET_PROFILE.get("allowed_location_keywords", [])
-        has_swiss = any(normalize(marker) in combined for marker in swiss_markers)
+        has_swiss = any(_match_text(marker) in combined for marker in swiss_markers)
         return not (has_foreign and not has_swiss)
 
     if not ACTIVE_MARKET_PROFILE.get("enforce_location_filter", True):
@@ -528,21 +1067,21 @@ def location_ok(loc: str, title: str = "", desc: str = "") -> bool:
         if ACTIVE_MARKET != "ch":
             return True
 
-        combined = normalize(f"{loc or ''} {title or ''} {desc or ''}")
+        combined = view.loc_text_norm
         foreign_keywords = ACTIVE_MARKET_PROFILE.get("foreign_location_keywords", [])
-        has_foreign = any(normalize(kw) in combined for kw in foreign_keywords)
+        has_foreign = any(_match_text(kw) in combined for kw in foreign_keywords)
 
         swiss_markers = ACTIVE_MARKET_PROFILE.get("allowed_location_keywords", [])
-        has_swiss = any(normalize(marker) in combined for marker in swiss_markers)
+        has_swiss = any(_match_text(marker) in combined for marker in swiss_markers)
 
         if has_foreign and not has_swiss:
             return False
         return True
 
     if loc:
-        norm_loc = normalize(loc)
+        norm_loc = view.loc_norm
         blocked_keywords = ACTIVE_MARKET_PROFILE.get("blocked_location_keywords", [])
-        if any(normalize(kw) in norm_loc for kw in blocked_keywords):
+        if any(_match_text(kw) in norm_loc for kw in blocked_keywords):
             return False
 
     keywords = ACTIVE_MARKET_PROFILE.get("allowed_location_keywords", [])
@@ -551,16 +1090,16 @@ def location_ok(loc: str, title: str = "", desc: str = "") -> bool:
     if not loc:
         # Keep unknown locations to avoid false negatives from sparse APIs.
         return True
-    norm_loc = normalize(loc)
-    return any(normalize(kw) in norm_loc for kw in keywords)
+    norm_loc = view.loc_norm
+    return any(_match_text(kw) in norm_loc for kw in keywords)
 
 
 def _strip_exclude_exceptions(text: str) -> str:
     """Remove benign phrases before exclude-keyword matching."""
-    norm = normalize_text(text or "")
+    norm = _match_text(text)
     norm_padded = f" {norm} "
     for exc in EXCLUDE_EXCEPTIONS:
-        exc_norm = normalize_text(exc)
+        exc_norm = _compiled_keyword(exc)[0]
         if not exc_norm:
             continue
         norm_padded = norm_padded.replace(f" {exc_norm} ", " ")
@@ -571,11 +1110,7 @@ def _strip_exclude_exceptions(text: str) -> str:
 def keyword_hits(text: str, keywords: list[str]) -> list[str]:
     """Return all matching keywords (order preserved) after exception cleanup."""
     filtered_text = _strip_exclude_exceptions(text)
-    hits = []
-    for kw in keywords:
-        if keyword_match(filtered_text, kw):
-            hits.append(kw)
-    return hits
+    return list(_iter_keyword_hits(filtered_text, keywords, whole_word_match=True))
 
 
 def excluded_hits(text: str) -> list[str]:
@@ -602,7 +1137,7 @@ LEAD_TITLE_MARKERS = [
 
 def title_has_lead_or_manager(title: str) -> bool:
     title_norm = normalize_text(title or "")
-    return any(keyword_hit(title_norm, marker, boundary_only=True) for marker in LEAD_TITLE_MARKERS)
+    return any_keyword_hit(title_norm, LEAD_TITLE_MARKERS)
 
 
 def _senior_keyword_is_contextual_exclude(title: str, text: str, years_required: int | None) -> bool:
@@ -628,11 +1163,16 @@ def _senior_keyword_is_contextual_exclude(title: str, text: str, years_required:
     return False
 
 
-def classify_excluded_hits(title: str, text: str) -> tuple[list[str], list[str]]:
+def classify_excluded_hits(title: "str | JobTextView", text: str | None = None) -> tuple[list[str], list[str]]:
     """
     Split exclude hits into hard vs soft.
     Lead mentions outside title are kept for manual review (soft).
+    A JobTextView title checks its full_text unless `text` is given.
     """
+    if isinstance(title, JobTextView):
+        if text is None:
+            text = title.full_text
+        title = title.title
     hits = excluded_hits(text)
     if not hits:
         return [], []
@@ -1166,10 +1706,8 @@ def detect_dutch_requirement(text: str, title: str = "") -> dict:
 def _extract_language_codes(text_norm: str) -> set[str]:
     found: set[str] = set()
     for code, terms in LANGUAGE_TERMS.items():
-        for term in terms:
-            if keyword_hit(text_norm, term, boundary_only=True):
-                found.add(code)
-                break
+        if any_keyword_hit(text_norm, terms):
+            found.add(code)
     return found
 
 
@@ -1294,8 +1832,65 @@ def language_requirements(text: str) -> dict:
         "alternative_language_option": bool,
       }
     """
-    norm = normalize_text(text or "")
-    return _parse_language_signals(norm)
+    return _copy_language_fields(analyze_language(text).requirements)
+
+
+def _copy_language_fields(values: dict) -> dict:
+    """Copy set/list values so callers cannot mutate a cached analysis."""
+    return {
+        key: set(val) if isinstance(val, set) else list(val) if isinstance(val, list) else val
+        for key, val in values.items()
+    }
+
+
+LANGUAGE_ANALYSIS_CACHE_SIZE = 2048
+_LANGUAGE_ANALYSIS_CACHE: "OrderedDict[bytes, LanguageAnalysis]" = OrderedDict()
+_LANGUAGE_ANALYSIS_LOCK = threading.Lock()
+
+
+class LanguageAnalysis:
+    """
+    Language signals of one text for the active market, computed once.
+    - requirements: language_requirements() result
+    - need: classify_language_need() result
+    - blocked_reason: strict blocked_language_requirement_reason()
+    - manual_review_reason: language_manual_review_reason()
+    Read-only: the public functions hand out copies.
+    """
+
+    __slots__ = ("norm", "requirements", "need", "blocked_reason", "manual_review_reason")
+
+    def __init__(self, text: str):
+        self.norm = normalize_text(text or "")
+        self.requirements = _parse_language_signals(self.norm)
+        self.need = _classify_language_need(text, self.norm, self.requirements)
+        self.blocked_reason = _blocked_language_reason_from_need(self.need)
+        self.manual_review_reason = _language_manual_review_reason_from_need(self.need)
+
+
+def _language_cache_key(text: str) -> bytes:
+    return hashlib.blake2b(str(text or "").encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def analyze_language(text: str) -> LanguageAnalysis:
+    """Return the LRU-cached language analysis of text (cache is reset by configure_market)."""
+    key = _language_cache_key(text)
+    with _LANGUAGE_ANALYSIS_LOCK:
+        cached = _LANGUAGE_ANALYSIS_CACHE.get(key)
+        if cached is not None:
+            _LANGUAGE_ANALYSIS_CACHE.move_to_end(key)
+            return cached
+    analysis = LanguageAnalysis(text)
+    with _LANGUAGE_ANALYSIS_LOCK:
+        _LANGUAGE_ANALYSIS_CACHE[key] = analysis
+        while len(_LANGUAGE_ANALYSIS_CACHE) > LANGUAGE_ANALYSIS_CACHE_SIZE:
+            _LANGUAGE_ANALYSIS_CACHE.popitem(last=False)
+    return analysis
+
+
+def clear_language_analysis_cache() -> None:
+    with _LANGUAGE_ANALYSIS_LOCK:
+        _LANGUAGE_ANALYSIS_CACHE.clear()
 
 
 def classify_language_need(text: str) -> dict:
@@ -1314,8 +1909,10 @@ def classify_language_need(text: str) -> dict:
         "english_only": bool,
       }
     """
-    norm = normalize_text(text or "")
-    parsed = _parse_language_signals(norm)
+    return _copy_language_fields(analyze_language(text).need)
+
+
+def _classify_language_need(text: str, norm: str, parsed: dict) -> dict:
     dutch_req = detect_dutch_requirement(text, "")
     required = set(parsed.get("required_langs", set()))
     optional = set(parsed.get("optional_langs", set()))
@@ -1384,12 +1981,16 @@ def classify_language_need(text: str) -> dict:
 
 
 def blocked_language_requirement_reason(text: str, filter_mode: str = "strict") -> str:
-    need = classify_language_need(text)
+    analysis = analyze_language(text)
 
     # In broad mode we keep those rows and rely on downstream flags/manual checks.
     mode = resolve_filter_mode(filter_mode, allow_both=False) if filter_mode else "strict"
     if mode == "broad":
         return ""
+    return analysis.blocked_reason
+
+
+def _blocked_language_reason_from_need(need: dict) -> str:
     if need.get("dutch_preferred_or_learn", False):
         return ""
 
@@ -1405,7 +2006,10 @@ def blocked_language_requirement_reason(text: str, filter_mode: str = "strict")
 
 
 def language_manual_review_reason(text: str) -> str:
-    need = classify_language_need(text)
+    return analyze_language(text).manual_review_reason
+
+
+def _language_manual_review_reason_from_need(need: dict) -> str:
     if need.get("dutch_preferred_or_learn", False):
         return "language_alternative:dutch_preferred_or_learn"
     alt_langs = set(need.get("alternative_langs", set()))
@@ -1426,7 +2030,7 @@ def has_acceptable_language_alternative(text: str) -> bool:
     Return True when the ad offers an FR/NL alternative (acceptable for this profile),
     as long as Dutch/German is not explicitly marked mandatory elsewhere.
     """
-    return bool(classify_language_need(text).get("acceptable_without_dutch", False))
+    return bool(analyze_language(text).need.get("acceptable_without_dutch", False))
 
 
 INTERNSHIP_ALLOW_MARKERS = [
@@ -1552,11 +2156,7 @@ def _years_from_text(text: str) -> int | None:
 
 
 def _match_phrase_list(text_norm: str, phrases: list[str]) -> str:
-    for phrase in phrases:
-        phrase_norm = normalize_text(phrase or "").strip()
-        if phrase_norm and keyword_hit(text_norm, phrase_norm, boundary_only=True):
-            return phrase
-    return ""
+    return next(_iter_keyword_hits(text_norm, phrases), "")
 
 
 def _extract_years_required(text_norm: str) -> tuple[int | None, str, bool]:
@@ -1605,13 +2205,17 @@ def _extract_years_required(text_norm: str) -> tuple[int | None, str, bool]:
     return years_required, detail or f"{years_required}+ years", is_range
 
 
-def internship_matching_text(title: str, desc: str) -> str:
+def internship_matching_text(title: "str | JobTextView", desc: str = "") -> str:
     """
     Build a cleaned text stream for internship detection.
     HTML/script/style/class noise is removed, then known technical tokens are stripped.
     """
-    clean_title = rule_plain_text(title or "")
-    clean_desc = rule_plain_text(desc or "")
+    return job_text_view(title, desc).internship_text
+
+
+def _internship_matching_text(view: JobTextView) -> str:
+    clean_title = rule_plain_text(view.title or "")
+    clean_desc = rule_plain_text(view.desc or "")
     text_norm = normalize_text(f"{clean_title} {clean_desc}")
     if not text_norm:
         return ""
@@ -1620,7 +2224,7 @@ def internship_matching_text(title: str, desc: str) -> str:
     return re.sub(r"\s+", " ", text_norm).strip()
 
 
-def internship_student_only_detail(title: str, desc: str) -> str:
+def internship_student_only_detail(title: "str | JobTextView", desc: str = "") -> str:
     """
     Return blocking detail for student-only internships, else empty string.
     """
@@ -1628,33 +2232,34 @@ def internship_student_only_detail(title: str, desc: str) -> str:
     if not text:
         return ""
 
-    if any(keyword_hit(text, marker, boundary_only=True) for marker in INTERNSHIP_ALLOW_MARKERS):
+    if any_keyword_hit(text, INTERNSHIP_ALLOW_MARKERS):
         return ""
 
-    if any(keyword_hit(text, marker, boundary_only=True) for marker in INTERNSHIP_AGREEMENT_MARKERS):
+    if any_keyword_hit(text, INTERNSHIP_AGREEMENT_MARKERS):
         return "internship_agreement_required"
 
-    if any(keyword_hit(text, marker, boundary_only=True) for marker in INTERNSHIP_STUDENT_ONLY_MARKERS):
+    if any_keyword_hit(text, INTERNSHIP_STUDENT_ONLY_MARKERS):
         return "student_only_keyword"
 
-    if any(keyword_hit(text, marker, boundary_only=True) for marker in INTERNSHIP_THESIS_MARKERS):
+    if any_keyword_hit(text, INTERNSHIP_THESIS_MARKERS):
         return "thesis_keyword"
 
     return ""
 
 
-def internship_generic_detail(title: str, desc: str) -> str:
+def internship_generic_detail(title: "str | JobTextView", desc: str = "") -> str:
     """
     Return manual-review detail for generic internship wording (not explicit student-only).
     """
-    text = internship_matching_text(title, desc)
+    view = job_text_view(title, desc)
+    text = view.internship_text
     if not text:
         return ""
 
-    if any(keyword_hit(text, marker, boundary_only=True) for marker in INTERNSHIP_ALLOW_MARKERS):
+    if any_keyword_hit(text, INTERNSHIP_ALLOW_MARKERS):
         return ""
 
-    if internship_student_only_detail(title, desc):
+    if internship_student_only_detail(view):
         return ""
 
     if INTERNSHIP_STAGE_TOKEN_RE.search(text):
@@ -1666,11 +2271,11 @@ def internship_generic_detail(title: str, desc: str) -> str:
     return ""
 
 
-def is_internship_student_only(title: str, desc: str) -> bool:
+def is_internship_student_only(title: "str | JobTextView", desc: str = "") -> bool:
     return bool(internship_student_only_detail(title, desc))
 
 
-def detect_experience_requirement_details(title: str, desc: str) -> tuple[str, str, int | None]:
+def detect_experience_requirement_details(title: "str | JobTextView", desc: str = "") -> tuple[str, str, int | None]:
     """
     Detect explicit experience constraints.
     Returns (level, detail, years_required):
@@ -1678,15 +2283,14 @@ def detect_experience_requirement_details(title: str, desc: str) -> tuple[str, s
       - soft / soft_junior_title for 3-4 years
       - none for 0-1 or no signal
     """
-    title_norm = normalize_text(title or "")
-    text_norm = normalize_text(f"{title or ''} {desc or ''}")
+    view = job_text_view(title, desc)
+    title_norm = view.title_norm
+    text_norm = view.text_norm
     if not text_norm:
         return "none", "", None
 
-    has_junior_title = any(keyword_hit(title_norm, marker, boundary_only=True) for marker in EXPERIENCE_JUNIOR_TITLE_MARKERS)
-    has_junior_context = any(
-        keyword_hit(text_norm, marker, boundary_only=True) for marker in EXPERIENCE_JUNIOR_CONTEXT_MARKERS
-    )
+    has_junior_title = any_keyword_hit(title_norm, EXPERIENCE_JUNIOR_TITLE_MARKERS)
+    has_junior_context = any_keyword_hit(text_norm, EXPERIENCE_JUNIOR_CONTEXT_MARKERS)
 
     years_required, detail, is_range = _extract_years_required(text_norm)
     if years_required is not None:
@@ -1729,21 +2333,21 @@ def detect_experience_requirement_details(title: str, desc: str) -> tuple[str, s
             return "soft_junior_title", "years_required_conflict_but_junior_signals", years_from_phrase
         return "soft", soft_phrase, years_from_phrase
 
-    for marker in EXPERIENCE_SOFT_SIGNAL_PHRASES:
-        if keyword_hit(text_norm, marker, boundary_only=True):
-            if has_junior_context or has_junior_title:
-                return "soft_junior_title", "years_required_conflict_but_junior_signals", None
-            return "soft", marker, None
+    marker = _match_phrase_list(text_norm, EXPERIENCE_SOFT_SIGNAL_PHRASES)
+    if marker:
+        if has_junior_context or has_junior_title:
+            return "soft_junior_title", "years_required_conflict_but_junior_signals", None
+        return "soft", marker, None
 
     return "none", "", None
 
 
-def detect_experience_requirement(title: str, desc: str) -> tuple[str, str]:
+def detect_experience_requirement(title: "str | JobTextView", desc: str = "") -> tuple[str, str]:
     level, detail, _years_required = detect_experience_requirement_details(title, desc)
     return level, detail
 
 
-def extract_years_required(title: str, desc: str) -> int | None:
+def extract_years_required(title: "str | JobTextView", desc: str = "") -> int | None:
     _level, _detail, years_required = detect_experience_requirement_details(title, desc)
     return years_required
 
@@ -1754,17 +2358,10 @@ def is_disallowed_language(text: str) -> bool:
     if not blocked_codes:
         return False
 
-    try:
-        snippet = (text or "")[:800]
-        if not snippet.strip():
-            return False
-
-        lang = detect(snippet)
-        return lang in blocked_codes
-    except LangDetectException:
-        return False
-    except Exception:
+    if not isinstance(text, str):
         return False
+    # Pre-classified, seeded and memoized: the same text gets the same answer in every pass.
+    return detect_language(text) in blocked_codes
 
 
 def is_dutch(text: str) -> bool:
@@ -1772,10 +2369,11 @@ def is_dutch(text: str) -> bool:
     return is_disallowed_language(text)
 
 
-def training_program_relevant(title: str, desc: str) -> bool:
+def training_program_relevant(title: "str | JobTextView", desc: str = "") -> bool:
     """Allow trainee/graduate programs only when they look CS/IT-related."""
-    text = normalize((title or "") + " " + (desc or ""))
-    title_norm = normalize(title or "")
+    view = job_text_view(title, desc)
+    text = view.text_norm
+    title_norm = view.title_norm
     training_markers = [
         "graduate",
         "trainee",
@@ -1824,12 +2422,12 @@ def training_program_relevant(title: str, desc: str) -> bool:
         "cloud", "linux", "devops", "platform", "sre", "ict", "network", "infrastructure engineer",
         "system administrator", "systems administrator", "it support", "it infrastructure",
     ]
-    has_training_marker = any(keyword_hit(text, marker, boundary_only=True) for marker in training_markers)
+    has_training_marker = any_keyword_hit(text, training_markers)
     if not has_training_marker:
         return False
-    if any(keyword_hit(title_norm, sig, boundary_only=True) for sig in it_title_signals):
+    if any_keyword_hit(title_norm, it_title_signals):
         return True
-    return any(keyword_hit(text, marker, boundary_only=True) for marker in cs_markers)
+    return any_keyword_hit(text, cs_markers)
 
 
 ROLE_TITLE_FALLBACK_KEYWORDS = [
@@ -2201,90 +2799,92 @@ IT_TRACK_PRIORITY_BONUS = {
 }
 
 
-def infer_it_track(title: str, desc: str) -> tuple[str, list[str]]:
+def infer_it_track(title: "str | JobTextView", desc: str = "") -> tuple[str, list[str]]:
     """
     Tag broad IT family so the user can widen the search without losing structure.
     The rules are intentionally simple and title-biased.
     """
-    text = normalize_text(f"{title or ''} {desc or ''}")
+    text = job_text_view(title, desc).text_norm
     hits: list[str] = []
     if not text:
         return "other_it", hits
     for track, patterns in IT_TRACK_RULES:
-        local_hits = [pattern for pattern in patterns if keyword_hit(text, pattern, boundary_only=True)]
+        local_hits = matched_keywords(text, patterns)
         if local_hits:
             return track, local_hits[:4]
     return "other_it", hits
 
 
-def role_title_fallback_relevant(title: str) -> bool:
+def role_title_fallback_relevant(title: "str | JobTextView") -> bool:
     """
     Recover obvious IT support/sysadmin titles that miss strict required-keyword patterns.
     """
-    t = normalize(title or "")
-    if any(keyword_hit(t, kw, boundary_only=True) for kw in ROLE_TITLE_FALLBACK_KEYWORDS):
+    t = job_text_view(title).title_norm
+    if any_keyword_hit(t, ROLE_TITLE_FALLBACK_KEYWORDS):
         return True
     return any(re.search(pattern, t) is not None for pattern in ROLE_TITLE_FALLBACK_PATTERNS)
 
 
-def role_alias_safe_relevant(title: str, desc: str) -> bool:
+def role_alias_safe_relevant(title: "str | JobTextView", desc: str = "") -> bool:
     """
     Recover safe infra aliases without opening non-target industrial automation noise.
     """
-    title_norm = normalize_text(title or "")
-    text_norm = normalize_text(f"{title or ''} {desc or ''}")
+    view = job_text_view(title, desc)
+    title_norm = view.title_norm
+    text_norm = view.text_norm
     if not text_norm:
         return False
 
-    if any(keyword_hit(text_norm, bad, boundary_only=True) for bad in ROLE_ALIAS_INDUSTRIAL_BLOCKERS):
+    if any_keyword_hit(text_norm, ROLE_ALIAS_INDUSTRIAL_BLOCKERS):
         return False
 
-    alias_hits = [kw for kw in ROLE_ALIAS_SAFE_KEYWORDS if keyword_hit(title_norm, kw, boundary_only=True)]
+    alias_hits = matched_keywords(title_norm, ROLE_ALIAS_SAFE_KEYWORDS)
     if not alias_hits:
         return False
 
     # "Automation Engineer" is broad; keep it only when explicit infra/tooling signals exist.
     if "automation engineer" in alias_hits:
-        if not any(keyword_hit(text_norm, sig, boundary_only=True) for sig in ROLE_ALIAS_TECH_SIGNALS):
+        if not any_keyword_hit(text_norm, ROLE_ALIAS_TECH_SIGNALS):
             return False
 
     return True
 
 
-def _has_primary_role_title_signal(title: str) -> bool:
-    title_norm = normalize_text(title or "")
+def _has_primary_role_title_signal(title: "str | JobTextView") -> bool:
+    title_norm = job_text_view(title).title_norm
     if not title_norm:
         return False
-    return any(keyword_hit(title_norm, sig, boundary_only=True) for sig in ROLE_TITLE_PRIMARY_SIGNALS)
+    return any_keyword_hit(title_norm, ROLE_TITLE_PRIMARY_SIGNALS)
 
 
-def _required_keywords_match_reliably(title: str, desc: str) -> bool:
+def _required_keywords_match_reliably(title: "str | JobTextView", desc: str = "") -> bool:
     """
     Evaluate ROLE_REQUIRED_KEYWORDS with stricter evidence to avoid description-only noise.
     Rules:
     - title hit => accept (high confidence)
     - description-only hit => require concrete infra/tooling evidence
     """
-    title_norm = normalize_text(title or "")
-    desc_norm = normalize_text(desc or "")
-    full_text = normalize_text(f"{title or ''} {desc or ''}")
+    view = job_text_view(title, desc)
+    title_norm = view.title_norm
+    desc_norm = view.desc_norm
+    full_text = view.text_norm
     if not full_text:
         return False
 
-    required_hits = [kw for kw in ROLE_REQUIRED_KEYWORDS if keyword_hit(full_text, kw, boundary_only=True)]
+    required_hits = matched_keywords(full_text, ROLE_REQUIRED_KEYWORDS)
     if not required_hits:
         return False
 
     # Any required keyword explicitly in title is a strong positive signal,
     # unless the description reveals a non-IT technical domain.
-    if any(keyword_hit(title_norm, kw, boundary_only=True) for kw in required_hits):
-        has_industrial_noise = any(keyword_hit(desc_norm, bad, boundary_only=True) for bad in ROLE_ALIAS_INDUSTRIAL_BLOCKERS)
+    if any_keyword_hit(title_norm, required_hits):
+        has_industrial_noise = any_keyword_hit(desc_norm, ROLE_ALIAS_INDUSTRIAL_BLOCKERS)
         if not has_industrial_noise:
             return True
 
     # Description-only matches are accepted only when they look truly infra-focused.
-    has_infra_evidence = any(keyword_hit(desc_norm, sig, boundary_only=True) for sig in ROLE_DESC_INFRA_EVIDENCE)
-    has_industrial_noise = any(keyword_hit(desc_norm, bad, boundary_only=True) for bad in ROLE_ALIAS_INDUSTRIAL_BLOCKERS)
+    has_infra_evidence = any_keyword_hit(desc_norm, ROLE_DESC_INFRA_EVIDENCE)
+    has_industrial_noise = any_keyword_hit(desc_norm, ROLE_ALIAS_INDUSTRIAL_BLOCKERS)
     return bool(has_infra_evidence and not has_industrial_noise)
 
 
@@ -2355,25 +2955,29 @@ def _is_commercial_sales_role(title_norm: str, text_norm: str) -> bool:
         return False
     if any(marker in text_norm for marker in COMMERCIAL_FALSE_POSITIVE_MARKERS):
         return False
-    return any(keyword_hit(text_norm, marker, boundary_only=True) for marker in COMMERCIAL_SALES_MARKERS)
+    return any_keyword_hit(text_norm, COMMERCIAL_SALES_MARKERS)
+
 
+@lru_cache(maxsize=1024)
+def _boundary_keyword_pattern(keyword_norm: str) -> re.Pattern:
+    return re.compile(r"(?<![a-z0-9])" + re.escape(keyword_norm).replace(r"\ ", r"\s+") + r"(?![a-z0-9])")
 
-def forbidden_hit_in_desc(desc: str, bad: str) -> bool:
+
+def forbidden_hit_in_desc(desc: "str | JobTextView", bad: str) -> bool:
     """
     Return True only when a forbidden keyword appears in a high-signal role context in description:
     - very early in the text (summary zone), or
     - near role/position/responsibility cues.
     Stakeholder contexts ("team includes", "work with", ...) are ignored.
     """
-    desc_norm = normalize_text(desc or "")
-    bad_norm = normalize_text(bad or "").strip()
+    desc_norm = desc.desc_norm if isinstance(desc, JobTextView) else _match_text(desc)
+    bad_norm = _compiled_keyword(bad or "")[0]
     if not desc_norm or not bad_norm:
         return False
     if not keyword_hit(desc_norm, bad_norm, boundary_only=True):
         return False
 
-    bad_pattern = r"(?<![a-z0-9])" + re.escape(bad_norm).replace(r"\ ", r"\s+") + r"(?![a-z0-9])"
-    for match in re.finditer(bad_pattern, desc_norm):
+    for match in _boundary_keyword_pattern(bad_norm).finditer(desc_norm):
         start = match.start()
         end = match.end()
         local_window = desc_norm[max(0, start - 90) : min(len(desc_norm), end + 120)]
@@ -2387,23 +2991,24 @@ def forbidden_hit_in_desc(desc: str, bad: str) -> bool:
     return False
 
 
-def role_forbidden_reason(title: str, desc: str) -> str:
+def role_forbidden_reason(title: "str | JobTextView", desc: str = "") -> str:
     """
     Return forbidden-role detail when text clearly matches out-of-target role.
     Context-aware handling avoids tech false positives like Keycloak or service delivery wording.
     """
-    text_norm = normalize_text(f"{title or ''} {desc or ''}")
-    title_norm = normalize_text(title or "")
+    view = job_text_view(title, desc)
+    text_norm = view.text_norm
+    title_norm = view.title_norm
 
     for bad in ROLE_FORBIDDEN_KEYWORDS:
-        bad_norm = normalize_text(bad or "").strip()
+        bad_norm = _compiled_keyword(bad or "")[0]
         if not bad_norm or bad_norm in ROLE_FORBIDDEN_CONTEXT_SKIP:
             continue
         # Title hit is a high-confidence signal: block directly.
         if keyword_hit(title_norm, bad_norm, boundary_only=True):
             return bad_norm
         # Description hit needs stronger contextual evidence to avoid stakeholder false positives.
-        if forbidden_hit_in_desc(desc, bad_norm):
+        if forbidden_hit_in_desc(view, bad_norm):
             return bad_norm
 
     if _is_delivery_role(text_norm):
@@ -2413,42 +3018,43 @@ def role_forbidden_reason(title: str, desc: str) -> str:
     return ""
 
 
-def role_relevant(title: str, desc: str) -> bool:
+def role_relevant(title: "str | JobTextView", desc: str = "") -> bool:
     """Keep infra / cloud / devops roles, drop forbidden ones."""
-    text = normalize_text((title or "") + " " + (desc or ""))
-    title_norm = normalize_text(title or "")
+    view = job_text_view(title, desc)
+    text = view.text_norm
+    title_norm = view.title_norm
 
     # Block non-IT technical domains by title before any keyword check.
     if any(kw in title_norm for kw in TITLE_DOMAIN_BLOCKERS):
         return False
 
-    if role_forbidden_reason(title, desc):
+    if role_forbidden_reason(view):
         return False
 
     # Title-first positive signal for target roles.
-    if _has_primary_role_title_signal(title):
+    if _has_primary_role_title_signal(view):
         return True
 
     # Required keyword logic with extra description guardrails.
-    if _required_keywords_match_reliably(title, desc):
+    if _required_keywords_match_reliably(view):
         return True
 
     if ACTIVE_JOB_MODE == "speed":
-        if any(keyword_hit(text, kw, boundary_only=True) for kw in SPEED_ROLE_TARGETS):
+        if any_keyword_hit(text, SPEED_ROLE_TARGETS):
             return True
 
-    if training_program_relevant(title, desc):
+    if training_program_relevant(view):
         return True
 
-    if role_alias_safe_relevant(title, desc):
+    if role_alias_safe_relevant(view):
         return True
 
-    return role_title_fallback_relevant(title)
+    return role_title_fallback_relevant(view)
 
 
-def compute_junior_score(title: str, desc: str) -> int:
+def compute_junior_score(title: "str | JobTextView", desc: str = "") -> int:
     """Score junior-friendliness."""
-    text = normalize((title or "") + " " + (desc or ""))
+    text = job_text_view(title, desc).text_norm
     score = 0
 
     positive_patterns = [
@@ -2560,29 +3166,27 @@ HIRE_NEGATIVE_MARKERS = [
 
 
 def compute_hiring_likelihood_score(
-    title: str,
-    desc: str,
-    years_required: int | None,
-    experience_level: str,
+    title: "str | JobTextView",
+    desc: str = "",
+    years_required: int | None = None,
+    experience_level: str = "",
     language_need: dict | None = None,
 ) -> tuple[int, list[str]]:
     """
     Estimate how likely the role is to be realistically attainable for a junior profile.
     This score is intentionally separate from pure relevance score.
     """
-    text = normalize_text(f"{title or ''} {desc or ''}")
+    text = job_text_view(title, desc).text_norm
     score = 0
     reasons: list[str] = []
 
-    for marker in HIRE_POSITIVE_MARKERS:
-        if keyword_hit(text, marker, boundary_only=True):
-            score += 2
-            reasons.append(f"plus:{marker}")
+    for marker in matched_keywords(text, HIRE_POSITIVE_MARKERS):
+        score += 2
+        reasons.append(f"plus:{marker}")
 
-    for marker in HIRE_NEGATIVE_MARKERS:
-        if keyword_hit(text, marker, boundary_only=True):
-            score -= 2
-            reasons.append(f"minus:{marker}")
+    for marker in matched_keywords(text, HIRE_NEGATIVE_MARKERS):
+        score -= 2
+        reasons.append(f"minus:{marker}")
 
     if years_required is not None:
         if years_required <= 2:
@@ -2616,15 +3220,16 @@ def compute_hiring_likelihood_score(
     return score, reasons[:8]
 
 
-def compute_language_fit_score(title: str, desc: str) -> int:
+def compute_language_fit_score(title: "str | JobTextView", desc: str = "") -> int:
     """
     Return language fit in [0..2]:
       - 2: FR/EN acceptable (including English-only acceptable)
       - 1: FR/EN acceptable but Dutch appears as preference (plus/asset)
       - 0: blocked language (NL/DE) explicitly required
     """
-    text = f"{title or ''} {desc or ''}"
-    need = classify_language_need(text)
+    view = job_text_view(title, desc)
+    analysis = analyze_language(view.text)
+    need = analysis.need
     required = set(need.get("required_langs", set()))
     optional = set(need.get("optional_langs", set()))
 
@@ -2641,7 +3246,7 @@ def compute_language_fit_score(title: str, desc: str) -> int:
     if need.get("acceptable_without_dutch", False):
         return 2
 
-    norm = normalize_text(text)
+    norm = analysis.norm
     has_fr_or_en_signal = bool(_extract_language_codes(norm).intersection({"fr", "en"}))
     if has_fr_or_en_signal:
         return 2
@@ -2697,7 +3302,7 @@ _AFFILIATION_PREFIX_RE = re.compile(
 )
 
 
-def compute_company_sponsor_signal(company: str, desc: str) -> int:
+def compute_company_sponsor_signal(company: "str | JobTextView", desc: str = "") -> int:
     """
     +3 if the COMPANY FIELD matches a known sponsoring employer (word boundary).
     +3 if description has an affiliation phrase ("Part of Accenture") referencing a known company.
@@ -2705,8 +3310,9 @@ def compute_company_sponsor_signal(company: str, desc: str) -> int:
     +2 if description shows international/global scale signals.
     Range: [0, +5].
     """
-    company_norm = normalize_text(company or "").strip()
-    desc_norm = normalize_text(desc or "")
+    view = company if isinstance(company, JobTextView) else JobTextView(desc=desc, company=company)
+    company_norm = view.company_norm
+    desc_norm = view.desc_norm
     score = 0
 
     # Match company field — exact word-boundary, no tool false positives.
@@ -2732,31 +3338,31 @@ def compute_company_sponsor_signal(company: str, desc: str) -> int:
     return min(5, score)
 
 
-def compute_sponsorship_score(title: str, desc: str) -> int:
+def compute_sponsorship_score(title: "str | JobTextView", desc: str = "") -> int:
     """
     Detect sponsorship / relocation signals in job text.
     +ve = employer likely sponsors; -ve = explicitly no sponsorship.
     Range: [-10, +10]. 0 = no signal (most jobs).
     Negative phrases are checked first — if any match, no positive score is added.
     """
-    text = normalize_text(f"{title or ''} {desc or ''}")
+    text = job_text_view(title, desc).text_norm
     score = 0
     # Check negatives first — if any hard negative found, cap at -8
     neg_hit = False
     for phrase in SPONSORSHIP_NEGATIVE_PHRASES:
-        if normalize_text(phrase) in text:
+        if _match_text(phrase) in text:
             score -= 8
             neg_hit = True
     # Only add positive score if no explicit negation was found
     if not neg_hit:
         for phrase in SPONSORSHIP_POSITIVE_PHRASES:
-            if normalize_text(phrase) in text:
+            if _match_text(phrase) in text:
                 score += 5
     return max(-10, min(10, score))
 
 
 def compute_priority_score(
-    title: str,
+    title: "str | JobTextView",
     desc: str,
     loc: str,
     created: str,
@@ -2765,14 +3371,17 @@ def compute_priority_score(
     hiring_likelihood_score: int = 0,
     sponsorship_score: int = 0,
     company_sponsor_signal: int = 0,
+    include_recency: bool = True,
 ) -> int:
     """
     Rank jobs by apply-first priority.
     Higher means better fit for quick-entry hiring strategy.
+    include_recency=False leaves out the freshness bonus (see recency_priority_bonus).
     """
-    text = normalize((title or "") + " " + (desc or ""))
-    loc_norm = normalize(loc or "")
-    it_track, _track_hits = infer_it_track(title, desc)
+    view = title if isinstance(title, JobTextView) else JobTextView(title, desc, loc)
+    text = view.text_norm
+    loc_norm = view.loc_norm
+    it_track, _track_hits = infer_it_track(view)
     score = 50 + max(0, junior_score) * 2 + language_fit_score * 2
     # Blend in a bounded hiring-likelihood component so top rows are both relevant
     # and realistically attainable for junior applications.
@@ -2786,7 +3395,7 @@ def compute_priority_score(
     score += int(IT_TRACK_PRIORITY_BONUS.get(it_track, 0))
 
     for term, weight in ACTIVE_PRIORITY_TERMS.items():
-        if normalize(term) in text:
+        if _match_text(term) in text:
             score += int(weight)
 
     training_patterns = [
@@ -2803,7 +3412,7 @@ def compute_priority_score(
         if pat in text:
             score += 2
 
-    work_mode = detect_work_mode(title, desc, loc)
+    work_mode = detect_work_mode(view)
     if work_mode == "remote":
         score += 5
     elif work_mode == "hybrid":
@@ -2826,22 +3435,28 @@ def compute_priority_score(
         if any(term in loc_norm for term in romandie_terms):
             score += 5
 
-    # Prefer fresher offers when deciding what to apply first.
+    if include_recency:
+        score += recency_priority_bonus(created)
+
+    return int(score)
+
+
+def recency_priority_bonus(created: str) -> int:
+    """Prefer fresher offers when deciding what to apply first. The only time-dependent score part."""
     try:
         dt = datetime.fromisoformat(str(created).replace("Z", "+00:00")).astimezone(timezone.utc)
         age_days = (datetime.now(timezone.utc) - dt).days
-        if age_days <= 3:
-            score += 8
-        elif age_days <= 7:
-            score += 6
-        elif age_days <= 14:
-            score += 4
-        elif age_days <= 30:
-            score += 2
     except Exception:
-        pass
-
-    return int(score)
+        return 0
+    if age_days <= 3:
+        return 8
+    if age_days <= 7:
+        return 6
+    if age_days <= 14:
+        return 4
+    if age_days <= 30:
+        return 2
+    return 0
 
 
 def close_excel_for_locked_path(path: str) -> str:
@@ -2931,98 +3546,299 @@ def safe_save_csv(df, path, retry_delay=3, max_retries=3):
     print(f"[WARN] Could not write {path} after {max_retries} attempts. Saved to {backup} instead.")
 
 
-def passes_filters(job: dict, source: str = "adzuna", filter_mode: str = "") -> dict | None:
-    """Apply common filters and return normalized job if it passes."""
-    mode = resolve_filter_mode(filter_mode or ACTIVE_FILTER_MODE, allow_both=False)
-    created = job.get("created", "") or job.get("updated", "")
+def safe_save_table(df, path):
+    """Save a pipeline table: CSV export at path (Excel-lock safe) plus its Parquet copy."""
+    save_table(df, path, save_csv=safe_save_csv)
+
+
+class StageOutcome(NamedTuple):
+    stage: str
+    passed: bool
+    detail: str = ""
+    # Every match behind detail (all bad-title patterns, all hard exclude keywords).
+    hits: tuple[str, ...] = ()
+
+
+# passes_filters stages in report order (filter_impact, jobs_viewer, recheck fail reasons).
+FILTER_TRACE_STAGES = (
+    "description_length",
+    "bad_title",
+    "recency",
+    "location",
+    "role_relevant",
+    "internship_student_only",
+    "internship_generic",
+    "exclude_keywords",
+    "experience",
+    "blocked_language_requirement",
+    "blocked_language",
+    "junior_score",
+)
+FILTER_TRACE_ORDER = {stage: index for index, stage in enumerate(FILTER_TRACE_STAGES)}
 
-    loc = job.get("location", "")
-    if isinstance(loc, dict):
-        loc = loc.get("display_name", "")
-    if not loc:
-        loc = job.get("location.display_name", "")
-    loc = rule_plain_text(loc)
 
-    title = rule_plain_text(job.get("title", "") or "")
-    desc = rule_plain_text(job.get("description", "") or "")
-    url = job.get("redirect_url", "") or job.get("url", "") or job.get("link", "")
-    canonical_url = canonicalize_url(url)
+class FilterTrace:
+    """
+    Outcome of every passes_filters stage for one job, in FILTER_TRACE_STAGES order, as recorded
+    by evaluate_job_rules(trace=..., exhaustive=True) (plus evaluate_job's recency cut-off).
+    All stages are evaluated (no early stop), so one trace answers both "which stage dropped it"
+    (first_fail) and "what would each stage remove on its own" (stage(name).passed).
+    job is what passes_filters returns: the parsed job when every stage passes, else None.
+    """
 
-    company_val = job.get("company", "")
-    if isinstance(company_val, dict):
-        company = company_val.get("display_name", "") or company_val.get("name", "")
-    else:
-        company = company_val or job.get("company.display_name", "")
-    company = rule_plain_text(company)
+    __slots__ = ("filter_mode", "stages", "junior_score", "job")
+
+    def __init__(
+        self, filter_mode: str, stages: list[StageOutcome] | None = None, junior_score: int = 0, job: dict | None = None
+    ):
+        self.filter_mode = filter_mode
+        self.stages = stages if stages is not None else []
+        self.junior_score = junior_score
+        self.job = job
+
+    @property
+    def first_fail(self) -> StageOutcome | None:
+        return next((outcome for outcome in self.stages if not outcome.passed), None)
+
+    @property
+    def passed(self) -> bool:
+        return self.first_fail is None
+
+    def stage(self, name: str) -> StageOutcome:
+        return next(outcome for outcome in self.stages if outcome.stage == name)
+
+    def reached(self, name: str) -> bool:
+        """True when every stage before name passed (the early-stop chain evaluated it)."""
+        for outcome in self.stages:
+            if outcome.stage == name:
+                return True
+            if not outcome.passed:
+                return False
+        return False
 
-    if REQUIRE_DESCRIPTION and len(desc.strip()) < MIN_DESCRIPTION_CHARS:
-        return None
+    def record(self, stage: str, passed: bool, detail: str = "", hits: tuple[str, ...] = ()) -> None:
+        self.stages.append(StageOutcome(stage, bool(passed), detail, hits))
 
-    norm_title = normalize(title)
-    if any(bt in norm_title for bt in BAD_TITLE_KEYWORDS):
-        return None
 
-    _rule_norm, full_text = job_text_for_rules({"title": title, "description": desc})
-    work_mode = detect_work_mode(title, desc, loc)
-    experience_level, experience_detail, years_required = detect_experience_requirement_details(title, desc)
+NEAR_MISS_MIN_PRIORITY = 68
 
-    if not is_recent(created, MAX_DAYS_OLD):
-        return None
 
-    if not location_ok(loc, title, desc):
-        return None
+def evaluate_job_rules(
+    job: dict,
+    source: str = "adzuna",
+    filter_modes: tuple[str, ...] = ("strict", "broad"),
+    near_miss: bool = True,
+    trace: FilterTrace | None = None,
+    exhaustive: bool = False,
+) -> dict[str, dict | None]:
+    """
+    Evaluate one job once for several outputs, leaving out everything that depends on today's date.
+    The checks shared by strict, broad and the location-only near miss run a single time.
+    The recency cut-off, the freshness bonus of priority_score and the near-miss priority
+    threshold are applied by finalize_verdicts, so the result can be cached across days.
+    Returns {mode: parsed_job | None for each filter mode, "near_miss": parsed_job | None}.
+    With trace, every rejection stage records its outcome for filter_modes as it runs (a stage
+    passes when one of the modes survives it). exhaustive=True keeps evaluating the stages after
+    a failure, so the trace holds all of them; the verdicts are the same either way.
+    """
+    modes = tuple(resolve_filter_mode(mode, allow_both=False) for mode in filter_modes)
+    verdicts: dict[str, dict | None] = {mode: None for mode in modes}
+    if near_miss:
+        verdicts["near_miss"] = None
+    check_modes = modes
+    check_near_miss = near_miss
 
-    if not role_relevant(title, desc):
-        return None
+    created = job.get("created", "") or job.get("updated", "")
 
-    if is_internship_student_only(title, desc):
-        return None
+    view = JobTextView.from_job(job)
+    title, desc, loc, company = view.title, view.desc, view.loc, view.company
+    url = job.get("redirect_url", "") or job.get("url", "") or job.get("link", "")
+    canonical_url = canonicalize_url(url)
+
+    too_short = REQUIRE_DESCRIPTION and len(desc.strip()) < MIN_DESCRIPTION_CHARS
+    if trace is not None:
+        trace.record("description_length", not too_short, "description_too_short" if too_short else "")
+    if too_short:
+        if not exhaustive:
+            return verdicts
+        check_modes, check_near_miss = (), False
+
+    norm_title = view.title_norm
+    if trace is not None:
+        bad_titles = tuple(bt for bt in BAD_TITLE_KEYWORDS if bt in norm_title)
+        trace.record("bad_title", not bad_titles, bad_titles[0] if bad_titles else "", bad_titles)
+        bad_title = bool(bad_titles)
+    else:
+        bad_title = any(bt in norm_title for bt in BAD_TITLE_KEYWORDS)
+    if bad_title:
+        if not exhaustive:
+            return verdicts
+        check_modes, check_near_miss = (), False
+
+    full_text = view.full_text
+    work_mode = detect_work_mode(view)
+    experience_level, experience_detail, years_required = detect_experience_requirement_details(view)
+
+    # Filter modes need an acceptable location; the near miss needs a failing one.
+    location_passes = location_ok(view)
+    if trace is not None:
+        trace.record("location", location_passes, "" if location_passes else "location_blocked")
+    check_modes = check_modes if location_passes else ()
+    check_near_miss = check_near_miss and not location_passes
+    if not check_modes and not check_near_miss and not exhaustive:
+        return verdicts
+
+    relevant = role_relevant(view)
+    if trace is not None:
+        role_detail = ""
+        if not relevant:
+            forbidden = role_forbidden_reason(view)
+            role_detail = f"forbidden:{forbidden}" if forbidden else "missing_required"
+        trace.record("role_relevant", relevant, role_detail)
+    if not relevant:
+        if not exhaustive:
+            return verdicts
+        check_modes, check_near_miss = (), False
+
+    if trace is not None:
+        student_detail = internship_student_only_detail(view)
+        trace.record("internship_student_only", not student_detail, student_detail)
+        student_only = bool(student_detail)
+    else:
+        student_only = is_internship_student_only(view)
+    if student_only:
+        if not exhaustive:
+            return verdicts
+        check_modes, check_near_miss = (), False
     # Morocco queue quality improves materially if we drop generic internship wording
     # before ranking. These are rarely "apply now" targets for the intended profile,
     # even when they mention IT support tasks.
-    if ACTIVE_MARKET == "ma" and internship_generic_detail(title, desc):
-        return None
-
-    exclude_hard_hits, _exclude_soft_hits = classify_excluded_hits(title, full_text)
+    if (check_modes or trace is not None) and ACTIVE_MARKET == "ma":
+        generic_detail = internship_generic_detail(view)
+        if trace is not None:
+            trace.record("internship_generic", not generic_detail, generic_detail)
+        if generic_detail:
+            check_modes = ()
+            if not check_near_miss and not exhaustive:
+                return verdicts
+    elif trace is not None:
+        trace.record("internship_generic", True)
+
+    exclude_hard_hits, exclude_soft_hits = classify_excluded_hits(view)
+    if trace is not None:
+        exclude_detail = (
+            exclude_hard_hits[0] if exclude_hard_hits else f"soft:{exclude_soft_hits[0]}" if exclude_soft_hits else ""
+        )
+        trace.record("exclude_keywords", not exclude_hard_hits, exclude_detail, tuple(exclude_hard_hits))
     if exclude_hard_hits:
-        return None
-
-    if experience_level == "hard":
-        return None
+        if not exhaustive:
+            return verdicts
+        check_modes, check_near_miss = (), False
+
+    hard_experience = experience_level == "hard"
+    if trace is not None:
+        trace.record("experience", not hard_experience, normalize_text(experience_detail) if hard_experience else "")
+    if hard_experience:
+        if not exhaustive:
+            return verdicts
+        check_modes, check_near_miss = (), False
 
     # Keep two views:
     # - mode-aware reason for filtering decision
     # - strict reason for diagnostics/CSV transparency
-    blocked_language_reason = blocked_language_requirement_reason(full_text, filter_mode=mode)
     blocked_language_reason_strict = blocked_language_requirement_reason(full_text, filter_mode="strict")
     language_need = classify_language_need(full_text)
     language_review_reason = language_manual_review_reason(full_text)
-    if blocked_language_reason:
-        return None
+    language_ok_modes = tuple(
+        mode
+        for mode in (modes if trace is not None else check_modes)
+        if not blocked_language_requirement_reason(full_text, filter_mode=mode)
+    )
+    if trace is not None:
+        # The detail keeps the strict reason so broad traces still show it.
+        trace.record("blocked_language_requirement", bool(language_ok_modes), blocked_language_reason_strict)
+    check_modes = tuple(mode for mode in check_modes if mode in language_ok_modes)
+    check_near_miss = check_near_miss and not blocked_language_reason_strict
+    if not check_modes and not check_near_miss and not exhaustive:
+        return verdicts
 
     disallowed_language_detected = is_disallowed_language(full_text)
-    if mode == "strict" and disallowed_language_detected and language_review_reason != "language_alternative:dutch_preferred_or_learn":
-        return None
+    language_alternative = language_review_reason == "language_alternative:dutch_preferred_or_learn"
+    if trace is not None:
+        if not disallowed_language_detected:
+            trace.record("blocked_language", True)
+        elif any(mode != "strict" for mode in modes):
+            trace.record("blocked_language", True, "would_block_in_strict")
+        elif language_alternative:
+            trace.record("blocked_language", True, "language_alternative:dutch_preferred_or_learn")
+        else:
+            trace.record("blocked_language", False, "blocked_language_detected")
+    if disallowed_language_detected:
+        if not language_alternative:
+            check_modes = tuple(mode for mode in check_modes if mode != "strict")
+        check_near_miss = False
 
     # Autoriser les offres neutres (score >= 0) pour ne pas filtrer trop agressivement
-    junior_score = compute_junior_score(title, desc)
+    junior_score = compute_junior_score(view)
+    if trace is not None:
+        min_junior_score = min(0 if mode == "strict" else -1 for mode in modes) if modes else 0
+        junior_ok = junior_score >= min_junior_score
+        trace.record("junior_score", junior_ok, "" if junior_ok else f"junior_score<{min_junior_score}")
+        trace.junior_score = junior_score
     # Exclure les annonces au score clairement nÃƒÆ’Ã†â€™Ãƒâ€šÃ‚Â©gatif, garder neutre ou positif
-    min_junior_score = 0 if mode == "strict" else -1
-    if junior_score < min_junior_score:
-        return None
-    language_fit_score = compute_language_fit_score(title, desc)
-    it_track, it_track_hits = infer_it_track(title, desc)
+    check_modes = tuple(mode for mode in check_modes if junior_score >= (0 if mode == "strict" else -1))
+    check_near_miss = check_near_miss and junior_score >= 0
+    if not check_modes and not check_near_miss:
+        return verdicts
+
+    language_fit_score = compute_language_fit_score(view)
     hiring_likelihood_score, hiring_likelihood_reasons = compute_hiring_likelihood_score(
-        title=title,
-        desc=desc,
+        view,
         years_required=years_required,
         experience_level=experience_level,
         language_need=language_need,
     )
-    sponsorship_score = compute_sponsorship_score(title, desc)
-    company_sponsor_signal = compute_company_sponsor_signal(company, desc)
 
-    return {
+    if check_near_miss:
+        priority_score = compute_priority_score(
+            view,
+            desc,
+            loc,
+            created,
+            junior_score,
+            language_fit_score,
+            hiring_likelihood_score,
+            include_recency=False,
+        )
+        verdicts["near_miss"] = {
+            "title": title,
+            "company": company,
+            "location": loc,
+            "created": created,
+            "url": url,
+            "canonical_url": canonical_url,
+            "description": desc[:400],
+            "search_term": job.get("search_term", ""),
+            "junior_score": junior_score,
+            "language_fit_score": language_fit_score,
+            "hiring_likelihood_score": hiring_likelihood_score,
+            "hiring_likelihood_reasons": " | ".join(hiring_likelihood_reasons),
+            "priority_score": priority_score,
+            "is_remote": work_mode in {"remote", "hybrid"},
+            "work_mode": work_mode,
+            "years_required": years_required if years_required is not None else "",
+            "near_miss_reason": "location_only",
+            "source": source,
+        }
+
+    if not check_modes:
+        return verdicts
+
+    it_track, it_track_hits = infer_it_track(view)
+    sponsorship_score = compute_sponsorship_score(view)
+    company_sponsor_signal = compute_company_sponsor_signal(view)
+
+    parsed = {
         "title": title,
         "company": company,
         "location": loc,
@@ -3042,7 +3858,7 @@ def passes_filters(job: dict, source: str = "adzuna", filter_mode: str = "") ->
         "sponsorship_score": sponsorship_score,
         "company_sponsor_signal": company_sponsor_signal,
         "priority_score": compute_priority_score(
-            title,
+            view,
             desc,
             loc,
             created,
@@ -3051,6 +3867,7 @@ def passes_filters(job: dict, source: str = "adzuna", filter_mode: str = "") ->
             hiring_likelihood_score,
             sponsorship_score,
             company_sponsor_signal,
+            include_recency=False,
         ),
         "is_remote": work_mode in {"remote", "hybrid"},
         "work_mode": work_mode,
@@ -3069,20 +3886,431 @@ def passes_filters(job: dict, source: str = "adzuna", filter_mode: str = "") ->
         ),
         "language_need_signals": " | ".join(language_need.get("signals", [])),
         "disallowed_language_detected": disallowed_language_detected,
-        "filter_mode": mode,
-        "source": source,
     }
+    for mode in check_modes:
+        verdicts[mode] = {**parsed, "filter_mode": mode, "source": source}
+    return verdicts
+
+
+def finalize_verdicts(
+    rules: dict[str, dict | None],
+    created: str,
+    filter_modes: tuple[str, ...],
+    near_miss: bool = True,
+    near_miss_min_priority: int = NEAR_MISS_MIN_PRIORITY,
+) -> dict[str, dict | None]:
+    """
+    Turn evaluate_job_rules output into today's verdicts: add the freshness bonus to
+    priority_score and apply the near-miss priority threshold. rules={} rejects everything.
+    """
+    bonus = recency_priority_bonus(created) if rules else 0
+    verdicts: dict[str, dict | None] = {}
+    for mode in filter_modes:
+        row = rules.get(mode)
+        verdicts[mode] = {**row, "priority_score": row["priority_score"] + bonus} if row else None
+    if near_miss:
+        row = rules.get("near_miss")
+        priority_score = row["priority_score"] + bonus if row else 0
+        verdicts["near_miss"] = (
+            {**row, "priority_score": priority_score} if row and priority_score >= near_miss_min_priority else None
+        )
+    return verdicts
+
+
+def evaluate_job(
+    job: dict,
+    source: str = "adzuna",
+    filter_modes: tuple[str, ...] = ("strict", "broad"),
+    near_miss: bool = True,
+    near_miss_min_priority: int = NEAR_MISS_MIN_PRIORITY,
+) -> dict[str, dict | None]:
+    """
+    Evaluate one job once for several outputs (strict, broad, location-only near miss).
+    With a verdict cache enabled, a job already evaluated under the same rules skips the rules.
+    Returns {mode: parsed_job | None for each filter mode, "near_miss": parsed_job | None}.
+    """
+    modes = tuple(resolve_filter_mode(mode, allow_both=False) for mode in filter_modes)
+    created = job.get("created", "") or job.get("updated", "")
+    if not is_recent(created, MAX_DAYS_OLD):
+        rules = {}
+    elif VERDICT_CACHE is not None:
+        rules = cached_job_rules(job, source)
+    else:
+        rules = evaluate_job_rules(job, source=source, filter_modes=modes, near_miss=near_miss)
+    return finalize_verdicts(rules, created, modes, near_miss, near_miss_min_priority)
+
+
+# Module globals that never change a verdict: outputs, credentials, runtime handles and caches,
+# Excel unlock switches.
+FINGERPRINT_IGNORED_GLOBALS = {
+    "ACTIVE_FILTER_MODE",
+    "ACTIVE_OUTPUT_PATHS",
+    "ADZUNA_APP_ID",
+    "ADZUNA_APP_KEY",
+    "ADZUNA_INCREMENTAL_STOP_SEEN_RATIO",
+    "ADZUNA_JOURNAL_FIELDS",
+    "AUTO_CLOSE_EXCEL_ON_LOCK",
+    "BASE_URL",
+    "DEFAULT_REPLAY_CHUNK_SIZE",
+    "FORCE_KILL_EXCEL_ON_LOCK",
+    "KEYWORD_MATCHER",
+    "RULE_PROFILER",
+    "VERDICT_CACHE",
+    "_LANGUAGE_ANALYSIS_CACHE",
+    "_RULES_FINGERPRINT",
+}
+
+
+def _fingerprint_value(value: Any) -> Any:
+    """JSON-able, order-stable form of a rule constant."""
+    if isinstance(value, dict):
+        return [[str(key), _fingerprint_value(item)] for key, item in sorted(value.items(), key=lambda kv: str(kv[0]))]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_fingerprint_value(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint_value(item) for item in value]
+    if isinstance(value, re.Pattern):
+        return [value.pattern, value.flags]
+    return value
+
+
+def rules_fingerprint() -> str:
+    """
+    Hash of everything evaluate_job_rules depends on: the source of this module and config.py,
+    the active market profile and every rule constant (keyword lists, patterns, thresholds,
+    env overrides). Computed once per configure_market.
+    """
+    global _RULES_FINGERPRINT
+    if not _RULES_FINGERPRINT:
+        digest = hashlib.blake2b(digest_size=16)
+        here = os.path.dirname(os.path.abspath(__file__))
+        for path in (os.path.abspath(__file__), os.path.join(here, "config.py"), language_id.__file__):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        constants = {
+            name: _fingerprint_value(value)
+            for name, value in globals().items()
+            if name.isupper()
+            and name not in FINGERPRINT_IGNORED_GLOBALS
+            and isinstance(value, (str, int, float, bool, list, tuple, dict, set, frozenset, re.Pattern))
+        }
+        constants["ftfy_available"] = ftfy is not None
+        digest.update(json.dumps(constants, sort_keys=True, default=str).encode("utf-8"))
+        _RULES_FINGERPRINT = digest.hexdigest()
+    return _RULES_FINGERPRINT
+
+
+def verdict_cache_key(job: dict, source: str) -> str:
+    """Content hash of a raw job and its source; any edit to the posting yields a new key."""
+    payload = json.dumps([source, job], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cached_job_rules(job: dict, source: str) -> dict[str, dict | None]:
+    """evaluate_job_rules for every output, served from VERDICT_CACHE when possible."""
+    key = verdict_cache_key(job, source)
+    fingerprint = rules_fingerprint()
+    rules = VERDICT_CACHE.get(key, fingerprint)
+    if rules is None:
+        rules = evaluate_job_rules(job, source=source)
+        VERDICT_CACHE.put(key, fingerprint, rules)
+    return rules
+
+
+def enable_verdict_cache(path: str = "") -> VerdictCache:
+    """Cache evaluate_job verdicts in SQLite (default: the active market's verdict_cache_db)."""
+    global VERDICT_CACHE
+    close_verdict_cache()
+    VERDICT_CACHE = VerdictCache(path or ACTIVE_OUTPUT_PATHS["verdict_cache_db"])
+    return VERDICT_CACHE
+
+
+def close_verdict_cache() -> None:
+    """Flush and close the verdict cache, if enabled."""
+    global VERDICT_CACHE
+    if VERDICT_CACHE is None:
+        return
+    cache, VERDICT_CACHE = VERDICT_CACHE, None
+    print(f"[CACHE] Verdicts: hits={cache.hits} misses={cache.misses} -> {cache.path}")
+    cache.close()
+
+
+def rule_profile_stages() -> dict:
+    """
+    Rule stages timed by --profile-rules, in evaluate_job_rules order, with the predicate that
+    tells when a stage's result rejects the job (None: scoring/analysis only).
+    """
+    return {
+        "evaluate_job_rules": lambda verdicts: not any(verdicts.values()),
+        "is_recent": lambda recent: not recent,
+        "detect_work_mode": None,
+        "detect_experience_requirement_details": lambda details: details[0] == "hard",
+        "location_ok": lambda ok: not ok,
+        "role_relevant": lambda relevant: not relevant,
+        "role_forbidden_reason": bool,
+        "is_internship_student_only": bool,
+        "internship_generic_detail": bool,
+        "classify_excluded_hits": lambda hits: bool(hits[0]),
+        "blocked_language_requirement_reason": bool,
+        "classify_language_need": None,
+        "analyze_language": None,
+        "language_manual_review_reason": None,
+        "is_disallowed_language": bool,
+        "detect_language": None,
+        "compute_junior_score": lambda score: score < 0,
+        "compute_language_fit_score": None,
+        "compute_hiring_likelihood_score": None,
+        "infer_it_track": None,
+        "compute_sponsorship_score": None,
+        "compute_company_sponsor_signal": None,
+        "compute_priority_score": None,
+    }
+
+
+def enable_rule_profiler() -> RuleProfiler:
+    """Time every rule stage until close_rule_profiler (the stages run unwrapped otherwise)."""
+    global RULE_PROFILER
+    if RULE_PROFILER is None:
+        RULE_PROFILER = RuleProfiler()
+        RULE_PROFILER.instrument(sys.modules[__name__], rule_profile_stages())
+        RULE_PROFILER.instrument(
+            language_id, {"quick_language": None, "langdetect_language": None}, prefix="language_id."
+        )
+    return RULE_PROFILER
+
+
+def close_rule_profiler(path: str = "", meta: dict | None = None) -> None:
+    """Unwrap the rule stages, print the per-stage table and save the JSON report to path."""
+    global RULE_PROFILER
+    if RULE_PROFILER is None:
+        return
+    profiler, RULE_PROFILER = RULE_PROFILER, None
+    profiler.restore()
+    rows = profiler.report()
+    for line in profiler.format_table(rows):
+        print(f"[PROFILE] {line}")
+    for row in rows[:3]:
+        for slow in row["slowest"][:2]:
+            print(f"[PROFILE] slowest {row['stage']}: {slow['ms']:.1f}ms {slow['input']}")
+    if path:
+        profiler.save(path, meta)
+        print(f"[PROFILE] Rule profile saved: {path}")
+
+
+def passes_filters(
+    job: dict, source: str = "adzuna", filter_mode: str = "", trace: bool = False
+) -> "dict | FilterTrace | None":
+    """
+    Apply common filters and return normalized job if it passes.
+    With trace=True, return the FilterTrace of every stage instead (its .job is the same result).
+    """
+    mode = resolve_filter_mode(filter_mode or ACTIVE_FILTER_MODE, allow_both=False)
+    if not trace:
+        return evaluate_job(job, source=source, filter_modes=(mode,), near_miss=False)[mode]
+    # One rules evaluation that records every stage; evaluate_job's recency cut-off is added here.
+    created = job.get("created", "") or job.get("updated", "")
+    recent = is_recent(created, MAX_DAYS_OLD)
+    job_trace = FilterTrace(mode)
+    job_trace.record("recency", recent, "" if recent else "too_old")
+    rules = evaluate_job_rules(
+        job, source=source, filter_modes=(mode,), near_miss=False, trace=job_trace, exhaustive=True
+    )
+    job_trace.stages.sort(key=lambda outcome: FILTER_TRACE_ORDER[outcome.stage])
+    job_trace.job = finalize_verdicts(rules if recent else {}, created, (mode,), near_miss=False)[mode]
+    return job_trace
+
+
+def _init_filter_worker(market: str, ch_focus: str) -> None:
+    """Process-pool initializer: configure the parent's market once per worker."""
+    global VERDICT_CACHE
+    configure_market(market, ch_focus)
+    # Only the parent process reads and writes the verdict cache.
+    VERDICT_CACHE = None
+
+
+def _filter_job_chunk(
+    items: list[tuple[dict, str]], filter_modes: tuple[str, ...], near_miss: bool = False
+) -> list[dict[str, dict | None]]:
+    """Run evaluate_job_rules on each (job, source) pair, in order."""
+    return [
+        evaluate_job_rules(job, source=job_source, filter_modes=filter_modes, near_miss=near_miss)
+        for job, job_source in items
+    ]
 
 
-def build_filtered_df(all_jobs: list[dict], filter_mode: str, source: str = "adzuna") -> pd.DataFrame:
+def filter_worker_pool(workers: int):
+    """Process pool for filter_jobs(executor=...): each worker configures the active market once."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_filter_worker,
+        initargs=(ACTIVE_MARKET, ACTIVE_CH_FOCUS),
+    )
+
+
+def filter_jobs(
+    all_jobs: list[dict],
+    filter_modes: list[str],
+    source: str | None = "adzuna",
+    workers: int = 1,
+    near_miss: bool = False,
+    executor=None,
+) -> dict[str, list[dict]]:
+    """
+    Run evaluate_job over all_jobs for each filter mode in a single traversal.
+    source=None uses each job's own `source` field (merged rows).
+    near_miss=True also collects location-only near misses under the "near_miss" key.
+    With a verdict cache enabled, only recent jobs missing from the cache go through the rules.
+    workers > 1 shards those jobs across a process pool; each worker configures the active market
+    once at startup, and results keep all_jobs order whatever the worker count. Callers filtering
+    many batches can pass executor=filter_worker_pool(workers) to reuse one pool.
+    Returns: {mode: [parsed_job, ...]}
+    """
+    modes = tuple(resolve_filter_mode(mode, allow_both=False) for mode in filter_modes)
+    keys = modes + (("near_miss",) if near_miss else ())
+    # Profiled rules run in this process, where the stage wrappers are installed.
+    workers = max(1, int(workers or 1)) if RULE_PROFILER is None else 1
+    cache = VERDICT_CACHE
+    fingerprint = rules_fingerprint() if cache is not None else ""
+
+    created_by_job = [job.get("created", "") or job.get("updated", "") for job in all_jobs]
+    rules_by_job: list[dict] = [{} for _ in all_jobs]
+    cache_keys: dict[int, str] = {}
+    pending: list[int] = []
+    for index, job in enumerate(all_jobs):
+        if not is_recent(created_by_job[index], MAX_DAYS_OLD):
+            continue
+        if cache is not None:
+            job_source = source if source is not None else job.get("source", "merged")
+            cache_keys[index] = verdict_cache_key(job, job_source)
+            cached = cache.get(cache_keys[index], fingerprint)
+            if cached is not None:
+                rules_by_job[index] = cached
+                continue
+        pending.append(index)
+
+    # Cached verdicts must cover every output, whatever this run asked for.
+    eval_modes, eval_near_miss = (("strict", "broad"), True) if cache is not None else (modes, near_miss)
+    items = [
+        (all_jobs[index], source if source is not None else all_jobs[index].get("source", "merged"))
+        for index in pending
+    ]
+    if workers == 1 or len(items) < 2:
+        evaluated = _filter_job_chunk(items, eval_modes, eval_near_miss)
+    else:
+        # Several chunks per worker keeps the pool busy when some jobs are much slower than others.
+        chunk_size = max(1, -(-len(items) // (workers * 4)))
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+        evaluated = []
+        pool = executor or filter_worker_pool(workers)
+        try:
+            for chunk_rules in pool.map(
+                _filter_job_chunk,
+                chunks,
+                [eval_modes] * len(chunks),
+                [eval_near_miss] * len(chunks),
+            ):
+                evaluated.extend(chunk_rules)
+        finally:
+            if executor is None:
+                pool.shutdown()
+    for index, rules in zip(pending, evaluated):
+        rules_by_job[index] = rules
+    if cache is not None:
+        cache.put_many(((cache_keys[index], rules) for index, rules in zip(pending, evaluated)), fingerprint)
+        cache.flush()
+
+    results: dict[str, list[dict]] = {key: [] for key in keys}
+    for rules, created in zip(rules_by_job, created_by_job):
+        job_verdicts = finalize_verdicts(rules, created, modes, near_miss)
+        for key in keys:
+            if job_verdicts[key]:
+                results[key].append(job_verdicts[key])
+    return results
+
+
+def build_filtered_df(
+    all_jobs: list[dict],
+    filter_mode: str,
+    source: str = "adzuna",
+    workers: int = 1,
+) -> pd.DataFrame:
     """Apply filtering + dedup + sorting for one filter mode."""
-    filtered = []
     resolved_mode = resolve_filter_mode(filter_mode, allow_both=False)
-    for job in all_jobs:
-        parsed = passes_filters(job, source=source, filter_mode=resolved_mode)
-        if parsed:
-            filtered.append(parsed)
+    filtered = filter_jobs(all_jobs, [resolved_mode], source=source, workers=workers)[resolved_mode]
+    return filtered_rows_to_df(filtered, resolved_mode)
 
+
+# Raw rows filtered per block when a fetched run replays its freshly compacted raw table.
+DEFAULT_REPLAY_CHUNK_SIZE = 5000
+
+
+def replay_raw_table(
+    raw_path: str,
+    filter_modes: list[str],
+    near_miss: bool,
+    chunk_size: int,
+    workers: int = 1,
+) -> dict[str, RowSpool]:
+    """
+    Raw table replay (every fetched run, or --no-fetch with --replay-chunk-size) that reads it
+    chunk_size rows at a time and spools the rows each chunk keeps, so memory follows the chunk
+    size instead of the archive size.
+    Returns a RowSpool per output ({mode: ..., "near_miss": ...}), deduplicated and sorted like
+    filtered_rows_to_df when saved.
+    """
+    spools = {mode: RowSpool(FILTERED_DEDUP_COLUMNS, FILTERED_SORT_COLUMNS) for mode in filter_modes}
+    if near_miss:
+        spools["near_miss"] = RowSpool(FILTERED_DEDUP_COLUMNS, NEAR_MISS_SORT_COLUMNS)
+    executor = filter_worker_pool(workers) if workers > 1 else None
+    replayed = 0
+    try:
+        for chunk in iter_table_chunks(raw_path, chunk_size):
+            jobs = chunk.to_dict(orient="records")
+            del chunk
+            kept = filter_jobs(
+                jobs, filter_modes, source="adzuna", workers=workers, near_miss=near_miss, executor=executor
+            )
+            for key, rows in kept.items():
+                spools[key].extend(rows)
+            replayed += len(jobs)
+            print(f"[INFO] Replayed {replayed} raw rows ({', '.join(f'{k}={len(v)}' for k, v in spools.items())})")
+    except BaseException:
+        for spool in spools.values():
+            spool.close()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return spools
+
+
+def save_filtered_spool(spool: RowSpool, filter_mode: str, paths: list[str]) -> int:
+    """Save a replayed filter mode to each of paths; the spool counterpart of filtered_rows_to_df."""
+    resolved_mode = resolve_filter_mode(filter_mode, allow_both=False)
+    if not len(spool):
+        df_f = filtered_rows_to_df([], resolved_mode)
+        for path in paths:
+            safe_save_table(df_f, path)
+        return 0
+    order = spool.order()
+    print(f"[INFO] [{resolved_mode}] Duplicates removed: {len(spool) - len(order)}")
+    print(f"[INFO] [{resolved_mode}] Filtered kept: {len(order)}")
+    for path in paths:
+        spool.save(path)
+    return len(order)
+
+
+# Filtered and near-miss outputs: duplicate key, and sort columns (all descending).
+FILTERED_DEDUP_COLUMNS = ["canonical_url", "title", "company"]
+FILTERED_SORT_COLUMNS = ["hiring_likelihood_score", "priority_score", "junior_score", "created"]
+NEAR_MISS_SORT_COLUMNS = ["priority_score", "language_fit_score", "junior_score", "created"]
+
+
+def filtered_rows_to_df(filtered: list[dict], filter_mode: str) -> pd.DataFrame:
+    """Dedup + sort rows kept by passes_filters for one filter mode."""
+    resolved_mode = resolve_filter_mode(filter_mode, allow_both=False)
     df_f = pd.DataFrame(filtered)
     before = len(df_f)
     if "canonical_url" not in df_f.columns:
@@ -3091,8 +4319,8 @@ def build_filtered_df(all_jobs: list[dict], filter_mode: str, source: str = "adz
         else:
             df_f["canonical_url"] = ""
     if not df_f.empty:
-        df_f = df_f.drop_duplicates(subset=["canonical_url", "title", "company"])
-        sort_cols = [c for c in ["hiring_likelihood_score", "priority_score", "junior_score", "created"] if c in df_f.columns]
+        df_f = df_f.drop_duplicates(subset=FILTERED_DEDUP_COLUMNS)
+        sort_cols = [c for c in FILTERED_SORT_COLUMNS if c in df_f.columns]
         if sort_cols:
             df_f = df_f.sort_values(by=sort_cols, ascending=[False] * len(sort_cols))
     after = len(df_f)
@@ -3101,114 +4329,55 @@ def build_filtered_df(all_jobs: list[dict], filter_mode: str, source: str = "adz
     return df_f
 
 
-def near_miss_location_only(job: dict, min_priority: int = 68, source: str = "adzuna") -> dict | None:
+def near_miss_location_only(
+    job: dict, min_priority: int = NEAR_MISS_MIN_PRIORITY, source: str = "adzuna"
+) -> dict | None:
     """
     Return job if it fails only location filter but is otherwise a strong candidate.
     Useful to manually review potentially relevant opportunities.
     """
-    created = job.get("created", "") or job.get("updated", "")
-
-    loc = job.get("location", "")
-    if isinstance(loc, dict):
-        loc = loc.get("display_name", "")
-    if not loc:
-        loc = job.get("location.display_name", "")
-    loc = rule_plain_text(loc)
-
-    title = rule_plain_text(job.get("title", "") or "")
-    desc = rule_plain_text(job.get("description", "") or "")
-    url = job.get("redirect_url", "") or job.get("url", "") or job.get("link", "")
-    canonical_url = canonicalize_url(url)
-
-    company_val = job.get("company", "")
-    if isinstance(company_val, dict):
-        company = company_val.get("display_name", "") or company_val.get("name", "")
-    else:
-        company = company_val or job.get("company.display_name", "")
-    company = rule_plain_text(company)
-
-    if REQUIRE_DESCRIPTION and len(desc.strip()) < MIN_DESCRIPTION_CHARS:
-        return None
-
-    norm_title = normalize(title)
-    if any(bt in norm_title for bt in BAD_TITLE_KEYWORDS):
-        return None
-
-    _rule_norm, full_text = job_text_for_rules({"title": title, "description": desc})
-    work_mode = detect_work_mode(title, desc, loc)
-    experience_level, _experience_detail, years_required = detect_experience_requirement_details(title, desc)
-
-    if not is_recent(created, MAX_DAYS_OLD):
-        return None
-
-    # Must fail location to be considered a location-only near miss.
-    if location_ok(loc, title, desc):
-        return None
-
-    if not role_relevant(title, desc):
-        return None
-
-    if is_internship_student_only(title, desc):
-        return None
-
-    exclude_hard_hits, _exclude_soft_hits = classify_excluded_hits(title, full_text)
-    if exclude_hard_hits:
-        return None
-
-    if experience_level == "hard":
-        return None
-
-    language_need = classify_language_need(full_text)
-    if blocked_language_requirement_reason(full_text):
-        return None
+    return evaluate_job(job, source=source, filter_modes=(), near_miss=True, near_miss_min_priority=min_priority)[
+        "near_miss"
+    ]
 
-    if is_disallowed_language(full_text):
-        return None
 
-    junior_score = compute_junior_score(title, desc)
-    if junior_score < 0:
-        return None
+def build_keyword_matcher() -> KeywordMatcher:
+    """Compile every rule keyword list (active market lists included) into one matcher."""
+    keyword_lists = [
+        EXCLUDE_KEYWORDS,
+        ROLE_REQUIRED_KEYWORDS,
+        ROLE_FORBIDDEN_KEYWORDS,
+        SPEED_ROLE_TARGETS,
+        HIRE_POSITIVE_MARKERS,
+        HIRE_NEGATIVE_MARKERS,
+        REMOTE_TERMS,
+        HYBRID_TERMS,
+        ONSITE_TERMS,
+        LEAD_TITLE_MARKERS,
+        INTERNSHIP_ALLOW_MARKERS,
+        INTERNSHIP_AGREEMENT_MARKERS,
+        INTERNSHIP_STUDENT_ONLY_MARKERS,
+        INTERNSHIP_THESIS_MARKERS,
+        EXPERIENCE_JUNIOR_TITLE_MARKERS,
+        EXPERIENCE_JUNIOR_CONTEXT_MARKERS,
+        EXPERIENCE_SOFT_SIGNAL_PHRASES,
+        EXPERIENCE_HARD_BLOCK_PHRASES,
+        EXPERIENCE_SOFT_BLOCK_PHRASES,
+        ROLE_TITLE_FALLBACK_KEYWORDS,
+        ROLE_ALIAS_SAFE_KEYWORDS,
+        ROLE_ALIAS_TECH_SIGNALS,
+        ROLE_ALIAS_INDUSTRIAL_BLOCKERS,
+        ROLE_TITLE_PRIMARY_SIGNALS,
+        ROLE_DESC_INFRA_EVIDENCE,
+        COMMERCIAL_SALES_MARKERS,
+    ]
+    keyword_lists.extend(LANGUAGE_TERMS.values())
+    keyword_lists.extend(patterns for _, patterns in IT_TRACK_RULES)
+    return KeywordMatcher(kw for keywords in keyword_lists for kw in keywords)
 
-    language_fit_score = compute_language_fit_score(title, desc)
-    hiring_likelihood_score, hiring_likelihood_reasons = compute_hiring_likelihood_score(
-        title=title,
-        desc=desc,
-        years_required=years_required,
-        experience_level=experience_level,
-        language_need=language_need,
-    )
-    priority_score = compute_priority_score(
-        title,
-        desc,
-        loc,
-        created,
-        junior_score,
-        language_fit_score,
-        hiring_likelihood_score,
-    )
-    if priority_score < min_priority:
-        return None
 
-    return {
-        "title": title,
-        "company": company,
-        "location": loc,
-        "created": created,
-        "url": url,
-        "canonical_url": canonical_url,
-        "description": desc[:400],
-        "search_term": job.get("search_term", ""),
-        "junior_score": junior_score,
-        "language_fit_score": language_fit_score,
-        "hiring_likelihood_score": hiring_likelihood_score,
-        "hiring_likelihood_reasons": " | ".join(hiring_likelihood_reasons),
-        "priority_score": priority_score,
-        "is_remote": work_mode in {"remote", "hybrid"},
-        "work_mode": work_mode,
-        "years_required": years_required if years_required is not None else "",
-        "near_miss_reason": "location_only",
-        "source": source,
-    }
+# Runs after every rule keyword list above exists, since it builds KEYWORD_MATCHER.
+configure_market()
 
 
 def main():
@@ -3239,6 +4408,58 @@ def main():
         action="store_true",
         help="Ne pas appeler l'API, utiliser uniquement le CSV brut existant",
     )
+    parser.add_argument(
+        "--replay-chunk-size",
+        type=int,
+        default=None,
+        help=(
+            "Filter the raw file N rows at a time instead of loading it whole (0 = off). "
+            f"Defaults to {DEFAULT_REPLAY_CHUNK_SIZE} after a fetch, off with --no-fetch."
+        ),
+    )
+    parser.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=0,
+        help="Concurrent Adzuna search terms (default: market profile adzuna_fetch_concurrency).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Fetch newest postings first and stop paging a term at already-seen ids "
+            "(market adzuna_seen_ids_json); new rows are merged into the raw file."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue today's fetch journal: pages an interrupted run already fetched are not requested again.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Filter jobs with N worker processes (default: 1, in-process).",
+    )
+    parser.add_argument(
+        "--verdict-cache",
+        default="",
+        help="SQLite verdict cache (default: market verdict_cache_db). Unchanged jobs skip the rules.",
+    )
+    parser.add_argument(
+        "--no-verdict-cache",
+        action="store_true",
+        help="Evaluate every job from scratch.",
+    )
+    parser.add_argument(
+        "--profile-rules",
+        action="store_true",
+        help=(
+            "Time each filter rule stage (also JOB_PROFILE_RULES=1) and save a report next to the outputs. "
+            "Combine with --no-verdict-cache to time every job."
+        ),
+    )
     parser.add_argument(
         "--self-test-exclude-keywords",
         action="store_true",
@@ -3279,76 +4500,120 @@ def main():
         f"filter_mode={selected_filter_mode}"
     )
 
+    # Strict, broad and near-miss verdicts come from one evaluation pass over the raw jobs.
+    # Near misses remain strict-only signal (best for manual review).
+    filter_modes = ["strict", "broad"] if selected_filter_mode == "both" else [selected_filter_mode]
+    want_near_miss = selected_filter_mode in ("strict", "both")
+    profile_rules = profiling_requested(args.profile_rules)
+    profile_meta = {"script": "adzuna_fetch", "market": ACTIVE_MARKET, "filter_mode": selected_filter_mode}
+    workers = args.workers
+    if profile_rules and workers > 1:
+        print("[INFO] Rule profiling runs the filters in-process (workers=1).")
+        workers = 1
     all_jobs = []
 
-    if args.no_fetch:
-        if not os.path.exists(adzuna_raw_csv):
-            print(f"[ERROR] Fichier brut introuvable: {adzuna_raw_csv}")
-            return
-        print("[INFO] Chargement du fichier brut existant...")
-        df_raw = pd.read_csv(adzuna_raw_csv)
-        all_jobs = df_raw.to_dict(orient="records")
-    else:
+    if not args.no_fetch:
         if not ACTIVE_MARKET_PROFILE.get("supports_adzuna", True):
             raise RuntimeError(f"Adzuna fetch is not supported for market '{ACTIVE_MARKET}'.")
         require_adzuna_credentials()
-        for term in search_terms:
-            print(f"[INFO] Searching for: {term}")
-            page_count = PAGES_PER_TERM.get(term, DEFAULT_PAGES)
-
-            for page in range(1, page_count + 1):
-                data = fetch_adzuna_page(page, term, RESULTS_PER_PAGE)
-                if not data:
-                    continue
-
-                results = data.get("results", [])
-                if not results:
-                    break
-
-                for job in results:
-                    job["search_term"] = term
-
-                all_jobs.extend(results)
-                time.sleep(1)
+        saved = fetch_raw_table(
+            search_terms,
+            adzuna_raw_csv,
+            concurrency=args.fetch_concurrency,
+            incremental=args.incremental,
+            resume=args.resume,
+        )
+        print(f"[INFO] Raw saved: {saved}")
+
+    replay_chunk_size = args.replay_chunk_size
+    if replay_chunk_size is None:
+        # The fetched raw table was compacted from the journal a block at a time; filter it the same way.
+        replay_chunk_size = 0 if args.no_fetch else DEFAULT_REPLAY_CHUNK_SIZE
+    if replay_chunk_size > 0:
+        if table_source(adzuna_raw_csv) is None:
+            print(f"[ERROR] Fichier brut introuvable: {adzuna_raw_csv}")
+            return
+        print(f"[INFO] Replay du fichier brut par blocs de {replay_chunk_size} lignes...")
+        if not args.no_verdict_cache:
+            enable_verdict_cache(args.verdict_cache)
+        if profile_rules:
+            enable_rule_profiler()
+        try:
+            spools = replay_raw_table(
+                adzuna_raw_csv, filter_modes, want_near_miss, replay_chunk_size, workers=workers
+            )
+        finally:
+            close_verdict_cache()
+            close_rule_profiler(ACTIVE_OUTPUT_PATHS["rule_profile_json"], profile_meta)
+        try:
+            if "strict" in spools:
+                strict_paths = [adzuna_filtered_strict_csv, adzuna_filtered_csv]
+                kept = save_filtered_spool(spools["strict"], "strict", strict_paths)
+                print(f"[INFO] Strict filtered saved: {kept}")
+            if "broad" in spools:
+                broad_paths = [adzuna_filtered_broad_csv] + (
+                    [adzuna_filtered_csv] if selected_filter_mode == "broad" else []
+                )
+                kept = save_filtered_spool(spools["broad"], "broad", broad_paths)
+                print(f"[INFO] Broad filtered saved: {kept}")
+            if want_near_miss:
+                if len(spools["near_miss"]):
+                    kept = spools["near_miss"].save(near_miss_csv)
+                else:
+                    kept = 0
+                    safe_save_table(pd.DataFrame([]), near_miss_csv)
+                print(f"[INFO] Near-miss (location-only) saved: {kept} -> {near_miss_csv}")
+            else:
+                print("[INFO] Near-miss skipped in broad mode (strict-only signal).")
+        finally:
+            for spool in spools.values():
+                spool.close()
+        return
 
-        df_raw = pd.json_normalize(all_jobs)
-        safe_save_csv(df_raw, adzuna_raw_csv)
-        print(f"[INFO] Raw saved: {len(df_raw)}")
+    if table_source(adzuna_raw_csv) is None:
+        print(f"[ERROR] Fichier brut introuvable: {adzuna_raw_csv}")
+        return
+    if args.no_fetch:
+        print("[INFO] Chargement du fichier brut existant...")
+    # Only reached with --replay-chunk-size 0: the raw table is filtered in one piece.
+    df_raw = read_table(adzuna_raw_csv)
+    all_jobs = df_raw.to_dict(orient="records")
+
+    if not args.no_verdict_cache:
+        enable_verdict_cache(args.verdict_cache)
+    if profile_rules:
+        enable_rule_profiler()
+    filtered_by_mode = filter_jobs(all_jobs, filter_modes, source="adzuna", workers=workers, near_miss=want_near_miss)
+    close_verdict_cache()
+    close_rule_profiler(ACTIVE_OUTPUT_PATHS["rule_profile_json"], profile_meta)
 
     if selected_filter_mode in ("strict", "both"):
-        df_strict = build_filtered_df(all_jobs, filter_mode="strict", source="adzuna")
-        safe_save_csv(df_strict, adzuna_filtered_strict_csv)
-        safe_save_csv(df_strict, adzuna_filtered_csv)
+        df_strict = filtered_rows_to_df(filtered_by_mode["strict"], "strict")
+        safe_save_table(df_strict, adzuna_filtered_strict_csv)
+        safe_save_table(df_strict, adzuna_filtered_csv)
         print(f"[INFO] Strict filtered saved: {len(df_strict)}")
     else:
         df_strict = None
 
     if selected_filter_mode in ("broad", "both"):
-        df_broad = build_filtered_df(all_jobs, filter_mode="broad", source="adzuna")
-        safe_save_csv(df_broad, adzuna_filtered_broad_csv)
+        df_broad = filtered_rows_to_df(filtered_by_mode["broad"], "broad")
+        safe_save_table(df_broad, adzuna_filtered_broad_csv)
         if selected_filter_mode == "broad":
-            safe_save_csv(df_broad, adzuna_filtered_csv)
+            safe_save_table(df_broad, adzuna_filtered_csv)
         print(f"[INFO] Broad filtered saved: {len(df_broad)}")
     else:
         df_broad = None
 
-    # Near misses remain strict-only signal (best for manual review).
-    if selected_filter_mode in ("strict", "both"):
-        near_miss = []
-        for job in all_jobs:
-            parsed = near_miss_location_only(job, min_priority=68, source="adzuna")
-            if parsed:
-                near_miss.append(parsed)
-
-        df_nm = pd.DataFrame(near_miss)
+    if want_near_miss:
+        df_nm = pd.DataFrame(filtered_by_mode["near_miss"])
         if not df_nm.empty:
             if "canonical_url" not in df_nm.columns:
                 df_nm["canonical_url"] = df_nm["url"].fillna("").astype(str).str.split("?", n=1).str[0]
-            df_nm = df_nm.drop_duplicates(subset=["canonical_url", "title", "company"])
-            sort_cols_nm = [c for c in ["priority_score", "language_fit_score", "junior_score", "created"] if c in df_nm.columns]
+            df_nm = df_nm.drop_duplicates(subset=FILTERED_DEDUP_COLUMNS)
+            sort_cols_nm = [c for c in NEAR_MISS_SORT_COLUMNS if c in df_nm.columns]
             if sort_cols_nm:
                 df_nm = df_nm.sort_values(by=sort_cols_nm, ascending=[False] * len(sort_cols_nm))
-        safe_save_csv(df_nm, near_miss_csv)
+        safe_save_table(df_nm, near_miss_csv)
         print(f"[INFO] Near-miss (location-only) saved: {len(df_nm)} -> {near_miss_csv}")
     else:
         print("[INFO] Near-miss skipped in broad mode (strict-only signal).")
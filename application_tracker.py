@@ -16,10 +16,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
-from pandas.errors import EmptyDataError
 
-from adzuna_fetch import configure_market, safe_save_csv
+from adzuna_fetch import configure_market, safe_save_table
 from config import SUPPORTED_CH_FOCUS, SUPPORTED_MARKETS, get_market_profile, get_output_paths
+from table_storage import read_table, table_source
 
 
 VALID_STATUSES = [
@@ -38,15 +38,6 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
-def safe_read_csv(path: str) -> pd.DataFrame:
-    if not os.path.exists(path):
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(path)
-    except EmptyDataError:
-        return pd.DataFrame()
-
-
 def make_job_id(canonical_url: str, title: str, company: str) -> str:
     raw = f"{canonical_url or ''}|{title or ''}|{company or ''}"
     return hashlib.sha1(raw.encode("utf-8", errors="ignore")).hexdigest()[:14]
@@ -56,12 +47,13 @@ def choose_input_csv(paths: dict) -> str:
     candidates = [paths["merged_filtered_csv"], paths["adzuna_filtered_csv"]]
     existing: list[tuple[str, float]] = []
     for path in candidates:
-        if not os.path.exists(path):
+        source = table_source(path)
+        if source is None:
             continue
         try:
-            if os.path.getsize(path) <= 0:
+            if os.path.getsize(source) <= 0:
                 continue
-            existing.append((path, os.path.getmtime(path)))
+            existing.append((path, os.path.getmtime(source)))
         except OSError:
             continue
     if not existing:
@@ -99,6 +91,22 @@ def ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
+# Job columns copied into the tracker; descriptions are never loaded.
+SYNC_JOB_COLUMNS = [
+    "title",
+    "company",
+    "canonical_url",
+    "url",
+    "location",
+    "created",
+    "search_term",
+    "source",
+    "priority_score",
+    "language_fit_score",
+    "junior_score",
+]
+
+
 def sync_tracker(market: str, ch_focus: str, input_csv: str = "", tracker_csv: str = ""):
     configure_market(market, ch_focus)
     profile = get_market_profile(market, ch_focus)
@@ -106,7 +114,7 @@ def sync_tracker(market: str, ch_focus: str, input_csv: str = "", tracker_csv: s
     input_path = input_csv or choose_input_csv(paths)
     tracker_path = tracker_csv or focused_path(paths["applications_tracker_csv"], market, profile["ch_focus"])
 
-    jobs = safe_read_csv(input_path)
+    jobs = read_table(input_path, columns=SYNC_JOB_COLUMNS)
     if jobs.empty:
         print(f"[TRACKER] No jobs found in {input_path}")
         return
@@ -147,7 +155,7 @@ def sync_tracker(market: str, ch_focus: str, input_csv: str = "", tracker_csv: s
     base_cols = [c for c in base_cols if c in jobs.columns]
     tracker_new = jobs[base_cols].copy()
 
-    tracker_old = ensure_cols(safe_read_csv(tracker_path))
+    tracker_old = ensure_cols(read_table(tracker_path))
     if not tracker_old.empty and "job_id" in tracker_old.columns:
         keep_old = [
             "job_id",
@@ -180,7 +188,7 @@ def sync_tracker(market: str, ch_focus: str, input_csv: str = "", tracker_csv: s
     out_dir = os.path.dirname(tracker_path)
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
-    safe_save_csv(tracker_new, tracker_path)
+    safe_save_table(tracker_new, tracker_path)
     print(
         f"[TRACKER] Synced market={market} ch_focus={profile['ch_focus']} "
         f"input={input_path} rows={len(tracker_new)} saved={tracker_path}"
@@ -201,7 +209,7 @@ def update_tracker(
     paths = get_output_paths(market)
     profile = get_market_profile(market, ch_focus)
     tracker_path = tracker_csv or focused_path(paths["applications_tracker_csv"], market, profile["ch_focus"])
-    tracker = ensure_cols(safe_read_csv(tracker_path))
+    tracker = ensure_cols(read_table(tracker_path))
     if tracker.empty:
         print(f"[TRACKER] Tracker is empty: {tracker_path}. Run sync first.")
         return
@@ -231,7 +239,7 @@ def update_tracker(
         tracker.loc[mask, "applied_date"] = applied_date
 
     tracker.loc[mask, "last_updated"] = now_iso()
-    safe_save_csv(tracker, tracker_path)
+    safe_save_table(tracker, tracker_path)
     print(f"[TRACKER] Updated {job_id} in {tracker_path}")
 
 
@@ -240,7 +248,7 @@ def show_tracker(market: str, ch_focus: str, status: str = "", top_n: int = 20,
     profile = get_market_profile(market, ch_focus)
     paths = get_output_paths(market)
     tracker_path = tracker_csv or focused_path(paths["applications_tracker_csv"], market, profile["ch_focus"])
-    tracker = ensure_cols(safe_read_csv(tracker_path))
+    tracker = ensure_cols(read_table(tracker_path))
     if tracker.empty:
         print(f"[TRACKER] Tracker empty: {tracker_path}")
         return
@@ -13,20 +13,24 @@ from __future__ import annotations
 import argparse
 import hashlib
 import os
+import re
 import unicodedata
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
+import numpy as np
 import pandas as pd
-from pandas.errors import EmptyDataError
 
-from adzuna_fetch import configure_market, safe_save_csv
+from adzuna_fetch import configure_market, safe_save_table
 from config import SUPPORTED_CH_FOCUS, SUPPORTED_MARKETS, get_market_profile, get_output_paths
+from table_storage import read_table, table_source
 
 
 CLOSED_STATUSES = {"applied", "interview", "offer", "rejected", "withdrawn", "not_interested"}
 POSITIVE_FEEDBACK_STATUSES = {"interview", "offer"}
 NEGATIVE_FEEDBACK_STATUSES = {"rejected", "not_interested", "withdrawn"}
+# Tracker columns the queue uses: status merge plus company/term feedback.
+TRACKER_QUEUE_COLUMNS = ["job_id", "status", "applied_date", "notes", "follow_up_date", "company", "search_term"]
 
 MA_LOCATION_FOCUS_CLUSTERS = {
     "rabat": ["rabat", "sale", "sale ", "salé", "technopolis", "skhirat", "temara", "temara", "témara"],
@@ -46,6 +50,56 @@ def _normalize_match_text(*values: str) -> str:
     return " ".join(folded.lower().split())
 
 
+def _column(df: pd.DataFrame, col: str, default="") -> pd.Series:
+    """df[col], or default on every row when the column is missing (like row.get(col, default))."""
+    if col in df.columns:
+        return df[col]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def _per_value(values: pd.Series, compute: Callable[[pd.Series], pd.Series | pd.DataFrame]):
+    """
+    compute() on the distinct values of a column only, spread back over its rows.
+    Titles, companies, locations and terms repeat a lot across a filtered table.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    result = compute(pd.Series(np.asarray(uniques, dtype=object), dtype=object))
+    spread = result.iloc[codes]
+    spread.index = values.index
+    return spread
+
+
+def _contains_any(texts: pd.Series, markers: Iterable[str]) -> pd.Series:
+    """any(marker in text for marker in markers) for every text, in one regex pass."""
+    markers = list(markers)
+    if not markers:
+        return pd.Series(False, index=texts.index)
+    return texts.str.contains("|".join(re.escape(marker) for marker in markers), regex=True)
+
+
+def _marker_flags(values: pd.Series, marker_groups: dict[str, list[str]]) -> pd.DataFrame:
+    """One boolean column per marker group: the group's markers found in _normalize_match_text(value)."""
+    texts = values.map(_normalize_match_text)
+    return pd.DataFrame({name: _contains_any(texts, markers) for name, markers in marker_groups.items()})
+
+
+def _join_labels(labels: list[tuple[pd.Series, object]], index: pd.Index, limit: int, sep: str) -> pd.Series:
+    """
+    Column-wise sep.join(reasons[:limit]): labels are (mask, label) pairs in reason order,
+    label being a string or a per-row Series.
+    """
+    joined = np.full(len(index), "", dtype=object)
+    taken = np.zeros(len(index), dtype=int)
+    for mask, label in labels:
+        rows = np.flatnonzero(mask.to_numpy(dtype=bool) & (taken < limit))
+        if not len(rows):
+            continue
+        label_values = label.to_numpy(dtype=object)[rows] if isinstance(label, pd.Series) else label
+        joined[rows] = np.where(taken[rows] > 0, joined[rows] + sep, "") + label_values
+        taken[rows] += 1
+    return pd.Series(joined, index=index, dtype=object)
+
+
 def resolve_location_focus_terms(location_focus: str, market: str) -> list[str]:
     focus = _normalize_match_text(location_focus)
     if not focus:
@@ -65,6 +119,19 @@ def location_matches_focus(location: str, location_focus: str, market: str, is_r
     return any(term in loc_norm for term in terms)
 
 
+def location_focus_mask(jobs: pd.DataFrame, location_focus: str, market: str) -> pd.Series:
+    """location_matches_focus for every row of jobs."""
+    terms = resolve_location_focus_terms(location_focus, market)
+    if not terms:
+        return pd.Series(True, index=jobs.index)
+    mask = _per_value(
+        _column(jobs, "location"), lambda locations: _contains_any(locations.map(_normalize_match_text), terms)
+    )
+    if market == "ma" and _normalize_match_text(location_focus) == "rabat_or_remote":
+        mask |= _column(jobs, "is_remote", False).astype(bool)
+    return mask
+
+
 def location_focus_path(path: str, location_focus: str) -> str:
     focus = _normalize_match_text(location_focus)
     if not focus:
@@ -170,6 +237,53 @@ def compute_market_queue_adjustment(row: pd.Series, market_profile: dict) -> tup
     return penalty, " | ".join(reasons[:4]), force_review
 
 
+def market_queue_adjustments(jobs: pd.DataFrame, market_profile: dict) -> pd.DataFrame:
+    """
+    compute_market_queue_adjustment for every row of jobs, column-wise.
+    Returns queue_adjustment, queue_adjustment_reasons and force_review columns.
+    """
+    market = str(market_profile.get("market", "") or "").strip().lower()
+    if market != "ma":
+        return pd.DataFrame(
+            {"queue_adjustment": 0, "queue_adjustment_reasons": "", "force_review": False}, index=jobs.index
+        )
+
+    allowed_languages = {str(code or "").strip().lower() for code in market_profile.get("allowed_language_codes", [])}
+    language_markers = {
+        f"language:{code}": markers
+        for code, markers in MA_NON_TARGET_LANGUAGE_MARKERS.items()
+        if code not in allowed_languages
+    }
+    # Language markers hold no spaces, so matching title, description and company one by one
+    # is the same as matching their normalized concatenation.
+    title_flags = _per_value(
+        _column(jobs, "title"),
+        lambda titles: _marker_flags(titles, {**language_markers, **MA_FORCE_REVIEW_TITLE_MARKERS}),
+    )
+    language_flags = title_flags[list(language_markers)]
+    for col in ["description", "company"]:
+        flags = _per_value(_column(jobs, col), lambda values: _marker_flags(values, language_markers))
+        language_flags = language_flags | flags.to_numpy()
+
+    labels: list[tuple[pd.Series, str]] = [(language_flags[name], name) for name in language_markers]
+    language_hits = len(labels)
+    labels += [(title_flags[reason], reason) for reason in MA_FORCE_REVIEW_TITLE_MARKERS]
+
+    penalty = pd.Series(0, index=jobs.index)
+    force_review = pd.Series(False, index=jobs.index)
+    for position, (mask, _) in enumerate(labels):
+        penalty -= mask.astype(int) * (12 if position < language_hits else 10)
+        force_review |= mask
+    return pd.DataFrame(
+        {
+            "queue_adjustment": penalty.clip(lower=-30),
+            "queue_adjustment_reasons": _join_labels(labels, jobs.index, 4, " | "),
+            "force_review": force_review,
+        },
+        index=jobs.index,
+    )
+
+
 def market_apply_now_allowed(row: pd.Series, market_profile: dict) -> tuple[bool, str]:
     """
     Gate the small `apply_now` bucket with higher confidence rules.
@@ -196,6 +310,28 @@ def market_apply_now_allowed(row: pd.Series, market_profile: dict) -> tuple[bool
     return False, "title_not_specific_enough"
 
 
+def market_apply_now_gate_reasons(jobs: pd.DataFrame, market_profile: dict) -> pd.Series:
+    """Reason from market_apply_now_allowed for every row of jobs ("" when apply_now is allowed)."""
+    market = str(market_profile.get("market", "") or "").strip().lower()
+    if market != "ma":
+        return pd.Series("", index=jobs.index, dtype=object)
+
+    def gate(titles: pd.Series) -> pd.Series:
+        title_norm = titles.map(_normalize_match_text)
+        reasons = np.select(
+            [
+                title_norm.eq(""),
+                _contains_any(title_norm, MA_GENERIC_TITLE_MARKERS),
+                _contains_any(title_norm, [*MA_APPLY_NOW_TITLE_SIGNALS, "junior"]),
+            ],
+            ["empty_title", "generic_language_title", ""],
+            default="title_not_specific_enough",
+        )
+        return pd.Series(reasons, index=titles.index, dtype=object)
+
+    return _per_value(_column(jobs, "title"), gate)
+
+
 def _status_outcome_weight(status: str) -> int:
     """
     Lightweight outcome weighting from tracker statuses.
@@ -224,32 +360,20 @@ def build_feedback_maps(tracker_df: pd.DataFrame) -> tuple[dict[str, int], dict[
     if tracker_df.empty:
         return {}, {}
 
-    by_company: dict[str, list[int]] = {}
-    by_term: dict[str, list[int]] = {}
-    for _, row in tracker_df.iterrows():
-        status = _normalize_text_key(row.get("status", ""))
-        weight = _status_outcome_weight(status)
-        if weight == 0:
-            continue
-
-        company_key = _normalize_text_key(row.get("company", ""))
-        term_key = _normalize_text_key(row.get("search_term", ""))
+    weights = _column(tracker_df, "status").map(lambda status: _status_outcome_weight(_normalize_text_key(status)))
+    outcomes = tracker_df[weights != 0]
+    weights = weights[weights != 0]
 
-        if company_key:
-            by_company.setdefault(company_key, []).append(weight)
-        if term_key:
-            by_term.setdefault(term_key, []).append(weight)
-
-    def aggregate(values: list[int]) -> int:
-        if not values:
-            return 0
+    def aggregate(col: str) -> dict[str, int]:
+        keys = _column(outcomes, col).map(_normalize_text_key)
+        grouped = weights[keys != ""].groupby(keys[keys != ""], sort=False).agg(["sum", "count"])
         # Use mean-like score and cap to avoid overpowering current relevance.
-        score = round(sum(values) / max(1, len(values)))
-        return int(max(-4, min(4, score)))
+        return {
+            key: int(max(-4, min(4, round(total / max(1, count)))))
+            for key, total, count in zip(grouped.index, grouped["sum"], grouped["count"])
+        }
 
-    company_scores = {k: aggregate(v) for k, v in by_company.items() if v}
-    term_scores = {k: aggregate(v) for k, v in by_term.items() if v}
-    return company_scores, term_scores
+    return aggregate("company"), aggregate("search_term")
 
 
 def compute_feedback_score(
@@ -268,30 +392,62 @@ def compute_feedback_score(
     return score, " | ".join(notes)
 
 
+def feedback_scores(
+    jobs: pd.DataFrame, company_scores: dict[str, int], term_scores: dict[str, int]
+) -> pd.DataFrame:
+    """compute_feedback_score for every row of jobs: feedback_score and feedback_signals columns."""
+    c_scores = _per_value(
+        _column(jobs, "company"), lambda names: names.map(_normalize_text_key).map(company_scores).fillna(0).astype(int)
+    )
+    t_scores = _per_value(
+        _column(jobs, "search_term"), lambda terms: terms.map(_normalize_text_key).map(term_scores).fillna(0).astype(int)
+    )
+    # Feedback maps only hold non-empty keys, so a non-zero score implies a key.
+    signals = _join_labels(
+        [
+            (c_scores != 0, "company:" + c_scores.astype(str)),
+            (t_scores != 0, "term:" + t_scores.astype(str)),
+        ],
+        jobs.index,
+        2,
+        " | ",
+    )
+    return pd.DataFrame(
+        {"feedback_score": (c_scores + t_scores).clip(-6, 6), "feedback_signals": signals}, index=jobs.index
+    )
+
+
 def make_job_id(canonical_url: str, title: str, company: str) -> str:
     raw = f"{canonical_url or ''}|{title or ''}|{company or ''}"
     return hashlib.sha1(raw.encode("utf-8", errors="ignore")).hexdigest()[:14]
 
 
-def safe_read_csv(path: str) -> pd.DataFrame:
-    if not os.path.exists(path):
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(path)
-    except EmptyDataError:
-        return pd.DataFrame()
+def make_job_ids(jobs: pd.DataFrame) -> pd.Series:
+    """make_job_id for every row of jobs: canonical_url (else url) + title + company."""
+    keys = [
+        f"{canonical or url}|{title}|{company}"
+        for canonical, url, title, company in zip(
+            jobs["canonical_url"].tolist(), jobs["url"].tolist(), jobs["title"].tolist(), jobs["company"].tolist()
+        )
+    ]
+    return pd.Series(
+        [hashlib.sha1(key.encode("utf-8", errors="ignore")).hexdigest()[:14] for key in keys],
+        index=jobs.index,
+        dtype=object,
+    )
 
 
 def choose_input_csv(paths: dict) -> str:
     candidates = [paths["merged_filtered_csv"], paths["adzuna_filtered_csv"]]
     existing: list[tuple[str, float]] = []
     for path in candidates:
-        if not os.path.exists(path):
+        source = table_source(path)
+        if source is None:
             continue
         try:
-            if os.path.getsize(path) <= 0:
+            if os.path.getsize(source) <= 0:
                 continue
-            existing.append((path, os.path.getmtime(path)))
+            existing.append((path, os.path.getmtime(source)))
         except OSError:
             continue
     if not existing:
@@ -307,6 +463,24 @@ def focused_path(path: str, market: str, ch_focus: str) -> str:
     return str(p.with_name(f"{p.stem}_{ch_focus}{p.suffix}"))
 
 
+ROMANDIE_LOCATION_MARKERS = [
+    "geneve",
+    "geneva",
+    "lausanne",
+    "vaud",
+    "neuchatel",
+    "jura",
+    "fribourg",
+    "valais",
+    "sion",
+    "nyon",
+    "montreux",
+    "morges",
+    "gland",
+    "yverdon",
+]
+
+
 def build_reason(row: pd.Series, market_profile: dict) -> str:
     reasons: list[str] = []
     if bool(row.get("is_remote", False)):
@@ -327,23 +501,7 @@ def build_reason(row: pd.Series, market_profile: dict) -> str:
         reasons.append(f"term:{search_term}")
 
     loc = str(row.get("location", "") or "").lower()
-    romandie_markers = [
-        "geneve",
-        "geneva",
-        "lausanne",
-        "vaud",
-        "neuchatel",
-        "jura",
-        "fribourg",
-        "valais",
-        "sion",
-        "nyon",
-        "montreux",
-        "morges",
-        "gland",
-        "yverdon",
-    ]
-    if any(m in loc for m in romandie_markers):
+    if any(m in loc for m in ROMANDIE_LOCATION_MARKERS):
         reasons.append("romandie")
 
     if market_profile.get("ch_focus") == "romandie" and "romandie" not in reasons:
@@ -358,6 +516,34 @@ def build_reason(row: pd.Series, market_profile: dict) -> str:
     return ", ".join(reasons[:4]) if reasons else "priority-ranked"
 
 
+def _truncated(values: pd.Series) -> pd.Series:
+    """int(value) for numeric columns, without the per-row conversion."""
+    return np.trunc(pd.to_numeric(values, errors="coerce").fillna(0))
+
+
+def build_reasons(jobs: pd.DataFrame, market_profile: dict) -> pd.Series:
+    """build_reason for every row of jobs."""
+    search_terms = _per_value(_column(jobs, "search_term"), lambda terms: terms.map(lambda term: str(term or "").strip()))
+    romandie = _per_value(
+        _column(jobs, "location"),
+        lambda locations: _contains_any(locations.map(lambda loc: str(loc or "").lower()), ROMANDIE_LOCATION_MARKERS),
+    )
+    feedback = _truncated(_column(jobs, "feedback_score", 0))
+    labels = [
+        (_column(jobs, "is_remote", False).astype(bool), "remote/hybrid"),
+        (_truncated(_column(jobs, "sponsorship_score", 0)) > 0, "sponsors-visa"),
+        (_truncated(_column(jobs, "language_fit_score", 0)) > 0, "language-fit"),
+        (_truncated(_column(jobs, "junior_score", 0)) >= 2, "junior-friendly"),
+        (search_terms != "", "term:" + search_terms),
+        (romandie, "romandie"),
+        (~romandie & (market_profile.get("ch_focus") == "romandie"), "swiss-wide"),
+        (feedback > 0, "historical-fit+"),
+        (feedback < 0, "historical-fit-"),
+    ]
+    reasons = _join_labels(labels, jobs.index, 4, ", ")
+    return reasons.mask(reasons == "", "priority-ranked")
+
+
 def normalize_status_col(status_values: Iterable) -> list[str]:
     out = []
     for s in status_values:
@@ -366,55 +552,26 @@ def normalize_status_col(status_values: Iterable) -> list[str]:
     return out
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Build top apply queue from filtered jobs.")
-    parser.add_argument(
-        "--market",
-        choices=SUPPORTED_MARKETS,
-        default="",
-        help="Market mode (be|ch). Defaults to JOB_MARKET env var or be.",
-    )
-    parser.add_argument(
-        "--ch-focus",
-        choices=SUPPORTED_CH_FOCUS,
-        default="",
-        help="CH focus mode (all|romandie). Defaults to JOB_CH_FOCUS env var or all.",
-    )
-    parser.add_argument("--input-csv", default="", help="Optional override input CSV path.")
-    parser.add_argument("--output-csv", default="", help="Optional override apply queue output CSV.")
-    parser.add_argument(
-        "--location-focus",
-        default="",
-        help="Optional location cluster filter (e.g. rabat, casablanca, tanger).",
-    )
-    parser.add_argument("--top-n", type=int, default=20, help="Max jobs to keep in apply queue.")
-    parser.add_argument(
-        "--min-priority",
-        type=int,
-        default=68,
-        help="Minimum priority score for apply_now recommendation.",
-    )
-    parser.add_argument(
-        "--include-closed",
-        action="store_true",
-        help="Include already closed statuses (applied/interview/rejected/etc.).",
-    )
-    args = parser.parse_args()
-
-    market = configure_market(args.market, args.ch_focus)
-    market_profile = get_market_profile(market, args.ch_focus)
-    paths = get_output_paths(market)
-
-    input_csv = args.input_csv or choose_input_csv(paths)
-    base_output_csv = args.output_csv or focused_path(paths["apply_queue_csv"], market, market_profile["ch_focus"])
-    output_csv = location_focus_path(base_output_csv, args.location_focus)
-    tracker_csv = focused_path(paths["applications_tracker_csv"], market, market_profile["ch_focus"])
+def _normalize_status_values(statuses: pd.Series) -> pd.Series:
+    return pd.Series(normalize_status_col(statuses), index=statuses.index, dtype=object)
 
-    jobs = safe_read_csv(input_csv)
-    if jobs.empty:
-        print(f"[QUEUE] No jobs found in {input_csv}")
-        return
 
+def rank_jobs(
+    jobs: pd.DataFrame,
+    tracker: pd.DataFrame,
+    company_feedback: dict[str, int],
+    term_feedback: dict[str, int],
+    market: str,
+    market_profile: dict,
+    min_priority: int = 68,
+    include_closed: bool = False,
+    location_focus: str = "",
+) -> pd.DataFrame:
+    """
+    Score, gate and rank filtered jobs for the apply queue (best first, per-company cap applied).
+    Every step works on whole columns; returns an empty frame when location_focus matches nothing.
+    """
+    jobs = jobs.copy()
     for col in ["title", "company", "canonical_url", "url", "created"]:
         if col not in jobs.columns:
             jobs[col] = ""
@@ -429,22 +586,13 @@ def main():
     if "search_term" not in jobs.columns:
         jobs["search_term"] = ""
 
-    jobs["job_id"] = jobs.apply(
-        lambda r: make_job_id(
-            str(r.get("canonical_url", "") or r.get("url", "")),
-            str(r.get("title", "")),
-            str(r.get("company", "")),
-        ),
-        axis=1,
-    )
+    jobs["job_id"] = make_job_ids(jobs)
 
-    tracker = safe_read_csv(tracker_csv)
-    company_feedback, term_feedback = build_feedback_maps(tracker)
     if not tracker.empty and "job_id" in tracker.columns:
         tracker = tracker.copy()
         if "status" not in tracker.columns:
             tracker["status"] = "to_apply"
-        tracker["status"] = normalize_status_col(tracker["status"])
+        tracker["status"] = _per_value(tracker["status"], _normalize_status_values)
         keep_cols = [c for c in ["job_id", "status", "applied_date", "notes", "follow_up_date"] if c in tracker.columns]
         jobs = jobs.merge(tracker[keep_cols], on="job_id", how="left")
     else:
@@ -453,37 +601,23 @@ def main():
         jobs["notes"] = ""
         jobs["follow_up_date"] = ""
 
-    jobs["status"] = normalize_status_col(jobs["status"])
-    if not args.include_closed:
+    jobs["status"] = _per_value(jobs["status"], _normalize_status_values)
+    if not include_closed:
         jobs = jobs[~jobs["status"].isin(CLOSED_STATUSES)].copy()
-    if args.location_focus:
+    if location_focus:
         before_focus = len(jobs)
-        jobs = jobs[
-            jobs.apply(
-                lambda row: location_matches_focus(
-                    row.get("location", ""),
-                    args.location_focus,
-                    market,
-                    bool(row.get("is_remote", False)),
-                ),
-                axis=1,
-            )
-        ].copy()
+        jobs = jobs[location_focus_mask(jobs, location_focus, market)].copy()
         print(
-            f"[QUEUE] Location focus={args.location_focus} matched {len(jobs)}/{before_focus} rows "
+            f"[QUEUE] Location focus={location_focus} matched {len(jobs)}/{before_focus} rows "
             f"(market={market})"
         )
         if jobs.empty:
-            print(f"[QUEUE] No jobs found for location focus '{args.location_focus}' in {input_csv}")
-            return
+            return jobs
 
     # Apply a light feedback loop from historical outcomes.
-    feedback_pairs = jobs.apply(
-        lambda r: compute_feedback_score(r, company_feedback, term_feedback),
-        axis=1,
-    )
-    jobs["feedback_score"] = feedback_pairs.map(lambda x: x[0])
-    jobs["feedback_signals"] = feedback_pairs.map(lambda x: x[1])
+    feedback = feedback_scores(jobs, company_feedback, term_feedback)
+    jobs["feedback_score"] = feedback["feedback_score"]
+    jobs["feedback_signals"] = feedback["feedback_signals"]
     if "hiring_likelihood_score" not in jobs.columns:
         jobs["hiring_likelihood_score"] = 0
     if "sponsorship_score" not in jobs.columns:
@@ -492,25 +626,20 @@ def main():
     jobs["hiring_likelihood_score"] = pd.to_numeric(jobs["hiring_likelihood_score"], errors="coerce").fillna(0)
     jobs["sponsorship_score"] = pd.to_numeric(jobs["sponsorship_score"], errors="coerce").fillna(0)
     jobs["feedback_score"] = pd.to_numeric(jobs["feedback_score"], errors="coerce").fillna(0)
-    market_adjustments = jobs.apply(lambda r: compute_market_queue_adjustment(r, market_profile), axis=1)
-    jobs["queue_adjustment"] = market_adjustments.map(lambda x: x[0])
-    jobs["queue_adjustment_reasons"] = market_adjustments.map(lambda x: x[1])
-    jobs["force_review"] = market_adjustments.map(lambda x: x[2])
+    market_adjustments = market_queue_adjustments(jobs, market_profile)
+    jobs["queue_adjustment"] = market_adjustments["queue_adjustment"]
+    jobs["queue_adjustment_reasons"] = market_adjustments["queue_adjustment_reasons"]
+    jobs["force_review"] = market_adjustments["force_review"]
     jobs["adjusted_priority_score"] = jobs["priority_score"] + jobs["feedback_score"] + jobs["queue_adjustment"]
 
-    jobs["apply_reason"] = jobs.apply(lambda r: build_reason(r, market_profile), axis=1)
-    apply_now_gates = jobs.apply(lambda r: market_apply_now_allowed(r, market_profile), axis=1)
-    jobs["apply_now_gate_reason"] = apply_now_gates.map(lambda x: x[1])
-    jobs["recommended_action"] = jobs.apply(
-        lambda r: "review"
-        if bool(r.get("force_review", False))
-        or not (
-            int(r.get("adjusted_priority_score", 0)) >= int(args.min_priority)
-            and not str(r.get("apply_now_gate_reason", "") or "")
-        )
-        else "apply_now",
-        axis=1,
+    jobs["apply_reason"] = build_reasons(jobs, market_profile)
+    jobs["apply_now_gate_reason"] = market_apply_now_gate_reasons(jobs, market_profile)
+    apply_now = (
+        ~jobs["force_review"].astype(bool)
+        & (_truncated(jobs["adjusted_priority_score"]) >= int(min_priority))
+        & jobs["apply_now_gate_reason"].eq("")
     )
+    jobs["recommended_action"] = np.where(apply_now, "apply_now", "review")
 
     sort_cols = [
         c
@@ -547,10 +676,78 @@ def main():
                     n = n[: -len(suffix)].strip()
             return n
 
-        company_key = jobs["company"].apply(_norm_company)
+        company_key = _per_value(jobs["company"], lambda names: names.map(_norm_company))
         # cumcount within each normalized company key (jobs already sorted by priority)
         rank_within_company = company_key.groupby(company_key).cumcount()
         jobs = jobs[rank_within_company < MAX_PER_COMPANY]
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build top apply queue from filtered jobs.")
+    parser.add_argument(
+        "--market",
+        choices=SUPPORTED_MARKETS,
+        default="",
+        help="Market mode (be|ch). Defaults to JOB_MARKET env var or be.",
+    )
+    parser.add_argument(
+        "--ch-focus",
+        choices=SUPPORTED_CH_FOCUS,
+        default="",
+        help="CH focus mode (all|romandie). Defaults to JOB_CH_FOCUS env var or all.",
+    )
+    parser.add_argument("--input-csv", default="", help="Optional override input CSV path.")
+    parser.add_argument("--output-csv", default="", help="Optional override apply queue output CSV.")
+    parser.add_argument(
+        "--location-focus",
+        default="",
+        help="Optional location cluster filter (e.g. rabat, casablanca, tanger).",
+    )
+    parser.add_argument("--top-n", type=int, default=20, help="Max jobs to keep in apply queue.")
+    parser.add_argument(
+        "--min-priority",
+        type=int,
+        default=68,
+        help="Minimum priority score for apply_now recommendation.",
+    )
+    parser.add_argument(
+        "--include-closed",
+        action="store_true",
+        help="Include already closed statuses (applied/interview/rejected/etc.).",
+    )
+    args = parser.parse_args()
+
+    market = configure_market(args.market, args.ch_focus)
+    market_profile = get_market_profile(market, args.ch_focus)
+    paths = get_output_paths(market)
+
+    input_csv = args.input_csv or choose_input_csv(paths)
+    base_output_csv = args.output_csv or focused_path(paths["apply_queue_csv"], market, market_profile["ch_focus"])
+    output_csv = location_focus_path(base_output_csv, args.location_focus)
+    tracker_csv = focused_path(paths["applications_tracker_csv"], market, market_profile["ch_focus"])
+
+    jobs = read_table(input_csv)
+    if jobs.empty:
+        print(f"[QUEUE] No jobs found in {input_csv}")
+        return
+
+    tracker = read_table(tracker_csv, columns=TRACKER_QUEUE_COLUMNS)
+    company_feedback, term_feedback = build_feedback_maps(tracker)
+    jobs = rank_jobs(
+        jobs,
+        tracker,
+        company_feedback,
+        term_feedback,
+        market,
+        market_profile,
+        min_priority=args.min_priority,
+        include_closed=args.include_closed,
+        location_focus=args.location_focus,
+    )
+    if jobs.empty and args.location_focus:
+        print(f"[QUEUE] No jobs found for location focus '{args.location_focus}' in {input_csv}")
+        return
 
     keep_cols = [
         "job_id",
@@ -587,7 +784,7 @@ def main():
     out_dir = os.path.dirname(output_csv)
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
-    safe_save_csv(queue, output_csv)
+    safe_save_table(queue, output_csv)
 
     print(
         f"[QUEUE] Market={market} ch_focus={market_profile['ch_focus']} "
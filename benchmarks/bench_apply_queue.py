@@ -0,0 +1,122 @@
+"""
+Benchmark apply_queue.rank_jobs on a synthetic filtered-jobs table.
+
+Usage:
+  python benchmarks/bench_apply_queue.py --rows 50000 --market ma
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from apply_queue import build_feedback_maps, make_job_ids, rank_jobs  # noqa: E402
+from config import SUPPORTED_MARKETS, get_market_profile  # noqa: E402
+
+TITLES = [
+    "Junior Cloud Engineer",
+    "Technicien IT Junior CDI - Tanger",
+    "Service Desk Analyst (Turkish) - Rabat",
+    "Proxy Product Owner (F/H) - Casablanca",
+    "Ingenieur Anglophone - Casablanca",
+    "Stagiaire DevOps",
+    "Help Desk Technician",
+    "Administrateur Systeme et Reseau",
+    "Platform Engineer",
+    "Data Analyst",
+]
+LOCATIONS = ["Rabat", "Salé, Technopolis", "Casablanca", "Tanger", "Genève", "Lausanne", "Brussels", "Gent", ""]
+DESCRIPTIONS = [
+    "Support N1/N2, maintenance postes et reseau.",
+    "Agent helpdesk italophone pour assistance utilisateurs.",
+    "Azure, Terraform, Linux and Kubernetes. English required.",
+    "Vloeiend Nederlands vereist.",
+]
+TERMS = ["devops", "cloud engineer", "support it", "system administrator", ""]
+STATUSES = ["applied", "interview", "offer", "rejected", "not_interested", "to_apply"]
+
+
+def make_jobs(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+    return pd.DataFrame(
+        {
+            "title": [rng.choice(TITLES) for _ in range(rows)],
+            "company": [f"Company {rng.randrange(rows // 5 or 1)}" for _ in range(rows)],
+            "location": [rng.choice(LOCATIONS) for _ in range(rows)],
+            "description": [rng.choice(DESCRIPTIONS) for _ in range(rows)],
+            "search_term": [rng.choice(TERMS) for _ in range(rows)],
+            "canonical_url": [f"https://jobs.example/{idx}" for idx in range(rows)],
+            "url": [f"https://jobs.example/{idx}?src=feed" for idx in range(rows)],
+            "created": [f"2026-10-{rng.randint(1, 15):02d}" for _ in range(rows)],
+            "priority_score": [rng.randint(40, 95) for _ in range(rows)],
+            "language_fit_score": [rng.randint(0, 2) for _ in range(rows)],
+            "junior_score": [rng.randint(0, 3) for _ in range(rows)],
+            "is_remote": [rng.random() < 0.2 for _ in range(rows)],
+            "sponsorship_score": [rng.choice([0, 0, 1]) for _ in range(rows)],
+            "source": [rng.choice(["adzuna", "rekrute", "emploi_ma"]) for _ in range(rows)],
+        }
+    )
+
+
+def make_tracker(jobs: pd.DataFrame, rows: int, seed: int = 7) -> pd.DataFrame:
+    sample = jobs.sample(min(rows, len(jobs)), random_state=seed)
+    rng = random.Random(seed)
+    return pd.DataFrame(
+        {
+            "job_id": make_job_ids(sample).to_numpy(),
+            "status": [rng.choice(STATUSES) for _ in range(len(sample))],
+            "applied_date": "2026-10-01",
+            "notes": "",
+            "follow_up_date": "",
+            "company": sample["company"].to_numpy(),
+            "search_term": sample["search_term"].to_numpy(),
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark apply queue ranking on synthetic jobs.")
+    parser.add_argument("--rows", type=int, default=50000, help="Synthetic filtered jobs.")
+    parser.add_argument("--tracker-rows", type=int, default=2000, help="Synthetic tracker rows.")
+    parser.add_argument("--market", choices=SUPPORTED_MARKETS, default="ma")
+    parser.add_argument("--location-focus", default="", help="Optional location focus to benchmark.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    market_profile = get_market_profile(args.market, "all")
+    jobs = make_jobs(args.rows)
+    tracker = make_tracker(jobs, args.tracker_rows)
+
+    timings = []
+    for _ in range(max(1, args.repeat)):
+        start = time.perf_counter()
+        company_feedback, term_feedback = build_feedback_maps(tracker)
+        ranked = rank_jobs(
+            jobs,
+            tracker,
+            company_feedback,
+            term_feedback,
+            args.market,
+            market_profile,
+            location_focus=args.location_focus,
+        )
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    apply_now = int((ranked["recommended_action"] == "apply_now").sum())
+    print(
+        f"[BENCH] apply_queue market={args.market} rows={len(jobs)} tracker={len(tracker)} "
+        f"ranked={len(ranked)} apply_now={apply_now}"
+    )
+    print(f"[BENCH] rank_jobs best={timings[0] * 1000:.1f}ms median={timings[len(timings) // 2] * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
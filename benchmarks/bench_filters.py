@@ -0,0 +1,211 @@
+"""
+Benchmark the filter engine on a seeded synthetic corpus (see synthetic_jobs.py).
+
+Micro cases time one rule function over every job of each market flavour; macro cases time
+filter_jobs (strict + broad + near miss) and merge_jobs.fuzzy_dedup. Each case reports its
+throughput (best of --repeat, rule caches cleared before every run) and its tracemalloc peak
+(one extra traced run). The clock is frozen so is_recent keeps the same jobs every day.
+
+The results are compared with a stored baseline: a case slower than the baseline by more than
+--tolerance, or using more than --memory-tolerance extra peak memory, fails the run (exit 1).
+Timings depend on the machine: refresh the baseline with --update-baseline where it is compared.
+
+Usage:
+  python benchmarks/bench_filters.py
+  python benchmarks/bench_filters.py --jobs 400 --only passes_filters,fuzzy_dedup
+  python benchmarks/bench_filters.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import adzuna_fetch as af  # noqa: E402
+import merge_jobs  # noqa: E402
+from synthetic_jobs import FLAVOURS, FROZEN_NOW, frozen_clock, make_corpus, near_duplicates  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "filters_baseline.json")
+
+
+def reset_rule_caches(flavour: str):
+    """Cold caches for every run: market settings, keyword matcher, language and text caches."""
+    af.configure_market(flavour)
+    af._match_text.cache_clear()
+    af._text_tokens.cache_clear()
+
+
+def job_texts(job: dict) -> tuple[str, str, str]:
+    view = af.JobTextView.from_job(job)
+    return view.title, view.desc, view.full_text
+
+
+def build_cases(corpus: dict[str, list[dict]]) -> dict[str, tuple[Callable[[list], object], dict[str, list]]]:
+    """{case: (run(items), {flavour: items})}; each case runs once per flavour with that market configured."""
+    texts = {flavour: [job_texts(job) for job in jobs] for flavour, jobs in corpus.items()}
+    all_jobs = [job for jobs in corpus.values() for job in jobs]
+    return {
+        "passes_filters": (
+            lambda jobs: [af.passes_filters(job, filter_mode="strict") for job in jobs],
+            corpus,
+        ),
+        "classify_language_need": (
+            lambda items: [af.classify_language_need(full_text) for _, _, full_text in items],
+            texts,
+        ),
+        "detect_experience_requirement_details": (
+            lambda items: [af.detect_experience_requirement_details(title, desc) for title, desc, _ in items],
+            texts,
+        ),
+        "role_relevant": (
+            lambda items: [af.role_relevant(title, desc) for title, desc, _ in items],
+            texts,
+        ),
+        "filter_jobs": (
+            lambda jobs: af.filter_jobs(jobs, ["strict", "broad"], near_miss=True),
+            corpus,
+        ),
+        # Dedup is market independent: one run over every flavour's rows.
+        "fuzzy_dedup": (
+            merge_jobs.fuzzy_dedup,
+            {"be": near_duplicates(all_jobs)},
+        ),
+    }
+
+
+def run_case(run: Callable[[list], object], batches: dict[str, list], repeat: int) -> dict:
+    items = sum(len(batch) for batch in batches.values())
+    timings = []
+    for _ in range(max(1, repeat)):
+        elapsed = 0.0
+        for flavour, batch in batches.items():
+            reset_rule_caches(flavour)
+            start = time.perf_counter()
+            run(batch)
+            elapsed += time.perf_counter() - start
+        timings.append(elapsed)
+
+    peak = 0
+    tracemalloc.start()
+    try:
+        for flavour, batch in batches.items():
+            reset_rule_caches(flavour)
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            run(batch)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "items": items,
+        "best_s": round(best, 4),
+        "per_sec": round(items / best, 1) if best else 0.0,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def compare(results: dict[str, dict], baseline: dict, tolerance: float, memory_tolerance: float) -> list[str]:
+    """Regression messages for cases slower or hungrier than the baseline allows."""
+    regressions = []
+    for case, result in results.items():
+        expected = baseline.get("cases", {}).get(case)
+        if not expected:
+            print(f"[WARN] No baseline for {case}; run with --update-baseline to record it.")
+            continue
+        min_rate = expected["per_sec"] * (1 - tolerance)
+        if result["per_sec"] < min_rate:
+            regressions.append(
+                f"{case}: {result['per_sec']:.0f}/s < {min_rate:.0f}/s "
+                f"(baseline {expected['per_sec']:.0f}/s, tolerance {tolerance:.0%})"
+            )
+        max_peak = expected["peak_kib"] * (1 + memory_tolerance)
+        if result["peak_kib"] > max_peak:
+            regressions.append(
+                f"{case}: peak {result['peak_kib']:.0f} KiB > {max_peak:.0f} KiB "
+                f"(baseline {expected['peak_kib']:.0f} KiB, tolerance {memory_tolerance:.0%})"
+            )
+    return regressions
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark filter rules and fuzzy dedup on synthetic jobs.")
+    parser.add_argument("--jobs", type=int, default=150, help="Synthetic jobs per market flavour.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--flavours", default=",".join(FLAVOURS), help="Comma-separated market flavours.")
+    parser.add_argument("--only", default="", help="Comma-separated case names (default: all).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare with.")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed throughput drop (0.25 = 25%%).")
+    parser.add_argument("--memory-tolerance", type=float, default=0.5, help="Allowed peak memory growth.")
+    args = parser.parse_args(argv)
+
+    flavours = tuple(flavour.strip() for flavour in args.flavours.split(",") if flavour.strip())
+    unknown = [flavour for flavour in flavours if flavour not in FLAVOURS]
+    if unknown:
+        parser.error(f"unknown flavours: {', '.join(unknown)} (choose from {', '.join(FLAVOURS)})")
+    corpus = make_corpus(args.jobs, seed=args.seed, flavours=flavours)
+    cases = build_cases(corpus)
+    wanted = [case.strip() for case in args.only.split(",") if case.strip()] or list(cases)
+    unknown = [case for case in wanted if case not in cases]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)} (choose from {', '.join(cases)})")
+    settings = {"jobs": args.jobs, "seed": args.seed, "flavours": list(flavours), "frozen_now": FROZEN_NOW.isoformat()}
+
+    results = {}
+    with frozen_clock(af):
+        for case in wanted:
+            run, batches = cases[case]
+            results[case] = run_case(run, batches, args.repeat)
+            result = results[case]
+            print(
+                f"[BENCH] {case:<38} items={result['items']:<6} best={result['best_s'] * 1000:8.1f}ms "
+                f"rate={result['per_sec']:>10.1f}/s peak={result['peak_kib']:>9.1f}KiB"
+            )
+    af.configure_market("")
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline:
+        # --only refreshes just those cases when the corpus settings are unchanged.
+        cases_kept = baseline.get("cases", {}) if baseline.get("settings") == settings else {}
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump({"settings": settings, "cases": {**cases_kept, **results}}, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"[INFO] Baseline saved: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"[WARN] Baseline not found: {args.baseline} (run with --update-baseline to create it).")
+        return 0
+    if baseline.get("settings") != settings:
+        print(f"[ERROR] Baseline settings {baseline.get('settings')} differ from this run {settings}.")
+        return 2
+    regressions = compare(results, baseline, args.tolerance, args.memory_tolerance)
+    for message in regressions:
+        print(f"[BENCH] REGRESSION {message}")
+    if regressions:
+        return 1
+    print(f"[BENCH] No regression against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark language_id.detect_language against plain seeded langdetect.
+
+Snippets come from the synthetic corpus (synthetic_jobs.py) and, with --table, from real job
+tables (title + description, like the filters see them). Reports the time per snippet of
+langdetect alone, of detect_language with a cold memo and of the repeated calls that hit it,
+the share settled by the pre-classifier, and how often both agree: on the language code, and
+on the blocked/allowed decision of each market that blocks languages.
+
+Usage:
+  python benchmarks/bench_language_id.py
+  python benchmarks/bench_language_id.py --table data/adzuna_jobs_raw.csv --passes 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import adzuna_fetch as af  # noqa: E402
+import language_id  # noqa: E402
+from config import SUPPORTED_MARKETS, get_market_profile  # noqa: E402
+from synthetic_jobs import make_corpus  # noqa: E402
+from table_storage import read_table  # noqa: E402
+
+
+def corpus_snippets(jobs_per_flavour: int, seed: int, tables: list[str]) -> list[str]:
+    """Unique SNIPPET_CHARS-long texts as is_disallowed_language sees them."""
+    texts = [
+        af.JobTextView.from_job(job).full_text
+        for jobs in make_corpus(jobs_per_flavour, seed=seed).values()
+        for job in jobs
+    ]
+    for path in tables:
+        df = read_table(path, columns=["title", "description"])
+        for title, desc in zip(df.get("title", []), df.get("description", [])):
+            texts.append(af.JobTextView.from_job({"title": title, "description": desc}).full_text)
+    snippets = {}
+    for text in texts:
+        snippet = text[: language_id.SNIPPET_CHARS]
+        if snippet.strip():
+            snippets.setdefault(snippet, None)
+    return list(snippets)
+
+
+def timed(func, snippets: list[str]) -> tuple[list[str], float]:
+    start = time.perf_counter()
+    codes = [func(snippet) for snippet in snippets]
+    return codes, time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cached language identification.")
+    parser.add_argument("--jobs", type=int, default=300, help="Synthetic jobs per market flavour.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--table", action="append", default=[], help="Job table to add (repeatable).")
+    parser.add_argument("--passes", type=int, default=4, help="Calls per text (rules, near miss, reports).")
+    args = parser.parse_args(argv)
+
+    snippets = corpus_snippets(args.jobs, args.seed, args.table)
+    reference, langdetect_s = timed(language_id.langdetect_language, snippets)
+
+    language_id.clear_language_id_cache()
+    codes, cold_s = timed(language_id.detect_language, snippets)
+    stats = dict(language_id.LANGUAGE_ID_STATS)
+    warm_s = 0.0
+    for _ in range(max(0, args.passes - 1)):
+        warm_s += timed(language_id.detect_language, snippets)[1]
+    language_id.clear_language_id_cache()
+
+    count = len(snippets)
+    per_call = lambda seconds, calls: seconds / max(calls, 1) * 1e6  # noqa: E731
+    pipeline_new = cold_s + warm_s
+    pipeline_old = langdetect_s * max(1, args.passes)
+    print(f"[BENCH] language_id snippets={count} passes={args.passes}")
+    print(f"[BENCH] langdetect (seeded)     {per_call(langdetect_s, count):9.1f}us/snippet")
+    print(
+        f"[BENCH] detect_language cold    {per_call(cold_s, count):9.1f}us/snippet "
+        f"(pre-classified={stats.get('quick', 0) / max(count, 1):.1%}, langdetect={stats.get('langdetect', 0)})"
+    )
+    if warm_s:
+        print(f"[BENCH] detect_language memo    {per_call(warm_s, count * (args.passes - 1)):9.1f}us/call")
+    print(
+        f"[BENCH] {args.passes} passes: {pipeline_old:.2f}s -> {pipeline_new:.2f}s "
+        f"(x{pipeline_old / max(pipeline_new, 1e-9):.1f})"
+    )
+
+    agree = sum(code == ref for code, ref in zip(codes, reference))
+    print(f"[BENCH] agreement with langdetect: {agree}/{count} ({agree / max(count, 1):.2%})")
+    for market in SUPPORTED_MARKETS:
+        blocked = set(get_market_profile(market).get("blocked_language_codes", []))
+        if not blocked:
+            continue
+        same = sum((code in blocked) == (ref in blocked) for code, ref in zip(codes, reference))
+        print(f"[BENCH]   {market} blocked decision ({','.join(sorted(blocked))}): {same / max(count, 1):.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
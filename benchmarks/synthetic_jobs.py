@@ -0,0 +1,210 @@
+"""
+Seeded synthetic Adzuna-style jobs for the filter benchmarks.
+
+Each market flavour (be, ch, fr, nl, de, ma) mixes local-language and English descriptions,
+HTML noise from job boards, and the language / experience clauses the filters look for,
+so a corpus exercises the same rule branches as a real fetch.
+The same seed always gives the same jobs; `created` dates are relative to FROZEN_NOW.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+FROZEN_NOW = datetime(2026, 10, 15, 9, 30, tzinfo=timezone.utc)
+
+FLAVOURS = ("be", "ch", "fr", "nl", "de", "ma")
+
+TITLES = {
+    "common": [
+        "Junior Cloud Engineer",
+        "Junior DevOps Engineer (m/f/x)",
+        "Linux System Administrator",
+        "Platform Engineer Azure",
+        "IT Support Technician",
+        "Site Reliability Engineer",
+        "Graduate Infrastructure Engineer",
+        "Senior Solutions Architect",
+        "Sales Manager Benelux",
+        "Data Analyst",
+    ],
+    "be": ["Medewerker IT Support", "Technicien Helpdesk N1/N2", "Cloud Engineer - Brussels", "Junior Systeembeheerder"],
+    "ch": ["Informatiker Systemtechnik EFZ", "Technicien support IT (80-100%)", "ICT Supporter", "Cloud Engineer Zürich"],
+    "fr": ["Ingénieur DevOps Junior H/F", "Technicien support informatique", "Administrateur systèmes et réseaux", "Stage DevOps"],
+    "nl": ["Junior Systeembeheerder", "Medewerker Servicedesk", "DevOps Engineer Amsterdam", "Traineeship IT"],
+    "de": ["Junior DevOps Engineer (w/m/d)", "Systemadministrator Linux", "IT-Support Mitarbeiter", "Werkstudent Cloud"],
+    "ma": ["Technicien IT Junior CDI - Tanger", "Ingénieur Cloud Anglophone", "Service Desk Analyst (Turkish) - Rabat", "Stagiaire DevOps"],
+}
+
+LOCATIONS = {
+    "be": [("Brussels", "Brussels Region"), ("Gent", "East Flanders"), ("Antwerpen", "Antwerp"), ("Liège", "Wallonia"), ("Namur", "Wallonia")],
+    "ch": [("Genève", "Geneva"), ("Lausanne", "Vaud"), ("Zürich", "Zurich"), ("Bern", "Bern"), ("Basel", "Basel-Stadt")],
+    "fr": [("Paris", "Ile-de-France"), ("Lyon", "Auvergne-Rhône-Alpes"), ("Lille", "Hauts-de-France"), ("Nantes", "Pays de la Loire")],
+    "nl": [("Amsterdam", "Noord-Holland"), ("Utrecht", "Utrecht"), ("Rotterdam", "Zuid-Holland"), ("Eindhoven", "Noord-Brabant")],
+    "de": [("Berlin", "Berlin"), ("München", "Bayern"), ("Hamburg", "Hamburg"), ("Köln", "Nordrhein-Westfalen")],
+    "ma": [("Casablanca", "Casablanca-Settat"), ("Rabat", "Rabat-Salé-Kénitra"), ("Tanger", "Tanger-Tétouan"), ("Marrakech", "Marrakech-Safi")],
+}
+
+COMPANIES = ["Acme", "Cloudify", "NRB", "Proximus", "Swisscom", "Capgemini", "HCLTech", "Sopra Steria", "Adecco", "Orange"]
+
+SENTENCES = {
+    "en": [
+        "You will automate Azure infrastructure with Terraform and maintain Linux servers.",
+        "Our platform team runs Kubernetes clusters, Docker images and CI/CD pipelines.",
+        "You support end users on Windows, Microsoft 365 and Active Directory.",
+        "Monitoring with Prometheus and Grafana is part of the daily routine.",
+        "We offer a hybrid working model, training budget and a friendly team.",
+    ],
+    "fr": [
+        "Vous assurez le support N1/N2 des utilisateurs et la gestion du parc informatique.",
+        "Vous participez à l'automatisation de l'infrastructure cloud (Azure, AWS, Terraform).",
+        "Vous administrez les serveurs Linux et Windows ainsi que le réseau.",
+        "Nous offrons un cadre de travail hybride et des formations certifiantes.",
+    ],
+    "nl": [
+        "Je ondersteunt gebruikers bij vragen over hardware, software en netwerk.",
+        "Je automatiseert onze cloud omgeving met Terraform en Azure DevOps.",
+        "Je beheert Linux servers en werkt mee aan CI/CD pipelines.",
+        "Wij bieden een hybride werkmodel, opleidingen en een fijn team.",
+    ],
+    "de": [
+        "Sie betreuen unsere Anwender im 1st und 2nd Level Support.",
+        "Sie automatisieren unsere Cloud-Infrastruktur mit Terraform und Kubernetes.",
+        "Sie administrieren Linux- und Windows-Server sowie das Netzwerk.",
+        "Wir bieten flexible Arbeitszeiten, Homeoffice und Weiterbildung.",
+    ],
+}
+
+FLAVOUR_LANGUAGES = {
+    "be": ["en", "fr", "nl"],
+    "ch": ["fr", "de", "en"],
+    "fr": ["fr", "en"],
+    "nl": ["nl", "en"],
+    "de": ["de", "en"],
+    "ma": ["fr", "en"],
+}
+
+LANGUAGE_CLAUSES = [
+    "English is required, French is a plus.",
+    "Fluent English required.",
+    "Vloeiend Nederlands is vereist.",
+    "Kennis van het Nederlands is een pluspunt.",
+    "Maîtrise du français et de l'anglais indispensable.",
+    "Le néerlandais est un atout.",
+    "Sehr gute Deutschkenntnisse (C1) zwingend erforderlich.",
+    "Deutsch von Vorteil, Englisch fliessend.",
+    "Bilingual French/Dutch mandatory.",
+    "Anglophone, la maîtrise du turc est exigée.",
+    "",
+]
+
+EXPERIENCE_CLAUSES = [
+    "Junior profiles and recent graduates are welcome.",
+    "At least 5 years of experience in a similar role.",
+    "2+ years of experience with Linux administration.",
+    "Minimum 3 ans d'expérience exigée.",
+    "Débutant accepté, première expérience souhaitée.",
+    "Minimaal 4 jaar ervaring als systeembeheerder.",
+    "Mindestens 3 Jahre Berufserfahrung.",
+    "10+ years experience, senior level.",
+    "",
+]
+
+HTML_NOISE = [
+    ("<p>", "</p>"),
+    ("<div class=\"job-description\"><ul><li>", "</li></ul></div>"),
+    ("<strong>", "</strong><br/>"),
+    ("", "&nbsp;&amp;&nbsp;"),
+    ("", ""),
+]
+
+# Feed mojibake the filters clean up (é read as latin-1).
+MOJIBAKE = {"é": "Ã©", "è": "Ã¨", "à": "Ã "}
+
+
+def _description(rng: random.Random, flavour: str) -> str:
+    languages = FLAVOUR_LANGUAGES[flavour]
+    lang = rng.choice(languages)
+    sentences = rng.sample(SENTENCES[lang], k=min(len(SENTENCES[lang]), rng.randint(2, 4)))
+    if lang != "en" and rng.random() < 0.5:
+        sentences.append(rng.choice(SENTENCES["en"]))
+    sentences.append(rng.choice(LANGUAGE_CLAUSES))
+    sentences.append(rng.choice(EXPERIENCE_CLAUSES))
+    rng.shuffle(sentences)
+    opening, closing = rng.choice(HTML_NOISE)
+    text = opening + " ".join(part for part in sentences if part) + closing
+    if rng.random() < 0.1:
+        for plain, garbled in MOJIBAKE.items():
+            text = text.replace(plain, garbled)
+    return text
+
+
+def make_job(rng: random.Random, flavour: str, idx: int, now: datetime = FROZEN_NOW) -> dict:
+    """One raw Adzuna API result (nested location/company like the fetch stores them)."""
+    city, area = rng.choice(LOCATIONS[flavour])
+    title = rng.choice(TITLES["common"] + TITLES[flavour] * 2)
+    created = now - timedelta(days=rng.randint(0, 55), minutes=rng.randint(0, 1440))
+    return {
+        "id": f"{flavour}-{idx}",
+        "title": title,
+        "description": _description(rng, flavour),
+        "location": {"display_name": f"{city}, {area}", "area": [flavour.upper(), area, city]},
+        "company": {"display_name": rng.choice(COMPANIES)},
+        "created": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "redirect_url": f"https://www.adzuna.example/{flavour}/details/{idx}?se=bench",
+        "salary_min": rng.choice([None, 38000, 45000]),
+        "salary_max": None,
+        "contract_type": rng.choice(["permanent", "contract", None]),
+        "search_term": rng.choice(["devops", "cloud engineer", "support it", "system administrator"]),
+    }
+
+
+def make_corpus(jobs_per_flavour: int, seed: int = 7, flavours: tuple[str, ...] = FLAVOURS) -> dict[str, list[dict]]:
+    """{flavour: [raw job, ...]}; every flavour draws from its own seeded generator."""
+    return {
+        flavour: [make_job(random.Random(f"{seed}:{flavour}:{idx}"), flavour, idx) for idx in range(jobs_per_flavour)]
+        for flavour in flavours
+    }
+
+
+def near_duplicates(jobs: list[dict], share: float = 0.3, seed: int = 7) -> list[dict]:
+    """
+    Flat merge-style rows (title/company/location/description/source) with a share of
+    re-posted variants (typo, suffix, other source) for fuzzy_dedup.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for job in jobs:
+        rows.append(
+            {
+                "title": job["title"],
+                "company": job["company"]["display_name"],
+                "location": job["location"]["display_name"].split(",")[0],
+                "description": job["description"],
+                "source": "adzuna",
+            }
+        )
+        if rng.random() < share:
+            title = job["title"]
+            pos = rng.randrange(len(title))
+            variant = dict(rows[-1], source=rng.choice(["jooble", "rekrute", "emploi_ma"]))
+            variant["title"] = rng.choice([title[:pos] + title[pos + 1 :], title + " - " + variant["location"]])
+            rows.append(variant)
+    rng.shuffle(rows)
+    return rows
+
+
+@contextmanager
+def frozen_clock(module, now: datetime = FROZEN_NOW):
+    """Pin module.datetime.now() (is_recent, recency bonus) to now while benchmarking."""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.replace(tzinfo=None) if tz is None else now.astimezone(tz)
+
+    with mock.patch.object(module, "datetime", FrozenDatetime):
+        yield now
@@ -40,6 +40,8 @@ DEFAULT_FILTER_MODE = "strict"
 SUPPORTED_FILTER_MODES = ("strict", "broad", "both")
 DEFAULT_JOB_MODE = "strict"
 SUPPORTED_JOB_MODES = ("strict", "speed")
+DEFAULT_TABLE_FORMAT = "parquet"
+SUPPORTED_TABLE_FORMATS = ("parquet", "csv")
 
 # Pagination et taille de page
 # PAGES_PER_TERM : dict facultatif pour surcharger le nombre de pages par terme
@@ -79,6 +81,15 @@ PAGES_PER_TERM = {
 DEFAULT_PAGES = 2
 RESULTS_PER_PAGE = 50
 
+# Adzuna API politeness: one token bucket shared by all concurrent fetch workers.
+# Markets can override these with the same keys in MARKET_PROFILES.
+ADZUNA_RATE_LIMIT_PER_SEC = 1.0
+ADZUNA_RATE_LIMIT_BURST = 2
+ADZUNA_FETCH_CONCURRENCY = 4
+# Incremental fetch (adzuna_fetch.py --incremental): results newest first, and a term stops paging
+# after the first page on which at least this share of job ids is already in the seen-id index.
+ADZUNA_INCREMENTAL_STOP_SEEN_RATIO = 0.8
+
 # Description minimale (plus souple pour garder les offres courtes)
 REQUIRE_DESCRIPTION = True
 MIN_DESCRIPTION_CHARS = 60
@@ -1816,6 +1827,20 @@ def resolve_job_mode(job_mode: str = "") -> str:
     return raw
 
 
+def resolve_table_format(table_format: str = "") -> str:
+    raw = (table_format or os.getenv("JOB_TABLE_FORMAT") or DEFAULT_TABLE_FORMAT).strip().lower()
+    if raw not in SUPPORTED_TABLE_FORMATS:
+        supported = ", ".join(SUPPORTED_TABLE_FORMATS)
+        raise ValueError(f"Unsupported table_format '{raw}'. Supported values: {supported}")
+    return raw
+
+
+def parquet_table_path(path: str) -> str:
+    """Parquet path of a table addressed by its CSV path (data/x.csv -> data/x.parquet)."""
+    root, ext = os.path.splitext(path)
+    return root + ".parquet" if ext.lower() in {".csv", ".parquet"} else path + ".parquet"
+
+
 def get_market_profile(market: str = "", ch_focus: str = "") -> dict:
     resolved = resolve_market(market)
     resolved_ch_focus = resolve_ch_focus(ch_focus) if resolved == "ch" else "all"
@@ -1839,6 +1864,11 @@ def get_market_profile(market: str = "", ch_focus: str = "") -> dict:
         "supports_emploi_ma": bool(profile.get("supports_emploi_ma", False)),
         "supports_rekrute": bool(profile.get("supports_rekrute", False)),
         "supports_marocannonces": bool(profile.get("supports_marocannonces", False)),
+        "adzuna_rate_limit_per_sec": float(profile.get("adzuna_rate_limit_per_sec", ADZUNA_RATE_LIMIT_PER_SEC)),
+        "adzuna_rate_limit_burst": int(profile.get("adzuna_rate_limit_burst", ADZUNA_RATE_LIMIT_BURST)),
+        "adzuna_fetch_concurrency": int(profile.get("adzuna_fetch_concurrency", ADZUNA_FETCH_CONCURRENCY)),
+        # Adzuna `where` sent by incremental fetches; empty searches the whole country.
+        "adzuna_where": str(profile.get("adzuna_where", "")),
         "enforce_location_filter": enforce_location_filter,
         "allowed_location_keywords": allowed_locations,
         "blocked_location_keywords": blocked_locations,
@@ -1854,14 +1884,26 @@ def get_market_profile(market: str = "", ch_focus: str = "") -> dict:
     }
 
 
-def get_output_paths(market: str = "") -> dict:
-    resolved = resolve_market(market)
+def get_output_paths(market: str = "", table_format: str = "csv") -> dict:
+    """
+    Output paths for market. Tables are addressed by their CSV path (CSV export, and the key
+    every stage reads through table_storage); table_format="parquet" gives their Parquet copies.
+    """
+    paths = _market_output_paths(resolve_market(market))
+    if resolve_table_format(table_format) == "parquet":
+        return {key: parquet_table_path(path) if path.endswith(".csv") else path for key, path in paths.items()}
+    return paths
+
+
+def _market_output_paths(resolved: str) -> dict:
     if resolved == DEFAULT_MARKET:
         return {
             "adzuna_raw_csv": "data/adzuna_jobs_raw.csv",
             "adzuna_filtered_csv": "data/adzuna_jobs_filtered.csv",
             "adzuna_filtered_strict_csv": "data/adzuna_jobs_filtered_strict.csv",
             "adzuna_filtered_broad_csv": "data/adzuna_jobs_filtered_broad.csv",
+            "adzuna_seen_ids_json": "data/adzuna_seen_ids.json",
+            "adzuna_journal_jsonl": "data/journal/adzuna_raw.jsonl",
             "emploi_ma_raw_csv": "data/emploi_ma_jobs_raw.csv",
             "emploi_ma_filtered_csv": "data/emploi_ma_jobs_filtered.csv",
             "emploi_ma_filtered_strict_csv": "data/emploi_ma_jobs_filtered_strict.csv",
@@ -1888,6 +1930,9 @@ def get_output_paths(market: str = "") -> dict:
             "daily_alert_state_json": "data/daily_alert_state.json",
             "near_miss_csv": "data/near_miss_jobs.csv",
             "term_performance_csv": "data/term_performance.csv",
+            "verdict_cache_db": "data/verdict_cache.sqlite",
+            "detail_cache_db": "data/detail_cache.sqlite",
+            "rule_profile_json": "data/rule_profile.json",
         }
 
     prefix = f"{resolved}_"
@@ -1896,6 +1941,8 @@ def get_output_paths(market: str = "") -> dict:
         "adzuna_filtered_csv": f"data/{prefix}adzuna_jobs_filtered.csv",
         "adzuna_filtered_strict_csv": f"data/{prefix}adzuna_jobs_filtered_strict.csv",
         "adzuna_filtered_broad_csv": f"data/{prefix}adzuna_jobs_filtered_broad.csv",
+        "adzuna_seen_ids_json": f"data/{prefix}adzuna_seen_ids.json",
+        "adzuna_journal_jsonl": f"data/journal/{prefix}adzuna_raw.jsonl",
         "emploi_ma_raw_csv": f"data/{prefix}emploi_ma_jobs_raw.csv",
         "emploi_ma_filtered_csv": f"data/{prefix}emploi_ma_jobs_filtered.csv",
         "emploi_ma_filtered_strict_csv": f"data/{prefix}emploi_ma_jobs_filtered_strict.csv",
@@ -1922,6 +1969,9 @@ def get_output_paths(market: str = "") -> dict:
         "daily_alert_state_json": f"data/{prefix}daily_alert_state.json",
         "near_miss_csv": f"data/{prefix}near_miss_jobs.csv",
         "term_performance_csv": f"data/{prefix}term_performance.csv",
+        "verdict_cache_db": f"data/{prefix}verdict_cache.sqlite",
+        "detail_cache_db": f"data/{prefix}detail_cache.sqlite",
+        "rule_profile_json": f"data/{prefix}rule_profile.json",
     }
 
 
@@ -0,0 +1,242 @@
+"""
+SQLite-backed cache of scraped job descriptions for enrich_full_descriptions.
+
+Each description is stored once in `contents`, keyed by its SHA-256. Every URL that resolved to
+it (details URL, canonical URL, tracking-param variants, ...) is a row in `urls`, pointing at
+that hash. Writes commit immediately, so an interrupted run keeps what it already fetched.
+Entries older than ttl_days are ignored on read and evicted when the cache is opened.
+The fetched URL also keeps its ETag/Last-Modified validators for conditional revalidation.
+
+One-shot import of the legacy JSON caches ({url: {"scraped": text}}):
+    python description_cache.py --db data/description_fetch_cache.sqlite data/description_fetch_cache_be.json
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+DEFAULT_TTL_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contents (
+    hash TEXT PRIMARY KEY,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    hash TEXT NOT NULL REFERENCES contents(hash),
+    fetched_at REAL NOT NULL,
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS urls_hash ON urls(hash);
+"""
+
+# Columns added after the first schema; older cache files get them on open.
+URL_COLUMN_MIGRATIONS = {
+    "etag": "ALTER TABLE urls ADD COLUMN etag TEXT NOT NULL DEFAULT ''",
+    "last_modified": "ALTER TABLE urls ADD COLUMN last_modified TEXT NOT NULL DEFAULT ''",
+}
+
+
+class CacheEntry(NamedTuple):
+    text: str
+    age_seconds: float
+    etag: str
+    last_modified: str
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class DescriptionCache:
+    """Thread-safe URL -> description cache. One connection, guarded by a lock."""
+
+    def __init__(self, path: str, ttl_days: float = DEFAULT_TTL_DAYS, clock=time.time):
+        self.path = str(path)
+        self.ttl_seconds = max(0.0, float(ttl_days)) * 86400
+        self._clock = clock
+        self._lock = threading.Lock()
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(urls)")}
+        for column, statement in URL_COLUMN_MIGRATIONS.items():
+            if column not in columns:
+                self._conn.execute(statement)
+        self._conn.commit()
+        self.evict_expired()
+
+    def _cutoff(self) -> float:
+        # ttl_days=0 keeps entries forever.
+        return self._clock() - self.ttl_seconds if self.ttl_seconds else float("-inf")
+
+    def get(self, url: str) -> Optional[str]:
+        """Cached description for url, or None when missing or older than the TTL."""
+        entry = self.lookup(url)
+        return entry.text if entry else None
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Cached entry (text, age, validators) for url, or None when missing or older than the TTL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT c.text, u.fetched_at, u.etag, u.last_modified FROM urls u "
+                "JOIN contents c ON c.hash = u.hash WHERE u.url = ? AND u.fetched_at >= ?",
+                (url, self._cutoff()),
+            ).fetchone()
+        if not row:
+            return None
+        text, fetched_at, etag, last_modified = row
+        return CacheEntry(text, max(0.0, self._clock() - fetched_at), etag, last_modified)
+
+    def put(
+        self,
+        url: str,
+        text: str,
+        aliases: Iterable[str] = (),
+        fetched_at: Optional[float] = None,
+        etag: str = "",
+        last_modified: str = "",
+    ):
+        """
+        Store text once and point url at it, with the validators of the response it came from.
+        Aliases are only (re)pointed when they have no live entry yet, so a fresher description
+        cached under an alias is kept. They get the same validators, so an alias served before url
+        is revalidated too.
+        """
+        digest = content_hash(text)
+        now = self._clock() if fetched_at is None else fetched_at
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO contents(hash, text) VALUES (?, ?)", (digest, text))
+            self._conn.execute(
+                "INSERT INTO urls(url, hash, fetched_at, etag, last_modified) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET hash = excluded.hash, fetched_at = excluded.fetched_at, "
+                "etag = excluded.etag, last_modified = excluded.last_modified",
+                (url, digest, now, etag or "", last_modified or ""),
+            )
+            self._conn.executemany(
+                "INSERT INTO urls(url, hash, fetched_at, etag, last_modified) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET hash = excluded.hash, fetched_at = excluded.fetched_at, "
+                "etag = excluded.etag, last_modified = excluded.last_modified WHERE urls.fetched_at < ?",
+                [
+                    (alias, digest, now, etag or "", last_modified or "", self._cutoff())
+                    for alias in aliases
+                    if alias and alias != url
+                ],
+            )
+
+    def discard(self, url: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM urls WHERE url = ?", (url,))
+            self._delete_orphans()
+
+    def touch(self, url: str, aliases: Iterable[str] = ()):
+        """
+        Mark url as verified now (e.g. after a 304), restarting its TTL and revalidation age.
+        Aliases pointing at the same description are verified with it.
+        """
+        urls = [url, *(alias for alias in aliases if alias and alias != url)]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE urls SET fetched_at = ? WHERE url = ? AND hash = (SELECT hash FROM urls WHERE url = ?)",
+                [(self._clock(), alias, url) for alias in urls],
+            )
+
+    def evict_expired(self) -> int:
+        """Drop URL entries past the TTL and descriptions no URL points to. Returns URLs removed."""
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM urls WHERE fetched_at < ?", (self._cutoff(),)).rowcount
+            self._delete_orphans()
+        return removed
+
+    def _delete_orphans(self):
+        self._conn.execute("DELETE FROM contents WHERE hash NOT IN (SELECT hash FROM urls)")
+
+    def import_json(self, json_path: str) -> int:
+        """
+        Import a legacy {url: {"scraped": text}} JSON cache. The JSON cache never expired, so its
+        entries are dated at import time and start a fresh TTL. Returns the number of URLs imported.
+        """
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return 0
+        if not isinstance(data, dict):
+            return 0
+        fetched_at = self._clock()
+        imported = 0
+        for url, entry in data.items():
+            text = str((entry or {}).get("scraped", "") or "") if isinstance(entry, dict) else ""
+            if url and text.strip():
+                self.put(url, text, fetched_at=fetched_at)
+                imported += 1
+        return imported
+
+    def stats(self) -> dict:
+        with self._lock:
+            urls = self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+            contents = self._conn.execute("SELECT COUNT(*) FROM contents").fetchone()[0]
+        return {"urls": urls, "contents": contents}
+
+    def __len__(self) -> int:
+        return self.stats()["urls"]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def open_description_cache(cache_path: str, ttl_days: float = DEFAULT_TTL_DAYS) -> DescriptionCache:
+    """
+    Open the SQLite cache for cache_path. A legacy `.json` path maps to the `.sqlite` file next to
+    it. When that database is first created, the matching legacy JSON cache (if any) is imported.
+    """
+    db_path = str(Path(cache_path).with_suffix(".sqlite")) if cache_path.lower().endswith(".json") else cache_path
+    legacy_json = str(Path(db_path).with_suffix(".json"))
+    is_new = not os.path.exists(db_path)
+    cache = DescriptionCache(db_path, ttl_days=ttl_days)
+    if is_new and os.path.exists(legacy_json):
+        imported = cache.import_json(legacy_json)
+        print(f"[CACHE] Imported {imported} entries from {legacy_json} into {db_path}")
+    return cache
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Import legacy JSON description caches into SQLite.")
+    parser.add_argument("json_paths", nargs="+", help="Legacy description_fetch_cache*.json files.")
+    parser.add_argument(
+        "--db",
+        default="data/description_fetch_cache.sqlite",
+        help="Target SQLite cache (created if missing).",
+    )
+    parser.add_argument(
+        "--ttl-days",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        help="Ignore/evict entries older than N days (0 = keep forever).",
+    )
+    args = parser.parse_args()
+
+    cache = DescriptionCache(args.db, ttl_days=args.ttl_days)
+    for json_path in args.json_paths:
+        imported = cache.import_json(json_path)
+        print(f"[CACHE] {json_path}: imported {imported} entries")
+    stats = cache.stats()
+    cache.close()
+    print(f"[CACHE] {args.db}: urls={stats['urls']} descriptions={stats['contents']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+SQLite-backed cache of parsed detail pages for the Moroccan fetchers (rekrute, marocannonces, emploi.ma).
+
+Each posting URL keeps the detail dict parsed from its page and a fingerprint of the listing card it
+was fetched for (title, date, snippet). While the card on the listing is unchanged, the cached
+detail is reused and the page is not downloaded again. Entries older than ttl_days (default
+MAX_DAYS_OLD, past which postings are filtered out anyway) are ignored on read and evicted when the
+cache is opened, so a posting still listed after that is fetched once more.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from config import MAX_DAYS_OLD
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS details (
+    url TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    card TEXT NOT NULL,
+    detail TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+# Listing-card fields whose change means the posting may have been edited.
+CARD_FIELDS = ("title", "created", "description")
+
+
+def card_fingerprint(job: dict) -> str:
+    """SHA-256 of the listing card fields (title, date, snippet) of a job."""
+    payload = "\x1f".join(" ".join(str(job.get(field, "") or "").split()) for field in CARD_FIELDS)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _url_key(job: dict) -> str:
+    return str(job.get("url", "") or "").strip()
+
+
+class DetailCache:
+    """Thread-safe posting URL -> parsed detail cache. One connection, guarded by a lock."""
+
+    def __init__(self, path: str, provider: str, ttl_days: float = MAX_DAYS_OLD, clock=time.time):
+        self.path = str(path)
+        self.provider = provider
+        self.ttl_seconds = max(0.0, float(ttl_days)) * 86400
+        self._clock = clock
+        self._lock = threading.Lock()
+        # hit | changed (card fingerprint differs) | miss | stored
+        self.stats: Counter[str] = Counter()
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self.evict_expired()
+
+    def _cutoff(self) -> float:
+        # ttl_days=0 keeps entries forever.
+        return self._clock() - self.ttl_seconds if self.ttl_seconds else float("-inf")
+
+    def _status(self, job: dict) -> tuple[str, Optional[dict]]:
+        url = _url_key(job)
+        if not url:
+            return "miss", None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT card, detail FROM details WHERE url = ? AND fetched_at >= ?",
+                (url, self._cutoff()),
+            ).fetchone()
+        if row is None:
+            return "miss", None
+        if row[0] != card_fingerprint(job):
+            return "changed", None
+        return "hit", json.loads(row[1])
+
+    def lookup(self, job: dict) -> Optional[dict]:
+        """Like get(), without counting the lookup in stats (for prefetch decisions)."""
+        return self._status(job)[1]
+
+    def get(self, job: dict) -> Optional[dict]:
+        """Cached detail of the job's URL if its listing card is unchanged and the entry is live."""
+        status, detail = self._status(job)
+        with self._lock:
+            self.stats[status] += 1
+        return detail
+
+    def put(self, job: dict, detail: dict, fetched_at: Optional[float] = None):
+        """Store the detail parsed for job, under the fingerprint of its current listing card."""
+        url = _url_key(job)
+        if not url:
+            return
+        now = self._clock() if fetched_at is None else fetched_at
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO details(url, provider, card, detail, fetched_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET provider = excluded.provider, card = excluded.card, "
+                "detail = excluded.detail, fetched_at = excluded.fetched_at",
+                (url, self.provider, card_fingerprint(job), json.dumps(detail, ensure_ascii=False), now),
+            )
+            self.stats["stored"] += 1
+
+    def evict_expired(self) -> int:
+        """Drop entries past the TTL. Returns the number removed."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM details WHERE fetched_at < ?", (self._cutoff(),)).rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM details WHERE provider = ?", (self.provider,)).fetchone()[0]
+
+    def summary(self) -> str:
+        looked_up = self.stats["hit"] + self.stats["changed"] + self.stats["miss"]
+        return (
+            f"[CACHE] {self.provider} details: {self.stats['hit']}/{looked_up} reused, "
+            f"{self.stats['changed']} cards changed, {self.stats['miss']} new, {self.stats['stored']} stored"
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -15,10 +15,10 @@ import os
 import re
 import time
 from datetime import datetime
+from typing import Optional
 from urllib.parse import urlencode
 
 import pandas as pd
-import requests
 from pandas.errors import EmptyDataError
 
 from adzuna_fetch import configure_market, passes_filters, safe_save_csv
@@ -30,6 +30,9 @@ from config import (
     get_output_paths,
     resolve_filter_mode,
 )
+from detail_cache import DetailCache
+from http_transport import get_transport, print_transport_stats
+from site_crawler import DEFAULT_CRAWL_CONCURRENCY, DetailPrefetch, SiteCrawler, merge_job_detail
 
 BASE_URL = "https://www.emploi.ma"
 IT_FILTER_VALUE = "im_field_offre_metiers:31"
@@ -40,6 +43,7 @@ DEFAULT_HEADERS = {
     ),
     "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
 }
+HTTP = get_transport("emploi_ma", headers=DEFAULT_HEADERS)
 
 SCRIPT_STYLE_RE = re.compile(r"(?is)<(script|style|noscript)[^>]*>.*?</\1>")
 TAG_RE = re.compile(r"<[^>]+>")
@@ -81,9 +85,7 @@ def build_listing_url(page: int = 0) -> str:
 
 
 def fetch_url(url: str, timeout: int = 20) -> str:
-    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
-    response.raise_for_status()
-    return response.text
+    return HTTP.get(url, timeout=timeout).text
 
 
 def extract_total_pages(listing_html: str) -> int:
@@ -234,24 +236,31 @@ def dedup_jobs(jobs: list[dict]) -> list[dict]:
     return list(bucket.values())
 
 
-def enrich_jobs_with_details(jobs: list[dict], sleep_seconds: float = 0.4, timeout: int = 20) -> list[dict]:
+def enrich_jobs_with_details(
+    jobs: list[dict],
+    sleep_seconds: float = 0.4,
+    timeout: int = 20,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
     enriched: list[dict] = []
     total = len(jobs)
     for idx, job in enumerate(jobs, start=1):
         url = job.get("url", "")
         merged = dict(job)
+        detail = detail_cache.get(job) if detail_cache is not None else None
+        fetched = detail is None
         try:
-            detail_html = fetch_url(url, timeout=timeout)
-            detail = parse_detail_page(detail_html, url)
-            for key, value in detail.items():
-                if value:
-                    merged[key] = value
+            if detail is None:
+                detail = parse_detail_page(fetch_url(url, timeout=timeout), url)
+                if detail_cache is not None:
+                    detail_cache.put(job, detail)
+            merged = merge_job_detail(job, detail)
         except Exception as exc:
             print(f"[WARN][Emploi.ma] detail fetch failed idx={idx}/{total} url={url}: {exc}")
         enriched.append(merged)
         if idx % 10 == 0 or idx == total:
             print(f"[INFO][Emploi.ma] detail progress {idx}/{total}")
-        if sleep_seconds > 0 and idx < total:
+        if fetched and sleep_seconds > 0 and idx < total:
             time.sleep(sleep_seconds)
     return enriched
 
@@ -273,7 +282,16 @@ def build_filtered_df(all_jobs: list[dict], filter_mode: str) -> pd.DataFrame:
     return df_f
 
 
-def fetch_all_jobs(max_pages: int = 0, max_jobs: int = 0, sleep_seconds: float = 0.4, timeout: int = 20) -> list[dict]:
+def fetch_all_jobs(
+    max_pages: int = 0,
+    max_jobs: int = 0,
+    sleep_seconds: float = 0.4,
+    timeout: int = 20,
+    concurrency: int = 1,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
+    if concurrency > 1:
+        return crawl_all_jobs(max_pages, max_jobs, sleep_seconds, timeout, concurrency, detail_cache)
     first_page_html = fetch_url(build_listing_url(0), timeout=timeout)
     total_pages = extract_total_pages(first_page_html)
     if max_pages > 0:
@@ -298,7 +316,49 @@ def fetch_all_jobs(max_pages: int = 0, max_jobs: int = 0, sleep_seconds: float =
         deduped = deduped[:max_jobs]
         print(f"[INFO][Emploi.ma] Max jobs limit applied: {len(deduped)}")
 
-    return enrich_jobs_with_details(deduped, sleep_seconds=sleep_seconds, timeout=timeout)
+    return enrich_jobs_with_details(deduped, sleep_seconds=sleep_seconds, timeout=timeout, detail_cache=detail_cache)
+
+
+def crawl_all_jobs(
+    max_pages: int = 0,
+    max_jobs: int = 0,
+    sleep_seconds: float = 0.4,
+    timeout: int = 20,
+    concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
+    """
+    fetch_all_jobs with every listing page (the count is known from page 1) fetched in parallel
+    and detail pages fetched as soon as their listing page is parsed.
+    sleep_seconds spaces request starts on the site.
+    """
+    with SiteCrawler(lambda url: fetch_url(url, timeout=timeout), concurrency, delay=sleep_seconds) as crawler:
+        details = DetailPrefetch(crawler, parse_detail_page, max_jobs=max_jobs, detail_cache=detail_cache)
+        first_page_html = crawler.submit(build_listing_url(0)).result()
+        total_pages = extract_total_pages(first_page_html)
+        if max_pages > 0:
+            total_pages = min(total_pages, max_pages)
+        pages = [crawler.submit(build_listing_url(page_idx)) for page_idx in range(1, total_pages)]
+
+        print(f"[INFO][Emploi.ma] Listing pages to fetch: {total_pages}")
+        listing_jobs = parse_listing_cards(first_page_html)
+        details.add(listing_jobs)
+        print(f"[INFO][Emploi.ma] Listing page 1/{total_pages}: {len(listing_jobs)} rows")
+
+        for page_idx, page in enumerate(pages, start=1):
+            page_jobs = parse_listing_cards(page.result())
+            listing_jobs.extend(page_jobs)
+            details.add(page_jobs)
+            print(f"[INFO][Emploi.ma] Listing page {page_idx + 1}/{total_pages}: {len(page_jobs)} rows")
+
+        deduped = dedup_jobs(listing_jobs)
+        print(f"[INFO][Emploi.ma] Listing deduped rows: {len(deduped)}")
+
+        if max_jobs > 0:
+            deduped = deduped[:max_jobs]
+            print(f"[INFO][Emploi.ma] Max jobs limit applied: {len(deduped)}")
+
+        return details.merge(deduped, merge_job_detail, "Emploi.ma")
 
 
 def main():
@@ -326,6 +386,22 @@ def main():
     parser.add_argument("--max-jobs", type=int, default=0, help="Limit jobs after listing dedup (0 = all).")
     parser.add_argument("--sleep", type=float, default=0.4, help="Sleep between HTTP requests.")
     parser.add_argument("--timeout", type=int, default=20, help="HTTP timeout in seconds.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CRAWL_CONCURRENCY,
+        help="Requests in flight on Emploi.ma (1 = serial crawl with --sleep pauses).",
+    )
+    parser.add_argument(
+        "--detail-cache",
+        default="",
+        help="SQLite cache of parsed detail pages (default: market detail_cache_db).",
+    )
+    parser.add_argument(
+        "--no-detail-cache",
+        action="store_true",
+        help="Fetch every detail page, even when its listing card is unchanged since the cached fetch.",
+    )
     args = parser.parse_args()
 
     market = configure_market(args.market, args.ch_focus)
@@ -356,12 +432,23 @@ def main():
             print(f"[WARN][Emploi.ma] Empty raw file: {raw_csv}")
             all_jobs = []
     else:
-        all_jobs = fetch_all_jobs(
-            max_pages=args.max_pages,
-            max_jobs=args.max_jobs,
-            sleep_seconds=args.sleep,
-            timeout=args.timeout,
+        detail_cache = None if args.no_detail_cache else DetailCache(
+            args.detail_cache or output_paths["detail_cache_db"], "emploi_ma"
         )
+        try:
+            all_jobs = fetch_all_jobs(
+                max_pages=args.max_pages,
+                max_jobs=args.max_jobs,
+                sleep_seconds=args.sleep,
+                timeout=args.timeout,
+                concurrency=args.concurrency,
+                detail_cache=detail_cache,
+            )
+            print_transport_stats()
+        finally:
+            if detail_cache is not None:
+                print(detail_cache.summary())
+                detail_cache.close()
         safe_save_csv(pd.DataFrame(all_jobs), raw_csv)
         print(f"[INFO][Emploi.ma] Raw saved: {len(all_jobs)}")
 
@@ -12,13 +12,17 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
+import queue
 import random
 import re
 import subprocess
 import sys
+import threading
 import time
 from collections import Counter
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import partial
 from html import unescape
 from pathlib import Path
 from typing import Optional, Tuple
@@ -35,6 +39,17 @@ except Exception:
 
 import adzuna_fetch as af
 from config import SUPPORTED_CH_FOCUS, SUPPORTED_FILTER_MODES, SUPPORTED_MARKETS, resolve_filter_mode
+from description_cache import DEFAULT_TTL_DAYS, CacheEntry, DescriptionCache, open_description_cache
+from http_transport import (
+    NO_RETRY,
+    RETRY_STATUSES,
+    HostPoliteness,
+    RetryPolicy,
+    get_transport,
+    print_transport_stats,
+)
+from rule_profiler import profiling_requested
+from table_storage import read_table, table_source
 
 try:
     from bs4 import BeautifulSoup
@@ -46,6 +61,12 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64; rv:126.0) Gecko/20100101 Firefox/126.0",
 ]
+HTML_ACCEPT = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+
+# Job pages on every host (Adzuna details, redirect targets, employer sites) share one transport.
+HTTP = get_transport("enrich", headers={"Accept": HTML_ACCEPT, "Accept-Language": "en-US,en;q=0.9"})
+# 403s are retried too: the next attempt rotates the User-Agent.
+ENRICH_RETRY_STATUSES = RETRY_STATUSES | {403}
 
 # In full-description recheck, only hard-exclude on high-confidence signals.
 HARD_EXCLUDE_KEYWORDS = {
@@ -282,40 +303,68 @@ CORE_IT_TITLE_MARKERS = [
 ]
 
 
+@contextmanager
+def _polite(politeness: Optional[HostPoliteness], url: str):
+    if politeness is None:
+        yield
+        return
+    with politeness.slot(url):
+        yield
+
+
+def fetch_response(
+    url: str,
+    session: Optional[requests.Session] = None,
+    max_retries: int = 3,
+    timeout: int = 15,
+    politeness: Optional[HostPoliteness] = None,
+    extra_headers: Optional[dict] = None,
+) -> Tuple[Optional[requests.Response], Optional[str]]:
+    """
+    Return (response, None) or (None, error). Retries on transient HTTP errors.
+    A 304 answer to conditional extra_headers is returned as a response, not an error.
+    session=None sends over the pooled keep-alive connections of HTTP.
+    """
+    parsed = urlparse(url)
+    referer = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme and parsed.netloc else "https://www.google.com/"
+
+    def headers(attempt: int) -> dict:
+        return {"User-Agent": USER_AGENTS[attempt % len(USER_AGENTS)], "Referer": referer, **(extra_headers or {})}
+
+    # Light jitter helps reduce synchronized retries on rate-limited hosts.
+    retry = RetryPolicy(attempts=max_retries, backoff=1.5, jitter=0.5, retry_statuses=ENRICH_RETRY_STATUSES)
+    try:
+        resp = HTTP.get(
+            url,
+            session=session,
+            headers=headers,
+            pace=partial(_polite, politeness, url),
+            retry=retry,
+            timeout=timeout,
+        )
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    return resp, None
+
+
+def response_validators(resp: requests.Response) -> dict:
+    """HTTP cache validators of a response, for later conditional requests."""
+    return {
+        "etag": str(resp.headers.get("ETag", "") or ""),
+        "last_modified": str(resp.headers.get("Last-Modified", "") or ""),
+    }
+
+
 def fetch_with_retries(
     url: str,
-    session: requests.Session,
+    session: Optional[requests.Session],
     max_retries: int = 3,
     timeout: int = 15,
+    politeness: Optional[HostPoliteness] = None,
 ) -> Tuple[Optional[str], Optional[str]]:
     """Return HTML text or (None, error). Retries on transient HTTP errors."""
-    for attempt in range(max_retries):
-        try:
-            parsed = urlparse(url)
-            referer = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme and parsed.netloc else "https://www.google.com/"
-            resp = session.get(
-                url,
-                timeout=timeout,
-                headers={
-                    "User-Agent": USER_AGENTS[attempt % len(USER_AGENTS)],
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Connection": "close",
-                    "Referer": referer,
-                },
-            )
-            if resp.status_code >= 500 or resp.status_code == 429:
-                raise requests.HTTPError(f"{resp.status_code} {resp.reason}")
-            resp.raise_for_status()
-            return resp.text, None
-        except Exception as e:
-            err = f"{type(e).__name__}: {e}"
-            if attempt < max_retries - 1:
-                # Light jitter helps reduce synchronized retries on rate-limited hosts.
-                time.sleep(1.5 * (attempt + 1) + random.uniform(0.1, 0.6))
-                continue
-            return None, err
-    return None, "unknown_error"
+    resp, err = fetch_response(url, session, max_retries=max_retries, timeout=timeout, politeness=politeness)
+    return (resp.text, None) if resp is not None else (None, err)
 
 
 def extract_text(html: str, max_chars: int = 12000) -> str:
@@ -461,9 +510,10 @@ def find_adzuna_url_via_search(
     title: str,
     company: str,
     location: str,
-    session: requests.Session,
+    session: Optional[requests.Session],
     timeout: int = 12,
     base_host: str = "www.adzuna.be",
+    politeness: Optional[HostPoliteness] = None,
 ) -> str:
     """
     Search Adzuna website and pick the most likely matching details URL.
@@ -490,18 +540,17 @@ def find_adzuna_url_via_search(
 
     for q in queries[:3]:
         try:
-            resp = session.get(
-                f"https://{base_host}/search",
+            search_url = f"https://{base_host}/search"
+            resp = HTTP.get(
+                search_url,
+                session=session,
                 params={"what": q},
                 timeout=timeout,
-                headers={
-                    "User-Agent": random.choice(USER_AGENTS),
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                },
+                headers={"User-Agent": random.choice(USER_AGENTS)},
+                pace=partial(_polite, politeness, search_url),
+                retry=NO_RETRY,
             )
-            if resp.status_code != 200:
-                continue
+            # HTTP raises requests.HTTPError for error statuses; the except below skips that query.
             html = resp.text
             candidates: list[tuple[str, str, str]] = []
 
@@ -543,27 +592,6 @@ def find_adzuna_url_via_search(
     return best_url if best_score >= 2 else ""
 
 
-def load_cache(cache_path: str) -> dict:
-    if not cache_path or not os.path.exists(cache_path):
-        return {}
-    try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        return {}
-
-
-def save_cache(cache_path: str, data: dict):
-    if not cache_path:
-        return
-    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
-    tmp = cache_path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False)
-    os.replace(tmp, cache_path)
-
-
 def _truthy(value) -> bool:
     return str(value or "").strip().lower() in {"1", "true", "yes", "y", "on"}
 
@@ -581,14 +609,29 @@ def _job_identity(row_data: dict) -> tuple[str, str, str]:
     return main_id, title, company
 
 
+# Columns of a previous diagnostics output needed to identify and reuse its rows.
+PREVIOUS_ENRICHMENT_COLUMNS = [
+    "canonical_url",
+    "url",
+    "title",
+    "company",
+    "combined_description",
+    "scraped_description",
+    "fetched_full_description",
+    "fetch_used_url",
+    "working_url",
+    "fetch_from_cache",
+]
+
+
 def load_previous_enrichment_map(output_csv: str) -> dict[tuple[str, str, str], dict]:
     """
     Load existing diagnostics output to avoid re-enriching already processed rows.
     """
-    if not output_csv or not os.path.exists(output_csv):
+    if not output_csv:
         return {}
     try:
-        prev_df = pd.read_csv(output_csv)
+        prev_df = read_table(output_csv, columns=PREVIOUS_ENRICHMENT_COLUMNS)
     except Exception:
         return {}
     if prev_df.empty:
@@ -708,46 +751,180 @@ def playwright_fetch(url: str, timeout_ms: int = 15000) -> Tuple[Optional[str],
         return None, f"{type(e).__name__}: {e}"
 
 
+class BrowserPool:
+    """
+    Long-lived headless Chromium for the Playwright fallback, shared by the whole run.
+
+    Playwright's sync API is bound to the thread that started it, so one owner thread runs
+    every browser fetch and callers from any worker thread wait on the result. Images, fonts
+    and media are blocked, and the browser context is recycled after `recycle_after` pages
+    so long runs don't accumulate cookies and memory. Call close() once at the end.
+    """
+
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+    def __init__(self, recycle_after: int = 25, driver_factory=None):
+        self.recycle_after = max(1, int(recycle_after))
+        self._driver_factory = driver_factory or sync_playwright
+        self._requests: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self.launches = 0
+        self.contexts_created = 0
+
+    def fetch(self, url: str, timeout_ms: int = 15000) -> Tuple[Optional[str], Optional[str]]:
+        """Render `url` and return (body_text, None) or (None, error)."""
+        if self._driver_factory is None:
+            return None, "playwright_not_installed"
+        with self._lock:
+            if self._closed:
+                return None, "browser_pool_closed"
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="enrich-browser", daemon=True)
+                self._thread.start()
+            done: Future = Future()
+            self._requests.put((url, timeout_ms, done))
+        return done.result()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._requests.put(None)
+        if thread is not None:
+            thread.join()
+
+    def _block_heavy_resources(self, route):
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _run(self):
+        driver = playwright = browser = context = page = None
+        launch_error = ""
+        uses = 0
+        try:
+            while True:
+                item = self._requests.get()
+                if item is None:
+                    break
+                url, timeout_ms, done = item
+                if launch_error:
+                    done.set_result((None, launch_error))
+                    continue
+                try:
+                    if browser is None:
+                        driver = self._driver_factory()
+                        playwright = driver.start()
+                        browser = playwright.chromium.launch(headless=True)
+                        self.launches += 1
+                    if context is None or uses >= self.recycle_after:
+                        if context is not None:
+                            try:
+                                context.close()
+                            except Exception:
+                                pass
+                        context = browser.new_context()
+                        context.route("**/*", self._block_heavy_resources)
+                        page = context.new_page()
+                        self.contexts_created += 1
+                        uses = 0
+                except Exception as e:
+                    # Missing browser binaries etc. won't fix themselves: fail fast for the rest of the run.
+                    launch_error = f"browser_launch_failed:{type(e).__name__}: {e}"
+                    done.set_result((None, launch_error))
+                    continue
+
+                uses += 1
+                try:
+                    page.set_default_timeout(timeout_ms)
+                    page.goto(url, wait_until="domcontentloaded")
+                    done.set_result((page.inner_text("body"), None))
+                except PlaywrightTimeout as e:
+                    done.set_result((None, f"PlaywrightTimeout: {e}"))
+                except Exception as e:
+                    done.set_result((None, f"{type(e).__name__}: {e}"))
+                    # Start from a fresh context after a crashed page.
+                    uses = self.recycle_after
+        finally:
+            for closer in (
+                getattr(context, "close", None),
+                getattr(browser, "close", None),
+                getattr(playwright, "stop", None),
+            ):
+                if closer is None:
+                    continue
+                try:
+                    closer()
+                except Exception:
+                    pass
+            # Anything still queued after a crash gets an answer instead of hanging its caller.
+            while True:
+                try:
+                    item = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[2].set_result((None, "browser_pool_closed"))
+
+
+def _browser_fetch(
+    browser: Optional[BrowserPool], url: str, timeout_ms: int
+) -> Tuple[Optional[str], Optional[str]]:
+    if browser is None:
+        return playwright_fetch(url, timeout_ms=timeout_ms)
+    return browser.fetch(url, timeout_ms=timeout_ms)
+
+
 def fetch_description_from_candidates(
     candidates: list[str],
     title: str,
     company: str,
     location: str,
-    session: requests.Session,
+    session: Optional[requests.Session],
     max_retries: int,
     timeout: int,
     use_browser: bool,
     browser_timeout: int,
     search_host: str = "www.adzuna.be",
-) -> tuple[str, str, str]:
+    politeness: Optional[HostPoliteness] = None,
+    browser: Optional[BrowserPool] = None,
+) -> tuple[str, str, str, dict]:
     """
     Try several URL candidates and return:
-      (description_text, used_url, error_summary)
+      (description_text, used_url, error_summary, validators)
+    validators holds the ETag/Last-Modified of the page used (empty for browser/failed fetches).
     """
     errors: list[str] = []
 
     for candidate in candidates:
-        html, err = fetch_with_retries(candidate, session, max_retries=max_retries, timeout=timeout)
+        resp, err = fetch_response(candidate, session, max_retries=max_retries, timeout=timeout, politeness=politeness)
+        html = resp.text if resp is not None else None
         if html:
             text = extract_text(html)
             if text and len(text.strip()) >= af.MIN_DESCRIPTION_CHARS:
                 if is_not_found_page_text(text):
                     errors.append(f"{candidate}::not_found_template")
                     continue
-                return text, candidate, ""
+                return text, candidate, "", response_validators(resp)
             errors.append(f"{candidate}::empty_or_short")
         else:
             errors.append(f"{candidate}::{err or 'fetch_failed'}")
 
         if use_browser and ("403" in (err or "") or "429" in (err or "") or "timeout" in (err or "").lower()):
-            text, perr = playwright_fetch(candidate, timeout_ms=browser_timeout * 1000)
+            text, perr = _browser_fetch(browser, candidate, timeout_ms=browser_timeout * 1000)
             if text:
                 normalized = " ".join(text.split())[:12000]
                 if normalized and len(normalized.strip()) >= af.MIN_DESCRIPTION_CHARS:
                     if is_not_found_page_text(normalized):
                         errors.append(f"{candidate}::browser::not_found_template")
                         continue
-                    return normalized, candidate, ""
+                    return normalized, candidate, "", {}
             errors.append(f"{candidate}::browser::{perr or 'browser_failed'}")
 
     search_url = find_adzuna_url_via_search(
@@ -757,49 +934,220 @@ def fetch_description_from_candidates(
         session=session,
         timeout=timeout,
         base_host=search_host,
+        politeness=politeness,
     )
     if search_url and search_url not in candidates:
-        html, err = fetch_with_retries(search_url, session, max_retries=max_retries, timeout=timeout)
+        resp, err = fetch_response(search_url, session, max_retries=max_retries, timeout=timeout, politeness=politeness)
+        html = resp.text if resp is not None else None
         if html:
             text = extract_text(html)
             if text and len(text.strip()) >= af.MIN_DESCRIPTION_CHARS:
                 if is_not_found_page_text(text):
                     errors.append(f"{search_url}::search_fallback::not_found_template")
                 else:
-                    return text, search_url, ""
+                    return text, search_url, "", response_validators(resp)
             errors.append(f"{search_url}::search_fallback::empty_or_short")
         else:
             errors.append(f"{search_url}::search_fallback::{err or 'fetch_failed'}")
 
         if use_browser and ("403" in (err or "") or "429" in (err or "") or "timeout" in (err or "").lower()):
-            text, perr = playwright_fetch(search_url, timeout_ms=browser_timeout * 1000)
+            text, perr = _browser_fetch(browser, search_url, timeout_ms=browser_timeout * 1000)
             if text:
                 normalized = " ".join(text.split())[:12000]
                 if normalized and len(normalized.strip()) >= af.MIN_DESCRIPTION_CHARS:
                     if is_not_found_page_text(normalized):
                         errors.append(f"{search_url}::search_fallback::browser::not_found_template")
-                        return "", "", " | ".join(errors[:6])
-                    return normalized, search_url, ""
+                        return "", "", " | ".join(errors[:6]), {}
+                    return normalized, search_url, "", {}
             errors.append(f"{search_url}::search_fallback::browser::{perr or 'browser_failed'}")
 
-    return "", "", " | ".join(errors[:6])
+    return "", "", " | ".join(errors[:6]), {}
 
 
-def first_fail_reason(job: dict, filter_mode: str) -> str:
-    """Mirror passes_filters order to expose first failing step."""
+def revalidate_cached_description(
+    url: str,
+    entry: CacheEntry,
+    session: Optional[requests.Session],
+    timeout: int,
+    politeness: Optional[HostPoliteness] = None,
+) -> tuple[str, str, dict]:
+    """
+    Conditional GET for a cached description using its ETag/Last-Modified validators.
+    Returns (status, text, validators) with status:
+      not_modified -> 304, cached text is still current
+      changed      -> 200 with a usable description (text/validators are the new ones)
+      gone         -> the page now serves a not-found template
+      failed       -> network error or unusable page; keep serving the cached text
+    """
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    resp, _err = fetch_response(url, session, max_retries=1, timeout=timeout, politeness=politeness, extra_headers=headers)
+    if resp is None:
+        return "failed", "", {}
+    if resp.status_code == 304:
+        return "not_modified", "", {}
+    text = extract_text(resp.text or "")
+    if is_not_found_page_text(text):
+        return "gone", "", {}
+    if len(text.strip()) < af.MIN_DESCRIPTION_CHARS:
+        return "failed", "", {}
+    return "changed", text, response_validators(resp)
+
+
+def fetch_row_description(
+    row_data: dict,
+    previous_enrichment_map: dict,
+    cache: Optional[DescriptionCache],
+    session: Optional[requests.Session],
+    max_retries: int,
+    timeout: int,
+    use_browser: bool,
+    browser_timeout: int,
+    default_adzuna_host: str = "www.adzuna.be",
+    politeness: Optional[HostPoliteness] = None,
+    browser: Optional[BrowserPool] = None,
+    revalidate_after: float = 0.0,
+) -> dict:
+    """
+    Resolve the full description of one input row: previous enrichment, then cache, then network.
+    Safe to call from worker threads (DescriptionCache is thread-safe).
+    session=None sends over the pooled connections of HTTP.
+    Cache entries older than revalidate_after seconds (0 = never) that carry HTTP validators are
+    revalidated with a conditional request; a 304 still counts as a cache hit.
+    `outcome` is one of ok|fail|cache_hit|reused_previous or "" for progress counters.
+    """
+    url = row_data.get("url") or row_data.get("canonical_url") or ""
+    canonical_url = row_data.get("canonical_url") or ""
+    row_adzuna_host = pick_adzuna_host(str(url), str(canonical_url), fallback_host=default_adzuna_host)
+    candidates = build_fetch_candidates(str(url), str(canonical_url), default_host=row_adzuna_host)
+    result = {
+        "row_adzuna_host": row_adzuna_host,
+        "candidates": candidates,
+        "scraped": "",
+        "fetch_error": "",
+        "fetch_used_url": "",
+        "fetch_from_cache": False,
+        "reused_previous_enrichment": False,
+        "performed_network_fetch": False,
+        "revalidation": "",
+        "outcome": "",
+    }
+
+    previous_row = previous_enrichment_map.get(_job_identity(row_data), {})
+    if previous_row:
+        previous_combined = af.clean_text(previous_row.get("combined_description", "") or "")
+        previous_scraped = af.clean_text(previous_row.get("scraped_description", "") or "")
+        previous_fetched = _truthy(previous_row.get("fetched_full_description", False))
+        if previous_fetched and len(previous_combined.strip()) >= af.MIN_DESCRIPTION_CHARS:
+            result["scraped"] = previous_scraped if previous_scraped else previous_combined
+            result["fetch_used_url"] = str(
+                previous_row.get("fetch_used_url")
+                or previous_row.get("working_url")
+                or previous_row.get("url")
+                or ""
+            ).strip()
+            result["fetch_from_cache"] = _truthy(previous_row.get("fetch_from_cache", False))
+            result["reused_previous_enrichment"] = True
+            result["outcome"] = "reused_previous"
+            return result
+
+    if not candidates:
+        result["fetch_error"] = "missing_url"
+        result["outcome"] = "fail"
+        return result
+
+    # Cache hit: first candidate with cached non-empty description wins.
+    if cache is not None:
+        for c in candidates:
+            entry = cache.lookup(c)
+            cached_text = entry.text if entry else ""
+            if is_not_found_page_text(cached_text):
+                # Purge stale cache entries containing generic "page not found" templates.
+                cache.discard(c)
+                continue
+            if cached_text and len(cached_text.strip()) >= af.MIN_DESCRIPTION_CHARS:
+                if revalidate_after > 0 and entry.age_seconds >= revalidate_after and (entry.etag or entry.last_modified):
+                    result["performed_network_fetch"] = True
+                    status, fresh_text, validators = revalidate_cached_description(
+                        c, entry, session, timeout=timeout, politeness=politeness
+                    )
+                    result["revalidation"] = status
+                    if status == "not_modified":
+                        cache.touch(c, aliases=candidates)
+                    elif status == "changed":
+                        cache.put(c, fresh_text, aliases=candidates, **validators)
+                        result["scraped"] = fresh_text
+                        result["fetch_used_url"] = c
+                        result["outcome"] = "ok"
+                        return result
+                    elif status == "gone":
+                        # The posting now serves a not-found page: drop it and fetch as a new row.
+                        cache.discard(c)
+                        continue
+                result["scraped"] = cached_text
+                result["fetch_used_url"] = c
+                result["fetch_from_cache"] = True
+                result["outcome"] = "cache_hit"
+                return result
+
+    result["performed_network_fetch"] = True
+    scraped, fetch_used_url, fetch_error, validators = fetch_description_from_candidates(
+        candidates=candidates,
+        title=str(row_data.get("title", "")),
+        company=str(row_data.get("company", "")),
+        location=str(row_data.get("location", "")),
+        session=session,
+        max_retries=max_retries,
+        timeout=timeout,
+        use_browser=use_browser,
+        browser_timeout=browser_timeout,
+        search_host=row_adzuna_host,
+        politeness=politeness,
+        browser=browser,
+    )
+    result.update(scraped=scraped, fetch_used_url=fetch_used_url, fetch_error=fetch_error)
+    if scraped:
+        if cache is not None and fetch_used_url:
+            # Keep aliases warm to improve future hit rates; the text itself is stored once.
+            cache.put(fetch_used_url, scraped, aliases=candidates, **validators)
+        result["outcome"] = "ok"
+    else:
+        result["outcome"] = "fail"
+    return result
+
+
+def _trace_fail_reason(outcome: "af.StageOutcome") -> str:
+    """Recheck reason id of a failed passes_filters stage."""
+    detail = outcome.detail
+    if outcome.stage == "bad_title":
+        return f"bad_title:{detail.strip()}"
+    if outcome.stage == "role_relevant":
+        if detail.startswith("forbidden:"):
+            return f"role_forbidden:{detail.split(':', 1)[1]}"
+        return "role_missing_required"
+    if outcome.stage == "internship_student_only":
+        return f"non_target_role:student_internship_required:{detail}"
+    if outcome.stage == "internship_generic":
+        return f"non_target_role:internship_generic:{detail}"
+    if outcome.stage == "exclude_keywords":
+        return f"exclude_keyword:{detail}"
+    if outcome.stage == "experience":
+        return f"explicit_senior_requirement:hard:{detail}"
+    return detail or outcome.stage
+
+
+def first_fail_reason(job: dict, filter_mode: str, trace: "af.FilterTrace | None" = None) -> str:
+    """
+    First failing step: the recheck-only rules, then the passes_filters trace (reused when
+    the caller already has it for this job and mode).
+    """
     mode = resolve_filter_mode(filter_mode, allow_both=False)
 
-    created = job.get("created", "") or job.get("updated", "")
-    loc = job.get("location", "")
-    if isinstance(loc, dict):
-        loc = loc.get("display_name", "")
-    if not loc:
-        loc = job.get("location.display_name", "")
-    loc = af.rule_plain_text(loc)
-
     title = af.rule_plain_text(job.get("title", "") or "")
     desc = af.rule_plain_text(job.get("description", "") or "")
-    full_text = f"{title} {desc}"
     senior_reason = detect_explicit_senior_requirement(title, desc)
     if senior_reason:
         return senior_reason
@@ -816,48 +1164,19 @@ def first_fail_reason(job: dict, filter_mode: str) -> str:
     if internship_manual_detail:
         return f"non_target_role:internship_generic:{internship_manual_detail}"
 
-    if af.REQUIRE_DESCRIPTION and len(desc.strip()) < af.MIN_DESCRIPTION_CHARS:
-        return "description_too_short"
-
-    norm_title = af.normalize(title)
-    for bad_title in af.BAD_TITLE_KEYWORDS:
-        if bad_title in norm_title:
-            return f"bad_title:{bad_title.strip()}"
-
-    if not af.is_recent(created, af.MAX_DAYS_OLD):
-        return "too_old"
-
-    if not af.location_ok(loc, title, desc):
-        return "location_blocked"
-
-    if not af.role_relevant(title, desc):
-        forbidden_detail = af.role_forbidden_reason(title, desc)
-        if forbidden_detail:
-            return f"role_forbidden:{forbidden_detail}"
-        return "role_missing_required"
-
-    hard_hits, soft_hits = af.classify_excluded_hits(title, full_text)
-    if hard_hits:
-        return f"exclude_keyword:{hard_hits[0]}"
-    if soft_hits:
-        return f"exclude_keyword:{soft_hits[0]}"
-
-    blocked_language_reason = af.blocked_language_requirement_reason(full_text)
-    if blocked_language_reason:
-        return blocked_language_reason
-
-    language_alternative_reason = af.language_manual_review_reason(full_text)
-    if language_alternative_reason:
-        return language_alternative_reason
-
-    if mode == "strict" and af.is_disallowed_language(full_text):
-        return "blocked_language_detected"
-
-    junior_score = af.compute_junior_score(title, desc)
-    min_junior_score = 0 if mode == "strict" else -1
-    if junior_score < min_junior_score:
-        return f"junior_score<{min_junior_score}"
-
+    if trace is None or trace.filter_mode != mode:
+        trace = af.passes_filters(job, filter_mode=mode, trace=True)
+    for outcome in trace.stages:
+        # Manual-review language alternatives outrank the language detection verdicts.
+        if outcome.stage == "blocked_language":
+            language_alternative_reason = af.language_manual_review_reason(f"{title} {desc}")
+            if language_alternative_reason:
+                return language_alternative_reason
+        if not outcome.passed:
+            return _trace_fail_reason(outcome)
+        # Soft exclude hits never reject on their own but explain a later failure best.
+        if outcome.stage == "exclude_keywords" and outcome.detail.startswith("soft:"):
+            return f"exclude_keyword:{outcome.detail.split(':', 1)[1]}"
     return ""
 
 
@@ -957,6 +1276,17 @@ def keyword_hit(text_norm: str, keyword: str) -> bool:
     return re.search(pattern, txt) is not None
 
 
+# Recheck stages timed by --profile-rules on top of the adzuna_fetch rule stages:
+# name -> predicate telling when the result drops the job (see rule_profiler).
+RECHECK_PROFILE_STAGES = {
+    "detect_explicit_senior_requirement": bool,
+    "detect_mid_experience_requirement": bool,
+    "detect_non_target_role": bool,
+    "first_fail_reason": bool,
+    "classify_recheck_failure": lambda result: result[0],
+}
+
+
 def detect_explicit_senior_requirement(title: str, desc: str) -> str:
     """Return a reason id when text clearly signals non-junior seniority."""
     title_norm = af.normalize(title or "")
@@ -1114,7 +1444,24 @@ def main():
         default="",
         help="Optional output CSV for hard-excluded rows only.",
     )
-    parser.add_argument("--sleep", type=float, default=1.5, help="Seconds to sleep between requests.")
+    parser.add_argument(
+        "--sleep",
+        type=float,
+        default=1.5,
+        help="Seconds to sleep between requests (per host when --concurrency > 1).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Fetch N rows in parallel with per-host politeness (default: 1, serial).",
+    )
+    parser.add_argument(
+        "--per-host-concurrency",
+        type=int,
+        default=1,
+        help="Max in-flight requests per host when --concurrency > 1.",
+    )
     parser.add_argument("--max-retries", type=int, default=3, help="Max retries per URL.")
     parser.add_argument("--timeout", type=int, default=15, help="Request timeout in seconds.")
     parser.add_argument(
@@ -1123,6 +1470,12 @@ def main():
         help="Use Playwright Chromium fallback for blocked/JS-heavy pages.",
     )
     parser.add_argument("--browser-timeout", type=int, default=15, help="Playwright timeout in seconds.")
+    parser.add_argument(
+        "--browser-recycle-after",
+        type=int,
+        default=25,
+        help="Open a fresh browser context after N rendered pages (one Chromium is kept for the run).",
+    )
     parser.add_argument(
         "--max-jobs",
         type=int,
@@ -1132,13 +1485,39 @@ def main():
     parser.add_argument(
         "--cache-path",
         default="",
-        help="Optional JSON cache file for fetched descriptions.",
+        help=(
+            "Optional SQLite cache file for fetched descriptions. A legacy .json path uses the "
+            ".sqlite file next to it and imports the JSON once."
+        ),
+    )
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        help="Ignore and evict cached descriptions older than N days (0 = keep forever).",
+    )
+    parser.add_argument(
+        "--revalidate-after-hours",
+        type=float,
+        default=24.0,
+        help=(
+            "Revalidate cached descriptions older than N hours with a conditional request "
+            "(ETag/Last-Modified; 0 = never)."
+        ),
     )
     parser.add_argument(
         "--no-cache",
         action="store_true",
         help="Disable description cache reads/writes.",
     )
+    parser.add_argument(
+        "--profile-rules",
+        action="store_true",
+        help=(
+            "Time each filter rule and recheck stage (also JOB_PROFILE_RULES=1); "
+            "the report is saved next to --output."
+        ),
+    )
     parser.add_argument(
         "--progress-every",
         type=int,
@@ -1164,25 +1543,27 @@ def main():
     )
     default_adzuna_host = f"www.adzuna.{af.ACTIVE_MARKET_PROFILE.get('adzuna_country', 'be')}"
 
-    default_cache_path = str(Path(args.output).with_name("description_fetch_cache.json"))
+    default_cache_path = str(Path(args.output).with_name("description_fetch_cache.sqlite"))
     cache_path = "" if args.no_cache else (args.cache_path or default_cache_path)
-    cache = load_cache(cache_path) if cache_path else {}
+    cache = open_description_cache(cache_path, ttl_days=args.cache_ttl_days) if cache_path else None
     previous_enrichment_map = load_previous_enrichment_map(args.output)
 
-    df = pd.read_csv(args.input)
+    if table_source(args.input) is None:
+        raise FileNotFoundError(args.input)
+    df = read_table(args.input)
     if df.empty:
         print(f"[ENRICH] Empty input: {args.input}")
         Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-        af.safe_save_csv(df, args.output)
+        af.safe_save_table(df, args.output)
         if apply_ready_output:
             Path(apply_ready_output).parent.mkdir(parents=True, exist_ok=True)
-            af.safe_save_csv(df, apply_ready_output)
+            af.safe_save_table(df, apply_ready_output)
         if manual_review_output:
             Path(manual_review_output).parent.mkdir(parents=True, exist_ok=True)
-            af.safe_save_csv(df, manual_review_output)
+            af.safe_save_table(df, manual_review_output)
         if hard_excluded_output:
             Path(hard_excluded_output).parent.mkdir(parents=True, exist_ok=True)
-            af.safe_save_csv(df, hard_excluded_output)
+            af.safe_save_table(df, hard_excluded_output)
         return
 
     if args.max_jobs and args.max_jobs > 0:
@@ -1196,7 +1577,29 @@ def main():
     hard_reason_counts: Counter[str] = Counter()
     review_reason_counts: Counter[str] = Counter()
 
-    session = requests.Session()
+    concurrency = max(1, int(args.concurrency or 1))
+    politeness = HostPoliteness(delay=args.sleep, max_per_host=args.per_host_concurrency) if concurrency > 1 else None
+    if concurrency > 1:
+        print(
+            f"[ENRICH] concurrency={concurrency} per_host_concurrency={politeness.max_per_host} "
+            f"per_host_delay={politeness.delay}s"
+        )
+    browser_pool = BrowserPool(recycle_after=args.browser_recycle_after) if args.use_browser else None
+    fetch_row = partial(
+        fetch_row_description,
+        previous_enrichment_map=previous_enrichment_map,
+        cache=cache,
+        session=None,
+        max_retries=args.max_retries,
+        timeout=args.timeout,
+        use_browser=args.use_browser,
+        browser_timeout=args.browser_timeout,
+        default_adzuna_host=default_adzuna_host,
+        politeness=politeness,
+        browser=browser_pool,
+        revalidate_after=max(0.0, args.revalidate_after_hours) * 3600,
+    )
+    revalidation_counts: Counter[str] = Counter()
     ok = 0
     fail = 0
     cache_hits = 0
@@ -1205,334 +1608,308 @@ def main():
     started_at = time.time()
     progress_every = max(0, int(args.progress_every))
 
-    for idx, (_, row) in enumerate(df.iterrows(), start=1):
-        row_data = row.to_dict()
-        url = row_data.get("url") or row_data.get("canonical_url") or ""
-        canonical_url = row_data.get("canonical_url") or ""
-        source = str(row_data.get("source", "adzuna") or "adzuna")
-        original_desc = af.clean_text(row_data.get("description", "") or "")
-        row_adzuna_host = pick_adzuna_host(str(url), str(canonical_url), fallback_host=default_adzuna_host)
-        candidates = build_fetch_candidates(str(url), str(canonical_url), default_host=row_adzuna_host)
-
-        scraped = ""
-        fetch_error = ""
-        fetch_used_url = ""
-        fetch_from_cache = False
-        reused_previous_enrichment = False
-        previous_row = previous_enrichment_map.get(_job_identity(row_data), {})
-        if previous_row:
-            previous_combined = af.clean_text(previous_row.get("combined_description", "") or "")
-            previous_scraped = af.clean_text(previous_row.get("scraped_description", "") or "")
-            previous_fetched = _truthy(previous_row.get("fetched_full_description", False))
-            if previous_fetched and len(previous_combined.strip()) >= af.MIN_DESCRIPTION_CHARS:
-                scraped = previous_scraped if previous_scraped else previous_combined
-                fetch_used_url = str(
-                    previous_row.get("fetch_used_url")
-                    or previous_row.get("working_url")
-                    or previous_row.get("url")
-                    or ""
-                ).strip()
-                fetch_from_cache = _truthy(previous_row.get("fetch_from_cache", False))
-                reused_previous_enrichment = True
-                reuse_hits += 1
-
-        performed_network_fetch = False
-        if candidates and not reused_previous_enrichment:
-            # Cache hit: first candidate with cached non-empty description wins.
-            if cache_path:
-                for c in candidates:
-                    cached = cache.get(c, {})
-                    cached_text = str(cached.get("scraped", "") or "")
-                    if is_not_found_page_text(cached_text):
-                        # Purge stale cache entries containing generic "page not found" templates.
-                        cache.pop(c, None)
-                        continue
-                    if cached_text and len(cached_text.strip()) >= af.MIN_DESCRIPTION_CHARS:
-                        scraped = cached_text
-                        fetch_used_url = c
-                        fetch_from_cache = True
-                        cache_hits += 1
-                        break
-
-            if not scraped:
-                performed_network_fetch = True
-                scraped, fetch_used_url, fetch_error = fetch_description_from_candidates(
-                    candidates=candidates,
-                    title=str(row_data.get("title", "")),
-                    company=str(row_data.get("company", "")),
-                    location=str(row_data.get("location", "")),
-                    session=session,
-                    max_retries=args.max_retries,
-                    timeout=args.timeout,
-                    use_browser=args.use_browser,
-                    browser_timeout=args.browser_timeout,
-                    search_host=row_adzuna_host,
-                )
-                if scraped:
-                    if cache_path and fetch_used_url:
-                        cache[fetch_used_url] = {"scraped": scraped}
-                        # Keep aliases warm to improve future hit rates.
-                        for c in candidates:
-                            if c not in cache and c != fetch_used_url:
-                                cache[c] = {"scraped": scraped}
-                    ok += 1
-                else:
-                    fail += 1
-            if performed_network_fetch:
+    input_rows = [row.to_dict() for _, row in df.iterrows()]
+    profile_path = ""
+    if profiling_requested(args.profile_rules):
+        output_path = Path(args.output)
+        profile_path = str(output_path.with_name(f"{output_path.stem}_rule_profile.json"))
+        af.enable_rule_profiler().instrument(sys.modules[__name__], RECHECK_PROFILE_STAGES, prefix="recheck.")
+    fetch_pool = None
+    try:
+        if concurrency > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            fetch_pool = ThreadPoolExecutor(max_workers=concurrency)
+            # pool.map yields results in input order while later rows are still being fetched.
+            fetched_rows = fetch_pool.map(fetch_row, input_rows)
+        else:
+            fetched_rows = map(fetch_row, input_rows)
+
+        for idx, (row_data, fetched) in enumerate(zip(input_rows, fetched_rows), start=1):
+            url = row_data.get("url") or row_data.get("canonical_url") or ""
+            canonical_url = row_data.get("canonical_url") or ""
+            source = str(row_data.get("source", "adzuna") or "adzuna")
+            original_desc = af.clean_text(row_data.get("description", "") or "")
+            row_adzuna_host = fetched["row_adzuna_host"]
+            candidates = fetched["candidates"]
+            scraped = fetched["scraped"]
+            fetch_error = fetched["fetch_error"]
+            fetch_used_url = fetched["fetch_used_url"]
+            fetch_from_cache = fetched["fetch_from_cache"]
+            reused_previous_enrichment = fetched["reused_previous_enrichment"]
+            ok += fetched["outcome"] == "ok"
+            fail += fetched["outcome"] == "fail"
+            cache_hits += fetched["outcome"] == "cache_hit"
+            reuse_hits += fetched["outcome"] == "reused_previous"
+            if fetched["revalidation"]:
+                revalidation_counts[fetched["revalidation"]] += 1
+            if fetched["performed_network_fetch"] and concurrency == 1:
                 time.sleep(args.sleep)
-        elif not candidates and not reused_previous_enrichment:
-            fetch_error = "missing_url"
-            fail += 1
-
-        combined_desc = scraped if scraped and len(scraped) > len(original_desc) else original_desc
-        details_from_url = normalize_details_url(str(url), default_host=row_adzuna_host)
-        details_from_canonical = normalize_details_url(str(canonical_url), default_host=row_adzuna_host)
-        working_url = fetch_used_url or details_from_url or details_from_canonical or str(canonical_url or url or "")
-        original_len = len((original_desc or "").strip())
-        combined_len = len((combined_desc or "").strip())
-        scraped_len = len((scraped or "").strip())
-        preview_only = (
-            original_len >= 390
-            and combined_len <= 420
-            and (not scraped or scraped_len <= original_len)
-        )
 
-        job_before = dict(row_data)
-        job_before["description"] = original_desc
-        keep_before = af.passes_filters(job_before, source=source, filter_mode=filter_mode) is not None
+            combined_desc = scraped if scraped and len(scraped) > len(original_desc) else original_desc
+            details_from_url = normalize_details_url(str(url), default_host=row_adzuna_host)
+            details_from_canonical = normalize_details_url(str(canonical_url), default_host=row_adzuna_host)
+            working_url = fetch_used_url or details_from_url or details_from_canonical or str(canonical_url or url or "")
+            original_len = len((original_desc or "").strip())
+            combined_len = len((combined_desc or "").strip())
+            scraped_len = len((scraped or "").strip())
+            preview_only = (
+                original_len >= 390
+                and combined_len <= 420
+                and (not scraped or scraped_len <= original_len)
+            )
 
-        job_after = dict(row_data)
-        job_after["description"] = combined_desc
-        title_text = str(row_data.get("title", "") or "")
-        location_text = str(row_data.get("location", "") or "")
-        experience_level, experience_detail, years_required = af.detect_experience_requirement_details(
-            title_text, combined_desc
-        )
-        work_mode = af.detect_work_mode(title_text, combined_desc, location_text)
-        explicit_senior_reason = detect_explicit_senior_requirement(title_text, combined_desc)
-        internship_reason_detail = af.internship_student_only_detail(title_text, combined_desc)
-        internship_manual_detail = af.internship_generic_detail(title_text, combined_desc)
-        non_target_reason = detect_non_target_role(title_text, combined_desc)
-        mid_experience_reason = detect_mid_experience_requirement(title_text, combined_desc)
-        language_req = af.language_requirements(combined_desc)
-        language_required_codes = sorted(language_req.get("required_langs", set()))
-        language_optional_codes = sorted(language_req.get("optional_langs", set()))
-        language_evidence = language_req.get("evidence", [])
-        blocked_language_reason = af.blocked_language_requirement_reason(combined_desc)
-        language_alternative_reason = af.language_manual_review_reason(combined_desc)
-        page_not_found_detected = (not scraped) and ("not_found_template" in str(fetch_error or "").lower())
-        keep_after_filters = af.passes_filters(job_after, source=source, filter_mode=filter_mode) is not None
-        if page_not_found_detected:
-            keep_after_full = False
-            fail_reason = "source_page_not_found"
-        elif keep_after_filters and preview_only:
-            keep_after_full = False
-            fail_reason = "insufficient_full_description"
-        elif explicit_senior_reason:
-            keep_after_full = False
-            fail_reason = explicit_senior_reason
-        elif internship_reason_detail:
-            keep_after_full = False
-            fail_reason = f"non_target_role:student_internship_required:{internship_reason_detail}"
-        elif non_target_reason:
-            keep_after_full = False
-            fail_reason = non_target_reason
-        elif blocked_language_reason:
-            keep_after_full = False
-            fail_reason = blocked_language_reason
-        elif language_alternative_reason:
-            keep_after_full = False
-            fail_reason = language_alternative_reason
-        elif mid_experience_reason:
-            keep_after_full = False
-            fail_reason = mid_experience_reason
-        elif internship_manual_detail:
-            keep_after_full = False
-            fail_reason = f"non_target_role:internship_generic:{internship_manual_detail}"
-        else:
-            keep_after_full = bool(keep_after_filters)
-            fail_reason = "" if keep_after_full else first_fail_reason(job_after, filter_mode)
-
-        hard_exclude, manual_review_reason = classify_recheck_failure(
-            keep_before=bool(keep_before),
-            keep_after_full=bool(keep_after_full),
-            fail_reason=fail_reason,
-            title=str(row_data.get("title", "") or ""),
-            filter_mode=filter_mode,
-        )
-        manual_review_flag = bool(keep_before and not keep_after_full and not hard_exclude and manual_review_reason)
-        apply_ready_flag = bool(keep_after_full and not hard_exclude and not manual_review_flag)
-        blocked_reason_detail = blocked_reason_detail_from_reason(manual_review_reason or fail_reason)
-        seniority_flag = "none"
-        if explicit_senior_reason:
-            seniority_flag = "hard"
-        elif mid_experience_reason:
-            seniority_flag = "soft"
-        effective_reason = manual_review_reason or fail_reason
-        if seniority_flag == "none":
-            if str(effective_reason).startswith("explicit_senior_requirement:") or str(effective_reason).startswith(
-                "title_senior_marker:"
-            ):
-                seniority_flag = "hard"
-            elif str(effective_reason).startswith("explicit_experience_requirement:"):
-                seniority_flag = "soft"
-            elif experience_level == "hard":
+            job_before = dict(row_data)
+            job_before["description"] = original_desc
+            keep_before = af.passes_filters(job_before, source=source, filter_mode=filter_mode) is not None
+
+            job_after = dict(row_data)
+            job_after["description"] = combined_desc
+            title_text = str(row_data.get("title", "") or "")
+            location_text = str(row_data.get("location", "") or "")
+            experience_level, experience_detail, years_required = af.detect_experience_requirement_details(
+                title_text, combined_desc
+            )
+            work_mode = af.detect_work_mode(title_text, combined_desc, location_text)
+            explicit_senior_reason = detect_explicit_senior_requirement(title_text, combined_desc)
+            internship_reason_detail = af.internship_student_only_detail(title_text, combined_desc)
+            internship_manual_detail = af.internship_generic_detail(title_text, combined_desc)
+            non_target_reason = detect_non_target_role(title_text, combined_desc)
+            mid_experience_reason = detect_mid_experience_requirement(title_text, combined_desc)
+            # One cached analysis serves the requirements, blocked and manual-review reasons below.
+            language_after = af.analyze_language(combined_desc)
+            language_req = language_after.requirements
+            language_required_codes = sorted(language_req.get("required_langs", set()))
+            language_optional_codes = sorted(language_req.get("optional_langs", set()))
+            language_evidence = list(language_req.get("evidence", []))
+            blocked_language_reason = language_after.blocked_reason
+            language_alternative_reason = language_after.manual_review_reason
+            page_not_found_detected = (not scraped) and ("not_found_template" in str(fetch_error or "").lower())
+            trace_after = af.passes_filters(job_after, source=source, filter_mode=filter_mode, trace=True)
+            keep_after_filters = trace_after.passed
+            if page_not_found_detected:
+                keep_after_full = False
+                fail_reason = "source_page_not_found"
+            elif keep_after_filters and preview_only:
+                keep_after_full = False
+                fail_reason = "insufficient_full_description"
+            elif explicit_senior_reason:
+                keep_after_full = False
+                fail_reason = explicit_senior_reason
+            elif internship_reason_detail:
+                keep_after_full = False
+                fail_reason = f"non_target_role:student_internship_required:{internship_reason_detail}"
+            elif non_target_reason:
+                keep_after_full = False
+                fail_reason = non_target_reason
+            elif blocked_language_reason:
+                keep_after_full = False
+                fail_reason = blocked_language_reason
+            elif language_alternative_reason:
+                keep_after_full = False
+                fail_reason = language_alternative_reason
+            elif mid_experience_reason:
+                keep_after_full = False
+                fail_reason = mid_experience_reason
+            elif internship_manual_detail:
+                keep_after_full = False
+                fail_reason = f"non_target_role:internship_generic:{internship_manual_detail}"
+            else:
+                keep_after_full = bool(keep_after_filters)
+                fail_reason = "" if keep_after_full else first_fail_reason(job_after, filter_mode, trace=trace_after)
+
+            hard_exclude, manual_review_reason = classify_recheck_failure(
+                keep_before=bool(keep_before),
+                keep_after_full=bool(keep_after_full),
+                fail_reason=fail_reason,
+                title=str(row_data.get("title", "") or ""),
+                filter_mode=filter_mode,
+            )
+            manual_review_flag = bool(keep_before and not keep_after_full and not hard_exclude and manual_review_reason)
+            apply_ready_flag = bool(keep_after_full and not hard_exclude and not manual_review_flag)
+            blocked_reason_detail = blocked_reason_detail_from_reason(manual_review_reason or fail_reason)
+            seniority_flag = "none"
+            if explicit_senior_reason:
                 seniority_flag = "hard"
-            elif experience_level in {"soft", "soft_junior_title"}:
+            elif mid_experience_reason:
                 seniority_flag = "soft"
-
-        internship_flag = "none"
-        if internship_reason_detail:
-            internship_flag = "blocked_student"
-        elif internship_manual_detail:
-            internship_flag = "manual"
-        if internship_flag == "none":
-            if str(effective_reason).startswith("non_target_role:student_internship_required:"):
+            effective_reason = manual_review_reason or fail_reason
+            if seniority_flag == "none":
+                if str(effective_reason).startswith("explicit_senior_requirement:") or str(effective_reason).startswith(
+                    "title_senior_marker:"
+                ):
+                    seniority_flag = "hard"
+                elif str(effective_reason).startswith("explicit_experience_requirement:"):
+                    seniority_flag = "soft"
+                elif experience_level == "hard":
+                    seniority_flag = "hard"
+                elif experience_level in {"soft", "soft_junior_title"}:
+                    seniority_flag = "soft"
+
+            internship_flag = "none"
+            if internship_reason_detail:
                 internship_flag = "blocked_student"
-            elif str(effective_reason).startswith("non_target_role:internship_generic:"):
+            elif internship_manual_detail:
                 internship_flag = "manual"
+            if internship_flag == "none":
+                if str(effective_reason).startswith("non_target_role:student_internship_required:"):
+                    internship_flag = "blocked_student"
+                elif str(effective_reason).startswith("non_target_role:internship_generic:"):
+                    internship_flag = "manual"
+
+            why_reasons = []
+            for reason in [
+                explicit_senior_reason,
+                mid_experience_reason,
+                (f"non_target_role:student_internship_required:{internship_reason_detail}" if internship_reason_detail else ""),
+                (f"non_target_role:internship_generic:{internship_manual_detail}" if internship_manual_detail else ""),
+                non_target_reason,
+                blocked_language_reason,
+                language_alternative_reason,
+                fail_reason,
+                manual_review_reason,
+            ]:
+                reason_str = str(reason or "").strip()
+                if reason_str and reason_str not in why_reasons:
+                    why_reasons.append(reason_str)
+            why_text = json.dumps(why_reasons, ensure_ascii=False)
+
+            if keep_before and not keep_after_full:
+                if hard_exclude:
+                    hard_reason_counts[fail_reason or "unknown"] += 1
+                else:
+                    review_reason_counts[manual_review_reason or fail_reason or "unknown"] += 1
+
+            original_hits = set(af.excluded_hits(original_desc))
+            combined_hits = set(af.excluded_hits(combined_desc))
+            hidden_hits = sorted(combined_hits - original_hits)
+
+            blocked_req_reason_before = af.analyze_language(original_desc).blocked_reason
+            blocked_req_reason_after = blocked_language_reason
+            blocked_req_before = bool(blocked_req_reason_before)
+            blocked_req_after = bool(blocked_req_reason_after)
+            blocked_lang_before = af.is_disallowed_language(original_desc)
+            blocked_lang_after = af.is_disallowed_language(combined_desc)
+
+            rows.append(
+                {
+                    **row_data,
+                    "scraped_description": scraped,
+                    "scraped_len": len(scraped),
+                    "original_len": len(original_desc),
+                    "combined_description": combined_desc,
+                    "combined_len": len(combined_desc),
+                    "fetched_full_description": bool(scraped),
+                    "fetch_from_cache": bool(fetch_from_cache),
+                    "fetch_used_url": fetch_used_url,
+                    "working_url": working_url,
+                    "fetch_candidates_count": len(candidates),
+                    "fetch_error": fetch_error,
+                    "reused_previous_enrichment": bool(reused_previous_enrichment),
+                    "preview_only_description": bool(preview_only),
+                    "not_found_template_detected": bool(page_not_found_detected),
+                    "keep_before_recheck": bool(keep_before),
+                    "keep_after_full_recheck": bool(keep_after_full),
+                    "keep_after_recheck": bool(apply_ready_flag),
+                    "apply_ready_after_recheck": bool(apply_ready_flag),
+                    "excluded_after_recheck": bool(keep_before and hard_exclude),
+                    "hard_excluded_after_recheck": bool(keep_before and hard_exclude),
+                    "manual_review_after_recheck": bool(manual_review_flag),
+                    "manual_review_reason": manual_review_reason if manual_review_flag else "",
+                    "blocked_reason_detail": blocked_reason_detail,
+                    "seniority_flag": seniority_flag,
+                    "years_required": years_required if years_required is not None else "",
+                    "experience_detail": af.normalize(experience_detail) if experience_detail else "",
+                    "internship_flag": internship_flag,
+                    "work_mode": work_mode,
+                    "why": why_text,
+                    "exclude_hits_combined": ", ".join(sorted(combined_hits)),
+                    "hidden_exclude_hits": ", ".join(hidden_hits),
+                    "blocked_lang_requirement_before": bool(blocked_req_before),
+                    "blocked_lang_requirement_after": bool(blocked_req_after),
+                    "blocked_lang_requirement_reason_before": blocked_req_reason_before,
+                    "blocked_lang_requirement_reason_after": blocked_req_reason_after,
+                    "disallowed_language_before": bool(blocked_lang_before),
+                    "disallowed_language_after": bool(blocked_lang_after),
+                    "language_required_langs": ",".join(language_required_codes),
+                    "language_optional_langs": ",".join(language_optional_codes),
+                    "language_requirement_evidence": " | ".join(language_evidence),
+                    "fail_reason_after_recheck": fail_reason,
+                }
+            )
 
-        why_reasons = []
-        for reason in [
-            explicit_senior_reason,
-            mid_experience_reason,
-            (f"non_target_role:student_internship_required:{internship_reason_detail}" if internship_reason_detail else ""),
-            (f"non_target_role:internship_generic:{internship_manual_detail}" if internship_manual_detail else ""),
-            non_target_reason,
-            blocked_language_reason,
-            language_alternative_reason,
-            fail_reason,
-            manual_review_reason,
-        ]:
-            reason_str = str(reason or "").strip()
-            if reason_str and reason_str not in why_reasons:
-                why_reasons.append(reason_str)
-        why_text = json.dumps(why_reasons, ensure_ascii=False)
-
-        if keep_before and not keep_after_full:
-            if hard_exclude:
-                hard_reason_counts[fail_reason or "unknown"] += 1
-            else:
-                review_reason_counts[manual_review_reason or fail_reason or "unknown"] += 1
-
-        original_hits = set(af.excluded_hits(original_desc))
-        combined_hits = set(af.excluded_hits(combined_desc))
-        hidden_hits = sorted(combined_hits - original_hits)
-
-        blocked_req_reason_before = af.blocked_language_requirement_reason(original_desc)
-        blocked_req_reason_after = af.blocked_language_requirement_reason(combined_desc)
-        blocked_req_before = bool(blocked_req_reason_before)
-        blocked_req_after = bool(blocked_req_reason_after)
-        blocked_lang_before = af.is_disallowed_language(original_desc)
-        blocked_lang_after = af.is_disallowed_language(combined_desc)
-
-        rows.append(
-            {
-                **row_data,
-                "scraped_description": scraped,
-                "scraped_len": len(scraped),
-                "original_len": len(original_desc),
-                "combined_description": combined_desc,
-                "combined_len": len(combined_desc),
-                "fetched_full_description": bool(scraped),
-                "fetch_from_cache": bool(fetch_from_cache),
-                "fetch_used_url": fetch_used_url,
-                "working_url": working_url,
-                "fetch_candidates_count": len(candidates),
-                "fetch_error": fetch_error,
-                "reused_previous_enrichment": bool(reused_previous_enrichment),
-                "preview_only_description": bool(preview_only),
-                "not_found_template_detected": bool(page_not_found_detected),
-                "keep_before_recheck": bool(keep_before),
-                "keep_after_full_recheck": bool(keep_after_full),
-                "keep_after_recheck": bool(apply_ready_flag),
-                "apply_ready_after_recheck": bool(apply_ready_flag),
-                "excluded_after_recheck": bool(keep_before and hard_exclude),
-                "hard_excluded_after_recheck": bool(keep_before and hard_exclude),
-                "manual_review_after_recheck": bool(manual_review_flag),
-                "manual_review_reason": manual_review_reason if manual_review_flag else "",
-                "blocked_reason_detail": blocked_reason_detail,
-                "seniority_flag": seniority_flag,
-                "years_required": years_required if years_required is not None else "",
-                "experience_detail": af.normalize(experience_detail) if experience_detail else "",
-                "internship_flag": internship_flag,
-                "work_mode": work_mode,
-                "why": why_text,
-                "exclude_hits_combined": ", ".join(sorted(combined_hits)),
-                "hidden_exclude_hits": ", ".join(hidden_hits),
-                "blocked_lang_requirement_before": bool(blocked_req_before),
-                "blocked_lang_requirement_after": bool(blocked_req_after),
-                "blocked_lang_requirement_reason_before": blocked_req_reason_before,
-                "blocked_lang_requirement_reason_after": blocked_req_reason_after,
-                "disallowed_language_before": bool(blocked_lang_before),
-                "disallowed_language_after": bool(blocked_lang_after),
-                "language_required_langs": ",".join(language_required_codes),
-                "language_optional_langs": ",".join(language_optional_codes),
-                "language_requirement_evidence": " | ".join(language_evidence),
-                "fail_reason_after_recheck": fail_reason,
-            }
+            if apply_ready_flag:
+                keep_row = dict(row_data)
+                keep_row["description"] = combined_desc[:400] if combined_desc else original_desc
+                keep_row["source_url"] = str(url or "")
+                keep_row["source_canonical_url"] = str(canonical_url or "")
+                keep_row["working_url"] = working_url
+                keep_row["needs_manual_review"] = False
+                keep_row["manual_review_reason"] = ""
+                keep_row["fail_reason_after_recheck"] = ""
+                keep_row["blocked_reason_detail"] = ""
+                keep_row["seniority_flag"] = seniority_flag
+                keep_row["years_required"] = years_required if years_required is not None else ""
+                keep_row["internship_flag"] = internship_flag
+                keep_row["work_mode"] = work_mode
+                keep_row["why"] = why_text
+                apply_ready_rows.append(keep_row)
+            elif manual_review_flag:
+                review_row = dict(row_data)
+                review_row["description"] = combined_desc[:400] if combined_desc else original_desc
+                review_row["source_url"] = str(url or "")
+                review_row["source_canonical_url"] = str(canonical_url or "")
+                review_row["working_url"] = working_url
+                review_row["manual_review_reason"] = manual_review_reason
+                review_row["fail_reason_after_recheck"] = fail_reason
+                review_row["blocked_reason_detail"] = blocked_reason_detail_from_reason(manual_review_reason or fail_reason)
+                review_row["seniority_flag"] = seniority_flag
+                review_row["years_required"] = years_required if years_required is not None else ""
+                review_row["internship_flag"] = internship_flag
+                review_row["work_mode"] = work_mode
+                review_row["why"] = why_text
+                manual_review_rows.append(review_row)
+            elif keep_before and hard_exclude:
+                hard_row = dict(row_data)
+                hard_row["description"] = combined_desc[:400] if combined_desc else original_desc
+                hard_row["source_url"] = str(url or "")
+                hard_row["source_canonical_url"] = str(canonical_url or "")
+                hard_row["working_url"] = working_url
+                hard_row["hard_exclude_reason"] = fail_reason
+                hard_row["blocked_reason_detail"] = blocked_reason_detail_from_reason(fail_reason)
+                hard_row["seniority_flag"] = seniority_flag
+                hard_row["years_required"] = years_required if years_required is not None else ""
+                hard_row["internship_flag"] = internship_flag
+                hard_row["work_mode"] = work_mode
+                hard_row["why"] = why_text
+                hard_excluded_rows.append(hard_row)
+
+            if progress_every and (idx == 1 or idx % progress_every == 0 or idx == total_rows):
+                elapsed = time.time() - started_at
+                rate = (idx / elapsed) if elapsed > 0 else 0.0
+                eta = ((total_rows - idx) / rate) if rate > 0 else 0.0
+                print(
+                    f"[ENRICH][PROGRESS] {idx}/{total_rows} ({(idx * 100.0 / total_rows):.1f}%) "
+                    f"elapsed={format_duration(elapsed)} eta={format_duration(eta)} "
+                    f"ok={ok} fail={fail} cache_hits={cache_hits} reused_previous={reuse_hits} "
+                    f"apply_ready={len(apply_ready_rows)} manual={len(manual_review_rows)} hard={len(hard_excluded_rows)}"
+                )
+    finally:
+        # Also on errors and Ctrl-C: stop the fetch workers and the browser owner thread.
+        if fetch_pool is not None:
+            fetch_pool.shutdown(cancel_futures=True)
+        if browser_pool is not None:
+            browser_pool.close()
+
+    if browser_pool is not None:
+        print(
+            f"[ENRICH] Browser fallback: launches={browser_pool.launches} "
+            f"contexts={browser_pool.contexts_created}"
         )
 
-        if apply_ready_flag:
-            keep_row = dict(row_data)
-            keep_row["description"] = combined_desc[:400] if combined_desc else original_desc
-            keep_row["source_url"] = str(url or "")
-            keep_row["source_canonical_url"] = str(canonical_url or "")
-            keep_row["working_url"] = working_url
-            keep_row["needs_manual_review"] = False
-            keep_row["manual_review_reason"] = ""
-            keep_row["fail_reason_after_recheck"] = ""
-            keep_row["blocked_reason_detail"] = ""
-            keep_row["seniority_flag"] = seniority_flag
-            keep_row["years_required"] = years_required if years_required is not None else ""
-            keep_row["internship_flag"] = internship_flag
-            keep_row["work_mode"] = work_mode
-            keep_row["why"] = why_text
-            apply_ready_rows.append(keep_row)
-        elif manual_review_flag:
-            review_row = dict(row_data)
-            review_row["description"] = combined_desc[:400] if combined_desc else original_desc
-            review_row["source_url"] = str(url or "")
-            review_row["source_canonical_url"] = str(canonical_url or "")
-            review_row["working_url"] = working_url
-            review_row["manual_review_reason"] = manual_review_reason
-            review_row["fail_reason_after_recheck"] = fail_reason
-            review_row["blocked_reason_detail"] = blocked_reason_detail_from_reason(manual_review_reason or fail_reason)
-            review_row["seniority_flag"] = seniority_flag
-            review_row["years_required"] = years_required if years_required is not None else ""
-            review_row["internship_flag"] = internship_flag
-            review_row["work_mode"] = work_mode
-            review_row["why"] = why_text
-            manual_review_rows.append(review_row)
-        elif keep_before and hard_exclude:
-            hard_row = dict(row_data)
-            hard_row["description"] = combined_desc[:400] if combined_desc else original_desc
-            hard_row["source_url"] = str(url or "")
-            hard_row["source_canonical_url"] = str(canonical_url or "")
-            hard_row["working_url"] = working_url
-            hard_row["hard_exclude_reason"] = fail_reason
-            hard_row["blocked_reason_detail"] = blocked_reason_detail_from_reason(fail_reason)
-            hard_row["seniority_flag"] = seniority_flag
-            hard_row["years_required"] = years_required if years_required is not None else ""
-            hard_row["internship_flag"] = internship_flag
-            hard_row["work_mode"] = work_mode
-            hard_row["why"] = why_text
-            hard_excluded_rows.append(hard_row)
-
-        if progress_every and (idx == 1 or idx % progress_every == 0 or idx == total_rows):
-            elapsed = time.time() - started_at
-            rate = (idx / elapsed) if elapsed > 0 else 0.0
-            eta = ((total_rows - idx) / rate) if rate > 0 else 0.0
-            print(
-                f"[ENRICH][PROGRESS] {idx}/{total_rows} ({(idx * 100.0 / total_rows):.1f}%) "
-                f"elapsed={format_duration(elapsed)} eta={format_duration(eta)} "
-                f"ok={ok} fail={fail} cache_hits={cache_hits} reused_previous={reuse_hits} "
-                f"apply_ready={len(apply_ready_rows)} manual={len(manual_review_rows)} hard={len(hard_excluded_rows)}"
-            )
-
     out_df = pd.DataFrame(rows)
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    af.safe_save_csv(out_df, args.output)
+    af.safe_save_table(out_df, args.output)
 
     excluded_after = 0
     manual_review_after = 0
@@ -1541,8 +1918,12 @@ def main():
     if "manual_review_after_recheck" in out_df.columns:
         manual_review_after = int(bool_to_int_series(out_df["manual_review_after_recheck"]).sum())
 
+    print_transport_stats()
     print(f"[ENRICH] Input rows: {len(df)}")
     print(f"[ENRICH] Fetched OK: {ok}, failed: {fail}, cache_hits: {cache_hits}, reused_previous: {reuse_hits}")
+    if revalidation_counts:
+        revalidated = ", ".join(f"{k}:{v}" for k, v in sorted(revalidation_counts.items()))
+        print(f"[ENRICH] Cache revalidation: {revalidated}")
     print(f"[ENRICH] Hard excluded after full-description recheck: {excluded_after}")
     print(f"[ENRICH] Marked manual-review after recheck: {manual_review_after}")
     print(f"[ENRICH] Apply-ready after recheck: {len(apply_ready_rows)}")
@@ -1558,14 +1939,17 @@ def main():
         print("[ENRICH] Top manual-review reasons: none")
     print(f"[ENRICH] Diagnostics saved: {args.output}")
 
-    if cache_path:
-        save_cache(cache_path, cache)
-        print(f"[ENRICH] Cache saved: {cache_path} (entries={len(cache)})")
+    if cache is not None:
+        cache_stats = cache.stats()
+        cache.close()
+        print(
+            f"[ENRICH] Cache: {cache.path} (urls={cache_stats['urls']}, descriptions={cache_stats['contents']})"
+        )
 
     if apply_ready_output:
         refined_df = pd.DataFrame(apply_ready_rows)
         Path(apply_ready_output).parent.mkdir(parents=True, exist_ok=True)
-        af.safe_save_csv(refined_df, apply_ready_output)
+        af.safe_save_table(refined_df, apply_ready_output)
         print(
             f"[ENRICH] Apply-ready saved: {apply_ready_output} "
             f"(kept={len(refined_df)}, removed={len(df) - len(refined_df)})"
@@ -1573,14 +1957,18 @@ def main():
     if manual_review_output:
         review_df = pd.DataFrame(manual_review_rows)
         Path(manual_review_output).parent.mkdir(parents=True, exist_ok=True)
-        af.safe_save_csv(review_df, manual_review_output)
+        af.safe_save_table(review_df, manual_review_output)
         print(f"[ENRICH] Manual-review saved: {manual_review_output} (rows={len(review_df)})")
     if hard_excluded_output:
         hard_df = pd.DataFrame(hard_excluded_rows)
         Path(hard_excluded_output).parent.mkdir(parents=True, exist_ok=True)
-        af.safe_save_csv(hard_df, hard_excluded_output)
+        af.safe_save_table(hard_df, hard_excluded_output)
         print(f"[ENRICH] Hard-excluded saved: {hard_excluded_output} (rows={len(hard_df)})")
 
+    af.close_rule_profiler(
+        profile_path, {"script": "enrich_full_descriptions", "market": market, "filter_mode": filter_mode}
+    )
+
     # Keep the local viewer in sync with the enriched CSV output.
     refresh_viewer_html(
         input_csv=args.output,
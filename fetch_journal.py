@@ -0,0 +1,165 @@
+"""
+Append-only JSONL journal of one day's fetch run (adzuna_fetch.py), so a crash or Ctrl-C keeps
+every page fetched so far.
+
+Each fetched page is one line, flushed to disk as soon as the response arrives:
+    {"term": ..., "page": 2, "fetched_at": ..., "stop": false, "jobs": [{...projected job...}]}
+Jobs are flattened like pd.json_normalize ("company.display_name") and projected to `fields`.
+"stop" marks the page that ended its term (no results, or mostly already-seen ids), so a resumed
+run does not page further than the crashed one. The journal lives in one file per day
+(<base>_<YYYY-MM-DD>.jsonl); resume=True continues today's file, otherwise it is started over.
+compact() builds the raw table from the journal through a RowSpool, a block of rows at a time.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, Optional
+
+from table_storage import RowSpool
+
+# Day partitions kept next to the current one.
+JOURNAL_KEEP_DAYS = 7
+
+
+def journal_path(base_path: str, day: Optional[date] = None) -> str:
+    """Day partition of the journal at base_path: data/journal/adzuna_raw.jsonl -> ..._2026-10-17.jsonl."""
+    day = day or datetime.now(timezone.utc).date()
+    root, ext = os.path.splitext(base_path)
+    return f"{root}_{day.isoformat()}{ext or '.jsonl'}"
+
+
+def flatten_job(job: dict, prefix: str = "") -> dict:
+    """Nested dicts as dotted keys, like pd.json_normalize does for one record."""
+    flat = {}
+    for key, value in job.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_job(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def project_job(job: dict, fields: Optional[Iterable[str]]) -> dict:
+    """flatten_job(job) restricted to fields (all fields when None), in fields order."""
+    flat = flatten_job(job)
+    if fields is None:
+        return flat
+    return {field: flat[field] for field in fields if field in flat}
+
+
+class FetchJournal:
+    """Thread-safe appender and reader of one journal partition."""
+
+    def __init__(self, path: str, fields: Optional[Iterable[str]] = None, resume: bool = False):
+        self.path = str(path)
+        self.fields = list(fields) if fields is not None else None
+        self._lock = threading.Lock()
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if resume:
+            self._drop_partial_line()
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        self.pages = self._read_pages() if resume else {}
+
+    def _drop_partial_line(self) -> None:
+        """Cut a line left half-written by a crash, so the next append starts on a fresh line."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as fh:
+            data = fh.read()
+            if data and not data.endswith(b"\n"):
+                fh.truncate(data.rfind(b"\n") + 1)
+
+    def _iter_entries(self) -> Iterator[tuple[int, dict]]:
+        """(offset, entry) of every readable line."""
+        with open(self.path, "rb") as fh:
+            offset = 0
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+                if isinstance(entry, dict) and "term" in entry and "page" in entry:
+                    yield offset, entry
+                offset += len(line)
+
+    def _read_pages(self) -> dict[tuple[str, int], bool]:
+        return {(entry["term"], int(entry["page"])): bool(entry.get("stop")) for _, entry in self._iter_entries()}
+
+    def done(self, term: str, page: int) -> Optional[bool]:
+        """None if (term, page) is not journaled yet, else whether that page ended its term."""
+        return self.pages.get((term, int(page)))
+
+    def record(self, term: str, page: int, jobs: list[dict], stop: bool = False) -> None:
+        """Append one fetched page and flush it to disk."""
+        entry = {
+            "term": term,
+            "page": int(page),
+            "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "stop": bool(stop),
+            "jobs": [project_job(job, self.fields) for job in jobs],
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.pages[(term, int(page))] = bool(stop)
+
+    def iter_jobs(self, terms: Optional[Iterable[str]] = None) -> Iterator[dict]:
+        """
+        Journaled jobs ordered by terms (then unlisted terms in journal order), then page,
+        whatever order the concurrent fetch wrote them in. Only one page is held at a time.
+        """
+        rank = {term: index for index, term in enumerate(terms or [])}
+        index = sorted(
+            (rank.get(entry["term"], len(rank)), int(entry["page"]), position, offset)
+            for position, (offset, entry) in enumerate(self._iter_entries())
+        )
+        with open(self.path, "rb") as fh:
+            for _, _, _, offset in index:
+                fh.seek(offset)
+                yield from json.loads(fh.readline()).get("jobs", [])
+
+    def compact(self, table_path: str, terms: Optional[Iterable[str]] = None) -> int:
+        """
+        Save the journaled jobs as the table at table_path (CSV and/or Parquet, like save_table),
+        one row per (search_term, id), in iter_jobs order. Returns the number of rows saved.
+        """
+        with self._lock:
+            self._file.flush()
+        spool = RowSpool(dedup_cols=["search_term", "id"], sort_cols=[])
+        try:
+            spool.extend(self.iter_jobs(terms))
+            return spool.save(table_path)
+        finally:
+            spool.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def prune_journals(base_path: str, keep_days: int = JOURNAL_KEEP_DAYS, today: Optional[date] = None) -> int:
+    """Delete day partitions of base_path older than keep_days. Returns the number removed."""
+    today = today or datetime.now(timezone.utc).date()
+    root, ext = os.path.splitext(base_path)
+    cutoff = today - timedelta(days=keep_days)
+    removed = 0
+    for path in glob.glob(f"{glob.escape(root)}_*{ext or '.jsonl'}"):
+        stamp = os.path.splitext(path)[0][len(root) + 1 :]
+        try:
+            day = date.fromisoformat(stamp)
+        except ValueError:
+            continue
+        if day < cutoff:
+            os.remove(path)
+            removed += 1
+    return removed
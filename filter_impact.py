@@ -1,21 +1,33 @@
 """
 Analyze the impact of each filtering step used in adzuna_fetch.py.
 
-Loads the raw Adzuna CSV, replays filters in the same order as passes_filters,
-and reports step-level removals with diagnostics.
+Loads the raw Adzuna CSV, traces every row through passes_filters once (trace=True),
+and reports step-level removals with diagnostics. The per-row failed-stage bitmask
+(RuleMatrix) is saved next to the raw table; what-if counts for any set of disabled
+steps are computed from it without re-running the rules.
 """
 
+import json
+import os
 from collections import Counter
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 import adzuna_fetch as af
 from config import SUPPORTED_CH_FOCUS, SUPPORTED_FILTER_MODES, SUPPORTED_MARKETS, get_output_paths, resolve_filter_mode
+from table_storage import read_table, table_source
+
+
+# Matrix bits: the passes_filters stages, in trace order.
+MATRIX_STAGES = af.FILTER_TRACE_STAGES
+RULE_MATRIX_SUFFIX = "_rule_matrix"
 
 
 def load_raw_jobs(path: str) -> List[Dict]:
-    df = pd.read_csv(path)
+    df = read_table(path)
     return df.to_dict(orient="records")
 
 
@@ -52,82 +64,200 @@ def extract_fields(job: Dict) -> Dict:
     }
 
 
-def check_description(desc: str) -> Tuple[bool, str]:
-    if not af.REQUIRE_DESCRIPTION:
-        return True, ""
-    ok = len((desc or "").strip()) >= af.MIN_DESCRIPTION_CHARS
-    return ok, "" if ok else "description_too_short"
-
-
-def check_bad_title(title: str) -> Tuple[bool, str]:
-    norm = af.normalize(title)
-    for pat in af.BAD_TITLE_KEYWORDS:
-        if pat in norm:
-            return False, pat
-    return True, ""
-
+def trace_jobs(raw_jobs: List[Dict], filter_mode: str) -> List[af.FilterTrace]:
+    """One passes_filters trace per raw row; every report below reads these."""
+    return [af.passes_filters(raw, source="adzuna", filter_mode=filter_mode, trace=True) for raw in raw_jobs]
 
-def check_recency(created: str) -> Tuple[bool, str]:
-    ok = af.is_recent(created, af.MAX_DAYS_OLD)
-    return ok, "" if ok else "too_old"
 
+def created_epoch(date_str) -> float:
+    """UTC timestamp of a created value, parsed like af.is_recent (NaN when unparseable)."""
+    try:
+        return datetime.fromisoformat(str(date_str).replace("Z", "+00:00")).astimezone(timezone.utc).timestamp()
+    except Exception:
+        return float("nan")
 
-def check_location(loc: str, title: str = "", desc: str = "") -> Tuple[bool, str]:
-    ok = af.location_ok(loc, title, desc)
-    return ok, "" if ok else "location_blocked"
 
+def rule_matrix_path(raw_path: str, filter_mode: str) -> str:
+    """Rule matrix file kept next to the raw table."""
+    return f"{os.path.splitext(raw_path)[0]}{RULE_MATRIX_SUFFIX}_{filter_mode}.npz"
 
-def check_role(title: str, desc: str) -> Tuple[bool, str]:
-    text = af.normalize((title or "") + " " + (desc or ""))
-    ok = af.role_relevant(title, desc)
-    if ok:
-        if any(good in text for good in af.ROLE_REQUIRED_KEYWORDS):
-            return True, ""
-        if af.training_program_relevant(title, desc):
-            return True, "training_program_relevant"
-        if af.role_title_fallback_relevant(title):
-            return True, "title_fallback_relevant"
-        return True, ""
 
-    forbidden = af.role_forbidden_reason(title, desc)
-    if forbidden:
-        return False, f"forbidden:{forbidden}"
-    return False, "missing_required"
+def raw_signature(raw_path: str) -> Dict:
+    """Identity of the file read_table loads for raw_path."""
+    source = table_source(raw_path) or raw_path
+    stat = os.stat(source)
+    return {"raw_source": os.path.basename(source), "raw_size": stat.st_size, "raw_mtime_ns": stat.st_mtime_ns}
 
 
-def check_internship_student_only(title: str, desc: str) -> Tuple[bool, str]:
-    detail = af.internship_student_only_detail(title, desc)
-    return (not bool(detail)), (detail or "")
+class RuleMatrix:
+    """
+    Failed-stage bitmask of every raw row: bit i of fails[row] is set when stages[i] rejects the
+    row, each stage evaluated independently (one passes_filters trace per row).
+    groups holds the dedup group of each row (canonical_url, title, company), and created the
+    row timestamp, so the recency bit follows today's date without re-running the rules.
+    Funnel, independent counts and any what-if combination of disabled stages are bit operations.
+    """
 
+    __slots__ = ("stages", "fails", "groups", "created", "meta")
+
+    def __init__(self, stages, fails: np.ndarray, groups: np.ndarray, created: np.ndarray, meta: Dict):
+        self.stages = tuple(stages)
+        self.fails = fails
+        self.groups = groups
+        self.created = created
+        self.meta = meta
+
+    @classmethod
+    def from_traces(cls, traces: List[af.FilterTrace], jobs: List[Dict], meta: Dict = None) -> "RuleMatrix":
+        """jobs are extract_fields rows, aligned with traces."""
+        stages = MATRIX_STAGES
+        bit = {stage: 1 << idx for idx, stage in enumerate(stages)}
+        fails = np.zeros(len(traces), dtype=np.uint16)
+        for row, trace in enumerate(traces):
+            fails[row] = sum(bit[outcome.stage] for outcome in trace.stages if not outcome.passed)
+        keys = pd.Series(
+            [f"{job.get('canonical_url', '')}\x1f{job.get('title', '')}\x1f{job.get('company', '')}" for job in jobs],
+            dtype=object,
+        )
+        groups = pd.factorize(keys)[0].astype(np.int32)
+        created = np.array([created_epoch(job.get("created", "")) for job in jobs], dtype=np.float64)
+        return cls(stages, fails, groups, created, dict(meta or {}))
+
+    @classmethod
+    def load(cls, path: str) -> "RuleMatrix":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            return cls(meta.pop("stages"), data["fails"], data["groups"], data["created"], meta)
+
+    def save(self, path: str) -> None:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        meta = json.dumps({**self.meta, "stages": list(self.stages)}, sort_keys=True)
+        tmp = f"{path}.tmp.npz"
+        np.savez_compressed(tmp, fails=self.fails, groups=self.groups, created=self.created, meta=np.array(meta))
+        os.replace(tmp, path)
+
+    def __len__(self) -> int:
+        return len(self.fails)
+
+    def mask(self, stages) -> int:
+        """Bitmask of the named stages."""
+        return sum(1 << self.stages.index(stage) for stage in set(stages))
+
+    def refresh_recency(self, now: datetime = None) -> None:
+        """Recompute the recency bit against now (is_recent semantics: strictly newer than the limit)."""
+        now = now or datetime.now(timezone.utc)
+        limit = (now - timedelta(days=af.MAX_DAYS_OLD)).timestamp()
+        recency_bit = np.uint16(self.mask(["recency"]))
+        with np.errstate(invalid="ignore"):
+            too_old = ~(self.created > limit)
+        self.fails = (self.fails & ~recency_bit) | np.where(too_old, recency_bit, np.uint16(0))
+
+    def kept(self, disabled=()) -> np.ndarray:
+        """Rows no enabled stage rejects."""
+        return (self.fails & np.uint16(~self.mask(disabled) & 0xFFFF)) == 0
+
+    def final_after_dedup(self, kept: np.ndarray) -> int:
+        return int(np.unique(self.groups[kept]).size)
+
+    def funnel(self) -> List[Dict]:
+        """Early-stop removals per stage: a row is removed by its first failing stage."""
+        summaries = []
+        before = len(self)
+        for idx, stage in enumerate(self.stages):
+            up_to = np.uint16((1 << (idx + 1)) - 1)
+            removed = int(np.count_nonzero((self.fails & up_to) == np.uint16(1 << idx)))
+            summaries.append(
+                {
+                    "step": stage,
+                    "before": before,
+                    "kept": before - removed,
+                    "removed": removed,
+                    "pct_removed": round(removed / before * 100, 1) if before else 0,
+                }
+            )
+            before -= removed
+        return summaries
+
+    def independent_counts(self) -> Dict[str, int]:
+        """Rows each stage rejects on its own (no early stop)."""
+        return {
+            stage: int(np.count_nonzero(self.fails & np.uint16(1 << idx))) for idx, stage in enumerate(self.stages)
+        }
+
+    def what_if(self, disabled=()) -> Dict:
+        kept = self.kept(disabled)
+        return {
+            "disabled": sorted(set(disabled), key=self.stages.index),
+            "kept": int(np.count_nonzero(kept)),
+            "final_after_dedup": self.final_after_dedup(kept),
+        }
+
+    def what_if_skip(self) -> List[Dict]:
+        """One row per stage: the final count with only that stage disabled, best gain first."""
+        baseline = self.what_if()["final_after_dedup"]
+        independent = self.independent_counts()
+        rows = []
+        for stage in self.stages:
+            result = self.what_if([stage])
+            rows.append(
+                {
+                    "step": stage,
+                    "rejects": independent[stage],
+                    "kept": result["kept"],
+                    "final_after_dedup": result["final_after_dedup"],
+                    "delta_vs_strict": result["final_after_dedup"] - baseline,
+                }
+            )
+        rows.sort(key=lambda row: (-row["delta_vs_strict"], self.stages.index(row["step"])))
+        return rows
 
-def check_excluded(title: str, text: str) -> Tuple[bool, str]:
-    hard_hits, soft_hits = af.classify_excluded_hits(title, text)
-    if hard_hits:
-        return False, hard_hits[0]
-    if soft_hits:
-        return True, f"soft:{soft_hits[0]}"
-    return True, ""
+    def to_json(self) -> Dict:
+        """Compact form the viewer recomputes what-if combinations from."""
+        return {"stages": list(self.stages), "fails": self.fails.tolist(), "groups": self.groups.tolist()}
 
 
-def check_blocked_language_requirement(text: str) -> Tuple[bool, str]:
-    reason = af.blocked_language_requirement_reason(text)
-    return (not bool(reason)), (reason if reason else "")
+def rule_matrix_meta(raw_path: str, filter_mode: str) -> Dict:
+    """What a persisted matrix must match to be reused."""
+    return {
+        "filter_mode": filter_mode,
+        "market": af.ACTIVE_MARKET,
+        "rules": af.rules_fingerprint(),
+        **raw_signature(raw_path),
+    }
 
 
-def check_disallowed_language(text: str, filter_mode: str) -> Tuple[bool, str]:
-    if af.blocked_language_requirement_reason(text):
-        return False, "blocked_language_req:explicit_required"
-    blocked = af.is_disallowed_language(text)
-    if filter_mode == "broad":
-        # In broad mode we keep this as diagnostic only, not as a hard reject.
-        return True, "would_block_in_strict" if blocked else ""
-    return (not blocked), ("blocked_language_detected" if blocked else "")
+def build_rule_matrix(raw_jobs: List[Dict], filter_mode: str, traces: List[af.FilterTrace] = None) -> RuleMatrix:
+    traces = traces if traces is not None else trace_jobs(raw_jobs, filter_mode)
+    return RuleMatrix.from_traces(traces, [extract_fields(job) for job in raw_jobs])
 
 
-def check_junior(title: str, desc: str, filter_mode: str) -> Tuple[bool, str, int]:
-    score = af.compute_junior_score(title, desc)
-    min_junior_score = 0 if filter_mode == "strict" else -1
-    return score >= min_junior_score, "" if score >= min_junior_score else f"junior_score<{min_junior_score}", score
+def load_rule_matrix(raw_path: str, filter_mode: str, rebuild: bool = False) -> RuleMatrix:
+    """
+    Rule matrix of a raw table for the active market: reused from disk when the raw file, filter
+    mode and rules fingerprint are unchanged, rebuilt (one trace per row) and saved otherwise.
+    """
+    mode = resolve_filter_mode(filter_mode, allow_both=False)
+    path = rule_matrix_path(raw_path, mode)
+    meta = rule_matrix_meta(raw_path, mode)
+    matrix = None
+    if not rebuild and os.path.exists(path):
+        try:
+            matrix = RuleMatrix.load(path)
+        except Exception as exc:
+            print(f"[WARN] Ignoring unreadable rule matrix {path}: {exc}")
+        if matrix is not None and (matrix.meta != meta or matrix.stages != MATRIX_STAGES):
+            matrix = None
+    if matrix is None:
+        matrix = build_rule_matrix(load_raw_jobs(raw_path), mode)
+        matrix.meta = meta
+        matrix.save(path)
+        print(f"[CACHE] Rule matrix saved: {path} ({len(matrix)} rows)")
+    else:
+        print(f"[CACHE] Rule matrix reused: {path} ({len(matrix)} rows)")
+    matrix.refresh_recency()
+    return matrix
 
 
 def summarize_counter(counter: Counter, top_n: int = 5, show_all: bool = False) -> str:
@@ -137,7 +267,9 @@ def summarize_counter(counter: Counter, top_n: int = 5, show_all: bool = False)
     return ", ".join(f"{k}:{v}" for k, v in items)
 
 
-def compute_global_hits(jobs: List[Dict]) -> Tuple[Dict[str, Counter], Dict[str, int]]:
+def compute_global_hits(
+    jobs: List[Dict], traces: List[af.FilterTrace]
+) -> Tuple[Dict[str, Counter], Dict[str, int]]:
     """
     Count keyword/filter triggers on all rows without early-stop.
     """
@@ -157,90 +289,75 @@ def compute_global_hits(jobs: List[Dict]) -> Tuple[Dict[str, Counter], Dict[str,
         "junior_negative": 0,
     }
 
-    for job in jobs:
-        title = job.get("title", "") or ""
-        desc = job.get("description", "") or ""
-        loc = job.get("location", "") or ""
-        created = job.get("created", "") or ""
-        full_text = f"{title} {desc}"
-        norm_title = af.normalize(title)
-        norm_text = af.normalize(full_text)
-
-        if af.REQUIRE_DESCRIPTION and len(desc.strip()) < af.MIN_DESCRIPTION_CHARS:
-            misc["description_too_short"] += 1
-
-        for pat in af.BAD_TITLE_KEYWORDS:
-            if pat in norm_title:
-                hits["bad_title"][pat] += 1
-
-        forbidden = af.role_forbidden_reason(title, desc)
-        if forbidden:
-            hits["role_forbidden"][forbidden] += 1
+    for job, trace in zip(jobs, traces):
+        stages = {outcome.stage: outcome for outcome in trace.stages}
+        norm_text = af.normalize(f"{job.get('title', '') or ''} {job.get('description', '') or ''}")
 
+        hits["bad_title"].update(stages["bad_title"].hits)
+        role_detail = stages["role_relevant"].detail
+        if role_detail.startswith("forbidden:"):
+            hits["role_forbidden"][role_detail.split(":", 1)[1]] += 1
         for good in af.ROLE_REQUIRED_KEYWORDS:
             if good in norm_text:
                 hits["role_required"][good] += 1
+        hits["exclude_keywords"].update(stages["exclude_keywords"].hits)
 
-        hard_hits, _soft_hits = af.classify_excluded_hits(title, full_text)
-        for kw in hard_hits:
-            hits["exclude_keywords"][kw] += 1
-
-        if not af.is_recent(created, af.MAX_DAYS_OLD):
-            misc["recency_fail"] += 1
-        if not af.location_ok(loc, title, desc):
-            misc["location_fail"] += 1
-        if af.internship_student_only_detail(title, desc):
-            misc["internship_student_only"] += 1
-        if af.blocked_language_requirement_reason(full_text):
-            misc["blocked_language_requirement"] += 1
-            misc["blocked_language_detected"] += 1
-        elif af.is_disallowed_language(full_text):
-            misc["blocked_language_detected"] += 1
-        if af.compute_junior_score(title, desc) < 0:
-            misc["junior_negative"] += 1
+        misc["description_too_short"] += not stages["description_length"].passed
+        misc["recency_fail"] += not stages["recency"].passed
+        misc["location_fail"] += not stages["location"].passed
+        misc["internship_student_only"] += not stages["internship_student_only"].passed
+        requirement = bool(stages["blocked_language_requirement"].detail)
+        misc["blocked_language_requirement"] += requirement
+        misc["blocked_language_detected"] += requirement or bool(stages["blocked_language"].detail)
+        misc["junior_negative"] += trace.junior_score < 0
 
     return hits, misc
 
 
-def analyze(raw_jobs: List[Dict], report_csv: str = None, show_all: bool = False, filter_mode: str = "strict"):
+def analyze(
+    raw_jobs: List[Dict],
+    report_csv: str = None,
+    show_all: bool = False,
+    filter_mode: str = "strict",
+    raw_path: str = "",
+    what_if: List[List[str]] = None,
+):
     filter_mode = resolve_filter_mode(filter_mode, allow_both=False)
-    step_summaries = []
     bad_title_hits = Counter()
     excluded_keyword_hits = Counter()
     forbidden_hits = Counter()
     blocked_language_requirement_hits = 0
     blocked_language_detected_hits = 0
 
-    report_rows = []
-
     all_jobs = [extract_fields(j) for j in raw_jobs]
     for idx, job in enumerate(all_jobs):
         job["row_id"] = idx
-    global_hits, global_misc = compute_global_hits(all_jobs)
-    current = list(all_jobs)
-    print(f"[IMPACT] Loaded raw rows: {len(current)} (filter_mode={filter_mode})")
-
-    steps = [
-        ("description_length", lambda job: check_description(job["description"])),
-        ("bad_title", lambda job: check_bad_title(job["title"])),
-        ("recency", lambda job: check_recency(job["created"])),
-        ("location", lambda job: check_location(job["location"], job["title"], job["description"])),
-        ("role_relevant", lambda job: check_role(job["title"], job["description"])),
-        ("internship_student_only", lambda job: check_internship_student_only(job["title"], job["description"])),
-        ("exclude_keywords", lambda job: check_excluded(job["title"], job["title"] + " " + job["description"])),
-        (
-            "blocked_language_requirement",
-            lambda job: check_blocked_language_requirement(job["title"] + " " + job["description"]),
-        ),
-        (
-            "blocked_language",
-            lambda job: check_disallowed_language(job["title"] + " " + job["description"], filter_mode),
-        ),
-        ("junior_score", lambda job: check_junior(job["title"], job["description"], filter_mode)),
-    ]
+    print(f"[IMPACT] Loaded raw rows: {len(all_jobs)} (filter_mode={filter_mode})")
+    traces = trace_jobs(raw_jobs, filter_mode)
+    global_hits, global_misc = compute_global_hits(all_jobs, traces)
+    matrix = RuleMatrix.from_traces(traces, all_jobs)
+    step_summaries = matrix.funnel()
 
-    if report_csv:
-        for job in all_jobs:
+    report_rows = []
+    for job, trace in zip(all_jobs, traces):
+        failed = trace.first_fail
+        if failed is not None:
+            if failed.stage == "bad_title":
+                bad_title_hits[failed.detail] += 1
+            elif failed.stage == "exclude_keywords":
+                excluded_keyword_hits[failed.detail] += 1
+            elif failed.stage == "role_relevant" and failed.detail.startswith("forbidden:"):
+                forbidden_hits[failed.detail.split(":", 1)[1]] += 1
+            elif failed.stage == "blocked_language_requirement":
+                blocked_language_requirement_hits += 1
+        if trace.reached("blocked_language") and trace.stage("blocked_language").detail in {
+            "blocked_language_detected",
+            "would_block_in_strict",
+        }:
+            blocked_language_detected_hits += 1
+        job["junior_score"] = trace.junior_score if trace.reached("junior_score") else ""
+
+        if report_csv:
             report_rows.append(
                 {
                     "row_id": job["row_id"],
@@ -250,70 +367,15 @@ def analyze(raw_jobs: List[Dict], report_csv: str = None, show_all: bool = False
                     "url": job.get("url", ""),
                     "search_term": job.get("search_term", ""),
                     "created": job.get("created", ""),
-                    "first_fail_step": "",
-                    "first_fail_detail": "",
-                    "junior_score": "",
-                    "passes_filters": False,
+                    "first_fail_step": failed.stage if failed else "passed_all",
+                    "first_fail_detail": failed.detail if failed else "",
+                    "junior_score": job["junior_score"],
+                    "passes_filters": trace.passed,
                     "duplicate_removed": False,
                 }
             )
 
-    for step_name, func in steps:
-        before = len(current)
-        kept = []
-        for job in current:
-            ok_detail = func(job)
-            ok = ok_detail[0]
-            detail = ok_detail[1] if len(ok_detail) > 1 else ""
-
-            if step_name == "junior_score":
-                job["junior_score"] = ok_detail[2]
-
-            if ok:
-                if step_name == "blocked_language" and detail == "would_block_in_strict":
-                    blocked_language_detected_hits += 1
-                kept.append(job)
-            else:
-                if step_name == "bad_title":
-                    bad_title_hits[detail] += 1
-                elif step_name == "exclude_keywords":
-                    excluded_keyword_hits[detail] += 1
-                elif step_name == "role_relevant" and detail.startswith("forbidden:"):
-                    forbidden_hits[detail.split(":", 1)[1]] += 1
-                elif step_name == "blocked_language_requirement":
-                    blocked_language_requirement_hits += 1
-                elif step_name == "blocked_language":
-                    blocked_language_detected_hits += 1
-
-                if report_csv:
-                    row = report_rows[job["row_id"]]
-                    if not row["first_fail_step"]:
-                        row["first_fail_step"] = step_name
-                        row["first_fail_detail"] = detail
-                        row["junior_score"] = job.get("junior_score", "")
-
-        removed_count = before - len(kept)
-        pct_removed = (removed_count / before * 100) if before else 0
-        step_summaries.append(
-            {
-                "step": step_name,
-                "before": before,
-                "kept": len(kept),
-                "removed": removed_count,
-                "pct_removed": round(pct_removed, 1),
-            }
-        )
-        current = kept
-
-    passed_jobs = current
-
-    if report_csv:
-        for job in passed_jobs:
-            row = report_rows[job["row_id"]]
-            row["passes_filters"] = True
-            row["junior_score"] = job.get("junior_score", "")
-            if not row["first_fail_step"]:
-                row["first_fail_step"] = "passed_all"
+    passed_jobs = [job for job, trace in zip(all_jobs, traces) if trace.passed]
 
     df_passed = pd.DataFrame(passed_jobs)
     subset_keys = ["canonical_url", "title", "company"]
@@ -330,15 +392,8 @@ def analyze(raw_jobs: List[Dict], report_csv: str = None, show_all: bool = False
             row = report_rows[int(dup_job["row_id"])]
             row["duplicate_removed"] = True
 
-    # Safety check: compare with passes_filters to ensure analyzer parity.
-    parity_mismatch = 0
-    passed_row_ids = {job.get("row_id") for job in passed_jobs}
-    for idx, raw in enumerate(raw_jobs):
-        parsed = af.passes_filters(raw, source="adzuna", filter_mode=filter_mode)
-        replay_ok = idx in passed_row_ids
-        parsed_ok = parsed is not None
-        if replay_ok != parsed_ok:
-            parity_mismatch += 1
+    # The trace is recorded by the same evaluation as its job, so the stages must agree with it.
+    parity_mismatch = sum(1 for trace in traces if trace.passed != (trace.job is not None))
 
     print("\n[IMPACT] Step-by-step removals:")
     for s in step_summaries:
@@ -373,6 +428,21 @@ def analyze(raw_jobs: List[Dict], report_csv: str = None, show_all: bool = False
     print(f"- Blocked language detected (all rows): {global_misc['blocked_language_detected']}")
     print(f"- Junior score < 0: {global_misc['junior_negative']}")
 
+    print("\n[IMPACT] What-if (skip one filter):")
+    for row in matrix.what_if_skip():
+        print(
+            f"- skip {row['step']}: rejects={row['rejects']} kept={row['kept']} "
+            f"final={row['final_after_dedup']} ({row['delta_vs_strict']:+d})"
+        )
+    for disabled in what_if or []:
+        result = matrix.what_if(disabled)
+        print(f"- skip {'+'.join(result['disabled'])}: kept={result['kept']} final={result['final_after_dedup']}")
+
+    if raw_path:
+        matrix.meta = rule_matrix_meta(raw_path, filter_mode)
+        matrix.save(rule_matrix_path(raw_path, filter_mode))
+        print(f"[IMPACT] Rule matrix written to {rule_matrix_path(raw_path, filter_mode)}")
+
     if report_csv:
         df_report = pd.DataFrame(report_rows)
         af.safe_save_csv(df_report, report_csv)
@@ -415,7 +485,18 @@ def main():
         action="store_true",
         help="Show full breakdown of keyword hits instead of top 5.",
     )
+    parser.add_argument(
+        "--what-if",
+        action="append",
+        default=[],
+        metavar="STEPS",
+        help=f"Comma-separated steps to disable together (repeatable). Steps: {', '.join(MATRIX_STAGES)}.",
+    )
     args = parser.parse_args()
+    what_if = [[step.strip() for step in value.split(",") if step.strip()] for value in args.what_if]
+    unknown = sorted({step for steps in what_if for step in steps} - set(MATRIX_STAGES))
+    if unknown:
+        parser.error(f"unknown --what-if steps: {', '.join(unknown)}")
 
     market = af.configure_market(args.market, args.ch_focus)
     selected_filter_mode = resolve_filter_mode(args.filter_mode, allow_both=False)
@@ -423,7 +504,14 @@ def main():
     raw_csv = args.raw_csv or default_raw_csv
 
     raw_jobs = load_raw_jobs(raw_csv)
-    analyze(raw_jobs, report_csv=args.report_csv, show_all=args.all_keywords, filter_mode=selected_filter_mode)
+    analyze(
+        raw_jobs,
+        report_csv=args.report_csv,
+        show_all=args.all_keywords,
+        filter_mode=selected_filter_mode,
+        raw_path=raw_csv,
+        what_if=what_if,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,335 @@
+"""
+Pooled HTTP transport shared by the provider fetchers (Adzuna, Jooble, the MA scrapers, enrichment).
+
+One HttpTransport per provider:
+- keep-alive connection pools per host, shared by every thread of the process
+  (each thread sends through its own requests.Session mounted on the shared adapter);
+- one retry policy: 429/5xx answers, connection errors and timeouts are retried with
+  exponential backoff + jitter, or after the server's Retry-After when it sends one;
+- gzip/deflate content encoding, plus br when a brotli decoder is installed;
+- per-request latency, bytes and status aggregated per provider (print_transport_stats).
+HostPoliteness caps requests in flight and spaces request starts per host for concurrent crawls.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import brotli  # noqa: F401
+except Exception:
+    try:
+        import brotlicffi as brotli  # noqa: F401
+    except Exception:
+        brotli = None
+
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+# Statuses retried on top of every 5xx.
+RETRY_STATUSES = frozenset({408, 429})
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+DEFAULT_POOL_SIZE = 16
+# Hosts whose pools a transport keeps open at once (least recently used pools are closed first).
+MAX_POOLED_HOSTS = 32
+
+
+def parse_retry_after(value, now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date); None if absent/invalid."""
+    value = str(value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = datetime.now(timezone.utc).timestamp() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+class RetryPolicy:
+    """
+    How often and how long to retry. The wait after failed attempt n (0-based) is
+    backoff * 2**n plus up to `jitter` seconds, or the server's Retry-After; both capped at max_wait.
+    """
+
+    __slots__ = ("attempts", "backoff", "jitter", "max_wait", "retry_statuses")
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 1.0,
+        jitter: float = 0.0,
+        max_wait: float = 60.0,
+        retry_statuses=RETRY_STATUSES,
+    ):
+        self.attempts = max(1, int(attempts))
+        self.backoff = max(0.0, float(backoff))
+        self.jitter = max(0.0, float(jitter))
+        self.max_wait = max(0.0, float(max_wait))
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def should_retry(self, status: int) -> bool:
+        return status >= 500 or status in self.retry_statuses
+
+    def wait(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is None:
+            retry_after = self.backoff * 2**attempt + random.uniform(0.0, self.jitter)
+        return min(retry_after, self.max_wait)
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+class HostPoliteness:
+    """
+    Per-host politeness for concurrent crawls (enrichment, MA providers): at most `max_per_host`
+    requests in flight per domain, and request starts on the same domain spaced by at least `delay` seconds.
+    Different domains never wait on each other.
+    """
+
+    def __init__(self, delay: float = 0.0, max_per_host: int = 1):
+        self.delay = max(0.0, float(delay))
+        self.max_per_host = max(1, int(max_per_host))
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        host = (urlparse(url).netloc or "").lower()
+        with self._lock:
+            sem = self._slots.setdefault(host, threading.Semaphore(self.max_per_host))
+        with sem:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.delay
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+def _wire_bytes(response: requests.Response) -> int:
+    """Bytes read off the socket (before content decoding) when urllib3 tracks them."""
+    try:
+        return int(response.raw.tell())
+    except Exception:
+        return len(response.content or b"")
+
+
+class ProviderStats:
+    """Thread-safe request counters of one provider."""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.errors = 0
+            self.statuses: Counter = Counter()
+            self.wire_bytes = 0
+            self.body_bytes = 0
+            self.latency_total = 0.0
+            self.latency_max = 0.0
+
+    def record(self, status, latency: float, wire_bytes: int = 0, body_bytes: int = 0) -> None:
+        with self._lock:
+            self.requests += 1
+            self.statuses[status] += 1
+            self.wire_bytes += wire_bytes
+            self.body_bytes += body_bytes
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def add_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "provider": self.provider,
+                "requests": self.requests,
+                "retries": self.retries,
+                "errors": self.errors,
+                "statuses": dict(self.statuses),
+                "wire_bytes": self.wire_bytes,
+                "body_bytes": self.body_bytes,
+                "latency_avg_s": self.latency_total / self.requests if self.requests else 0.0,
+                "latency_max_s": self.latency_max,
+            }
+
+
+class HttpTransport:
+    """
+    Retrying HTTP client of one provider over keep-alive connection pools shared by all threads.
+    requests.Session is not documented as thread-safe, so each thread gets its own session; they all
+    mount the same HTTPAdapter, whose urllib3 pools (one per host) are.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        headers: Optional[dict] = None,
+        retry: Optional[RetryPolicy] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = 20,
+    ):
+        self.provider = provider
+        self.headers = {"Accept-Encoding": ACCEPT_ENCODING, **(headers or {})}
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
+        self.stats = ProviderStats(provider)
+        self._adapter = HTTPAdapter(pool_connections=MAX_POOLED_HOSTS, pool_maxsize=max(1, int(pool_size)))
+        self._local = threading.local()
+
+    def session(self) -> requests.Session:
+        """This thread's session over the shared connection pools."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    def connections_opened(self) -> int:
+        """Connections opened by the pools still alive (requests minus this = reused connections)."""
+        pools = self._adapter.poolmanager.pools
+        total = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            total += getattr(pool, "num_connections", 0) if pool is not None else 0
+        return total
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        session: Optional[requests.Session] = None,
+        headers=None,
+        pace: Optional[Callable] = None,
+        retry: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request, retrying per `retry` (default: the transport policy); return the first
+        response below 400. headers is a dict or a callable(attempt) -> dict (e.g. to rotate the
+        User-Agent); pace is a callable returning a context manager held around each attempt (rate
+        limiter, per-host politeness) but not around the backoff waits. session overrides the pooled one.
+        Raises requests.HTTPError (response attached) or the last connection error once retries
+        are exhausted, or at once for a status the policy does not retry.
+        """
+        retry = retry or self.retry
+        http = session or self.session()
+        for attempt in range(retry.attempts):
+            attempt_headers = {**self.headers, **((headers(attempt) if callable(headers) else headers) or {})}
+            response = None
+            with pace() if pace is not None else nullcontext():
+                started = time.perf_counter()
+                try:
+                    response = http.request(
+                        method, url, headers=attempt_headers, timeout=timeout or self.timeout, **kwargs
+                    )
+                except RETRY_EXCEPTIONS as exc:
+                    self.stats.record("error", time.perf_counter() - started)
+                    error = exc
+                else:
+                    self.stats.record(
+                        response.status_code,
+                        time.perf_counter() - started,
+                        _wire_bytes(response),
+                        len(response.content or b""),
+                    )
+            if response is not None:
+                if response.status_code < 400:
+                    return response
+                error = requests.HTTPError(f"{response.status_code} {response.reason}", response=response)
+                if not retry.should_retry(response.status_code):
+                    break
+            if attempt + 1 < retry.attempts:
+                delay = retry.wait(attempt, response)
+                self.stats.add_retry()
+                print(
+                    f"[WARN] {self.provider} {method} {urlparse(url).netloc} attempt {attempt + 1}/{retry.attempts}: "
+                    f"{error}; retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+        self.stats.add_error()
+        raise error
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the pooled connections (the transport reopens them on next use)."""
+        self._adapter.close()
+
+
+_TRANSPORTS: dict[str, HttpTransport] = {}
+_TRANSPORTS_LOCK = threading.Lock()
+
+
+def get_transport(provider: str, **config) -> HttpTransport:
+    """The process-wide transport of `provider`, created with `config` on first use."""
+    with _TRANSPORTS_LOCK:
+        transport = _TRANSPORTS.get(provider)
+        if transport is None:
+            transport = _TRANSPORTS[provider] = HttpTransport(provider, **config)
+        return transport
+
+
+def transport_stats() -> list[dict]:
+    """Stats of every registered transport that sent requests, with the connections it opened."""
+    rows = []
+    for transport in list(_TRANSPORTS.values()):
+        row = transport.stats.to_dict()
+        if row["requests"]:
+            row["connections"] = transport.connections_opened()
+            rows.append(row)
+    return rows
+
+
+def print_transport_stats() -> None:
+    for row in transport_stats():
+        statuses = " ".join(f"{status}x{count}" for status, count in sorted(row["statuses"].items(), key=str))
+        print(
+            f"[HTTP] {row['provider']}: {row['requests']} requests over {row['connections']} connections, "
+            f"{row['retries']} retries, {row['errors']} errors | {statuses} | "
+            f"{row['wire_bytes'] / 1e6:.2f} MB on the wire ({row['body_bytes'] / 1e6:.2f} MB decoded) | "
+            f"latency avg {row['latency_avg_s'] * 1000:.0f} ms, max {row['latency_max_s'] * 1000:.0f} ms"
+        )
+
+
+def close_transports() -> None:
+    for transport in list(_TRANSPORTS.values()):
+        transport.close()
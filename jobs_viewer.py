@@ -10,7 +10,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
 import subprocess
 import sys
 import unicodedata
@@ -19,11 +18,11 @@ from html import escape
 from pathlib import Path
 
 import pandas as pd
-from pandas.errors import EmptyDataError
 
 import adzuna_fetch as af
 import filter_impact as fi
 from config import SUPPORTED_CH_FOCUS, SUPPORTED_MARKETS, get_output_paths, resolve_filter_mode
+from table_storage import read_table, table_source
 
 
 DEFAULT_INPUT = "data/adzuna_jobs_filtered_strict_enriched.csv"
@@ -35,14 +34,6 @@ MA_LOCATION_FOCUS_CLUSTERS = {
     "rabat_or_remote": ["rabat", "sale", "salé", "technopolis", "skhirat", "temara", "témara"],
 }
 
-def safe_read_csv(path: str) -> pd.DataFrame:
-    if not os.path.exists(path):
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(path)
-    except EmptyDataError:
-        return pd.DataFrame()
-
 def normalize_match_text(*values: str) -> str:
     raw = " ".join(str(v or "") for v in values if str(v or ""))
     folded = unicodedata.normalize("NFKD", raw).encode("ascii", "ignore").decode("ascii")
@@ -220,70 +211,52 @@ def build_records(df: pd.DataFrame) -> list[dict]:
 def compute_independent_filter_impact(records: list[dict], filter_mode: str) -> dict:
     """
     Count how many rows would be removed by each filter independently.
-    No early-stop chaining here: each filter is evaluated on all rows.
+    No early-stop chaining here: each row's passes_filters trace holds every stage outcome.
     """
     mode = resolve_filter_mode(filter_mode, allow_both=False)
-    min_junior_score = 0 if mode == "strict" else -1
-    total = len(records)
     out = {
-        "total_rows": total,
+        "total_rows": len(records),
         "description_too_short": 0,
         "bad_title": 0,
         "too_old": 0,
         "location_blocked": 0,
         "role_not_relevant": 0,
         "internship_student_only": 0,
+        "internship_generic": 0,
         "exclude_keyword": 0,
+        "experience_hard": 0,
         "blocked_language_requirement": 0,
         "blocked_language_detected": 0,
         "junior_score_below_min": 0,
     }
+    counters = {
+        "description_length": "description_too_short",
+        "bad_title": "bad_title",
+        "recency": "too_old",
+        "location": "location_blocked",
+        "role_relevant": "role_not_relevant",
+        "internship_student_only": "internship_student_only",
+        "internship_generic": "internship_generic",
+        "exclude_keywords": "exclude_keyword",
+        "experience": "experience_hard",
+        "junior_score": "junior_score_below_min",
+    }
 
-    for r in records:
-        title = str(r.get("title", "") or "")
-        desc = str(r.get("description", "") or "")
-        loc = str(r.get("location", "") or "")
-        created = str(r.get("created", "") or "")
-        full = f"{title} {desc}"
-
-        if af.REQUIRE_DESCRIPTION and len(desc.strip()) < af.MIN_DESCRIPTION_CHARS:
-            out["description_too_short"] += 1
-
-        norm_title = af.normalize(title)
-        if any(pat in norm_title for pat in af.BAD_TITLE_KEYWORDS):
-            out["bad_title"] += 1
-
-        if not af.is_recent(created, af.MAX_DAYS_OLD):
-            out["too_old"] += 1
-
-        if not af.location_ok(loc, title, desc):
-            out["location_blocked"] += 1
-
-        if not af.role_relevant(title, desc):
-            out["role_not_relevant"] += 1
-
-        if af.internship_student_only_detail(title, desc):
-            out["internship_student_only"] += 1
-
-        hard_hits, _soft_hits = af.classify_excluded_hits(title, full)
-        if hard_hits:
-            out["exclude_keyword"] += 1
-
-        if af.blocked_language_requirement_reason(full):
-            out["blocked_language_requirement"] += 1
-            out["blocked_language_detected"] += 1
-        elif af.is_disallowed_language(full):
-            out["blocked_language_detected"] += 1
-
-        if af.compute_junior_score(title, desc) < min_junior_score:
-            out["junior_score_below_min"] += 1
+    for trace in fi.trace_jobs(records, mode):
+        stages = {outcome.stage: outcome for outcome in trace.stages}
+        for stage, key in counters.items():
+            out[key] += not stages[stage].passed
+        # Language counters keep the strict view, as in the strict recheck.
+        requirement = bool(stages["blocked_language_requirement"].detail)
+        out["blocked_language_requirement"] += requirement
+        out["blocked_language_detected"] += requirement or bool(stages["blocked_language"].detail)
 
     return out
 
 
 def compute_raw_to_strict_impact(raw_csv: str, filter_mode: str) -> dict:
     mode = resolve_filter_mode(filter_mode, allow_both=False)
-    if not raw_csv or not os.path.exists(raw_csv):
+    if not raw_csv or table_source(raw_csv) is None:
         return {
             "available": False,
             "raw_csv": raw_csv,
@@ -293,58 +266,16 @@ def compute_raw_to_strict_impact(raw_csv: str, filter_mode: str) -> dict:
             "analysis_trimmed": True,
         }
 
-    raw_jobs = fi.load_raw_jobs(raw_csv)
-    all_jobs = [fi.extract_fields(j) for j in raw_jobs]
-    for idx, job in enumerate(all_jobs):
-        job["row_id"] = idx
-
-    steps = [
-        ("description_length", lambda job: fi.check_description(job["description"])),
-        ("bad_title", lambda job: fi.check_bad_title(job["title"])),
-        ("recency", lambda job: fi.check_recency(job["created"])),
-        ("location", lambda job: fi.check_location(job["location"], job["title"], job["description"])),
-        ("role_relevant", lambda job: fi.check_role(job["title"], job["description"])),
-        ("internship_student_only", lambda job: fi.check_internship_student_only(job["title"], job["description"])),
-        ("exclude_keywords", lambda job: fi.check_excluded(job["title"], job["title"] + " " + job["description"])),
-        (
-            "blocked_language_requirement",
-            lambda job: fi.check_blocked_language_requirement(job["title"] + " " + job["description"]),
-        ),
-        ("blocked_language", lambda job: fi.check_disallowed_language(job["title"] + " " + job["description"], mode)),
-        ("junior_score", lambda job: fi.check_junior(job["title"], job["description"], mode)),
-    ]
-
-    current = list(all_jobs)
-    step_rows = []
-    for step_name, fn in steps:
-        before = len(current)
-        kept = []
-        for job in current:
-            result = fn(job)
-            ok = bool(result[0])
-            if ok:
-                kept.append(job)
-        removed = before - len(kept)
-        pct = round((removed * 100.0 / before), 1) if before else 0.0
-        step_rows.append({"step": step_name, "before": before, "removed": removed, "kept": len(kept), "pct_removed": pct})
-        current = kept
-
-    final_df = pd.DataFrame(current)
-    if not final_df.empty:
-        final_after_dedup = int(
-            len(final_df.drop_duplicates(subset=["canonical_url", "title", "company"], keep="first"))
-        )
-    else:
-        final_after_dedup = 0
-
+    matrix = fi.load_rule_matrix(raw_csv, mode)
     return {
         "available": True,
         "raw_csv": raw_csv,
-        "raw_rows": len(all_jobs),
-        "steps": step_rows,
-        "final_after_dedup": final_after_dedup,
-        "what_if_skip": [],
-        "analysis_trimmed": True,
+        "raw_rows": len(matrix),
+        "steps": matrix.funnel(),
+        "final_after_dedup": matrix.what_if()["final_after_dedup"],
+        "what_if_skip": matrix.what_if_skip(),
+        "rule_matrix": matrix.to_json(),
+        "analysis_trimmed": False,
     }
 
 
@@ -501,6 +432,9 @@ def build_html(
       font-size: 12px;
     }}
     .impact-card b {{ color: var(--accent); }}
+    .whatif-table {{ border-collapse: collapse; margin-top: 8px; font-size: 12px; }}
+    .whatif-table th, .whatif-table td {{ border-bottom: 1px solid var(--line); padding: 3px 8px; text-align: right; }}
+    .whatif-table th:first-child, .whatif-table td:first-child {{ text-align: left; }}
     .btn {{
       padding: 7px 10px;
       border-radius: 8px;
@@ -558,6 +492,8 @@ def build_html(
       <div class="tiny muted">From raw Adzuna search to strict final output.</div>
       <div class="impact-grid" id="rawflow"></div>
       <div class="tiny muted" id="rawwhatif"></div>
+      <div id="rawwhatiftable"></div>
+      <div class="tiny muted" id="rawwhatifcombo"></div>
       <div class="row" style="margin-top:8px">
         <button id="rawRebuildBtn" class="btn" type="button">Rebuild raw impact (copy command)</button>
         <span class="tiny muted" id="rawCmdStatus"></span>
@@ -592,6 +528,8 @@ def build_html(
     const reasonsEl = document.getElementById("reasons");
     const rawFlowEl = document.getElementById("rawflow");
     const rawWhatIfEl = document.getElementById("rawwhatif");
+    const rawWhatIfTableEl = document.getElementById("rawwhatiftable");
+    const rawWhatIfComboEl = document.getElementById("rawwhatifcombo");
     const rawRebuildBtn = document.getElementById("rawRebuildBtn");
     const rawCmdStatusEl = document.getElementById("rawCmdStatus");
     const rawCmdEl = document.getElementById("rawcmd");
@@ -696,7 +634,9 @@ def build_html(
         ["location blocked", IMPACT.location_blocked || 0],
         ["role not relevant", IMPACT.role_not_relevant || 0],
         ["internship student only", IMPACT.internship_student_only || 0],
+        ["internship generic", IMPACT.internship_generic || 0],
         ["exclude keyword", IMPACT.exclude_keyword || 0],
+        ["hard experience requirement", IMPACT.experience_hard || 0],
         ["blocked language req", IMPACT.blocked_language_requirement || 0],
         ["blocked language detected", IMPACT.blocked_language_detected || 0],
         ["junior score below min", IMPACT.junior_score_below_min || 0],
@@ -758,6 +698,50 @@ def build_html(
         notes.push(`<a href="${{href}}" target="_blank" rel="noopener">Open detailed stats page</a>`);
       }}
       rawWhatIfEl.innerHTML = notes.join(" | ");
+      renderWhatIfTable(whatIf);
+    }}
+
+    // Any combination of disabled steps, from the per-row failed-step bitmask.
+    function whatIfCounts(disabledMask) {{
+      const matrix = RAW_IMPACT.rule_matrix;
+      const groups = new Set();
+      let kept = 0;
+      matrix.fails.forEach((fails, i) => {{
+        if ((fails & ~disabledMask) === 0) {{
+          kept += 1;
+          groups.add(matrix.groups[i]);
+        }}
+      }});
+      return {{ kept, final: groups.size }};
+    }}
+
+    function renderWhatIfTable(whatIf) {{
+      const matrix = RAW_IMPACT.rule_matrix;
+      if (!matrix || !whatIf.length) {{
+        rawWhatIfTableEl.innerHTML = "";
+        rawWhatIfComboEl.textContent = "";
+        return;
+      }}
+      const head = "<tr><th>disable</th><th>step</th><th>rejects alone</th><th>kept</th><th>final</th><th>delta</th></tr>";
+      const body = whatIf.map(x => {{
+        const bit = 1 << matrix.stages.indexOf(x.step);
+        return `<tr><td><input type="checkbox" class="whatif-toggle" data-bit="${{bit}}"></td><td>${{esc(x.step)}}</td>` +
+          `<td>${{x.rejects}}</td><td>${{x.kept}}</td><td>${{x.final_after_dedup}}</td><td>${{x.delta_vs_strict > 0 ? "+" : ""}}${{x.delta_vs_strict}}</td></tr>`;
+      }}).join("");
+      rawWhatIfTableEl.innerHTML = `<table class="whatif-table">${{head}}${{body}}</table>`;
+      const toggles = Array.from(rawWhatIfTableEl.querySelectorAll(".whatif-toggle"));
+      const update = () => {{
+        const mask = toggles.filter(t => t.checked).reduce((acc, t) => acc | Number(t.dataset.bit), 0);
+        if (!mask) {{
+          rawWhatIfComboEl.textContent = "Tick steps to combine them.";
+          return;
+        }}
+        const counts = whatIfCounts(mask);
+        const delta = counts.final - Number(RAW_IMPACT.final_after_dedup || 0);
+        rawWhatIfComboEl.textContent = `Without the ticked steps: kept=${{counts.kept}} final=${{counts.final}} (${{delta >= 0 ? "+" : ""}}${{delta}})`;
+      }};
+      toggles.forEach(t => t.addEventListener("change", update));
+      update();
     }}
 
     function setupRawCommandButton() {{
@@ -838,7 +822,7 @@ def main():
     args = parser.parse_args()
 
     af.configure_market(args.market, args.ch_focus)
-    df = safe_read_csv(args.input)
+    df = read_table(args.input)
     if df.empty:
         raise SystemExit(f"[VIEWER] No data found in: {args.input}")
 
@@ -5,7 +5,6 @@ Fetch jobs from Jooble API and apply the same filters as Adzuna.
 import time
 
 import pandas as pd
-import requests
 from pandas.errors import EmptyDataError
 
 from adzuna_fetch import configure_market, passes_filters, safe_save_csv
@@ -22,8 +21,10 @@ from config import (
     require_jooble_credentials,
     resolve_filter_mode,
 )
+from http_transport import get_transport, print_transport_stats
 
 BASE_URL = f"https://jooble.org/api/{JOOBLE_API_KEY}"
+HTTP = get_transport("jooble", timeout=12)
 
 
 def build_filtered_df(all_jobs: list[dict], filter_mode: str) -> pd.DataFrame:
@@ -60,9 +61,7 @@ def fetch_jooble_page(
     if jooble_location:
         payload["location"] = jooble_location
     try:
-        resp = requests.post(BASE_URL, json=payload, timeout=12)
-        resp.raise_for_status()
-        return resp.json()
+        return HTTP.post(BASE_URL, json=payload).json()
     except Exception as e:
         print(f"[WARN] Jooble error term='{term}' page={page}: {e}")
         return None
@@ -159,6 +158,7 @@ def main():
                 all_jobs.extend(results)
                 time.sleep(1)
 
+        print_transport_stats()
         df_raw = pd.DataFrame(all_jobs)
         safe_save_csv(df_raw, jooble_raw_csv)
         print(f"[INFO][Jooble] Raw saved: {len(df_raw)}")
@@ -0,0 +1,152 @@
+"""
+Language identification for job text (is_disallowed_language).
+
+detect_language(text) returns the dominant ISO 639-1 code of the text's first 800 characters:
+1. A stopword pre-classifier settles clear fr, en, nl, de and it snippets.
+2. Ambiguous snippets go to langdetect, seeded so the same text always gets the same code.
+3. Results are memoized in a bounded LRU keyed by a hash of the snippet, so the rules, the
+   near-miss pass, filter_impact and jobs_viewer share one answer per text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict
+
+from langdetect import DetectorFactory, LangDetectException
+from langdetect import detect as _langdetect
+
+# langdetect draws random samples; a fixed seed makes its answer a function of the text.
+DetectorFactory.seed = 0
+
+SNIPPET_CHARS = 800
+LANGUAGE_ID_CACHE_SIZE = 8192
+
+# Function words that are frequent in one of the languages and absent from the others
+# ("de", "en", "die", "is", "du", "als", ... are shared and left out).
+STOPWORDS = {
+    "en": (
+        "the and of to with for you your our we are will have has this that from or on at by who "
+        "which their they be it as about into not can"
+    ),
+    "fr": (
+        "le la les des et un une pour vous nous avec dans sur est sont au aux votre vos nos notre qui "
+        "que ce cette ces par pas plus être avez êtes sera leur ou à afin ainsi"
+    ),
+    "nl": (
+        "het een van voor met je jouw jij wij zijn niet ook bij naar om op aan dat te worden wordt heb "
+        "hebt heeft onze ons ben binnen deze door hoe maar meer nog uit wat waar zal zoals tot jaar "
+        "kennis ervaring"
+    ),
+    "de": (
+        "der das und mit für sie wir ist sind ein eine einen dem den zu von bei auf im nicht oder auch "
+        "werden wird unsere unser ihre ihr ihnen dich deine sowie über nach aus zur zum vom haben sehr"
+    ),
+    "it": (
+        "il lo gli della delle dei degli con sono una che nel nella alla del di è siamo essere lavoro "
+        "esperienza conoscenza"
+    ),
+}
+STOPWORD_LANGUAGE = {word: lang for lang, words in STOPWORDS.items() for word in words.split()}
+
+# Function words of close relatives of those languages (Afrikaans next to nl, Luxembourgish next
+# to de). Such text shares enough stopwords with nl/de to look clear-cut, so one of these words
+# leaves the snippet to langdetect.
+RELATED_STOPWORDS = {
+    "af": "nie vir jy julle hierdie ek hulle baie wees asook sodat reeds",
+    "lb": "ass mat fir och sinn gëtt vun eis eise ech kënnen hutt bass dës",
+}
+RELATED_WORDS = frozenset(word for words in RELATED_STOPWORDS.values() for word in words.split())
+
+# Letters or character n-grams of a language. They never settle a snippet on their own: a snippet
+# whose markers point elsewhere than its stopwords (QUICK_MIN_HITS or more) goes to langdetect.
+CHAR_MARKERS = (
+    ("fr", re.compile(r"[éèêàçùûîôœ]")),
+    ("de", re.compile(r"[äöüß]|sch|ung$|keit$|heit$")),
+    ("nl", re.compile(r"ij")),
+    ("it", re.compile(r"zion[ei]$")),
+)
+
+# A snippet is settled without langdetect when its top language has at least QUICK_MIN_HITS
+# stopwords and QUICK_DOMINANCE times as many as the runner-up.
+QUICK_MIN_HITS = 4
+QUICK_DOMINANCE = 3.0
+
+_WORD_RE = re.compile(r"[a-zà-öø-ÿß]+")
+
+_LANGUAGE_ID_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_LANGUAGE_ID_LOCK = threading.Lock()
+# quick / langdetect / cache_hit counts since the last clear_language_id_cache().
+LANGUAGE_ID_STATS: Counter = Counter()
+
+
+def quick_language(snippet: str) -> str:
+    """Language of a clear-cut snippet from its stopwords; "" when ambiguous."""
+    counts: Counter = Counter()
+    markers: Counter = Counter()
+    for word in _WORD_RE.findall(snippet.lower()):
+        if word in RELATED_WORDS:
+            return ""
+        lang = STOPWORD_LANGUAGE.get(word)
+        if lang is not None:
+            counts[lang] += 1
+            continue
+        for marker_lang, pattern in CHAR_MARKERS:
+            if pattern.search(word):
+                markers[marker_lang] += 1
+                break
+    if not counts:
+        return ""
+    ranked = counts.most_common(2)
+    top, hits = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0
+    if hits < QUICK_MIN_HITS or hits < QUICK_DOMINANCE * runner_up:
+        return ""
+    if any(lang != top and marked >= QUICK_MIN_HITS and marked > markers[top] for lang, marked in markers.items()):
+        return ""
+    return top
+
+
+def langdetect_language(snippet: str) -> str:
+    """Seeded langdetect; "" when it cannot decide (no letters, too short)."""
+    try:
+        return _langdetect(snippet)
+    except LangDetectException:
+        return ""
+
+
+def _snippet_key(snippet: str) -> bytes:
+    return hashlib.blake2b(snippet.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def detect_language(text: str) -> str:
+    """Dominant language code of the start of text ("" for empty or undecidable text)."""
+    snippet = str(text or "")[:SNIPPET_CHARS]
+    if not snippet.strip():
+        return ""
+    key = _snippet_key(snippet)
+    with _LANGUAGE_ID_LOCK:
+        cached = _LANGUAGE_ID_CACHE.get(key)
+        if cached is not None:
+            _LANGUAGE_ID_CACHE.move_to_end(key)
+            LANGUAGE_ID_STATS["cache_hit"] += 1
+            return cached
+    lang = quick_language(snippet)
+    step = "quick"
+    if not lang:
+        lang = langdetect_language(snippet)
+        step = "langdetect"
+    with _LANGUAGE_ID_LOCK:
+        LANGUAGE_ID_STATS[step] += 1
+        _LANGUAGE_ID_CACHE[key] = lang
+        while len(_LANGUAGE_ID_CACHE) > LANGUAGE_ID_CACHE_SIZE:
+            _LANGUAGE_ID_CACHE.popitem(last=False)
+    return lang
+
+
+def clear_language_id_cache() -> None:
+    with _LANGUAGE_ID_LOCK:
+        _LANGUAGE_ID_CACHE.clear()
+        LANGUAGE_ID_STATS.clear()
@@ -15,10 +15,10 @@ import json
 import os
 import re
 import time
+from typing import Optional
 from urllib.parse import urljoin
 
 import pandas as pd
-import requests
 from pandas.errors import EmptyDataError
 
 from adzuna_fetch import configure_market, passes_filters, safe_save_csv
@@ -30,6 +30,9 @@ from config import (
     get_output_paths,
     resolve_filter_mode,
 )
+from detail_cache import DetailCache
+from http_transport import get_transport, print_transport_stats
+from site_crawler import DEFAULT_CRAWL_CONCURRENCY, DetailPrefetch, SiteCrawler, merge_job_detail
 
 BASE_URL = "https://www.marocannonces.com"
 LISTING_URL = (
@@ -43,6 +46,7 @@ DEFAULT_HEADERS = {
     ),
     "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
 }
+HTTP = get_transport("marocannonces", headers=DEFAULT_HEADERS)
 
 TAG_RE = re.compile(r"<[^>]+>")
 WHITESPACE_RE = re.compile(r"\s+")
@@ -81,9 +85,7 @@ def build_listing_url(page: int = 0) -> str:
 
 
 def fetch_html(url: str, timeout: int = 20) -> str:
-    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
-    response.raise_for_status()
-    return response.text
+    return HTTP.get(url, timeout=timeout).text
 
 
 def extract_total_pages(listing_html: str) -> int:
@@ -252,33 +254,54 @@ def dedup_jobs(jobs: list[dict]) -> list[dict]:
     return list(bucket.values())
 
 
-def enrich_with_details(jobs: list[dict], sleep_seconds: float = 0.25, timeout: int = 20) -> list[dict]:
+def enrich_with_details(
+    jobs: list[dict],
+    sleep_seconds: float = 0.25,
+    timeout: int = 20,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
     enriched: list[dict] = []
     total = len(jobs)
     for idx, job in enumerate(jobs, start=1):
         merged = dict(job)
+        detail = detail_cache.get(job) if detail_cache is not None else None
+        fetched = detail is None
         try:
-            detail = parse_detail_page(fetch_html(job["url"], timeout=timeout), job["url"])
-            for key, value in detail.items():
-                if value:
-                    merged[key] = value
+            if detail is None:
+                detail = parse_detail_page(fetch_html(job["url"], timeout=timeout), job["url"])
+                if detail_cache is not None:
+                    detail_cache.put(job, detail)
+            merged = merge_job_detail(job, detail)
         except Exception as exc:
             print(f"[WARN][MarocAnnonces] detail fetch failed idx={idx}/{total} url={job.get('url','')}: {exc}")
         enriched.append(merged)
         if idx % 10 == 0 or idx == total:
             print(f"[INFO][MarocAnnonces] detail progress {idx}/{total}")
-        if sleep_seconds > 0 and idx < total:
+        if fetched and sleep_seconds > 0 and idx < total:
             time.sleep(sleep_seconds)
     return enriched
 
 
-def fetch_all_jobs(max_pages: int = 0, max_jobs: int = 0, sleep_seconds: float = 0.25, timeout: int = 20) -> list[dict]:
-    first_page = fetch_html(build_listing_url(0), timeout=timeout)
+def listing_page_urls(first_page: str, max_pages: int = 0) -> list[str]:
     page_urls = extract_page_urls(first_page)
-    total_pages = len(page_urls)
     if max_pages and max_pages > 0:
         page_urls = page_urls[:max_pages]
-        total_pages = len(page_urls)
+    return page_urls
+
+
+def fetch_all_jobs(
+    max_pages: int = 0,
+    max_jobs: int = 0,
+    sleep_seconds: float = 0.25,
+    timeout: int = 20,
+    concurrency: int = 1,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
+    if concurrency > 1:
+        return crawl_all_jobs(max_pages, max_jobs, sleep_seconds, timeout, concurrency, detail_cache)
+    first_page = fetch_html(build_listing_url(0), timeout=timeout)
+    page_urls = listing_page_urls(first_page, max_pages)
+    total_pages = len(page_urls)
 
     jobs = parse_listing_page(first_page)
     print(f"[INFO][MarocAnnonces] Listing page 1/{total_pages}: {len(jobs)} rows")
@@ -299,7 +322,50 @@ def fetch_all_jobs(max_pages: int = 0, max_jobs: int = 0, sleep_seconds: float =
     if max_jobs > 0:
         deduped = deduped[:max_jobs]
         print(f"[INFO][MarocAnnonces] Max jobs limit applied: {len(deduped)}")
-    return enrich_with_details(deduped, sleep_seconds=sleep_seconds, timeout=timeout)
+    return enrich_with_details(deduped, sleep_seconds=sleep_seconds, timeout=timeout, detail_cache=detail_cache)
+
+
+def crawl_all_jobs(
+    max_pages: int = 0,
+    max_jobs: int = 0,
+    sleep_seconds: float = 0.25,
+    timeout: int = 20,
+    concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
+    """
+    fetch_all_jobs with the listing pages linked from page 1 fetched in parallel and detail pages
+    fetched as soon as their listing page is parsed. Pages after the first empty one are discarded,
+    like the serial early stop. sleep_seconds spaces request starts on the site.
+    """
+    with SiteCrawler(lambda url: fetch_html(url, timeout=timeout), concurrency, delay=sleep_seconds) as crawler:
+        details = DetailPrefetch(crawler, parse_detail_page, max_jobs=max_jobs, detail_cache=detail_cache)
+        first_page = crawler.submit(build_listing_url(0)).result()
+        page_urls = listing_page_urls(first_page, max_pages)
+        total_pages = len(page_urls)
+        pages = [(page_url, crawler.submit(page_url)) for page_url in page_urls[1:]]
+
+        jobs = parse_listing_page(first_page)
+        details.add(jobs)
+        print(f"[INFO][MarocAnnonces] Listing page 1/{total_pages}: {len(jobs)} rows")
+
+        for idx, (page_url, page) in enumerate(pages, start=2):
+            page_jobs = parse_listing_page(page.result())
+            jobs.extend(page_jobs)
+            details.add(page_jobs)
+            print(f"[INFO][MarocAnnonces] Listing page {idx}/{total_pages}: {len(page_jobs)} rows")
+            if not page_jobs:
+                print(f"[INFO][MarocAnnonces] Early stop on empty listing page: {page_url}")
+                for _url, later in pages[idx - 1 :]:
+                    later.cancel()
+                break
+
+        deduped = dedup_jobs(jobs)
+        print(f"[INFO][MarocAnnonces] Listing deduped rows: {len(deduped)}")
+        if max_jobs > 0:
+            deduped = deduped[:max_jobs]
+            print(f"[INFO][MarocAnnonces] Max jobs limit applied: {len(deduped)}")
+        return details.merge(deduped, merge_job_detail, "MarocAnnonces")
 
 
 def build_filtered_df(all_jobs: list[dict], filter_mode: str) -> pd.DataFrame:
@@ -358,6 +424,22 @@ def main():
     parser.add_argument("--max-jobs", type=int, default=0, help="Limit detail pages (0 = all).")
     parser.add_argument("--sleep", type=float, default=0.25, help="Sleep seconds between requests.")
     parser.add_argument("--timeout", type=int, default=20, help="HTTP timeout in seconds.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CRAWL_CONCURRENCY,
+        help="Requests in flight on MarocAnnonces (1 = serial crawl with --sleep pauses).",
+    )
+    parser.add_argument(
+        "--detail-cache",
+        default="",
+        help="SQLite cache of parsed detail pages (default: market detail_cache_db).",
+    )
+    parser.add_argument(
+        "--no-detail-cache",
+        action="store_true",
+        help="Fetch every detail page, even when its listing card is unchanged since the cached fetch.",
+    )
     args = parser.parse_args()
 
     market = configure_market(args.market, args.ch_focus)
@@ -377,12 +459,23 @@ def main():
     if args.no_fetch:
         all_jobs = safe_read_raw(raw_csv)
     else:
-        all_jobs = fetch_all_jobs(
-            max_pages=args.max_pages,
-            max_jobs=args.max_jobs,
-            sleep_seconds=args.sleep,
-            timeout=args.timeout,
+        detail_cache = None if args.no_detail_cache else DetailCache(
+            args.detail_cache or paths["detail_cache_db"], "marocannonces"
         )
+        try:
+            all_jobs = fetch_all_jobs(
+                max_pages=args.max_pages,
+                max_jobs=args.max_jobs,
+                sleep_seconds=args.sleep,
+                timeout=args.timeout,
+                concurrency=args.concurrency,
+                detail_cache=detail_cache,
+            )
+            print_transport_stats()
+        finally:
+            if detail_cache is not None:
+                print(detail_cache.summary())
+                detail_cache.close()
         safe_save_csv(pd.DataFrame(all_jobs), raw_csv)
 
     if selected_filter_mode in ("strict", "both"):
@@ -4,14 +4,15 @@ Merge provider outputs, deduplicate (3 levels), then apply final filters.
 
 import re
 import unicodedata
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-from pandas.errors import EmptyDataError
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
-from adzuna_fetch import configure_market, passes_filters, safe_save_csv
+from adzuna_fetch import close_verdict_cache, configure_market, enable_verdict_cache, filter_jobs, safe_save_table
 from config import (
     SUPPORTED_CH_FOCUS,
     SUPPORTED_FILTER_MODES,
@@ -19,6 +20,7 @@ from config import (
     get_output_paths,
     resolve_filter_mode,
 )
+from table_storage import read_table, table_source
 
 
 def safe_text(value) -> str:
@@ -139,41 +141,146 @@ def dedup_by_canonical(jobs: List[Dict]) -> List[Dict]:
     return list(bucket.values())
 
 
-def location_similar(a: str, b: str) -> bool:
-    na = normalize_simple(a)
-    nb = normalize_simple(b)
+FUZZY_DUP_SCORE = 92
+FUZZY_LOCATION_SCORE = 90
+
+# Fuzzy dedup blocking. token_set_ratio(a, b) >= FUZZY_DUP_SCORE only happens when
+# - the token sets share a token and one side is (almost) contained in the other: its tokens missing
+#   from the other side stay under ~17% of its length, so the other side shares one of its rarest
+#   tokens covering FUZZY_PREFIX_SHARE of its length; or
+# - the sorted token strings are within edit distance 8% of their total length, which bounds the
+#   difference of their character counts (CHAR_ALPHABET covers everything normalize_simple keeps).
+# Blocks are built from both conditions, so they only skip pairs that could never merge.
+FUZZY_PREFIX_SHARE = 0.18
+CHAR_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789 "
+CHAR_INDEX = {ch: i for i, ch in enumerate(CHAR_ALPHABET)}
+
+
+def _locations_similar(na: str, nb: str) -> bool:
+    """location_similar on locations already passed through normalize_simple."""
     if not na or not nb:
         return True
     if na == nb:
         return True
-    return fuzz.token_set_ratio(na, nb) >= 90
+    return fuzz.token_set_ratio(na, nb) >= FUZZY_LOCATION_SCORE
+
+
+def location_similar(a: str, b: str) -> bool:
+    return _locations_similar(normalize_simple(a), normalize_simple(b))
+
+
+def dedup_text(job: Dict) -> str:
+    return f"{normalize_simple(job.get('company', ''))} {normalize_simple(job.get('title', ''))}"
+
+
+def _char_counts(text: str) -> np.ndarray:
+    counts = np.zeros(len(CHAR_ALPHABET), dtype=np.int32)
+    for ch in text:
+        counts[CHAR_INDEX[ch]] += 1
+    return counts
+
+
+def _rare_prefix(tokens: set, doc_freq: Counter) -> List[str]:
+    """Rarest tokens first, until they cover FUZZY_PREFIX_SHARE of the sorted token string."""
+    ordered = sorted(tokens, key=lambda tok: (doc_freq[tok], tok))
+    target = FUZZY_PREFIX_SHARE * len(" ".join(ordered))
+    prefix = []
+    width = -1
+    for tok in ordered:
+        prefix.append(tok)
+        width += len(tok) + 1
+        if width >= target:
+            break
+    return prefix
 
 
 def fuzzy_dedup(jobs: List[Dict]) -> List[Dict]:
-    kept = []
-    keys = []
-    for job in jobs:
-        text = f"{normalize_simple(job.get('company', ''))} {normalize_simple(job.get('title', ''))}"
+    """
+    Merge jobs whose company + title score >= FUZZY_DUP_SCORE (token_set_ratio) at a similar location.
+    Each job merges into the first kept job it matches, as in a full pairwise scan, but is only
+    scored against the kept jobs in its blocks (see FUZZY_PREFIX_SHARE above).
+    """
+    texts = [dedup_text(job) for job in jobs]
+    locations = [normalize_simple(job.get("location", "")) for job in jobs]
+    token_sets = [set(text.split()) for text in texts]
+    doc_freq = Counter(tok for tokens in token_sets for tok in tokens)
+
+    kept: List[Dict] = []
+    keys: List[str] = []
+    kept_locations: List[str] = []
+    by_token: Dict[str, List[int]] = {}
+    by_rare_prefix: Dict[str, List[int]] = {}
+    char_counts = np.zeros((len(jobs), len(CHAR_ALPHABET)), dtype=np.int32)
+    # Slots without tokens never match; their length keeps them out of the character block.
+    sorted_lengths = np.full(len(jobs), np.iinfo(np.int32).max // 2, dtype=np.int32)
+
+    for job, text, location, tokens in zip(jobs, texts, locations, token_sets):
+        sorted_text = " ".join(sorted(tokens))
+        prefix = _rare_prefix(tokens, doc_freq) if tokens else []
         merged = False
-        for idx, existing in enumerate(kept):
-            score = fuzz.token_set_ratio(text, keys[idx])
-            if score >= 92 and location_similar(job.get("location", ""), existing.get("location", "")):
-                kept[idx] = choose_best(existing, job)
-                merged = True
-                break
+        if tokens and kept:
+            candidates = set()
+            for tok in prefix:
+                candidates.update(by_token.get(tok, ()))
+            for tok in tokens:
+                candidates.update(by_rare_prefix.get(tok, ()))
+            slots = len(kept)
+            char_dist = np.abs(char_counts[:slots] - _char_counts(sorted_text)).sum(axis=1)
+            close = char_dist <= (1 - FUZZY_DUP_SCORE / 100) * (len(sorted_text) + sorted_lengths[:slots]) + 1
+            candidates.update(np.flatnonzero(close).tolist())
+            block = sorted(candidates)
+            scores = process.cdist(
+                [text], [keys[idx] for idx in block], scorer=fuzz.token_set_ratio, score_cutoff=FUZZY_DUP_SCORE
+            )[0]
+            for idx, score in zip(block, scores):
+                if score and _locations_similar(location, kept_locations[idx]):
+                    best = choose_best(kept[idx], job)
+                    if best is not kept[idx]:
+                        kept_locations[idx] = location
+                    kept[idx] = best
+                    merged = True
+                    break
         if not merged:
+            slot = len(kept)
             kept.append(job)
             keys.append(text)
+            kept_locations.append(location)
+            if tokens:
+                char_counts[slot] = _char_counts(sorted_text)
+                sorted_lengths[slot] = len(sorted_text)
+                for tok in tokens:
+                    by_token.setdefault(tok, []).append(slot)
+                for tok in prefix:
+                    by_rare_prefix.setdefault(tok, []).append(slot)
     return kept
 
 
+# Every provider column the map_*_row functions read; raw tables are loaded with only these.
+RAW_COLUMNS = [
+    "title",
+    "company",
+    "company.display_name",
+    "location",
+    "location.display_name",
+    "created",
+    "updated",
+    "url",
+    "link",
+    "redirect_url",
+    "salary_min",
+    "salary_max",
+    "description",
+    "snippet",
+    "search_term",
+]
+
+
 def load_raw_jobs(path: str, source: str) -> List[Dict]:
-    try:
-        df = pd.read_csv(path)
-    except FileNotFoundError:
+    if table_source(path) is None:
         print(f"[MERGE] No file for {source}: {path}")
         return []
-    except EmptyDataError:
+    df = read_table(path, columns=RAW_COLUMNS)
+    if df.empty and not len(df.columns):
         print(f"[MERGE] Empty file for {source}: {path}")
         return []
     records = df.to_dict(orient="records")
@@ -287,6 +394,22 @@ def main():
         default="",
         help="Filtering strictness (strict|broad|both). Defaults to JOB_FILTER_MODE env var or strict.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Filter jobs with N worker processes (default: 1, in-process).",
+    )
+    parser.add_argument(
+        "--verdict-cache",
+        default="",
+        help="SQLite verdict cache (default: market verdict_cache_db). Unchanged jobs skip the rules.",
+    )
+    parser.add_argument(
+        "--no-verdict-cache",
+        action="store_true",
+        help="Evaluate every job from scratch.",
+    )
     args = parser.parse_args()
 
     market = configure_market(args.market, args.ch_focus)
@@ -326,7 +449,7 @@ def main():
     )
 
     # Save merged raw (normalized)
-    safe_save_csv(pd.DataFrame(normalized), merged_raw_csv)
+    safe_save_table(pd.DataFrame(normalized), merged_raw_csv)
 
     # Dedup levels
     lvl1 = dedup_by_url(normalized)
@@ -334,27 +457,29 @@ def main():
     lvl3 = fuzzy_dedup(lvl2)
     print(f"[MERGE] Dedup level1 -> {len(lvl1)}, level2 -> {len(lvl2)}, level3 -> {len(lvl3)}")
 
+    # Strict and broad verdicts come from one evaluation pass; each row keeps its provider source.
+    filter_modes = ["strict", "broad"] if selected_filter_mode == "both" else [selected_filter_mode]
+    if not args.no_verdict_cache:
+        enable_verdict_cache(args.verdict_cache)
+    kept_by_mode = filter_jobs(lvl3, filter_modes, source=None, workers=args.workers)
+    close_verdict_cache()
+
     def run_filter(mode: str) -> pd.DataFrame:
-        kept = []
-        for job in lvl3:
-            parsed = passes_filters(job, source=job.get("source", "merged"), filter_mode=mode)
-            if parsed:
-                kept.append(parsed)
-        return pd.DataFrame(kept)
+        return pd.DataFrame(kept_by_mode[mode])
 
     if selected_filter_mode in ("strict", "both"):
         df_strict = run_filter("strict")
-        safe_save_csv(df_strict, merged_filtered_strict_csv)
-        safe_save_csv(df_strict, merged_filtered_csv)
-        safe_save_csv(df_strict, merged_csv)  # legacy path
+        safe_save_table(df_strict, merged_filtered_strict_csv)
+        safe_save_table(df_strict, merged_filtered_csv)
+        safe_save_table(df_strict, merged_csv)  # legacy path
         print(f"[MERGE] Strict filtered: {len(df_strict)}")
 
     if selected_filter_mode in ("broad", "both"):
         df_broad = run_filter("broad")
-        safe_save_csv(df_broad, merged_filtered_broad_csv)
+        safe_save_table(df_broad, merged_filtered_broad_csv)
         if selected_filter_mode == "broad":
-            safe_save_csv(df_broad, merged_filtered_csv)
-            safe_save_csv(df_broad, merged_csv)  # legacy path
+            safe_save_table(df_broad, merged_filtered_csv)
+            safe_save_table(df_broad, merged_csv)  # legacy path
         print(f"[MERGE] Broad filtered: {len(df_broad)}")
 
     print(f"[MERGE] Raw merged: {len(normalized)} rows")
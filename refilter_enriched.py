@@ -1,10 +1,12 @@
 """Re-apply updated filter rules to enriched CSVs without re-fetching descriptions."""
 import csv
 import sys
-from adzuna_fetch import passes_filters, configure_market
+from adzuna_fetch import passes_filters, configure_market, enable_verdict_cache, close_verdict_cache
 
-def refilter(market: str, input_csv: str, output_csv: str):
+def refilter(market: str, input_csv: str, output_csv: str, verdict_cache: str = "", use_verdict_cache: bool = True):
     configure_market(market)
+    if use_verdict_cache:
+        enable_verdict_cache(verdict_cache)
     kept = []
     dropped = []
     with open(input_csv, newline='', encoding='utf-8-sig') as f:
@@ -27,6 +29,7 @@ def refilter(market: str, input_csv: str, output_csv: str):
                 kept.append(row)
             else:
                 dropped.append(row.get("title", "?") + " | " + row.get("company", "?"))
+    close_verdict_cache()
 
     with open(output_csv, "w", newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -45,5 +48,7 @@ if __name__ == "__main__":
     p.add_argument("--market", required=True)
     p.add_argument("--input", required=True)
     p.add_argument("--output", required=True)
+    p.add_argument("--verdict-cache", default="", help="SQLite verdict cache (default: market verdict_cache_db)")
+    p.add_argument("--no-verdict-cache", action="store_true", help="Evaluate every row from scratch")
     args = p.parse_args()
-    refilter(args.market, args.input, args.output)
+    refilter(args.market, args.input, args.output, args.verdict_cache, not args.no_verdict_cache)
@@ -15,10 +15,10 @@ import os
 import re
 import time
 from datetime import datetime
+from typing import Optional
 from urllib.parse import urljoin
 
 import pandas as pd
-import requests
 from pandas.errors import EmptyDataError
 
 from adzuna_fetch import configure_market, passes_filters, safe_save_csv
@@ -30,6 +30,9 @@ from config import (
     get_output_paths,
     resolve_filter_mode,
 )
+from detail_cache import DetailCache
+from http_transport import get_transport, print_transport_stats
+from site_crawler import DEFAULT_CRAWL_CONCURRENCY, DetailPrefetch, SiteCrawler, merge_job_detail
 
 BASE_URL = "https://www.rekrute.com"
 START_URL = (
@@ -43,6 +46,7 @@ DEFAULT_HEADERS = {
     ),
     "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
 }
+HTTP = get_transport("rekrute", headers=DEFAULT_HEADERS)
 
 
 def clean_text(value: str) -> str:
@@ -57,9 +61,7 @@ def clean_location(value: str) -> str:
 
 
 def fetch_html(url: str, timeout: int = 20) -> str:
-    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
-    response.raise_for_status()
-    return response.text
+    return HTTP.get(url, timeout=timeout).text
 
 
 def parse_listing_page(page_html: str, page_url: str) -> tuple[list[dict], str]:
@@ -212,29 +214,51 @@ def dedup_jobs(jobs: list[dict]) -> list[dict]:
     return list(bucket.values())
 
 
-def enrich_with_details(jobs: list[dict], sleep_seconds: float = 0.3, timeout: int = 20) -> list[dict]:
+def merge_detail(job: dict, detail: dict) -> dict:
+    merged = merge_job_detail(job, detail)
+    if not merged.get("created"):
+        merged["created"] = job.get("created", "")
+    return merged
+
+
+def enrich_with_details(
+    jobs: list[dict],
+    sleep_seconds: float = 0.3,
+    timeout: int = 20,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
     enriched: list[dict] = []
     total = len(jobs)
     for idx, job in enumerate(jobs, start=1):
         merged = dict(job)
+        detail = detail_cache.get(job) if detail_cache is not None else None
+        fetched = detail is None
         try:
-            detail = parse_detail_page(fetch_html(job["url"], timeout=timeout), job["url"])
-            for key, value in detail.items():
-                if value:
-                    merged[key] = value
-            if not merged.get("created"):
-                merged["created"] = job.get("created", "")
+            if detail is None:
+                detail = parse_detail_page(fetch_html(job["url"], timeout=timeout), job["url"])
+                if detail_cache is not None:
+                    detail_cache.put(job, detail)
+            merged = merge_detail(job, detail)
         except Exception as exc:
             print(f"[WARN][ReKrute] detail fetch failed idx={idx}/{total} url={job.get('url','')}: {exc}")
         enriched.append(merged)
         if idx % 10 == 0 or idx == total:
             print(f"[INFO][ReKrute] detail progress {idx}/{total}")
-        if sleep_seconds > 0 and idx < total:
+        if fetched and sleep_seconds > 0 and idx < total:
             time.sleep(sleep_seconds)
     return enriched
 
 
-def fetch_all_jobs(max_pages: int = 0, max_jobs: int = 0, sleep_seconds: float = 0.3, timeout: int = 20) -> list[dict]:
+def fetch_all_jobs(
+    max_pages: int = 0,
+    max_jobs: int = 0,
+    sleep_seconds: float = 0.3,
+    timeout: int = 20,
+    concurrency: int = 1,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
+    if concurrency > 1:
+        return crawl_all_jobs(max_pages, max_jobs, sleep_seconds, timeout, concurrency, detail_cache)
     jobs: list[dict] = []
     visited = set()
     page_url = START_URL
@@ -258,7 +282,46 @@ def fetch_all_jobs(max_pages: int = 0, max_jobs: int = 0, sleep_seconds: float =
     if max_jobs > 0:
         deduped = deduped[:max_jobs]
         print(f"[INFO][ReKrute] Max jobs limit applied: {len(deduped)}")
-    return enrich_with_details(deduped, sleep_seconds=sleep_seconds, timeout=timeout)
+    return enrich_with_details(deduped, sleep_seconds=sleep_seconds, timeout=timeout, detail_cache=detail_cache)
+
+
+def crawl_all_jobs(
+    max_pages: int = 0,
+    max_jobs: int = 0,
+    sleep_seconds: float = 0.3,
+    timeout: int = 20,
+    concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+    detail_cache: Optional[DetailCache] = None,
+) -> list[dict]:
+    """
+    fetch_all_jobs with detail pages fetched while the listing is still being walked.
+    Listing pages chain through their "next" link, so they stay sequential; sleep_seconds
+    spaces request starts on the site instead of pausing between requests.
+    """
+    jobs: list[dict] = []
+    visited = set()
+    page_url = START_URL
+    page_no = 0
+
+    with SiteCrawler(lambda url: fetch_html(url, timeout=timeout), concurrency, delay=sleep_seconds) as crawler:
+        details = DetailPrefetch(crawler, parse_detail_page, max_jobs=max_jobs, detail_cache=detail_cache)
+        while page_url and page_url not in visited:
+            visited.add(page_url)
+            page_no += 1
+            page_jobs, next_url = parse_listing_page(crawler.submit(page_url).result(), page_url)
+            jobs.extend(page_jobs)
+            details.add(page_jobs)
+            print(f"[INFO][ReKrute] Listing page {page_no}: {len(page_jobs)} rows")
+            if max_pages and page_no >= max_pages:
+                break
+            page_url = next_url
+
+        deduped = dedup_jobs(jobs)
+        print(f"[INFO][ReKrute] Listing deduped rows: {len(deduped)}")
+        if max_jobs > 0:
+            deduped = deduped[:max_jobs]
+            print(f"[INFO][ReKrute] Max jobs limit applied: {len(deduped)}")
+        return details.merge(deduped, merge_detail, "ReKrute")
 
 
 def build_filtered_df(all_jobs: list[dict], filter_mode: str) -> pd.DataFrame:
@@ -288,6 +351,22 @@ def main():
     parser.add_argument("--max-jobs", type=int, default=0)
     parser.add_argument("--sleep", type=float, default=0.3)
     parser.add_argument("--timeout", type=int, default=20)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CRAWL_CONCURRENCY,
+        help="Requests in flight on ReKrute (1 = serial crawl with --sleep pauses).",
+    )
+    parser.add_argument(
+        "--detail-cache",
+        default="",
+        help="SQLite cache of parsed detail pages (default: market detail_cache_db).",
+    )
+    parser.add_argument(
+        "--no-detail-cache",
+        action="store_true",
+        help="Fetch every detail page, even when its listing card is unchanged since the cached fetch.",
+    )
     args = parser.parse_args()
 
     market = configure_market(args.market, args.ch_focus)
@@ -318,12 +397,23 @@ def main():
             print(f"[WARN][ReKrute] Empty raw file: {raw_csv}")
             all_jobs = []
     else:
-        all_jobs = fetch_all_jobs(
-            max_pages=args.max_pages,
-            max_jobs=args.max_jobs,
-            sleep_seconds=args.sleep,
-            timeout=args.timeout,
+        detail_cache = None if args.no_detail_cache else DetailCache(
+            args.detail_cache or output_paths["detail_cache_db"], "rekrute"
         )
+        try:
+            all_jobs = fetch_all_jobs(
+                max_pages=args.max_pages,
+                max_jobs=args.max_jobs,
+                sleep_seconds=args.sleep,
+                timeout=args.timeout,
+                concurrency=args.concurrency,
+                detail_cache=detail_cache,
+            )
+            print_transport_stats()
+        finally:
+            if detail_cache is not None:
+                print(detail_cache.summary())
+                detail_cache.close()
         safe_save_csv(pd.DataFrame(all_jobs), raw_csv)
         print(f"[INFO][ReKrute] Raw saved: {len(all_jobs)}")
 
@@ -0,0 +1,175 @@
+"""
+Opt-in per-stage timing of the filter rules (--profile-rules or JOB_PROFILE_RULES=1).
+
+RuleProfiler.instrument(module, stages) swaps the named module functions for timing wrappers;
+restore() puts the originals back. The rules call each other through module globals, so every
+call made while profiling is counted, and with profiling off nothing is wrapped at all.
+
+Per stage the profiler keeps:
+- calls, and rejects (calls whose result rejects the job, per the stage's predicate)
+- total time (including nested stages) and self time (excluding them)
+- the slowest inputs (a short preview of the first argument)
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+PROFILE_ENV = "JOB_PROFILE_RULES"
+SLOWEST_INPUTS = 5
+PREVIEW_CHARS = 120
+
+
+def profiling_requested(flag: bool = False) -> bool:
+    """True when --profile-rules was passed or JOB_PROFILE_RULES is set to a truthy value."""
+    return flag or os.getenv(PROFILE_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def input_preview(args: tuple) -> str:
+    """Short description of a stage input: a job title, or the start of the text."""
+    if not args:
+        return ""
+    value = args[0]
+    if isinstance(value, dict):
+        value = value.get("title", "") or value.get("description", "")
+    elif not isinstance(value, str) and hasattr(value, "title"):
+        value = value.title
+    return " ".join(str(value).split())[:PREVIEW_CHARS]
+
+
+class StageStats:
+    __slots__ = ("calls", "rejects", "total_s", "self_s", "slowest")
+
+    def __init__(self):
+        self.calls = 0
+        self.rejects = 0
+        self.total_s = 0.0
+        self.self_s = 0.0
+        # Min-heap of (seconds, tie-breaker, preview) holding the slowest calls.
+        self.slowest: list[tuple[float, int, str]] = []
+
+
+class RuleProfiler:
+    def __init__(self, slowest: int = SLOWEST_INPUTS):
+        self.slowest = slowest
+        self.stages: dict[str, StageStats] = {}
+        self._originals: list[tuple[Any, str, Callable]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sequence = itertools.count()
+        self.started_at = time.perf_counter()
+
+    def instrument(self, module, stages: dict[str, Optional[Callable[[Any], bool]]], prefix: str = ""):
+        """
+        Wrap module.<name> for each stage; stages maps the name to a reject predicate applied to
+        the stage's result (None: the stage never rejects on its own).
+        """
+        for name, rejects in stages.items():
+            original = getattr(module, name)
+            self._originals.append((module, name, original))
+            setattr(module, name, self._wrap(prefix + name, original, rejects))
+
+    def restore(self):
+        """Put the original functions back (last wrapped first)."""
+        while self._originals:
+            module, name, original = self._originals.pop()
+            setattr(module, name, original)
+
+    def _wrap(self, stage: str, func: Callable, rejects: Optional[Callable[[Any], bool]]):
+        stats = self.stages.setdefault(stage, StageStats())
+        local = self._local
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            stack = getattr(local, "stack", None)
+            if stack is None:
+                stack = local.stack = []
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+            rejected = bool(rejects is not None and rejects(result))
+            self._record(stats, elapsed, elapsed - nested, rejected, args)
+            return result
+
+        return timed
+
+    def _record(self, stats: StageStats, elapsed: float, own: float, rejected: bool, args: tuple):
+        with self._lock:
+            stats.calls += 1
+            stats.rejects += rejected
+            stats.total_s += elapsed
+            stats.self_s += own
+            if len(stats.slowest) < self.slowest or elapsed > stats.slowest[0][0]:
+                entry = (elapsed, next(self._sequence), input_preview(args))
+                if len(stats.slowest) < self.slowest:
+                    heapq.heappush(stats.slowest, entry)
+                else:
+                    heapq.heapreplace(stats.slowest, entry)
+
+    def report(self) -> list[dict]:
+        """Stages sorted by self time, slowest inputs first."""
+        rows = []
+        with self._lock:
+            for stage, stats in self.stages.items():
+                if not stats.calls:
+                    continue
+                rows.append(
+                    {
+                        "stage": stage,
+                        "calls": stats.calls,
+                        "rejects": stats.rejects,
+                        "total_ms": round(stats.total_s * 1000, 3),
+                        "self_ms": round(stats.self_s * 1000, 3),
+                        "mean_us": round(stats.total_s / stats.calls * 1e6, 1),
+                        "slowest": [
+                            {"ms": round(seconds * 1000, 3), "input": preview}
+                            for seconds, _, preview in sorted(stats.slowest, reverse=True)
+                        ],
+                    }
+                )
+        rows.sort(key=lambda row: row["self_ms"], reverse=True)
+        return rows
+
+    def format_table(self, rows: Optional[list[dict]] = None) -> list[str]:
+        rows = self.report() if rows is None else rows
+        self_total = sum(row["self_ms"] for row in rows) or 1.0
+        lines = [
+            f"{'stage':<44} {'calls':>8} {'rejects':>8} {'total_ms':>10} {'self_ms':>10} {'self%':>6} {'mean_us':>9}"
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['stage']:<44} {row['calls']:>8} {row['rejects']:>8} {row['total_ms']:>10.1f} "
+                f"{row['self_ms']:>10.1f} {row['self_ms'] / self_total:>6.1%} {row['mean_us']:>9.1f}"
+            )
+        return lines
+
+    def save(self, path: str, meta: Optional[dict] = None) -> list[dict]:
+        """Write the JSON report to path and return its stage rows."""
+        rows = self.report()
+        payload = {
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "wall_s": round(time.perf_counter() - self.started_at, 3),
+            **(meta or {}),
+            "stages": rows,
+        }
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, ensure_ascii=False)
+            handle.write("\n")
+        return rows
@@ -0,0 +1,87 @@
+"""
+Persisted index of the Adzuna job ids already fetched, used by the incremental fetch
+(adzuna_fetch.py --incremental) to stop paging a term once its date-sorted results are known.
+
+Stored as a JSON object {job_id: first_seen_epoch}. Ids first seen more than max_age_days ago
+(default MAX_DAYS_OLD) are dropped on save: the API no longer returns those postings under
+max_days_old, so keeping them would only grow the file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Iterable
+
+from config import MAX_DAYS_OLD
+
+
+def job_id_key(value) -> str:
+    """Adzuna id as a string; ids read back from the raw CSV may come as int or float."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value:
+            return ""
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+
+class SeenIdIndex:
+    """Job id -> first-seen timestamp, loaded from and saved to one JSON file."""
+
+    def __init__(self, path: str, clock=time.time):
+        self.path = str(path)
+        self._clock = clock
+        self._seen: dict[str, float] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as fh:
+                    self._seen = {str(key): float(value) for key, value in json.load(fh).items()}
+            except Exception as exc:
+                print(f"[WARN] Seen-id index unreadable, starting empty: {self.path} ({exc})")
+
+    def __contains__(self, job_id) -> bool:
+        return job_id_key(job_id) in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def seen_share(self, job_ids: Iterable) -> float:
+        """Share of job_ids already in the index (0.0 for no ids)."""
+        keys = [job_id_key(job_id) for job_id in job_ids]
+        keys = [key for key in keys if key]
+        if not keys:
+            return 0.0
+        return sum(key in self._seen for key in keys) / len(keys)
+
+    def add(self, job_ids: Iterable) -> int:
+        """Record job_ids as seen now (first-seen time of known ids is kept). Returns how many were new."""
+        now = self._clock()
+        added = 0
+        for job_id in job_ids:
+            key = job_id_key(job_id)
+            if key and key not in self._seen:
+                self._seen[key] = now
+                added += 1
+        return added
+
+    def prune(self, max_age_days: float = MAX_DAYS_OLD) -> int:
+        """Drop ids first seen more than max_age_days ago. Returns the number removed."""
+        cutoff = self._clock() - float(max_age_days) * 86400
+        expired = [key for key, first_seen in self._seen.items() if first_seen < cutoff]
+        for key in expired:
+            del self._seen[key]
+        return len(expired)
+
+    def save(self, max_age_days: float = MAX_DAYS_OLD) -> None:
+        self.prune(max_age_days)
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self._seen, fh, sort_keys=True)
+        os.replace(tmp, self.path)
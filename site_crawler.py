@@ -0,0 +1,124 @@
+"""
+Bounded-concurrency crawl of one job site (listing pages, then one detail page per job), used by
+the Moroccan providers (rekrute_fetch, marocannonces_fetch, emploi_ma_fetch).
+
+SiteCrawler runs page fetches on a small thread pool behind a HostPoliteness gate: at most
+`concurrency` requests in flight on the site and request starts spaced by at least `delay` seconds.
+DetailPrefetch submits the detail page of every new job as soon as its listing page is parsed
+(unless detail_cache already holds it), so listing and detail fetches overlap. Callers consume
+listing pages in page order and details in deduped job order, which keeps the output identical
+to the serial crawl.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from detail_cache import DetailCache
+from http_transport import HostPoliteness
+
+# Requests in flight per site in the MA fetchers (their --concurrency default; 1 = serial crawl).
+DEFAULT_CRAWL_CONCURRENCY = 4
+
+
+class SiteCrawler:
+    """Thread pool fetching pages of one site through `fetch(url) -> html` under per-site politeness."""
+
+    def __init__(self, fetch: Callable[[str], str], concurrency: int = DEFAULT_CRAWL_CONCURRENCY, delay: float = 0.0):
+        self.fetch = fetch
+        self.concurrency = max(1, int(concurrency))
+        self.politeness = HostPoliteness(delay=delay, max_per_host=self.concurrency)
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="site-crawler")
+
+    def _fetch(self, url: str, parse: Optional[Callable[[str, str], dict]]):
+        with self.politeness.slot(url):
+            page_html = self.fetch(url)
+        return parse(page_html, url) if parse is not None else page_html
+
+    def submit(self, url: str, parse: Optional[Callable[[str, str], dict]] = None) -> Future:
+        """Future of the page html, or of parse(html, url) (parsed on the worker thread)."""
+        return self._pool.submit(self._fetch, url, parse)
+
+    def close(self) -> None:
+        """Stop the workers; pages not started yet (e.g. after an early stop) are cancelled."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def merge_job_detail(job: dict, detail: dict) -> dict:
+    """Listing job with the non-empty fields parsed from its detail page on top."""
+    merged = dict(job)
+    for key, value in detail.items():
+        if value:
+            merged[key] = value
+    return merged
+
+
+class DetailPrefetch:
+    """
+    Detail fetches started while the listings are still being crawled. Mirrors dedup_jobs and the
+    max_jobs cut of the serial path: one fetch per distinct URL, for the first max_jobs URLs only.
+    URLs whose listing card matches detail_cache are not fetched.
+    """
+
+    def __init__(
+        self,
+        crawler: SiteCrawler,
+        parse_detail: Callable[[str, str], dict],
+        max_jobs: int = 0,
+        detail_cache: Optional[DetailCache] = None,
+    ):
+        self.crawler = crawler
+        self.parse_detail = parse_detail
+        self.max_jobs = max(0, int(max_jobs))
+        self.detail_cache = detail_cache
+        self._seen: set[str] = set()
+        self._futures: dict[str, Future] = {}
+
+    def add(self, jobs: list[dict]) -> None:
+        for job in jobs:
+            key = (job.get("url") or "").strip()
+            if not key or key in self._seen:
+                continue
+            if self.max_jobs and len(self._seen) >= self.max_jobs:
+                return
+            self._seen.add(key)
+            if self.detail_cache is None or self.detail_cache.lookup(job) is None:
+                self._futures[key] = self.crawler.submit(job["url"], self.parse_detail)
+
+    def merge(
+        self,
+        jobs: list[dict],
+        merge_detail: Callable[[dict, dict], dict],
+        label: str,
+    ) -> list[dict]:
+        """
+        merge_detail(job, detail) for every deduped job, in order, with the serial path's warnings
+        and progress lines; a job whose detail fetch failed is kept with its listing fields.
+        The cache is checked against the deduped card, like the serial path does.
+        """
+        enriched: list[dict] = []
+        total = len(jobs)
+        for idx, job in enumerate(jobs, start=1):
+            url = job.get("url", "")
+            try:
+                detail = self.detail_cache.get(job) if self.detail_cache is not None else None
+                if detail is None:
+                    future = self._futures.get((url or "").strip()) or self.crawler.submit(url, self.parse_detail)
+                    detail = future.result()
+                    if self.detail_cache is not None:
+                        self.detail_cache.put(job, detail)
+                merged = merge_detail(job, detail)
+            except Exception as exc:
+                print(f"[WARN][{label}] detail fetch failed idx={idx}/{total} url={url}: {exc}")
+                merged = dict(job)
+            enriched.append(merged)
+            if idx % 10 == 0 or idx == total:
+                print(f"[INFO][{label}] detail progress {idx}/{total}")
+        return enriched
@@ -0,0 +1,418 @@
+"""
+Pipeline table storage: Parquet as the primary format, CSV as an export for Excel users.
+
+Stages keep addressing tables by their CSV path from get_output_paths; the Parquet copy sits next
+to it (data/x.csv -> data/x.parquet, see get_output_paths(table_format="parquet")). Readers take
+the Parquet copy unless the CSV is newer (edited in Excel, or written by an older script), and
+only load the columns they ask for.
+
+Parquet needs pyarrow. Without it, or with JOB_TABLE_FORMAT=csv, every table stays CSV.
+JOB_CSV_EXPORT=0 skips the CSV export when Parquet is written.
+
+Large tables can be streamed: iter_table_chunks reads a table a chunk at a time, and RowSpool
+collects output rows on disk and saves them deduplicated and sorted, block by block.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+from pandas.errors import EmptyDataError
+
+from config import parquet_table_path, resolve_table_format
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:
+    pa = None
+    pq = None
+
+CSV_EXPORT = os.getenv("JOB_CSV_EXPORT", "1").strip().lower() not in {"0", "false", "no", "off"}
+PARQUET_COMPRESSION = "zstd"
+
+
+def parquet_enabled() -> bool:
+    return pq is not None and resolve_table_format() == "parquet"
+
+
+def _write_csv(df: pd.DataFrame, path: str):
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+    print(f"[INFO] Saved file: {path}")
+
+
+def _as_text(value):
+    if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+        return value
+    return str(value)
+
+
+def _arrow_ready(df: pd.DataFrame) -> pd.DataFrame:
+    """Object columns mixing value types (e.g. years_required: 3 or "") are stored as strings."""
+    fixes = {}
+    for col in df.columns[df.dtypes == object]:
+        if df[col].dropna().map(type).nunique() > 1:
+            fixes[col] = df[col].map(_as_text)
+    return df.assign(**fixes) if fixes else df
+
+
+def write_parquet(df: pd.DataFrame, path: str) -> bool:
+    """Write the Parquet copy of the table at path. Returns False (and drops a stale copy) on failure."""
+    target = parquet_table_path(path)
+    try:
+        _arrow_ready(df).to_parquet(target, index=False, compression=PARQUET_COMPRESSION)
+    except Exception as exc:
+        print(f"[WARN] Parquet write failed for {target}: {exc}. Keeping CSV only.")
+        try:
+            os.remove(target)
+        except OSError:
+            pass
+        return False
+    print(f"[INFO] Saved file: {target}")
+    return True
+
+
+def save_table(
+    df: pd.DataFrame,
+    path: str,
+    csv_export: Optional[bool] = None,
+    save_csv: Optional[Callable[[pd.DataFrame, str], None]] = None,
+):
+    """
+    Save df as the table at path: the CSV export first, then the Parquet copy, so the Parquet
+    file is never older than the CSV it was written with. save_csv writes the CSV
+    (adzuna_fetch.safe_save_table passes safe_save_csv for its Excel-lock retries).
+    """
+    save_csv = save_csv or _write_csv
+    use_parquet = parquet_enabled()
+    export = CSV_EXPORT if csv_export is None else csv_export
+    if export or not use_parquet:
+        save_csv(df, path)
+    if use_parquet and not write_parquet(df, path) and not export:
+        save_csv(df, path)
+
+
+def table_source(path: str) -> Optional[str]:
+    """File read_table loads for path: the Parquet copy unless the CSV is newer. None if neither exists."""
+    if path.lower().endswith(".parquet"):
+        return path if os.path.exists(path) else None
+    csv_exists = os.path.exists(path)
+    parquet = parquet_table_path(path)
+    if pq is not None and os.path.exists(parquet):
+        if not csv_exists or os.path.getmtime(parquet) >= os.path.getmtime(path):
+            return parquet
+    return path if csv_exists else None
+
+
+def read_table(path: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Load the table saved at path, or an empty DataFrame when there is none.
+    columns restricts the load to those columns; columns the table lacks are skipped.
+    """
+    source = table_source(path)
+    if source is None:
+        return pd.DataFrame()
+    wanted = list(columns) if columns is not None else None
+    if source.lower().endswith(".parquet"):
+        if pq is None:
+            raise RuntimeError(f"pyarrow is required to read {source}")
+        if wanted is not None:
+            available = set(pq.read_schema(source).names)
+            wanted = [col for col in wanted if col in available]
+        return pd.read_parquet(source, columns=wanted)
+    try:
+        if wanted is None:
+            return pd.read_csv(source)
+        wanted_set = set(wanted)
+        return pd.read_csv(source, usecols=lambda col: col in wanted_set)
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+def _csv_chunk_dtypes(source: str, chunk_size: int, usecols=None) -> dict[str, Any]:
+    """
+    dtype overrides that make a chunked read_csv return the values of a whole-file read.
+    Each chunk infers types from its own rows: an integer column with blanks in another chunk
+    would stay int64, and a text column would turn numeric in chunks holding only digits or
+    only blanks.
+    """
+    kinds: dict[str, set[str]] = {}
+    nullable: set[str] = set()
+    for chunk in pd.read_csv(source, chunksize=chunk_size, usecols=usecols):
+        for col in chunk.columns:
+            values = chunk[col]
+            present = values.dropna()
+            if len(present) < len(values):
+                nullable.add(col)
+            if present.empty:
+                continue
+            if pd.api.types.is_bool_dtype(values) or present.map(type).eq(bool).all():
+                kind = "bool"
+            elif pd.api.types.is_integer_dtype(values):
+                kind = "int"
+            elif pd.api.types.is_float_dtype(values):
+                kind = "float"
+            else:
+                kind = "text"
+            kinds.setdefault(col, set()).add(kind)
+    overrides: dict[str, Any] = {}
+    for col, found in kinds.items():
+        if found == {"int"}:
+            if col in nullable:
+                overrides[col] = "float64"
+        elif found <= {"int", "float"}:
+            overrides[col] = "float64"
+        elif len(found) > 1 or (found == {"text"} and col in nullable):
+            overrides[col] = str
+    return overrides
+
+
+def iter_table_chunks(
+    path: str, chunk_size: int, columns: Optional[Iterable[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield the table saved at path in chunks of up to chunk_size rows, with the values read_table
+    would load for the same rows (column types are settled over the whole table first).
+    A CSV source is parsed twice: once for its column types, once for the rows.
+    """
+    source = table_source(path)
+    if source is None:
+        return
+    chunk_size = max(1, int(chunk_size))
+    wanted = list(columns) if columns is not None else None
+    if source.lower().endswith(".parquet"):
+        if pq is None:
+            raise RuntimeError(f"pyarrow is required to read {source}")
+        parquet_file = pq.ParquetFile(source)
+        schema = parquet_file.schema_arrow
+        if wanted is not None:
+            wanted = [col for col in wanted if col in schema.names]
+        # A whole-table read turns integer columns holding nulls into float64 (or the nullable
+        # dtype recorded by pandas); batches without nulls would stay int64.
+        int_cols = [
+            field.name
+            for field in schema
+            if pa.types.is_integer(field.type) and (wanted is None or field.name in wanted)
+        ]
+        int_dtypes = pd.read_parquet(source, columns=int_cols).dtypes.to_dict() if int_cols else {}
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=wanted):
+            chunk = pa.Table.from_batches([batch]).replace_schema_metadata(schema.metadata).to_pandas()
+            yield chunk.astype(int_dtypes) if int_dtypes else chunk
+        return
+    usecols = None
+    if wanted is not None:
+        wanted_set = set(wanted)
+        usecols = lambda col: col in wanted_set  # noqa: E731
+    try:
+        dtypes = _csv_chunk_dtypes(source, chunk_size, usecols)
+        yield from pd.read_csv(source, chunksize=chunk_size, usecols=usecols, dtype=dtypes or None)
+    except EmptyDataError:
+        return
+
+
+def _is_null(value) -> bool:
+    return value is None or value is pd.NA or (isinstance(value, float) and value != value)
+
+
+class RowSpool:
+    """
+    Output rows collected a chunk at a time and saved as
+    pd.DataFrame(rows).drop_duplicates(subset=dedup_cols).sort_values(sort_cols, ascending=False),
+    without holding the rows in memory.
+
+    Rows are pickled to a temporary file. Dedup and sort run on a small index (a digest of the
+    dedup columns, the sort values and the row's file offset); saving reads the rows back in
+    order, block by block. Column types are tracked while rows come in, so every block is
+    written with the types the whole table would get.
+    """
+
+    def __init__(self, dedup_cols: Iterable[str], sort_cols: Iterable[str]):
+        self.dedup_cols = list(dedup_cols)
+        self.sort_cols = list(sort_cols)
+        self._file = tempfile.TemporaryFile()
+        self._offsets: list[int] = []
+        self._keys: list[bytes] = []
+        self._sort_values: dict[str, list] = {col: [] for col in self.sort_cols}
+        # Union of row keys in first-seen order, and per column: value type -> example value.
+        self._columns: dict[str, None] = {}
+        self._examples: dict[str, dict[type, Any]] = {}
+        self._null_examples: dict[str, dict[type, Any]] = {}
+        self._nullable: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def add(self, row: dict):
+        self._file.seek(0, os.SEEK_END)
+        self._offsets.append(self._file.tell())
+        pickle.dump(row, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        key = json.dumps([row.get(col) for col in self.dedup_cols], default=str)
+        self._keys.append(hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest())
+        for col in self.sort_cols:
+            self._sort_values[col].append(row.get(col))
+        # A key missing from a row reads back as NaN, like pd.DataFrame(rows) fills it.
+        for col in self._columns:
+            if col not in row:
+                self._nullable.add(col)
+                self._null_examples[col].setdefault(float, float("nan"))
+        for col, value in row.items():
+            if col not in self._columns:
+                self._columns[col] = None
+                self._examples[col] = {}
+                self._null_examples[col] = {}
+                if len(self._offsets) > 1:
+                    self._nullable.add(col)
+                    self._null_examples[col].setdefault(float, float("nan"))
+            if _is_null(value):
+                self._nullable.add(col)
+                self._null_examples[col].setdefault(type(value), value)
+            else:
+                self._examples[col].setdefault(type(value), value)
+
+    def extend(self, rows: Iterable[dict]):
+        for row in rows:
+            self.add(row)
+
+    def order(self) -> list[int]:
+        """Positions of the rows to save, deduplicated and sorted."""
+        index = pd.DataFrame({"_key": self._keys})
+        for col in self.sort_cols:
+            if col in self._columns:
+                index[col] = self._sort_values[col]
+        index = index.drop_duplicates(subset=["_key"])
+        sort_cols = [col for col in self.sort_cols if col in self._columns]
+        if sort_cols:
+            index = index.sort_values(by=sort_cols, ascending=[False] * len(sort_cols))
+        return index.index.tolist()
+
+    def iter_rows(self, order: Optional[list[int]] = None, block_size: int = 5000) -> Iterator[list[dict]]:
+        """Rows in order (default: self.order()), read back block_size at a time."""
+        positions = self.order() if order is None else order
+        for start in range(0, len(positions), block_size):
+            rows = []
+            for position in positions[start : start + block_size]:
+                self._file.seek(self._offsets[position])
+                rows.append(pickle.load(self._file))
+            yield rows
+
+    def _column_casts(self) -> dict[str, str]:
+        """Columns whose per-block type could differ from the whole table's: "float" or "text"."""
+        casts = {}
+        for col, examples in self._examples.items():
+            kinds = set(examples)
+            if (kinds == {int} and col in self._nullable) or kinds == {int, float}:
+                casts[col] = "float"
+            elif len(kinds) > 1:
+                casts[col] = "text"
+        return casts
+
+    def _frame(self, rows: list[dict], casts: dict[str, str]) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=list(self._columns))
+        fixes = {
+            col: df[col].astype("float64") if cast == "float" else df[col].map(_as_text)
+            for col, cast in casts.items()
+        }
+        return df.assign(**fixes) if fixes else df
+
+    def _arrow_schema(self, casts: dict[str, str]):
+        """Arrow schema of the whole table, from one example value per column type."""
+        samples = {}
+        for col in self._columns:
+            values = list(self._examples[col].values())
+            if col in self._nullable or not values:
+                # An all-NaN column is float64 in the whole table, an all-None one is untyped.
+                nulls = self._null_examples[col]
+                values.append(nulls.get(float, None) if not values else None)
+            samples[col] = values
+        length = max(len(values) for values in samples.values())
+        rows = [{col: values[min(i, len(values) - 1)] for col, values in samples.items()} for i in range(length)]
+        return pa.Schema.from_pandas(self._frame(rows, casts), preserve_index=False)
+
+    def save(self, path: str, block_size: int = 5000, csv_export: Optional[bool] = None) -> int:
+        """
+        Save the deduplicated, sorted rows as the table at path (same outputs as save_table).
+        Files are written next to their target and moved into place once complete.
+        Returns the number of rows saved.
+        """
+        order = self.order()
+        casts = self._column_casts()
+        use_parquet = parquet_enabled() and bool(self._columns)
+        export = CSV_EXPORT if csv_export is None else csv_export
+        write_csv = export or not use_parquet
+        csv_partial = path + ".partial"
+        parquet_target = parquet_table_path(path)
+        parquet_partial = parquet_target + ".partial"
+        writer = None
+        schema = None
+        if use_parquet:
+            try:
+                schema = self._arrow_schema(casts)
+                writer = pq.ParquetWriter(parquet_partial, schema, compression=PARQUET_COMPRESSION)
+            except Exception as exc:
+                print(f"[WARN] Parquet write failed for {parquet_target}: {exc}. Keeping CSV only.")
+                if not write_csv:
+                    return self.save(path, block_size, csv_export=True)
+        csv_file = open(csv_partial, "w", encoding="utf-8-sig", newline="") if write_csv else None
+        try:
+            for block_index, rows in enumerate(self.iter_rows(order, block_size)):
+                df = self._frame(rows, casts)
+                if csv_file is not None:
+                    df.to_csv(csv_file, index=False, header=block_index == 0)
+                if writer is not None:
+                    try:
+                        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                        writer.write_table(table.replace_schema_metadata(schema.metadata))
+                    except Exception as exc:
+                        print(f"[WARN] Parquet write failed for {parquet_target}: {exc}. Keeping CSV only.")
+                        writer.close()
+                        writer = None
+                        os.remove(parquet_partial)
+                        if csv_file is None:
+                            return self.save(path, block_size, csv_export=True)
+            if csv_file is not None and not order:
+                pd.DataFrame(columns=list(self._columns)).to_csv(csv_file, index=False)
+        except BaseException:
+            for handle in (csv_file, writer):
+                if handle is not None:
+                    handle.close()
+            for partial in (csv_partial, parquet_partial):
+                try:
+                    os.remove(partial)
+                except OSError:
+                    pass
+            raise
+        if csv_file is not None:
+            csv_file.close()
+        if writer is not None:
+            writer.close()
+        if csv_file is not None:
+            _move_into_place(csv_partial, path)
+        if writer is not None:
+            _move_into_place(parquet_partial, parquet_target)
+        elif use_parquet:
+            try:
+                os.remove(parquet_target)
+            except OSError:
+                pass
+        return len(order)
+
+    def close(self):
+        self._file.close()
+
+
+def _move_into_place(partial: str, target: str):
+    """Replace target with the finished partial file; a locked target (Excel) leaves a .bak copy."""
+    try:
+        os.replace(partial, target)
+    except PermissionError:
+        backup = target + ".bak"
+        os.replace(partial, backup)
+        print(f"[WARN] Could not write {target} (file is open). Saved to {backup} instead.")
+        return
+    print(f"[INFO] Saved file: {target}")
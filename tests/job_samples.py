@@ -0,0 +1,21 @@
+"""Adzuna-style jobs shared by the filter tests."""
+
+from datetime import datetime, timedelta, timezone
+
+CLOUD_DESC = (
+    "Junior role in our platform team. You will automate Azure infrastructure with Terraform, "
+    "maintain Linux servers and CI/CD pipelines with Docker and Kubernetes. English required. "
+) * 3
+DUTCH_DESC = CLOUD_DESC + "Vloeiend Nederlands is vereist. "
+
+
+def make_job(idx: int, title: str, desc: str = CLOUD_DESC, location: str = "Brussels", days_old: int = 2) -> dict:
+    return {
+        "title": title,
+        "description": desc,
+        "location": location,
+        "company": f"Company {idx}",
+        "created": (datetime.now(timezone.utc) - timedelta(days=days_old)).isoformat(),
+        "redirect_url": f"https://www.adzuna.be/details/{idx}",
+        "search_term": "devops",
+    }
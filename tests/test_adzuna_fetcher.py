@@ -0,0 +1,318 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+import adzuna_fetch as af
+from fetch_journal import FetchJournal
+from job_samples import CLOUD_DESC
+from seen_ids import SeenIdIndex
+from table_storage import read_table
+
+
+class StubAdzunaHandler(BaseHTTPRequestHandler):
+    # term -> number of pages with results; later pages come back empty.
+    pages_with_results = {"devops": 2, "cloud": 3, "empty": 0}
+    flaky_once = {("cloud", 2)}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        page = int(parsed.path.rstrip("/").rsplit("/", 1)[-1])
+        term = parse_qs(parsed.query)["what"][0]
+        server = self.server
+        with server.lock:
+            server.requests.append((term, page))
+            server.queries.append(parse_qs(parsed.query))
+            failing = (term, page) in server.pending_failures
+            server.pending_failures.discard((term, page))
+        if failing:
+            self.send_response(502)
+            self.end_headers()
+            return
+        count = self.pages_with_results.get(term, 0)
+        results = [{"id": f"{term}-{page}-{i}"} for i in range(2)] if page <= count else []
+        body = json.dumps({"results": results}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AdzunaFetcherTests(unittest.TestCase):
+    def setUp(self):
+        af.configure_market("be")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubAdzunaHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.queries = []
+        self.server.pending_failures = set(StubAdzunaHandler.flaky_once)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        patcher = mock.patch.object(af, "BASE_URL", f"http://127.0.0.1:{self.server.server_port}/search")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Retry backoff is real time otherwise.
+        sleeper = mock.patch.object(af.time, "sleep")
+        sleeper.start()
+        self.addCleanup(sleeper.stop)
+
+    def fetch(self, concurrency):
+        return af.fetch_adzuna_jobs(
+            ["devops", "empty", "cloud"],
+            results_per_page=2,
+            concurrency=concurrency,
+            pages_per_term={"devops": 5, "empty": 5, "cloud": 5},
+            rate_limiter=af.TokenBucket(rate=0),
+        )
+
+    def test_concurrent_fetch_matches_serial_order(self):
+        serial = self.fetch(concurrency=1)
+        self.server.pending_failures = set(StubAdzunaHandler.flaky_once)
+        pooled = self.fetch(concurrency=3)
+        self.assertEqual(pooled, serial)
+        self.assertEqual(
+            [job["id"] for job in pooled],
+            ["devops-1-0", "devops-1-1", "devops-2-0", "devops-2-1"]
+            + [f"cloud-{page}-{i}" for page in (1, 2, 3) for i in range(2)],
+        )
+        self.assertEqual({job["search_term"] for job in pooled if job["id"].startswith("cloud")}, {"cloud"})
+
+    def test_empty_page_stops_term_and_5xx_is_retried(self):
+        self.fetch(concurrency=3)
+        requested = self.server.requests
+        self.assertEqual([page for term, page in requested if term == "empty"], [1])
+        self.assertEqual(sorted(page for term, page in requested if term == "devops"), [1, 2, 3])
+        # Page 2 of "cloud" failed once with a 502 and was fetched again.
+        self.assertEqual(sorted(page for term, page in requested if term == "cloud"), [1, 2, 2, 3, 4])
+
+
+    def test_incremental_fetch_stops_at_seen_page(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        seen = SeenIdIndex(os.path.join(tmp.name, "seen.json"))
+        # Page 1 of "cloud" is fully known, "devops" half known: only "cloud" stops early.
+        seen.add(["cloud-1-0", "cloud-1-1", "devops-1-0"])
+        jobs = af.fetch_adzuna_jobs(
+            ["devops", "cloud"],
+            results_per_page=2,
+            concurrency=2,
+            pages_per_term={"devops": 5, "cloud": 5},
+            rate_limiter=af.TokenBucket(rate=0),
+            seen_ids=seen,
+        )
+        requested = self.server.requests
+        self.assertEqual(sorted(page for term, page in requested if term == "devops"), [1, 2, 3])
+        self.assertEqual([page for term, page in requested if term == "cloud"], [1])
+        self.assertEqual([job["id"] for job in jobs][-2:], ["cloud-1-0", "cloud-1-1"])
+        for query in self.server.queries:
+            self.assertEqual((query["sort_by"], query["max_days_old"]), (["date"], [str(af.MAX_DAYS_OLD)]))
+        self.assertEqual(len(seen), 3)
+
+    def journal(self, resume=False):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        journal = FetchJournal(os.path.join(tmp.name, "journal.jsonl"), fields=af.ADZUNA_JOURNAL_FIELDS)
+        self.addCleanup(journal.close)
+        return journal
+
+    def test_journaled_fetch_compacts_to_serial_order(self):
+        serial = self.fetch(concurrency=1)
+        self.server.pending_failures = set(StubAdzunaHandler.flaky_once)
+        journal = self.journal()
+        jobs = af.fetch_adzuna_jobs(
+            ["devops", "empty", "cloud"],
+            results_per_page=2,
+            concurrency=3,
+            pages_per_term={"devops": 5, "empty": 5, "cloud": 5},
+            rate_limiter=af.TokenBucket(rate=0),
+            journal=journal,
+        )
+        self.assertEqual(jobs, [])
+        raw_csv = os.path.join(self.tmp, "raw.csv")
+        self.assertEqual(journal.compact(raw_csv, ["devops", "empty", "cloud"]), len(serial))
+        raw = read_table(raw_csv)
+        self.assertEqual(list(raw["id"]), [job["id"] for job in serial])
+        self.assertEqual(list(raw["search_term"]), [job["search_term"] for job in serial])
+
+    def test_resume_skips_journaled_pages(self):
+        path = self.journal().path
+        crashed = FetchJournal(path, fields=af.ADZUNA_JOURNAL_FIELDS)
+        crashed.record("devops", 1, [{"id": "devops-1-0", "search_term": "devops", "company": {"display_name": "A"}}])
+        crashed.record("empty", 1, [], stop=True)
+        crashed.close()
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write('{"term": "devops", "page": 2, "jo')
+
+        resumed = FetchJournal(path, fields=af.ADZUNA_JOURNAL_FIELDS, resume=True)
+        self.addCleanup(resumed.close)
+        self.assertEqual(resumed.pages, {("devops", 1): False, ("empty", 1): True})
+        af.fetch_adzuna_jobs(
+            ["devops", "empty"],
+            results_per_page=2,
+            concurrency=2,
+            pages_per_term={"devops": 5, "empty": 5},
+            rate_limiter=af.TokenBucket(rate=0),
+            journal=resumed,
+        )
+        self.assertEqual(sorted(self.server.requests), [("devops", 2), ("devops", 3)])
+        jobs = list(resumed.iter_jobs(["devops", "empty"]))
+        self.assertEqual([job["id"] for job in jobs], ["devops-1-0", "devops-2-0", "devops-2-1"])
+        self.assertEqual(jobs[0]["company.display_name"], "A")
+
+
+class IncrementalStoreTests(unittest.TestCase):
+    def test_merge_keeps_fresh_copy_and_drops_expired_rows(self):
+        now = datetime.now(timezone.utc)
+        recent = (now - timedelta(days=2)).isoformat()
+        expired = (now - timedelta(days=af.MAX_DAYS_OLD + 1)).isoformat()
+        # Ids read back from the raw CSV are numbers.
+        previous = pd.DataFrame(
+            [
+                {"id": 101, "title": "Old title", "created": recent},
+                {"id": 102, "title": "Still listed", "created": recent},
+                {"id": 103, "title": "Expired", "created": expired},
+            ]
+        )
+        fresh = [{"id": "101", "title": "New title", "created": recent, "company": {"display_name": "Acme"}}]
+        merged = af.merge_raw_store(previous, fresh)
+        self.assertEqual(list(merged["title"]), ["New title", "Still listed"])
+        self.assertEqual(merged["company.display_name"].iloc[0], "Acme")
+
+    def test_merge_keeps_one_row_per_term_like_the_compacted_table(self):
+        recent = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+        previous = pd.DataFrame(
+            [
+                {"id": 101, "search_term": "devops", "title": "Old title", "created": recent},
+                {"id": 101, "search_term": "cloud", "title": "Old title", "created": recent},
+            ]
+        )
+        fresh = [
+            {"id": "101", "search_term": "devops", "title": "New title", "created": recent},
+            {"id": "101", "search_term": "linux", "title": "New title", "created": recent},
+        ]
+        merged = af.merge_raw_store(previous, fresh)
+        self.assertEqual(list(merged["search_term"]), ["devops", "linux", "cloud"])
+        self.assertEqual(list(merged["title"]), ["New title", "New title", "Old title"])
+
+    def test_seen_index_round_trip_and_prune(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "seen.json")
+        now = [1_000_000.0]
+        index = SeenIdIndex(path, clock=lambda: now[0])
+        self.assertEqual(index.add(["1", 2.0, "1", None]), 2)
+        index.save()
+        now[0] += (af.MAX_DAYS_OLD + 1) * 86400
+        reloaded = SeenIdIndex(path, clock=lambda: now[0])
+        self.assertTrue(2 in reloaded and "2" in reloaded)
+        self.assertEqual(reloaded.seen_share(["1", "3"]), 0.5)
+        reloaded.add(["3"])
+        reloaded.save()
+        self.assertEqual(len(SeenIdIndex(path)), 1)
+
+
+class FetchedRunReplayTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.paths = {
+            key: os.path.join(tmp.name, os.path.basename(path)) for key, path in af.get_output_paths("be").items()
+        }
+        created = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+        self.raw = pd.DataFrame(
+            [
+                {
+                    "id": idx,
+                    "title": title,
+                    "description": CLOUD_DESC,
+                    "created": created,
+                    "redirect_url": f"https://www.adzuna.be/details/{idx}",
+                    "company.display_name": f"Company {idx}",
+                    "location.display_name": "Brussels",
+                    "search_term": "devops",
+                }
+                for idx, title in enumerate(["Junior Cloud Engineer", "Sales Manager", "Junior DevOps Engineer"])
+            ]
+        )
+        for target, replacement in (
+            ("get_output_paths", lambda market="": dict(self.paths)),
+            ("require_adzuna_credentials", lambda: None),
+            ("fetch_raw_table", self.fake_fetch),
+        ):
+            patcher = mock.patch.object(af, target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(af.configure_market, "be")
+
+    def fake_fetch(self, search_terms, raw_path, **kwargs):
+        af.save_table(self.raw, raw_path)
+        return len(self.raw)
+
+    def run_main(self, *extra):
+        argv = ["adzuna_fetch.py", "--market", "be", "--filter-mode", "strict", "--no-verdict-cache", *extra]
+        with mock.patch.object(af.sys, "argv", argv):
+            af.main()
+        return read_table(self.paths["adzuna_filtered_strict_csv"])
+
+    def test_fetched_run_replays_the_raw_table_in_chunks(self):
+        with (
+            mock.patch.object(af, "iter_table_chunks", wraps=af.iter_table_chunks) as chunks,
+            mock.patch.object(af, "read_table", side_effect=AssertionError("raw table loaded whole")),
+        ):
+            chunked = self.run_main()
+        chunks.assert_called_once_with(self.paths["adzuna_raw_csv"], af.DEFAULT_REPLAY_CHUNK_SIZE)
+        whole = self.run_main("--replay-chunk-size", "0")
+        self.assertEqual(list(chunked["title"]), ["Junior Cloud Engineer", "Junior DevOps Engineer"])
+        pd.testing.assert_frame_equal(chunked, whole)
+
+    def test_failed_chunk_closes_the_verdict_cache_and_spools(self):
+        closed = []
+
+        class TrackedSpool(af.RowSpool):
+            def close(self):
+                closed.append(self)
+                super().close()
+
+        argv = ["adzuna_fetch.py", "--market", "be", "--filter-mode", "strict"]
+        with (
+            mock.patch.object(af.sys, "argv", argv),
+            mock.patch.object(af, "RowSpool", TrackedSpool),
+            mock.patch.object(af, "filter_jobs", side_effect=RuntimeError("chunk failed")),
+        ):
+            with self.assertRaises(RuntimeError):
+                af.main()
+        self.assertIsNone(af.VERDICT_CACHE)
+        # strict and near_miss
+        self.assertEqual(len(closed), 2)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_waits_for_refill_after_burst(self):
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        bucket = af.TokenBucket(rate=2.0, burst=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(4):
+            bucket.acquire()
+        self.assertEqual(slept, [0.5, 0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
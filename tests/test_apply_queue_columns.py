@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import apply_queue as aq
+from config import get_market_profile
+
+
+def messy_jobs() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "title": [
+                "Service Desk Analyst (Turkish) - Rabat",
+                "Proxy Product Owner (F/H) - Casablanca",
+                "Technicien IT Junior CDI - Tanger",
+                "Ingenieur Anglophone - Casablanca",
+                "Stagiaire QA",
+                np.nan,
+                "Data Analyst",
+                "Technicien Service Desk / Support IT (Franco-Italophone)",
+            ],
+            "description": [
+                "Technical support.",
+                "Roadmap.",
+                "Support N1/N2.",
+                np.nan,
+                "Tests.",
+                "Deutsch erforderlich.",
+                "Nederlands vereist.",
+                "Agent helpdesk italophone.",
+            ],
+            "company": ["HCLTech", "Sofrecom", "Manpower", "", np.nan, "Acme", "Acme", "AFRICAWORK"],
+            "location": ["Salé, Technopolis", "Casablanca", "Genève", np.nan, "Lausanne", "", "Rabat", "Zürich"],
+            "search_term": ["support it", "", np.nan, "devops ", "cloud", "cloud", "support it", ""],
+            "canonical_url": ["https://a/1", "", np.nan, "https://a/4", "", "https://a/6", "", ""],
+            "url": ["https://u/1", "https://u/2", "https://u/3", "", "", "", np.nan, "https://u/8"],
+            "is_remote": [False, True, False, False, True, False, False, True],
+            "sponsorship_score": [0.0, 1.0, 0.5, 2.0, 0.0, 0.0, 1.0, 0.0],
+            "language_fit_score": [0, 1, 2, 0, 1, 0, 0, 2],
+            "junior_score": [0, 2, 3, 1, 2, 0, 1, 2],
+            "feedback_score": [0, 2, -1, 0, 0, 3, -4, 0],
+        }
+    )
+
+
+class ColumnWiseQueueTests(unittest.TestCase):
+    """The column-wise queue steps must match their row-wise definitions."""
+
+    def setUp(self):
+        self.jobs = messy_jobs()
+        self.rows = [row for _, row in self.jobs.iterrows()]
+
+    def test_job_ids(self):
+        expected = [
+            aq.make_job_id(str(r.get("canonical_url", "") or r.get("url", "")), str(r.get("title", "")), str(r.get("company", "")))
+            for r in self.rows
+        ]
+        self.assertEqual(aq.make_job_ids(self.jobs).tolist(), expected)
+
+    def test_market_adjustments_and_gate(self):
+        for market, focus in [("ma", "all"), ("ch", "romandie"), ("be", "all")]:
+            profile = get_market_profile(market, focus)
+            adjustments = aq.market_queue_adjustments(self.jobs, profile)
+            expected = [aq.compute_market_queue_adjustment(r, profile) for r in self.rows]
+            self.assertEqual(list(adjustments.itertuples(index=False, name=None)), expected)
+            gates = aq.market_apply_now_gate_reasons(self.jobs, profile)
+            self.assertEqual(gates.tolist(), [aq.market_apply_now_allowed(r, profile)[1] for r in self.rows])
+
+    def test_reasons_and_location_focus(self):
+        for market, focus in [("ma", "all"), ("ch", "romandie")]:
+            profile = get_market_profile(market, focus)
+            self.assertEqual(aq.build_reasons(self.jobs, profile).tolist(), [aq.build_reason(r, profile) for r in self.rows])
+        for location_focus in ["rabat", "rabat_or_remote", "Genève", ""]:
+            mask = aq.location_focus_mask(self.jobs, location_focus, "ma")
+            expected = [
+                aq.location_matches_focus(r.get("location", ""), location_focus, "ma", bool(r.get("is_remote", False)))
+                for r in self.rows
+            ]
+            self.assertEqual(mask.tolist(), expected)
+
+    def test_feedback(self):
+        tracker = pd.DataFrame(
+            {
+                "status": ["offer", "rejected", "interview", "applied", "to_apply", np.nan],
+                "company": ["Acme", "acme ", "HCLTech", np.nan, "Manpower", "Manpower"],
+                "search_term": ["cloud", "cloud", "", "support it", "cloud", "cloud"],
+            }
+        )
+        company_scores, term_scores = aq.build_feedback_maps(tracker)
+        self.assertEqual(company_scores, {"acme": 0, "hcltech": 3, "nan": 1})
+        self.assertEqual(term_scores, {"cloud": 0, "support it": 1})
+        feedback = aq.feedback_scores(self.jobs, company_scores, term_scores)
+        expected = [aq.compute_feedback_score(r, company_scores, term_scores) for r in self.rows]
+        self.assertEqual(list(feedback.itertuples(index=False, name=None)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
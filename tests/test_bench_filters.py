@@ -0,0 +1,81 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import adzuna_fetch as af  # noqa: E402
+import bench_filters  # noqa: E402
+import synthetic_jobs  # noqa: E402
+
+
+class SyntheticCorpusTests(unittest.TestCase):
+    def test_corpus_is_seeded(self):
+        first = synthetic_jobs.make_corpus(20, seed=3)
+        self.assertEqual(first, synthetic_jobs.make_corpus(20, seed=3))
+        self.assertNotEqual(first, synthetic_jobs.make_corpus(20, seed=4))
+        self.assertEqual(set(first), set(synthetic_jobs.FLAVOURS))
+        # Growing the corpus keeps the jobs already drawn.
+        self.assertEqual(synthetic_jobs.make_corpus(30, seed=3)["ch"][:20], first["ch"])
+
+    def test_frozen_clock_pins_is_recent(self):
+        now = synthetic_jobs.FROZEN_NOW
+        fresh = (now - timedelta(days=af.MAX_DAYS_OLD - 1)).isoformat()
+        stale = (now - timedelta(days=af.MAX_DAYS_OLD + 1)).isoformat()
+        with synthetic_jobs.frozen_clock(af):
+            self.assertTrue(af.is_recent(fresh, af.MAX_DAYS_OLD))
+            self.assertFalse(af.is_recent(stale, af.MAX_DAYS_OLD))
+        self.assertIs(af.datetime, datetime)
+        self.assertFalse(af.is_recent(datetime(2000, 1, 1, tzinfo=timezone.utc).isoformat(), af.MAX_DAYS_OLD))
+
+
+class BaselineComparisonTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.baseline = os.path.join(tmp.name, "baseline.json")
+        self.args = ["--jobs", "4", "--repeat", "1", "--only", "role_relevant,fuzzy_dedup", "--baseline", self.baseline]
+
+    def run_bench(self, *extra):
+        with redirect_stdout(io.StringIO()) as out:
+            code = bench_filters.main(self.args + list(extra))
+        return code, out.getvalue()
+
+    def test_slowdown_against_baseline_fails(self):
+        self.assertEqual(self.run_bench("--update-baseline")[0], 0)
+        with open(self.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        self.assertEqual(sorted(baseline["cases"]), ["fuzzy_dedup", "role_relevant"])
+
+        baseline["cases"]["role_relevant"]["per_sec"] *= 1000
+        with open(self.baseline, "w", encoding="utf-8") as handle:
+            json.dump(baseline, handle)
+        # Loose tolerances: only the inflated baseline may trip on such a small corpus.
+        code, output = self.run_bench("--tolerance", "0.9", "--memory-tolerance", "100")
+        self.assertEqual(code, 1)
+        self.assertIn("REGRESSION role_relevant", output)
+        self.assertNotIn("REGRESSION fuzzy_dedup", output)
+
+    def test_other_corpus_settings_are_not_compared(self):
+        self.run_bench("--update-baseline")
+        code, output = self.run_bench("--seed", "8")
+        self.assertEqual(code, 2)
+        self.assertIn("differ", output)
+
+    def test_compare_flags_memory_growth(self):
+        baseline = {"cases": {"role_relevant": {"per_sec": 100.0, "peak_kib": 100.0}}}
+        result = {"role_relevant": {"per_sec": 100.0, "peak_kib": 151.0}}
+        messages = bench_filters.compare(result, baseline, tolerance=0.25, memory_tolerance=0.5)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("peak", messages[0])
+        result["role_relevant"]["peak_kib"] = 149.0
+        self.assertEqual(bench_filters.compare(result, baseline, 0.25, 0.5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import enrich_full_descriptions as efd
+
+
+class FakeRoute:
+    def __init__(self, resource_type: str):
+        self.request = type("Request", (), {"resource_type": resource_type})()
+        self.action = ""
+
+    def abort(self):
+        self.action = "abort"
+
+    def continue_(self):
+        self.action = "continue"
+
+
+class FakePage:
+    def __init__(self, driver):
+        self.driver = driver
+        self.url = ""
+
+    def set_default_timeout(self, timeout_ms):
+        pass
+
+    def goto(self, url, wait_until=""):
+        self.driver.threads.add(threading.get_ident())
+        if "timeout" in url:
+            raise efd.PlaywrightTimeout("slow page")
+        self.url = url
+
+    def inner_text(self, selector):
+        return f"body of {self.url}"
+
+
+class FakeContext:
+    def __init__(self, driver):
+        self.driver = driver
+        self.closed = False
+
+    def route(self, pattern, handler):
+        self.driver.route_handlers.append(handler)
+
+    def new_page(self):
+        return FakePage(self.driver)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, driver):
+        self.driver = driver
+        self.closed = False
+
+    def new_context(self):
+        context = FakeContext(self.driver)
+        self.driver.contexts.append(context)
+        return context
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDriver:
+    """Stands in for sync_playwright(): records launches, contexts and the thread pages run on."""
+
+    def __init__(self):
+        self.browsers = []
+        self.contexts = []
+        self.route_handlers = []
+        self.threads = set()
+        self.stopped = False
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    def start(self):
+        return self
+
+    def launch(self, headless=True):
+        browser = FakeBrowser(self)
+        self.browsers.append(browser)
+        return browser
+
+    def stop(self):
+        self.stopped = True
+
+
+class BrowserPoolTests(unittest.TestCase):
+    def test_one_browser_for_many_fetches_with_recycled_contexts(self):
+        driver = FakeDriver()
+        pool = efd.BrowserPool(recycle_after=2, driver_factory=driver)
+        urls = [f"https://jobs.example/{i}" for i in range(5)]
+        with ThreadPoolExecutor(max_workers=3) as workers:
+            results = list(workers.map(pool.fetch, urls))
+        pool.close()
+
+        self.assertEqual(results, [(f"body of {url}", None) for url in urls])
+        self.assertEqual(len(driver.browsers), 1)
+        self.assertEqual(len(driver.contexts), 3)
+        self.assertEqual(len(driver.threads), 1)
+        self.assertTrue(all(context.closed for context in driver.contexts))
+        self.assertTrue(driver.browsers[0].closed and driver.stopped)
+
+    def test_heavy_resources_are_blocked(self):
+        driver = FakeDriver()
+        pool = efd.BrowserPool(driver_factory=driver)
+        pool.fetch("https://jobs.example/1")
+        pool.close()
+        handler = driver.route_handlers[0]
+        for resource_type, action in [("image", "abort"), ("font", "abort"), ("media", "abort"), ("document", "continue")]:
+            route = FakeRoute(resource_type)
+            handler(route)
+            self.assertEqual(route.action, action, resource_type)
+
+    def test_timeout_and_closed_pool_return_errors(self):
+        pool = efd.BrowserPool(driver_factory=FakeDriver())
+        text, err = pool.fetch("https://jobs.example/timeout")
+        self.assertIsNone(text)
+        self.assertTrue(err.startswith("PlaywrightTimeout"))
+        pool.close()
+        self.assertEqual(pool.fetch("https://jobs.example/1"), (None, "browser_pool_closed"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from description_cache import DescriptionCache, open_description_cache
+
+TEXT = "Junior cloud engineer working on Azure, Terraform and Linux automation every day."
+
+
+class DescriptionCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.now = [1_000_000.0]
+
+    def open(self, name="cache.sqlite", ttl_days=30) -> DescriptionCache:
+        cache = DescriptionCache(str(self.dir / name), ttl_days=ttl_days, clock=lambda: self.now[0])
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_content_is_stored_once_for_all_aliases(self):
+        cache = self.open()
+        aliases = ["https://www.adzuna.be/details/1", "https://www.adzuna.be/land/ad/1?utm=x"]
+        cache.put("https://jobs.example/1", TEXT, aliases=aliases)
+        self.assertEqual(cache.stats(), {"urls": 3, "contents": 1})
+        for url in ["https://jobs.example/1", *aliases]:
+            self.assertEqual(cache.get(url), TEXT)
+
+    def test_aliases_keep_their_live_entry(self):
+        cache = self.open()
+        cache.put("https://a.example/1", "first " + TEXT)
+        cache.put("https://b.example/1", "second " + TEXT, aliases=["https://a.example/1"])
+        self.assertEqual(cache.get("https://a.example/1"), "first " + TEXT)
+
+    def test_ttl_hides_and_evicts_old_entries(self):
+        cache = self.open(ttl_days=1)
+        cache.put("https://jobs.example/1", TEXT)
+        self.now[0] += 2 * 86400
+        self.assertIsNone(cache.get("https://jobs.example/1"))
+        self.assertEqual(cache.evict_expired(), 1)
+        self.assertEqual(cache.stats(), {"urls": 0, "contents": 0})
+
+    def test_writes_survive_without_explicit_save(self):
+        cache = self.open()
+        cache.put("https://jobs.example/1", TEXT)
+        reopened = self.open()
+        self.assertEqual(reopened.get("https://jobs.example/1"), TEXT)
+
+    def test_discard_drops_orphaned_content(self):
+        cache = self.open()
+        cache.put("https://jobs.example/1", TEXT)
+        cache.discard("https://jobs.example/1")
+        self.assertEqual(cache.stats(), {"urls": 0, "contents": 0})
+
+    def test_legacy_json_path_is_imported_once(self):
+        legacy = self.dir / "description_fetch_cache.json"
+        legacy.write_text(
+            json.dumps({"https://jobs.example/1": {"scraped": TEXT}, "https://jobs.example/2": {"scraped": TEXT}}),
+            encoding="utf-8",
+        )
+        cache = open_description_cache(str(legacy))
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.path, str(self.dir / "description_fetch_cache.sqlite"))
+        self.assertEqual(cache.stats(), {"urls": 2, "contents": 1})
+        self.assertTrue(os.path.exists(legacy))
+
+    def test_old_cache_file_gains_validator_columns(self):
+        path = self.dir / "old.sqlite"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE contents (hash TEXT PRIMARY KEY, text TEXT NOT NULL);"
+            "CREATE TABLE urls (url TEXT PRIMARY KEY, hash TEXT NOT NULL, fetched_at REAL NOT NULL);"
+        )
+        conn.close()
+        cache = self.open("old.sqlite")
+        cache.put("https://jobs.example/1", TEXT, etag='"abc"')
+        entry = cache.lookup("https://jobs.example/1")
+        self.assertEqual((entry.text, entry.etag, entry.last_modified), (TEXT, '"abc"', ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import adzuna_fetch as af
+import enrich_full_descriptions as efd
+from description_cache import DescriptionCache
+
+
+def fetch_kwargs(**overrides) -> dict:
+    kwargs = {
+        "previous_enrichment_map": {},
+        "cache": None,
+        "session": None,
+        "max_retries": 1,
+        "timeout": 5,
+        "use_browser": False,
+        "browser_timeout": 5,
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+class HostPolitenessTests(unittest.TestCase):
+    def test_same_host_is_spaced_other_hosts_are_not(self):
+        politeness = efd.HostPoliteness(delay=0.2, max_per_host=2)
+        starts: dict[str, list[float]] = {"a": [], "b": []}
+
+        def hit(url):
+            with politeness.slot(url):
+                starts[url.split("/")[2][0]].append(time.monotonic())
+
+        urls = ["https://a.example/1", "https://a.example/2", "https://b.example/1"]
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(hit, urls))
+
+        a_first, a_second = sorted(starts["a"])
+        self.assertGreaterEqual(a_second - a_first, 0.19)
+        self.assertLess(starts["b"][0] - a_first, 0.15)
+
+
+class FetchRowDescriptionTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+
+    def test_cache_hits_and_reuse_from_worker_threads(self):
+        text = "Junior cloud engineer working on Azure, Terraform and Linux automation every day."
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache = DescriptionCache(str(Path(tmp.name) / "cache.sqlite"))
+        self.addCleanup(cache.close)
+        for i in range(20):
+            cache.put(f"https://jobs.example/{i}", f"{text} #{i}")
+        rows = [{"url": f"https://jobs.example/{i}", "title": "Cloud Engineer"} for i in range(20)]
+        previous = {efd._job_identity(rows[3]): {"fetched_full_description": True, "combined_description": text}}
+        kwargs = fetch_kwargs(cache=cache, previous_enrichment_map=previous)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda row: efd.fetch_row_description(row, **kwargs), rows))
+
+        self.assertEqual(results[3]["outcome"], "reused_previous")
+        self.assertEqual(results[3]["scraped"], text)
+        for i, result in enumerate(results):
+            if i != 3:
+                self.assertEqual(result["outcome"], "cache_hit")
+                self.assertEqual(result["scraped"], f"{text} #{i}")
+                self.assertFalse(result["performed_network_fetch"])
+
+    def test_missing_url_fails_without_fetch(self):
+        result = efd.fetch_row_description({"title": "Cloud Engineer"}, **fetch_kwargs())
+        self.assertEqual((result["outcome"], result["fetch_error"]), ("fail", "missing_url"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import adzuna_fetch as af
+import enrich_full_descriptions as efd
+from description_cache import DescriptionCache
+
+
+class VersionedJobHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.seen.append({"if_none_match": self.headers.get("If-None-Match", ""), "bytes": 0})
+        if self.path in server.missing:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = f'"v{server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        desc = f"Version {server.version}: junior cloud engineer automating Azure with Terraform and Linux."
+        body = f'<script type="application/ld+json">{json.dumps({"@type": "JobPosting", "description": desc})}</script>'
+        payload = body.encode("utf-8")
+        server.seen[-1]["bytes"] = len(payload)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", "Mon, 05 Oct 2026 08:00:00 GMT")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RevalidationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), VersionedJobHandler)
+        self.server.version = 1
+        self.server.seen = []
+        self.server.missing = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.now = [1_000_000.0]
+        self.cache = DescriptionCache(str(Path(tmp.name) / "cache.sqlite"), clock=lambda: self.now[0])
+        self.addCleanup(self.cache.close)
+        self.session = efd.requests.Session()
+        self.addCleanup(self.session.close)
+        self.row = {"url": f"http://127.0.0.1:{self.server.server_port}/job/1", "title": "Cloud Engineer"}
+
+    def fetch(self):
+        return efd.fetch_row_description(
+            self.row,
+            previous_enrichment_map={},
+            cache=self.cache,
+            session=self.session,
+            max_retries=1,
+            timeout=5,
+            use_browser=False,
+            browser_timeout=5,
+            revalidate_after=3600,
+        )
+
+    def test_fresh_entries_are_served_without_a_request(self):
+        self.assertEqual(self.fetch()["outcome"], "ok")
+        self.now[0] += 60
+        result = self.fetch()
+        self.assertEqual((result["outcome"], result["revalidation"]), ("cache_hit", ""))
+        self.assertEqual(len(self.server.seen), 1)
+
+    def test_unchanged_page_revalidates_with_304(self):
+        first = self.fetch()
+        self.assertEqual(self.cache.lookup(self.row["url"]).etag, '"v1"')
+        self.now[0] += 2 * 3600
+        result = self.fetch()
+        self.assertEqual((result["outcome"], result["revalidation"]), ("cache_hit", "not_modified"))
+        self.assertEqual(result["scraped"], first["scraped"])
+        self.assertEqual(self.server.seen[-1], {"if_none_match": '"v1"', "bytes": 0})
+        # The 304 restarts the revalidation age.
+        self.assertEqual(self.cache.lookup(self.row["url"]).age_seconds, 0)
+
+    def test_edited_page_replaces_cached_description(self):
+        self.fetch()
+        self.server.version = 2
+        self.now[0] += 2 * 3600
+        result = self.fetch()
+        self.assertEqual((result["outcome"], result["revalidation"]), ("ok", "changed"))
+        self.assertTrue(result["scraped"].startswith("Version 2"))
+        self.assertTrue(self.cache.get(self.row["url"]).startswith("Version 2"))
+        self.assertEqual(self.cache.lookup(self.row["url"]).etag, '"v2"')
+
+    def test_alias_served_first_is_revalidated_and_touched(self):
+        base = f"http://127.0.0.1:{self.server.server_port}"
+        self.row = {"url": f"{base}/job/1", "canonical_url": f"{base}/alias/1", "title": "Cloud Engineer"}
+        # The first candidate is down on the first run, so the description comes from the second one.
+        self.server.missing = {"/alias/1"}
+        first = self.fetch()
+        self.assertEqual((first["outcome"], first["fetch_used_url"]), ("ok", f"{base}/job/1"))
+        self.assertEqual(self.cache.lookup(f"{base}/alias/1").etag, '"v1"')
+        self.server.missing = set()
+
+        self.now[0] += 2 * 3600
+        unchanged = self.fetch()
+        self.assertEqual((unchanged["fetch_used_url"], unchanged["revalidation"]), (f"{base}/alias/1", "not_modified"))
+        for url in first["candidates"]:
+            self.assertEqual(self.cache.lookup(url).age_seconds, 0)
+
+        self.server.version = 2
+        self.now[0] += 2 * 3600
+        edited = self.fetch()
+        self.assertEqual((edited["outcome"], edited["revalidation"]), ("ok", "changed"))
+        self.assertTrue(edited["scraped"].startswith("Version 2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
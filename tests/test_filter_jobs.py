@@ -0,0 +1,65 @@
+import unittest
+
+import adzuna_fetch as af
+from job_samples import CLOUD_DESC, DUTCH_DESC, make_job
+
+
+class FilterJobsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+        cls.jobs = [
+            make_job(1, "Junior Cloud Engineer", CLOUD_DESC),
+            make_job(2, "Sales Manager", CLOUD_DESC),
+            make_job(3, "Junior DevOps Engineer", DUTCH_DESC),
+            make_job(4, "Junior Linux System Administrator", CLOUD_DESC, location="Gent"),
+            make_job(5, "Junior Cloud Engineer", "Too short"),
+        ]
+
+    def test_single_pass_matches_per_mode_passes_filters(self):
+        results = af.filter_jobs(self.jobs, ["strict", "broad"])
+        for mode in ("strict", "broad"):
+            expected = [p for p in (af.passes_filters(job, filter_mode=mode) for job in self.jobs) if p]
+            self.assertEqual(results[mode], expected)
+
+    def test_evaluate_job_matches_separate_checks(self):
+        for job in self.jobs:
+            verdicts = af.evaluate_job(job)
+            self.assertEqual(verdicts["strict"], af.passes_filters(job, filter_mode="strict"))
+            self.assertEqual(verdicts["broad"], af.passes_filters(job, filter_mode="broad"))
+            self.assertEqual(verdicts["near_miss"], af.near_miss_location_only(job))
+
+    def test_near_miss_collected_in_same_traversal(self):
+        # MA enforces its location filter, so an out-of-market city turns into a near miss.
+        af.configure_market("ma")
+        try:
+            jobs = [
+                make_job(1, "Junior Cloud Engineer", CLOUD_DESC, location="Casablanca"),
+                make_job(2, "Junior Cloud Engineer", CLOUD_DESC, location="Lyon"),
+            ]
+            results = af.filter_jobs(jobs, ["strict"], near_miss=True)
+            self.assertEqual([row["location"] for row in results["strict"]], ["Casablanca"])
+            self.assertEqual([row["location"] for row in results["near_miss"]], ["Lyon"])
+            self.assertEqual(results["near_miss"], [af.near_miss_location_only(jobs[1])])
+        finally:
+            af.configure_market("be")
+
+    def test_worker_pool_keeps_input_order(self):
+        serial = af.filter_jobs(self.jobs, ["strict", "broad"], workers=1)
+        pooled = af.filter_jobs(self.jobs, ["strict", "broad"], workers=2)
+        self.assertEqual(pooled, serial)
+
+    def test_source_none_uses_job_source(self):
+        job = dict(self.jobs[0], source="jooble")
+        kept = af.filter_jobs([job], ["broad"], source=None)["broad"]
+        self.assertEqual([row["source"] for row in kept], ["jooble"])
+
+    def test_kept_row_ends_with_filter_mode_then_source(self):
+        # Column order of the filtered CSV/Parquet outputs.
+        for mode in ("strict", "broad"):
+            row = af.passes_filters(self.jobs[0], filter_mode=mode)
+            self.assertEqual(list(row)[-2:], ["filter_mode", "source"])
+
+
+if __name__ == "__main__":
+    unittest.main()
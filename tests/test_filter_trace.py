@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pandas as pd
+
+import adzuna_fetch as af
+import enrich_full_descriptions as efd
+import filter_impact as fi
+import jobs_viewer
+from job_samples import CLOUD_DESC, DUTCH_DESC, make_job
+
+
+class FilterTraceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+        cls.jobs = [
+            make_job(1, "Junior Cloud Engineer", CLOUD_DESC),
+            make_job(2, "Sales Manager", CLOUD_DESC),
+            make_job(3, "Junior DevOps Engineer", DUTCH_DESC),
+            make_job(4, "Senior Cloud Engineer", CLOUD_DESC, days_old=90),
+            make_job(5, "Junior Cloud Engineer", "Too short"),
+        ]
+
+    def test_trace_matches_passes_filters(self):
+        for mode in ("strict", "broad"):
+            for job in self.jobs:
+                trace = af.passes_filters(job, filter_mode=mode, trace=True)
+                parsed = af.passes_filters(job, filter_mode=mode)
+                self.assertEqual(trace.passed, parsed is not None)
+                self.assertEqual(trace.job, parsed)
+                self.assertEqual([outcome.stage for outcome in trace.stages], list(af.FILTER_TRACE_STAGES))
+
+    def test_every_stage_is_recorded_past_the_first_failure(self):
+        trace = af.passes_filters(self.jobs[3], filter_mode="strict", trace=True)
+        self.assertEqual((trace.first_fail.stage, trace.first_fail.detail), ("bad_title", "senior"))
+        self.assertFalse(trace.stage("recency").passed)
+        self.assertTrue(trace.reached("bad_title"))
+        self.assertFalse(trace.reached("recency"))
+
+        dutch = af.passes_filters(self.jobs[2], filter_mode="broad", trace=True)
+        self.assertTrue(dutch.stage("blocked_language_requirement").passed)
+        self.assertEqual(dutch.stage("blocked_language_requirement").detail, "blocked_language_req:dutch_required")
+
+    def test_trace_comes_from_a_single_rules_evaluation(self):
+        with mock.patch.object(af, "evaluate_job_rules", wraps=af.evaluate_job_rules) as rules:
+            trace = af.passes_filters(self.jobs[0], filter_mode="strict", trace=True)
+        self.assertTrue(trace.passed)
+        self.assertEqual(rules.call_count, 1)
+        self.assertTrue(rules.call_args.kwargs["exhaustive"])
+
+    def test_step_summary_counts_first_failures(self):
+        steps = {row["step"]: row for row in fi.build_rule_matrix(self.jobs, "strict").funnel()}
+        self.assertEqual(steps["description_length"]["removed"], 1)
+        self.assertEqual(steps["bad_title"]["removed"], 1)
+        self.assertEqual(steps["recency"]["before"], 3)
+        self.assertEqual(steps["blocked_language_requirement"]["removed"], 1)
+        self.assertEqual(steps["junior_score"]["kept"], 1)
+
+    def test_viewer_impact_counts_stages_independently(self):
+        impact = jobs_viewer.compute_independent_filter_impact(self.jobs, "strict")
+        self.assertEqual((impact["bad_title"], impact["too_old"]), (1, 1))
+        self.assertEqual((impact["blocked_language_requirement"], impact["blocked_language_detected"]), (1, 1))
+
+    def test_first_fail_reason_reuses_the_trace(self):
+        job = make_job(6, "Junior Cloud Engineer", CLOUD_DESC, days_old=90)
+        trace = af.passes_filters(job, filter_mode="strict", trace=True)
+        with mock.patch.object(af, "passes_filters", side_effect=AssertionError("chain replayed")):
+            self.assertEqual(efd.first_fail_reason(job, "strict", trace=trace), "too_old")
+        self.assertEqual(efd.first_fail_reason(self.jobs[2], "strict"), "blocked_language_req:dutch_required")
+
+
+class RuleMatrixTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+        cls.jobs = [
+            make_job(1, "Junior Cloud Engineer", CLOUD_DESC),
+            make_job(1, "Junior Cloud Engineer", CLOUD_DESC),
+            make_job(2, "Junior Cloud Engineer", "Too short"),
+            make_job(3, "Senior Cloud Engineer", CLOUD_DESC, days_old=90),
+            make_job(4, "Junior DevOps Engineer", CLOUD_DESC, days_old=90),
+        ]
+
+    def test_what_if_matches_traces_with_stages_disabled(self):
+        traces = fi.trace_jobs(self.jobs, "strict")
+        matrix = fi.build_rule_matrix(self.jobs, "strict", traces=traces)
+        for disabled in ([], ["recency"], ["recency", "bad_title"], ["description_length", "recency", "bad_title"]):
+            expected = sum(
+                1 for trace in traces if all(o.passed or o.stage in disabled for o in trace.stages)
+            )
+            self.assertEqual(matrix.what_if(disabled)["kept"], expected)
+        self.assertEqual(matrix.what_if()["final_after_dedup"], 1)
+        skip = {row["step"]: row for row in matrix.what_if_skip()}
+        self.assertEqual((skip["recency"]["rejects"], skip["recency"]["delta_vs_strict"]), (2, 1))
+        self.assertEqual(matrix.independent_counts()["bad_title"], 1)
+
+    def test_matrix_is_persisted_next_to_the_raw_table_and_reused(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            raw = os.path.join(tmp, "adzuna_jobs_raw.csv")
+            pd.DataFrame(self.jobs).to_csv(raw, index=False)
+            with mock.patch("builtins.print"):
+                built = fi.load_rule_matrix(raw, "strict")
+                self.assertTrue(os.path.exists(os.path.join(tmp, "adzuna_jobs_raw_rule_matrix_strict.npz")))
+                with mock.patch.object(af, "passes_filters", side_effect=AssertionError("rules re-run")):
+                    reused = fi.load_rule_matrix(raw, "strict")
+            self.assertEqual(reused.fails.tolist(), built.fails.tolist())
+            self.assertEqual(reused.funnel(), built.funnel())
+
+            # Recency follows the clock without re-running the rules.
+            reused.refresh_recency(datetime.now(timezone.utc) + timedelta(days=365))
+            self.assertEqual(reused.what_if()["kept"], 0)
+
+            pd.DataFrame(self.jobs[:2]).to_csv(raw, index=False)
+            os.utime(raw, ns=(0, 10**9))
+            with mock.patch("builtins.print"):
+                self.assertEqual(len(fi.load_rule_matrix(raw, "strict")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
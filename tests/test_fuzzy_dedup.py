@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from rapidfuzz import fuzz
+
+import merge_jobs as mj
+
+
+def pairwise_dedup(jobs):
+    """The full pairwise scan fuzzy_dedup replaces."""
+    kept, keys = [], []
+    for job in jobs:
+        text = mj.dedup_text(job)
+        for idx, existing in enumerate(kept):
+            if fuzz.token_set_ratio(text, keys[idx]) >= mj.FUZZY_DUP_SCORE and mj.location_similar(
+                job.get("location", ""), existing.get("location", "")
+            ):
+                kept[idx] = mj.choose_best(existing, job)
+                break
+        else:
+            kept.append(job)
+            keys.append(text)
+    return kept
+
+
+COMPANIES = ["Acme", "Cloudify BV", "Data Systems", "Orange Belgium", "", "NRB"]
+TITLES = [
+    "Cloud Engineer",
+    "Junior Cloud Engineer",
+    "Junior DevOps Engineer (m/f/x)",
+    "Linux System Administrator",
+    "Platform Engineer Azure",
+    "IT Support",
+    "Site Reliability Engineer",
+]
+LOCATIONS = ["Brussels", "Bruxelles", "Gent", "Antwerpen", "", "Brussels Region"]
+
+
+def typo(text, rng):
+    if len(text) < 4:
+        return text
+    pos = rng.randrange(len(text))
+    return text[:pos] + rng.choice("aeiorst") + text[pos + 1 :]
+
+
+def make_jobs(count, seed):
+    rng = random.Random(seed)
+    jobs = []
+    for idx in range(count):
+        title = rng.choice(TITLES)
+        company = rng.choice(COMPANIES)
+        if rng.random() < 0.3:
+            title = typo(title, rng)
+        if rng.random() < 0.2:
+            title += " " + rng.choice(["Senior", "II", "Brussels", "Kubernetes"])
+        jobs.append(
+            {
+                "title": title,
+                "company": company,
+                "location": rng.choice(LOCATIONS),
+                "description": "x" * rng.randrange(50),
+                "source": rng.choice(["adzuna", "jooble", "rekrute"]),
+            }
+        )
+    return jobs
+
+
+class FuzzyDedupTests(unittest.TestCase):
+    def test_same_merges_as_pairwise_scan(self):
+        for seed in range(5):
+            jobs = make_jobs(300, seed)
+            expected = pairwise_dedup(jobs)
+            self.assertEqual([id(job) for job in mj.fuzzy_dedup(jobs)], [id(job) for job in expected])
+
+    def test_typo_and_subset_titles_merge(self):
+        jobs = [
+            {"title": "Cloud Engineer", "company": "Acme", "location": "Brussels", "description": "short"},
+            {"title": "Cloud Enginer", "company": "Acme", "location": "Brussels", "description": "longer one"},
+            {"title": "Cloud Engineer", "company": "Acme", "location": "Gent", "description": ""},
+            {"title": "Senior Cloud Engineer", "company": "Acme", "location": "", "description": ""},
+        ]
+        kept = mj.fuzzy_dedup(jobs)
+        self.assertEqual([job["location"] for job in kept], ["Brussels", "Gent"])
+        self.assertEqual(kept[0]["description"], "longer one")
+
+
+if __name__ == "__main__":
+    unittest.main()
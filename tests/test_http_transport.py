@@ -0,0 +1,114 @@
+import gzip
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+import http_transport as ht
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+        if self.path == "/busy" and hits == 1:
+            self.reply(503, b"busy", extra={"Retry-After": "1"})
+        elif self.path == "/missing":
+            self.reply(404, b"not found")
+        elif self.path == "/page" and "gzip" in self.headers.get("Accept-Encoding", ""):
+            self.reply(200, gzip.compress(b"junior cloud engineer " * 200), extra={"Content-Encoding": "gzip"})
+        else:
+            self.reply(200, b"ok")
+
+    def reply(self, status: int, body: bytes, extra: dict | None = None):
+        self.send_response(status)
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpTransportTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.hits = {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+        self.transport = ht.HttpTransport("stub", retry=ht.RetryPolicy(attempts=3, backoff=5.0))
+        self.addCleanup(self.transport.close)
+        sleeper = mock.patch.object(ht.time, "sleep")
+        self.sleep = sleeper.start()
+        self.addCleanup(sleeper.stop)
+
+    def test_retry_waits_for_retry_after(self):
+        with mock.patch("builtins.print"):
+            resp = self.transport.get(f"{self.base}/busy")
+        self.assertEqual(resp.text, "ok")
+        self.sleep.assert_called_once_with(1.0)
+        stats = self.transport.stats.to_dict()
+        self.assertEqual((stats["requests"], stats["retries"], stats["statuses"]), (2, 1, {503: 1, 200: 1}))
+
+    def test_client_errors_are_not_retried(self):
+        with self.assertRaises(requests.HTTPError) as ctx:
+            self.transport.get(f"{self.base}/missing")
+        self.assertEqual(ctx.exception.response.status_code, 404)
+        self.assertEqual(self.server.hits["/missing"], 1)
+        self.assertEqual(self.transport.stats.to_dict()["errors"], 1)
+        self.sleep.assert_not_called()
+
+    def test_connections_are_pooled_across_requests_and_threads(self):
+        for _ in range(5):
+            self.transport.get(f"{self.base}/ok")
+        self.assertEqual(self.transport.connections_opened(), 1)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: self.transport.get(f"{self.base}/ok").text, range(40)))
+        self.assertLessEqual(self.transport.connections_opened(), 4)
+        self.assertEqual(self.transport.stats.to_dict()["requests"], 45)
+
+    def test_compressed_bytes_are_measured_on_the_wire(self):
+        resp = self.transport.get(f"{self.base}/page")
+        self.assertTrue(resp.text.startswith("junior cloud engineer"))
+        stats = self.transport.stats.to_dict()
+        self.assertLess(stats["wire_bytes"], stats["body_bytes"])
+        self.assertEqual(stats["body_bytes"], len(resp.content))
+
+    def test_headers_and_pacing_apply_to_every_attempt(self):
+        seen = []
+        paced = []
+
+        def headers(attempt):
+            seen.append(attempt)
+            return {"User-Agent": f"agent-{attempt}"}
+
+        def pace():
+            paced.append(True)
+            return mock.MagicMock()
+
+        with mock.patch("builtins.print"):
+            self.transport.get(f"{self.base}/busy", headers=headers, pace=pace)
+        self.assertEqual((seen, len(paced)), ([0, 1], 2))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(ht.parse_retry_after("7"), 7.0)
+        self.assertEqual(ht.parse_retry_after("Wed, 21 Oct 2026 07:28:00 GMT", now=1792567670.0), 10.0)
+        self.assertIsNone(ht.parse_retry_after("soon"))
+        self.assertIsNone(ht.parse_retry_after(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
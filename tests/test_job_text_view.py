@@ -0,0 +1,49 @@
+import unittest
+
+import adzuna_fetch as af
+
+
+class JobTextViewTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+
+    def setUp(self):
+        self.job = {
+            "title": "Junior <b>Cloud</b> Engineer",
+            "description": "<p>Hybrid role in Brussels. You will automate Azure infrastructure with Terraform.</p>",
+            "location": {"display_name": "Bruxelles, Belgique"},
+            "company": {"display_name": "Acme"},
+        }
+        self.view = af.JobTextView.from_job(self.job)
+
+    def test_view_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.view.title = "Senior Cloud Engineer"
+
+    def test_view_uses_plain_job_fields(self):
+        self.assertEqual(self.view.title, "Junior Cloud Engineer")
+        self.assertEqual(self.view.loc, "Bruxelles, Belgique")
+        self.assertEqual(self.view.company, "Acme")
+        self.assertEqual(self.view.text_norm, af.normalize_text(f"{self.view.title} {self.view.desc}"))
+        self.assertIs(self.view.text_norm, self.view.text_norm)
+
+    def test_rules_accept_view_or_strings(self):
+        title, desc, loc = self.view.title, self.view.desc, self.view.loc
+        self.assertEqual(af.detect_work_mode(self.view), af.detect_work_mode(title, desc, loc))
+        self.assertEqual(af.location_ok(self.view), af.location_ok(loc, title, desc))
+        self.assertEqual(af.role_relevant(self.view), af.role_relevant(title, desc))
+        self.assertEqual(af.compute_junior_score(self.view), af.compute_junior_score(title, desc))
+        self.assertEqual(af.infer_it_track(self.view), af.infer_it_track(title, desc))
+        self.assertEqual(
+            af.detect_experience_requirement_details(self.view),
+            af.detect_experience_requirement_details(title, desc),
+        )
+        self.assertEqual(
+            af.classify_excluded_hits(self.view),
+            af.classify_excluded_hits(title, self.view.full_text),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
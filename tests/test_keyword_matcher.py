@@ -0,0 +1,70 @@
+import random
+import re
+import unittest
+
+import adzuna_fetch as af
+
+
+def regex_keyword_hit(text: str, keyword: str) -> bool:
+    txt = af.normalize(text or "")
+    kw = af.normalize(keyword or "").strip()
+    if not txt or not kw:
+        return False
+    if re.fullmatch(r"[a-z0-9 ]+", kw):
+        pattern = r"(?<![a-z0-9])" + re.escape(kw).replace(r"\ ", r"\s+") + r"(?![a-z0-9])"
+        return re.search(pattern, txt) is not None
+    return kw in txt
+
+
+def regex_keyword_match(text: str, kw: str) -> bool:
+    txt_norm = af.normalize_text(text or "")
+    kw_norm = af.normalize_text(kw or "").strip()
+    if not txt_norm or not kw_norm:
+        return False
+    if " " in kw_norm or re.search(r"\W", kw_norm):
+        return kw_norm in txt_norm
+    return re.search(rf"\b{re.escape(kw_norm)}\b", txt_norm, flags=re.IGNORECASE) is not None
+
+
+class KeywordMatcherTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+
+    def test_boundaries_match_regex_semantics(self):
+        self.assertTrue(af.keyword_hit("Junior DevOps Engineer (m/f/x)", "devops engineer"))
+        self.assertFalse(af.keyword_hit("Strong expertise in hosting", "expert"))
+        self.assertFalse(af.keyword_hit("DevOps-Engineer", "devops engineer"))
+        self.assertTrue(af.keyword_hit("CI/CD pipelines", "ci/cd"))
+        self.assertTrue(af.keyword_match("Senior-level engineer", "senior"))
+        self.assertFalse(af.keyword_match("Seniors welcome", "senior"))
+
+    def test_matcher_scan_agrees_with_per_keyword_checks(self):
+        vocab = sorted(af.KEYWORD_MATCHER.keywords)
+        rnd = random.Random(3)
+        fillers = ["the", "-", "/", "and", "é", "2", "x", ",", "ops"]
+        for _ in range(200):
+            words = rnd.sample(vocab, 6) + rnd.sample(fillers, 3)
+            rnd.shuffle(words)
+            text = af.normalize(" ".join(words))
+            hits = af.KEYWORD_MATCHER.hits(text)
+            matches = af.KEYWORD_MATCHER.matches(text)
+            for kw in vocab:
+                self.assertEqual(kw in hits, regex_keyword_hit(text, kw), (text, kw))
+                self.assertEqual(kw in matches, regex_keyword_match(text, kw), (text, kw))
+
+    def test_matched_keywords_keeps_order_and_unknown_keywords(self):
+        text = "Hybrid role: 2 days remote, Linux and Terraform on-site in Brussels"
+        keywords = ["terraform", "not-in-vocab zz", "linux", "hybrid"]
+        self.assertEqual(af.matched_keywords(text, keywords), ["terraform", "linux", "hybrid"])
+        self.assertTrue(af.any_keyword_hit(text, ["brussels"]))
+        self.assertFalse(af.any_keyword_hit(text, ["brussel"]))
+
+    def test_excluded_hits_follow_keyword_match(self):
+        text = "Senior engineer, working with senior engineers on Kubernetes"
+        expected = [kw for kw in af.EXCLUDE_KEYWORDS if regex_keyword_match(af._strip_exclude_exceptions(text), kw)]
+        self.assertEqual(af.excluded_hits(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+import adzuna_fetch as af
+import language_id as lid
+
+FRENCH = "Vous assurez le support des utilisateurs et la gestion du parc informatique avec notre équipe."
+DUTCH = "Je ondersteunt gebruikers bij vragen over hardware en je beheert onze servers met het team."
+GERMAN = "Sie betreuen unsere Anwender und administrieren die Server sowie das Netzwerk für den Kunden."
+ENGLISH = "You will automate our infrastructure with Terraform and maintain the Linux servers for the team."
+# Close relatives of nl and de: they share enough stopwords to look like them.
+AFRIKAANS = (
+    "Ons soek 'n ervare stelseladministrateur vir ons span in Kaapstad. Jy sal verantwoordelik wees vir "
+    "die bestuur van bedieners en netwerke. Kennis van Linux is noodsaaklik en ervaring met wolkdienste is 'n voordeel."
+)
+LUXEMBOURGISH = (
+    "Mir sichen en Systemadministrateur fir eis Equipe zu Lëtzebuerg. Du bass verantwortlech fir d'Betreiung "
+    "vun eise Serveren an dem Netzwierk. Kenntnisser vu Linux sinn néideg an Erfahrung mat Cloud ass e Virdeel."
+)
+MIXED = "Cloud Engineer. Vloeiend Nederlands vereist. Fluent English required. Deutsch von Vorteil."
+
+
+class LanguageIdTests(unittest.TestCase):
+    def setUp(self):
+        lid.clear_language_id_cache()
+        self.addCleanup(lid.clear_language_id_cache)
+
+    def test_clear_snippets_skip_langdetect(self):
+        with mock.patch.object(lid, "_langdetect", side_effect=AssertionError("langdetect called")):
+            self.assertEqual(
+                [lid.detect_language(text) for text in (FRENCH, DUTCH, GERMAN, ENGLISH)],
+                ["fr", "nl", "de", "en"],
+            )
+        self.assertEqual(lid.LANGUAGE_ID_STATS["quick"], 4)
+
+    def test_ambiguous_snippets_use_seeded_langdetect_once(self):
+        self.assertEqual(lid.quick_language(MIXED), "")
+        first = lid.detect_language(MIXED)
+        self.assertEqual(first, lid.langdetect_language(MIXED))
+        with mock.patch.object(lid, "_langdetect", side_effect=AssertionError("not memoized")):
+            self.assertEqual(lid.detect_language(MIXED), first)
+        self.assertEqual((lid.LANGUAGE_ID_STATS["langdetect"], lid.LANGUAGE_ID_STATS["cache_hit"]), (1, 1))
+
+    def test_related_languages_are_left_to_langdetect(self):
+        self.assertEqual(lid.quick_language(AFRIKAANS), "")
+        self.assertEqual(lid.quick_language(LUXEMBOURGISH), "")
+        self.assertEqual(lid.detect_language(AFRIKAANS), "af")
+        self.assertEqual(lid.LANGUAGE_ID_STATS["langdetect"], 1)
+        af.configure_market("be")
+        self.assertFalse(af.is_disallowed_language(AFRIKAANS))
+
+    def test_char_markers_alone_do_not_settle(self):
+        self.assertEqual(lid.quick_language("Schulung Betreuung Sicherheit Zuverlässigkeit Ausschreibung"), "")
+
+    def test_memo_is_bounded_and_keyed_on_the_snippet(self):
+        with mock.patch.object(lid, "LANGUAGE_ID_CACHE_SIZE", 2):
+            for text in (FRENCH, DUTCH, GERMAN):
+                lid.detect_language(text)
+            self.assertEqual(len(lid._LANGUAGE_ID_CACHE), 2)
+        # Only the first SNIPPET_CHARS characters are classified.
+        lid.detect_language(ENGLISH * 20)
+        lid.detect_language(ENGLISH * 20 + FRENCH * 5)
+        self.assertEqual(lid.LANGUAGE_ID_STATS["cache_hit"], 1)
+        self.assertEqual(lid.detect_language("   "), "")
+
+    def test_is_disallowed_language_per_market(self):
+        af.configure_market("be")
+        self.assertTrue(af.is_disallowed_language(DUTCH))
+        self.assertFalse(af.is_disallowed_language(FRENCH))
+        self.assertFalse(af.is_disallowed_language(float("nan")))
+        af.configure_market("ma")
+        self.assertFalse(af.is_disallowed_language(DUTCH))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -77,6 +77,23 @@ class LanguageRequirementsTests(unittest.TestCase):
         desc = "Build pipelines and dashboards."
         self.assertEqual(af.role_forbidden_reason(title, desc), "business development")
 
+    def test_language_analysis_is_cached_and_copied_out(self):
+        text = "Fluent Dutch required. English is a plus."
+        analysis = af.analyze_language(text)
+        self.assertIs(af.analyze_language(text), analysis)
+
+        need = af.classify_language_need(text)
+        need["required_langs"].add("fr")
+        self.assertNotIn("fr", af.classify_language_need(text)["required_langs"])
+        self.assertEqual(af.blocked_language_requirement_reason(text), analysis.blocked_reason)
+        self.assertEqual(af.blocked_language_requirement_reason(text, filter_mode="broad"), "")
+
+    def test_configure_market_resets_language_analysis(self):
+        text = "Fluent German required."
+        analysis = af.analyze_language(text)
+        af.configure_market("be")
+        self.assertIsNot(af.analyze_language(text), analysis)
+
 
 if __name__ == "__main__":
     unittest.main()
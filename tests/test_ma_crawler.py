@@ -0,0 +1,242 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+import zlib
+from unittest import mock
+
+import emploi_ma_fetch
+import marocannonces_fetch
+import rekrute_fetch
+from config import MAX_DAYS_OLD
+from detail_cache import DetailCache, card_fingerprint
+from site_crawler import DetailPrefetch, SiteCrawler
+
+
+class FakeSite:
+    """url -> html, answered after a small per-URL delay so concurrent fetches complete out of order."""
+
+    def __init__(self, pages: dict[str, str]):
+        self.pages = pages
+        self.fetched: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str, timeout: int = 20) -> str:
+        with self._lock:
+            self.fetched.append(url)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep((zlib.crc32(url.encode("utf-8")) % 5) * 0.002)
+            if url not in self.pages:
+                raise RuntimeError(f"404 {url}")
+            return self.pages[url]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def rekrute_site() -> FakeSite:
+    base = rekrute_fetch.BASE_URL
+    pages = {}
+    listing_ids = [[1, 2, 3], [3, 4, 5], [6, 7, 1]]
+    page_urls = [rekrute_fetch.START_URL] + [f"{base}/offres.html?p={n}&s=1&o=1" for n in (2, 3)]
+    for page_no, ids in enumerate(listing_ids):
+        items = "".join(
+            f"""
+            <li class="post-id" id="{job_id}">
+              <div class="section">
+                <h2><a class='titreJob' href="/offre-emploi-junior-cloud-{job_id}.html">Junior Cloud {job_id} | Casablanca (Maroc)</a></h2>
+                <div class="holder">
+                  <div class="info"><span>Support cloud et serveurs Linux {job_id}{' et scripts' * page_no}.</span></div>
+                  <em class="date">Publication : du <span>16/04/2026</span> au <span>16/06/2026</span></em>
+                </div>
+              </div>
+            </li>"""
+            for job_id in ids
+        )
+        next_link = f'<a class="next" href="{page_urls[page_no + 1]}"></a>' if page_no + 1 < len(page_urls) else ""
+        pages[page_urls[page_no]] = f'<ul class="job-list">{items}</ul>{next_link}'
+    for job_id in range(1, 8):
+        if job_id == 5:
+            continue  # detail page gone: the listing row is kept as is
+        url = f"{base}/offre-emploi-junior-cloud-{job_id}.html"
+        pages[url] = f"""
+        <html><head><meta property="og:title" content="[ACME {job_id}] Junior Cloud {job_id}" /></head>
+        <body><h1>Junior Cloud {job_id} - Casablanca</h1>
+          <ul class="featureInfo"><li title="Expérience requise">Débutant (-1 an)</li></ul>
+          <div class="col-md-12 blc"><h2>Missions</h2><p>Automatiser Azure et Terraform pour le poste {job_id}.</p></div>
+        </body></html>"""
+    return FakeSite(pages)
+
+
+def marocannonces_site() -> FakeSite:
+    listing = marocannonces_fetch.LISTING_URL
+    pages = {}
+    links = "".join(f'<a href="{listing}&pge={n}">{n + 1}</a>' for n in range(1, 6))
+    listing_ids = [[11, 12], [12, 13], [14], [], [15, 16]]
+    page_urls = [listing] + [f"{listing}&pge={n}" for n in range(2, 6)]
+    for page_url, ids in zip(page_urls, listing_ids):
+        items = "".join(
+            f"""
+            <li>
+              <a title="Technicien support {job_id}" href="categorie/309/Offres-emploi/annonce/{job_id}/Technicien.html">
+                <div class="holder"><h3>Technicien support {job_id}</h3><span class="location">Rabat</span></div>
+              </a>
+              <div class="time"><em class="date"><span class="cnt-today">Aujourd'hui</span></em></div>
+            </li>"""
+            for job_id in ids
+        )
+        pages[page_url] = f'<ul class="cars-list">{items}</ul>{links if page_url == listing else ""}'
+    for job_id in range(11, 17):
+        url = f"{marocannonces_fetch.BASE_URL}/categorie/309/Offres-emploi/annonce/{job_id}/Technicien.html"
+        pages[url] = f"""
+        <html><head><script type="application/ld+json">
+        {{"@type": "JobPosting", "title": "Technicien support {job_id}", "datePosted": "2026-04-16 10:42",
+          "description": "<p>Support utilisateurs et maintenance reseau {job_id}.</p>",
+          "hiringOrganization": {{"@type": "Organization", "name": "Tech Maroc {job_id}"}}}}
+        </script></head><body><h1>Technicien support {job_id} - Rabat</h1></body></html>"""
+    return FakeSite(pages)
+
+
+def emploi_ma_site() -> FakeSite:
+    pages = {}
+    pagination = "".join(
+        f'<a href="/recherche-jobs-maroc?f%5B0%5D=im_field_offre_metiers%3A31&page={n}">{n + 1}</a>' for n in (1, 2, 3)
+    )
+    listing_ids = [[21, 22, 23], [23, 24], [25, 21], [26]]
+    for page_idx, ids in enumerate(listing_ids):
+        cards = "".join(
+            f"""
+            <div class="card card-job" data-href="https://www.emploi.ma/offre-emploi-maroc/devops-{job_id}">
+              <div class="card-job-detail">
+                <h3><a href="/offre-emploi-maroc/devops-{job_id}" title="DevOps {job_id}">DevOps {job_id}</a></h3>
+                <a href="/recruteur/{job_id}" class="card-job-company company-name">ACME {job_id}</a>
+                <div class="card-job-description"><p>CI/CD et cloud {job_id}.</p></div>
+                <time datetime="2026-04-16">16.04.2026</time>
+              </div>
+            </div>"""
+            for job_id in ids
+        )
+        pages[emploi_ma_fetch.build_listing_url(page_idx)] = cards + (pagination if page_idx == 0 else "")
+    for job_id in range(21, 27):
+        url = f"{emploi_ma_fetch.BASE_URL}/offre-emploi-maroc/devops-{job_id}"
+        pages[url] = f"""
+        <html><body><h1 class="text-center">DevOps {job_id} - Casablanca</h1>
+          <li class="withicon file-signature"><span>CDI</span></li>
+          <div class="job-description"><p>Déployer des pipelines CI/CD {job_id}.</p></div>
+        </body></html>"""
+    return FakeSite(pages)
+
+
+class CrawlParityTests(unittest.TestCase):
+    def run_both(self, module, fetch_name: str, make_site, **kwargs):
+        runs = []
+        for concurrency in (1, 4):
+            site = make_site()
+            with mock.patch.object(module, fetch_name, site.fetch), mock.patch("builtins.print"):
+                jobs = module.fetch_all_jobs(sleep_seconds=0, concurrency=concurrency, **kwargs)
+            runs.append((jobs, site))
+        return runs
+
+    def test_rekrute_matches_serial_crawl(self):
+        for kwargs in ({"max_jobs": 4}, {"max_pages": 2}, {}):
+            (serial, serial_site), (crawled, crawled_site) = self.run_both(
+                rekrute_fetch, "fetch_html", rekrute_site, **kwargs
+            )
+            self.assertEqual(crawled, serial)
+            self.assertEqual(sorted(crawled_site.fetched), sorted(serial_site.fetched))
+        self.assertEqual(len(serial), 7)
+        by_url = {job["url"]: job for job in serial}
+        self.assertIn("Terraform pour le poste 1", by_url[f"{rekrute_fetch.BASE_URL}/offre-emploi-junior-cloud-1.html"]["description"])
+        self.assertIn("Linux 5", by_url[f"{rekrute_fetch.BASE_URL}/offre-emploi-junior-cloud-5.html"]["description"])
+
+    def test_marocannonces_stops_at_the_first_empty_page(self):
+        (serial, serial_site), (crawled, crawled_site) = self.run_both(
+            marocannonces_fetch, "fetch_html", marocannonces_site
+        )
+        self.assertEqual(crawled, serial)
+        self.assertEqual([job["company"] for job in crawled], [f"Tech Maroc {n}" for n in (11, 12, 13, 14)])
+        details = lambda site: sorted(url for url in site.fetched if "/annonce/" in url)  # noqa: E731
+        self.assertEqual(details(crawled_site), details(serial_site))
+
+    def test_emploi_ma_fetches_listing_pages_in_parallel(self):
+        for kwargs in ({"max_jobs": 3}, {"max_pages": 2}, {}):
+            (serial, serial_site), (crawled, crawled_site) = self.run_both(
+                emploi_ma_fetch, "fetch_url", emploi_ma_site, **kwargs
+            )
+            self.assertEqual(crawled, serial)
+            self.assertEqual(sorted(crawled_site.fetched), sorted(serial_site.fetched))
+        self.assertEqual([job["title"] for job in serial][:2], ["DevOps 21 - Casablanca", "DevOps 22 - Casablanca"])
+        self.assertGreater(crawled_site.max_in_flight, 1)
+
+    def test_crawler_bounds_requests_in_flight(self):
+        site = emploi_ma_site()
+        urls = sorted(site.pages) * 3
+        with SiteCrawler(site.fetch, concurrency=2) as crawler:
+            prefetch = DetailPrefetch(crawler, lambda page_html, url: {"size": len(page_html)}, max_jobs=3)
+            prefetch.add([{"url": url} for url in urls])
+            jobs = [{"url": url} for url in sorted(site.pages)[:3]]
+            merged = prefetch.merge(jobs, lambda job, detail: {**job, **detail}, "Test")
+        self.assertEqual([job["size"] for job in merged], [len(site.pages[job["url"]]) for job in jobs])
+        self.assertEqual(len(site.fetched), 3)
+        self.assertLessEqual(site.max_in_flight, 2)
+
+
+class DetailCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "detail_cache.sqlite")
+        self.now = [1_000_000.0]
+
+    def crawl(self, site: FakeSite, concurrency: int) -> list[dict]:
+        cache = DetailCache(self.path, "emploi_ma", clock=lambda: self.now[0])
+        try:
+            with mock.patch.object(emploi_ma_fetch, "fetch_url", site.fetch), mock.patch("builtins.print"):
+                return emploi_ma_fetch.fetch_all_jobs(sleep_seconds=0, concurrency=concurrency, detail_cache=cache)
+        finally:
+            cache.close()
+
+    def test_unchanged_cards_skip_detail_pages(self):
+        for concurrency in (1, 4):
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            fresh_site = emploi_ma_site()
+            fresh = self.crawl(fresh_site, concurrency)
+            self.assertEqual(sum("/offre-emploi-maroc/" in url for url in fresh_site.fetched), 6)
+
+            rerun_site = emploi_ma_site()
+            self.assertEqual(self.crawl(rerun_site, concurrency), fresh)
+            self.assertFalse([url for url in rerun_site.fetched if "/offre-emploi-maroc/" in url])
+
+            # An edited card (new snippet) refetches that posting only.
+            edited_site = emploi_ma_site()
+            listing = emploi_ma_fetch.build_listing_url(1)
+            edited_site.pages[listing] = edited_site.pages[listing].replace("CI/CD et cloud 24.", "Kubernetes 24.")
+            detail_url = f"{emploi_ma_fetch.BASE_URL}/offre-emploi-maroc/devops-24"
+            edited_site.pages[detail_url] = edited_site.pages[detail_url].replace("CI/CD 24", "Kubernetes 24")
+            edited = self.crawl(edited_site, concurrency)
+            self.assertEqual([url for url in edited_site.fetched if "/offre-emploi-maroc/" in url], [detail_url])
+            self.assertIn("Kubernetes 24", {job["url"]: job for job in edited}[detail_url]["description"])
+
+    def test_entries_expire_after_max_days_old(self):
+        cache = DetailCache(self.path, "rekrute", clock=lambda: self.now[0])
+        self.addCleanup(cache.close)
+        job = {"url": "https://www.rekrute.com/offre-1.html ", "title": "Junior Cloud", "created": "2026-04-16"}
+        cache.put(job, {"description": "Terraform"})
+        self.assertEqual(cache.get({**job, "url": job["url"].strip()}), {"description": "Terraform"})
+        self.assertIsNone(cache.get({**job, "title": "Senior Cloud"}))
+        self.assertNotEqual(card_fingerprint(job), card_fingerprint({**job, "description": "snippet"}))
+
+        self.now[0] += MAX_DAYS_OLD * 86400 + 1
+        self.assertIsNone(cache.lookup(job))
+        self.assertEqual(cache.evict_expired(), 1)
+        self.assertEqual(dict(cache.stats), {"stored": 1, "hit": 1, "changed": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
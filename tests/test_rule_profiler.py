@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+import adzuna_fetch as af
+import rule_profiler
+from job_samples import make_job
+from rule_profiler import RuleProfiler
+
+
+class RuleProfilerTests(unittest.TestCase):
+    def test_self_time_excludes_nested_stages(self):
+        module = types.SimpleNamespace()
+        module.inner = lambda text: time.sleep(0.01) or text.startswith("x")
+        module.outer = lambda text: [module.inner(text) for _ in range(2)] and time.sleep(0.005)
+        originals = (module.outer, module.inner)
+        profiler = RuleProfiler(slowest=1)
+        profiler.instrument(module, {"outer": None, "inner": bool})
+        module.outer("xyz")
+        module.outer("abc")
+        profiler.restore()
+        self.assertEqual((module.outer, module.inner), originals)
+
+        rows = {row["stage"]: row for row in profiler.report()}
+        self.assertEqual((rows["inner"]["calls"], rows["inner"]["rejects"]), (4, 2))
+        self.assertEqual((rows["outer"]["calls"], rows["outer"]["rejects"]), (2, 0))
+        self.assertGreaterEqual(rows["outer"]["total_ms"], rows["inner"]["total_ms"] + 9)
+        self.assertLess(rows["outer"]["self_ms"], rows["inner"]["total_ms"])
+        self.assertEqual(len(rows["inner"]["slowest"]), 1)
+
+    def test_requested_by_flag_or_env(self):
+        with mock.patch.dict(os.environ, {rule_profiler.PROFILE_ENV: ""}):
+            self.assertFalse(rule_profiler.profiling_requested())
+            self.assertTrue(rule_profiler.profiling_requested(True))
+        with mock.patch.dict(os.environ, {rule_profiler.PROFILE_ENV: "1"}):
+            self.assertTrue(rule_profiler.profiling_requested())
+
+
+class FilterProfilingTests(unittest.TestCase):
+    def setUp(self):
+        af.configure_market("be")
+        self.jobs = [
+            make_job(1, "Junior Cloud Engineer"),
+            make_job(2, "Sales Manager"),
+            make_job(3, "Junior Linux System Administrator", location="Gent"),
+            make_job(4, "Junior Cloud Engineer", location="Casablanca"),
+        ]
+
+    def test_profiled_filters_keep_verdicts_and_report_stages(self):
+        original = af.location_ok
+        expected = af.filter_jobs(self.jobs, ["strict", "broad"], near_miss=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rule_profile.json")
+            af.enable_rule_profiler()
+            try:
+                self.assertIsNot(af.location_ok, original)
+                results = af.filter_jobs(self.jobs, ["strict", "broad"], workers=2, near_miss=True)
+            finally:
+                with mock.patch("builtins.print"):
+                    af.close_rule_profiler(path, {"market": "be"})
+            with open(path, encoding="utf-8") as handle:
+                report = json.load(handle)
+
+        self.assertIs(af.location_ok, original)
+        self.assertIsNone(af.RULE_PROFILER)
+        self.assertEqual(results, expected)
+        self.assertEqual(report["market"], "be")
+        stages = {row["stage"]: row for row in report["stages"]}
+        rejected = sum(
+            1 for job in self.jobs if not any(af.evaluate_job_rules(job, filter_modes=("strict", "broad")).values())
+        )
+        self.assertEqual(stages["evaluate_job_rules"]["calls"], len(self.jobs))
+        self.assertEqual(stages["evaluate_job_rules"]["rejects"], rejected)
+        self.assertGreaterEqual(stages["location_ok"]["calls"], 1)
+        self.assertIn(stages["evaluate_job_rules"]["slowest"][0]["input"], {job["title"] for job in self.jobs})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import table_storage as ts
+from config import get_output_paths
+
+
+class TableStorageTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv = str(Path(tmp.name) / "jobs.csv")
+        self.df = pd.DataFrame(
+            {
+                "title": ["Cloud Engineer", "IT Support"],
+                "description": ["Azure and Terraform " * 20, "Helpdesk " * 20],
+                "years_required": [2, ""],
+                "priority_score": [81, 70],
+            }
+        )
+
+    def test_missing_table_reads_empty(self):
+        self.assertTrue(ts.read_table(self.csv).empty)
+        self.assertIsNone(ts.table_source(self.csv))
+
+    def test_csv_only_round_trip_with_projection(self):
+        with mock.patch.dict(os.environ, {"JOB_TABLE_FORMAT": "csv"}):
+            ts.save_table(self.df, self.csv)
+        self.assertFalse(os.path.exists(ts.parquet_table_path(self.csv)))
+        loaded = ts.read_table(self.csv, columns=["title", "priority_score", "not_there"])
+        self.assertEqual(list(loaded.columns), ["title", "priority_score"])
+        self.assertEqual(loaded["priority_score"].tolist(), [81, 70])
+
+    @unittest.skipUnless(ts.pq is not None, "pyarrow not installed")
+    def test_parquet_copy_is_preferred_until_csv_is_edited(self):
+        with mock.patch.dict(os.environ, {"JOB_TABLE_FORMAT": "parquet"}):
+            ts.save_table(self.df, self.csv)
+        self.assertEqual(ts.table_source(self.csv), ts.parquet_table_path(self.csv))
+        loaded = ts.read_table(self.csv, columns=["title", "years_required"])
+        self.assertEqual(loaded["years_required"].tolist(), ["2", ""])
+
+        edited = self.df.assign(priority_score=[1, 2])
+        edited.to_csv(self.csv, index=False)
+        later = os.path.getmtime(ts.parquet_table_path(self.csv)) + 10
+        os.utime(self.csv, (later, later))
+        self.assertEqual(ts.read_table(self.csv)["priority_score"].tolist(), [1, 2])
+
+    def test_output_paths_resolve_parquet_copies(self):
+        csv_paths = get_output_paths("ch")
+        parquet_paths = get_output_paths("ch", table_format="parquet")
+        self.assertEqual(parquet_paths["merged_filtered_csv"], "data/ch_all_jobs_merged_filtered.parquet")
+        self.assertEqual(parquet_paths["daily_alert_state_json"], csv_paths["daily_alert_state_json"])
+
+
+def messy_rows():
+    rows = []
+    for idx in range(23):
+        row = {
+            "canonical_url": f"https://x/{idx % 9}",
+            "title": "Cloud Engineer" if idx % 3 else "IT Support",
+            "company": "Acme",
+            "priority_score": idx % 5,
+            "created": f"2026-01-{idx % 28 + 1:02d}",
+            "salary_max": np.nan,
+            "years_required": None if idx % 4 else idx,
+            "note": idx if idx % 7 == 0 else "text",
+        }
+        if idx % 6 == 0:
+            row.pop("company")
+        if idx > 10:
+            row["late_column"] = "added"
+        rows.append(row)
+    return rows
+
+
+class ChunkedTableTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.rows = messy_rows()
+
+    def whole_table(self, rows):
+        return pd.DataFrame(rows).drop_duplicates(subset=["canonical_url", "title"]).sort_values(
+            by=["priority_score", "created"], ascending=[False, False]
+        )
+
+    def spool(self, rows):
+        spool = ts.RowSpool(["canonical_url", "title"], ["priority_score", "created"])
+        self.addCleanup(spool.close)
+        spool.extend(rows)
+        return spool
+
+    def check_chunks_match_whole_read(self, path):
+        whole = ts.read_table(path)
+        for chunk_size in (1, 4, 100):
+            chunks = list(ts.iter_table_chunks(path, chunk_size))
+            self.assertEqual(len(chunks), -(-len(whole) // chunk_size))
+            joined = pd.concat(chunks, ignore_index=True)
+            pd.testing.assert_frame_equal(joined, whole)
+        columns = ["title", "years_required", "not_there"]
+        projected = pd.concat(ts.iter_table_chunks(path, 4, columns=columns), ignore_index=True)
+        pd.testing.assert_frame_equal(projected, ts.read_table(path, columns=columns))
+
+    def test_csv_chunks_match_whole_read(self):
+        path = str(self.dir / "raw.csv")
+        with mock.patch.dict(os.environ, {"JOB_TABLE_FORMAT": "csv"}):
+            ts.save_table(pd.DataFrame(self.rows), path)
+        self.check_chunks_match_whole_read(path)
+        self.assertEqual(list(ts.iter_table_chunks(str(self.dir / "missing.csv"), 10)), [])
+
+    @unittest.skipUnless(ts.pq is not None, "pyarrow not installed")
+    def test_parquet_chunks_match_whole_read(self):
+        path = str(self.dir / "raw.csv")
+        with mock.patch.dict(os.environ, {"JOB_TABLE_FORMAT": "parquet"}):
+            ts.save_table(pd.DataFrame(self.rows).astype({"years_required": "Int64"}), path)
+            self.check_chunks_match_whole_read(path)
+
+    def test_spool_saves_like_whole_frame_csv(self):
+        expected_path, spool_path = str(self.dir / "expected.csv"), str(self.dir / "spooled.csv")
+        with mock.patch.dict(os.environ, {"JOB_TABLE_FORMAT": "csv"}):
+            ts.save_table(self.whole_table(self.rows), expected_path)
+            saved = self.spool(self.rows).save(spool_path, block_size=4)
+        self.assertEqual(saved, len(self.whole_table(self.rows)))
+        self.assertEqual(Path(spool_path).read_bytes(), Path(expected_path).read_bytes())
+
+    @unittest.skipUnless(ts.pq is not None, "pyarrow not installed")
+    def test_spool_saves_like_whole_frame_parquet(self):
+        expected_path, spool_path = str(self.dir / "expected.csv"), str(self.dir / "spooled.csv")
+        with mock.patch.dict(os.environ, {"JOB_TABLE_FORMAT": "parquet"}):
+            ts.save_table(self.whole_table(self.rows), expected_path)
+            self.spool(self.rows).save(spool_path, block_size=4)
+        expected = ts.pq.read_table(ts.parquet_table_path(expected_path))
+        spooled = ts.pq.read_table(ts.parquet_table_path(spool_path))
+        self.assertTrue(spooled.schema.remove_metadata().equals(expected.schema.remove_metadata()))
+        pd.testing.assert_frame_equal(spooled.to_pandas(), expected.to_pandas())
+        self.assertFalse(any(name.endswith(".partial") for name in os.listdir(self.dir)))
+
+
+if __name__ == "__main__":
+    unittest.main()
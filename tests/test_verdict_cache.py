@@ -0,0 +1,103 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import adzuna_fetch as af
+from job_samples import CLOUD_DESC, DUTCH_DESC, make_job
+from verdict_cache import VerdictCache
+
+
+class VerdictCacheStoreTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = str(Path(tmp.name) / "verdicts.sqlite")
+        self.now = [1_000_000.0]
+
+    def open(self, max_age_days=60) -> VerdictCache:
+        cache = VerdictCache(self.path, max_age_days=max_age_days, clock=lambda: self.now[0])
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_verdicts_are_scoped_to_the_fingerprint(self):
+        cache = self.open()
+        cache.put("job-1", "rules-a", {"strict": {"priority_score": 70}, "broad": None})
+        cache.close()
+        reopened = self.open()
+        self.assertEqual(reopened.get("job-1", "rules-a"), {"strict": {"priority_score": 70}, "broad": None})
+        self.assertIsNone(reopened.get("job-1", "rules-b"))
+        self.assertEqual((reopened.hits, reopened.misses), (1, 1))
+
+    def test_unused_verdicts_are_pruned_on_open(self):
+        cache = self.open(max_age_days=1)
+        cache.put("job-1", "rules-a", {})
+        cache.put("job-2", "rules-a", {})
+        cache.flush()
+        self.now[0] += 2 * 86400
+        cache.get("job-2", "rules-a")
+        cache.close()
+        self.assertEqual(len(self.open(max_age_days=1)), 1)
+
+
+class CachedFilteringTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        af.configure_market("be")
+        cls.jobs = [
+            make_job(1, "Junior Cloud Engineer", CLOUD_DESC),
+            make_job(2, "Sales Manager", CLOUD_DESC),
+            make_job(3, "Junior DevOps Engineer", DUTCH_DESC),
+            make_job(4, "Junior Linux System Administrator", CLOUD_DESC, location="Gent"),
+        ]
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = af.enable_verdict_cache(str(Path(tmp.name) / "verdicts.sqlite"))
+        self.addCleanup(af.close_verdict_cache)
+
+    def uncached(self, modes):
+        with mock.patch.object(af, "VERDICT_CACHE", None):
+            return af.filter_jobs(self.jobs, modes)
+
+    def test_warm_replay_skips_rules_and_matches_uncached(self):
+        expected = self.uncached(["strict", "broad"])
+        self.assertEqual(af.filter_jobs(self.jobs, ["strict", "broad"]), expected)
+        with mock.patch.object(af, "evaluate_job_rules", side_effect=AssertionError("rules re-run")):
+            self.assertEqual(af.filter_jobs(self.jobs, ["strict", "broad"]), expected)
+            # Verdicts cached by one mode serve the other modes too.
+            self.assertEqual(af.passes_filters(self.jobs[0], filter_mode="broad"), expected["broad"][0])
+        self.assertEqual(self.cache.misses, len(self.jobs))
+
+    def test_recency_is_applied_to_cached_verdicts(self):
+        af.filter_jobs(self.jobs, ["strict"])
+        fresh = af.passes_filters(self.jobs[0], filter_mode="strict")
+        with mock.patch.object(af, "recency_priority_bonus", return_value=0):
+            stale = af.passes_filters(self.jobs[0], filter_mode="strict")
+        self.assertEqual(stale["priority_score"], fresh["priority_score"] - 8)
+        with mock.patch.object(af, "is_recent", return_value=False):
+            self.assertEqual(af.filter_jobs(self.jobs, ["strict"]), {"strict": []})
+
+    def test_rule_or_job_change_misses_the_cache(self):
+        af.filter_jobs(self.jobs, ["strict"])
+        fingerprint = af.rules_fingerprint()
+        edited = dict(self.jobs[0], description=CLOUD_DESC + "Nederlands vereist.")
+        af.filter_jobs([edited], ["strict"])
+        self.assertEqual(self.cache.misses, len(self.jobs) + 1)
+        with mock.patch.object(af, "MIN_DESCRIPTION_CHARS", af.MIN_DESCRIPTION_CHARS + 1), mock.patch.object(
+            af, "_RULES_FINGERPRINT", ""
+        ):
+            self.assertNotEqual(af.rules_fingerprint(), fingerprint)
+
+    def test_fingerprint_is_unchanged_by_a_filter_run(self):
+        af.clear_language_analysis_cache()
+        with mock.patch.object(af, "_RULES_FINGERPRINT", ""):
+            before = af.rules_fingerprint()
+        self.uncached(["strict"])
+        with mock.patch.object(af, "_RULES_FINGERPRINT", ""):
+            self.assertEqual(af.rules_fingerprint(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
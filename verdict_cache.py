@@ -0,0 +1,123 @@
+"""
+SQLite-backed cache of filter verdicts for adzuna_fetch.evaluate_job.
+
+A verdict is keyed on (job key, rules fingerprint):
+- the job key hashes the job's content and source, so an edited posting is a new key;
+- the rules fingerprint hashes everything the rules read (rule code, market profile, keyword
+  lists, thresholds), so any rule change misses the cache instead of serving stale verdicts.
+Stored verdicts are timeless: the recency cut-off and the freshness part of priority_score are
+applied by the caller on every run. Rows unused for max_age_days are pruned when the cache opens.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+DEFAULT_MAX_AGE_DAYS = 60
+
+# Buffered puts are committed in batches; a commit per job would dominate a warm replay.
+FLUSH_EVERY = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    job_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    verdict BLOB NOT NULL,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (job_key, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS verdicts_used_at ON verdicts(used_at);
+"""
+
+
+class VerdictCache:
+    """Thread-safe (job key, fingerprint) -> verdict cache. One connection, guarded by a lock."""
+
+    def __init__(self, path: str, max_age_days: float = DEFAULT_MAX_AGE_DAYS, clock=time.time):
+        self.path = str(path)
+        self.max_age_seconds = max(0.0, float(max_age_days)) * 86400
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], bytes] = {}
+        self._used: set[tuple[str, str]] = set()
+        self.hits = 0
+        self.misses = 0
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self.prune()
+
+    def get(self, job_key: str, fingerprint: str) -> Optional[Any]:
+        """Cached verdict, or None on a miss."""
+        key = (job_key, fingerprint)
+        with self._lock:
+            blob = self._pending.get(key)
+            if blob is None:
+                row = self._conn.execute(
+                    "SELECT verdict FROM verdicts WHERE job_key = ? AND fingerprint = ?", key
+                ).fetchone()
+                blob = row[0] if row else None
+            if blob is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._used.add(key)
+        return pickle.loads(blob)
+
+    def put(self, job_key: str, fingerprint: str, verdict: Any):
+        self.put_many([(job_key, verdict)], fingerprint)
+
+    def put_many(self, items: Iterable[tuple[str, Any]], fingerprint: str):
+        with self._lock:
+            for job_key, verdict in items:
+                self._pending[(job_key, fingerprint)] = pickle.dumps(verdict, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(self._pending) >= FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self):
+        """Commit buffered verdicts and refresh used_at of the verdicts served since the last flush."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending and not self._used:
+            return
+        now = self._clock()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO verdicts(job_key, fingerprint, verdict, used_at) VALUES (?, ?, ?, ?)",
+                [(job_key, fingerprint, blob, now) for (job_key, fingerprint), blob in self._pending.items()],
+            )
+            self._conn.executemany(
+                "UPDATE verdicts SET used_at = ? WHERE job_key = ? AND fingerprint = ?",
+                [(now, job_key, fingerprint) for job_key, fingerprint in self._used - self._pending.keys()],
+            )
+        self._pending.clear()
+        self._used.clear()
+
+    def prune(self) -> int:
+        """Drop verdicts not used for max_age_days (0 = keep forever). Returns rows removed."""
+        if not self.max_age_seconds:
+            return 0
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "DELETE FROM verdicts WHERE used_at < ?", (self._clock() - self.max_age_seconds,)
+            ).rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()